@@ -3,7 +3,6 @@ from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.uix.textinput import TextInput
 from kivy.uix.button import Button
-from kivy.uix.image import Image
 from kivy.graphics import Color, RoundedRectangle, Rectangle
 from kivy.core.window import Window
 from kivy.clock import Clock
@@ -12,9 +11,14 @@ from kivy.metrics import dp, sp
 from kivy.uix.widget import Widget
 from kivy.uix.scrollview import ScrollView
 from kivy.utils import platform
-from threading import Thread
+from task_executor import tasks, PRIORITY_HIGH
 from api_client import api
 from session_manager import session
+from responsive import responsive
+from assets import assets
+from app_logging import get_logger
+
+log = get_logger("actualizar")
 
 
 # ------------------ UTILIDADES RESPONSIVE ------------------
@@ -115,17 +119,13 @@ class RoundedTextInput(TextInput):
             )
 
         self.bind(pos=self._update_rects, size=self._update_rects)
-        Window.bind(on_resize=self.on_window_resize)
+        responsive.track(self, font_size=lambda: ResponsiveHelper.get_font_size(18))
 
     def _update_rects(self, *args):
         self.bg_rect.pos = self.pos
         self.bg_rect.size = self.size
         self.border_rect.pos = (self.pos[0]+dp(2), self.pos[1]+dp(2))
         self.border_rect.size = (self.size[0]-dp(4), self.size[1]-dp(4))
-    
-    def on_window_resize(self, instance, width, height):
-        self.font_size = ResponsiveHelper.get_font_size(18)
-        self.height = dp(55)
 
     def on_focus(self, instance, value):
         if value:
@@ -182,15 +182,11 @@ class HoverButton(Button):
             self.rect = RoundedRectangle(pos=self.pos, size=self.size, radius=[self.border_radius])
 
         self.bind(pos=self.update_rect, size=self.update_rect)
-        Window.bind(on_resize=self.on_window_resize)
+        responsive.track(self, font_size=lambda: ResponsiveHelper.get_font_size(18))
 
     def update_rect(self, *args):
         self.rect.pos = self.pos
         self.rect.size = self.size
-    
-    def on_window_resize(self, instance, width, height):
-        self.font_size = ResponsiveHelper.get_font_size(18)
-        self.height = dp(50)
 
 
 # ------------------ PANTALLA ACTUALIZAR DATOS ------------------
@@ -199,7 +195,6 @@ class ActualizarDatosScreen(Screen):
         super().__init__(**kwargs)
         self.admin_data = None
         self.build_ui()
-        Window.bind(on_resize=self.on_window_resize)
 
     def on_pre_enter(self):
         """Se ejecuta antes de mostrar la pantalla"""
@@ -217,8 +212,9 @@ class ActualizarDatosScreen(Screen):
             admin_id = session.get_admin_id()
             print(f"[ActualizarDatosScreen] Cargando datos del admin ID: {admin_id}")
             
-            # Obtener datos frescos del backend
-            self.admin_data = api.get_administrador_by_id(admin_id)
+            # Datos del backend (o de la caché; si estaban vencidos llegan
+            # los frescos después por set_admin_data)
+            self.admin_data = api.get_administrador_by_id(admin_id, on_update=self.set_admin_data, owner=self)
             
             # Actualizar campos con los datos
             self.actualizar_campos_ui()
@@ -281,14 +277,20 @@ class ActualizarDatosScreen(Screen):
         # Logo responsive centrado
         logo_height = ResponsiveHelper.get_logo_height()
         logo_container = BoxLayout(size_hint=(1, None), height=logo_height)
-        logo = Image(
-            source="Imagen5-Photoroom.png",
+        logo = assets.image(
+            "Imagen5-Photoroom.png",
             size_hint=(None, None),
             width=logo_height * 1.2,
             height=logo_height,
             pos_hint={'center_x': 0.5},
             fit_mode="contain"
         )
+        responsive.track(logo_container, height=ResponsiveHelper.get_logo_height)
+        responsive.track(
+            logo,
+            width=lambda: ResponsiveHelper.get_logo_height() * 1.2,
+            height=ResponsiveHelper.get_logo_height
+        )
         logo_container.add_widget(Widget())
         logo_container.add_widget(logo)
         logo_container.add_widget(Widget())
@@ -318,6 +320,7 @@ class ActualizarDatosScreen(Screen):
             pos_hint={'center_x': 0.5}
         )
         form_container.bind(minimum_height=form_container.setter('height'))
+        responsive.track(form_container, size_hint_x=ResponsiveHelper.get_form_width)
 
         # Título
         titulo = Label(
@@ -330,6 +333,7 @@ class ActualizarDatosScreen(Screen):
             halign='center',
             valign='middle'
         )
+        responsive.track(titulo, font_size=lambda: ResponsiveHelper.get_font_size(32))
         form_container.add_widget(titulo)
 
         # Función para crear campos editables
@@ -342,15 +346,14 @@ class ActualizarDatosScreen(Screen):
             )
             campo_layout.bind(minimum_height=campo_layout.setter('height'))
 
-            campo_layout.add_widget(Label(
+            campo_layout.add_widget(responsive.track(Label(
                 text=texto,
-                font_size=ResponsiveHelper.get_font_size(18),
                 color=(0.1, 0.1, 0.2, 1),
                 size_hint_y=None,
                 size_hint_x=1,
                 height=dp(30),
                 halign='left'
-            ))
+            ), font_size=lambda: ResponsiveHelper.get_font_size(18)))
 
             input_field = RoundedTextInput(
                 text=valor_actual,
@@ -410,6 +413,11 @@ class ActualizarDatosScreen(Screen):
             size_hint_x=1,
             height=ResponsiveHelper.get_button_layout_height()
         )
+        responsive.track(
+            botones_layout,
+            orientation=ResponsiveHelper.get_button_layout_orientation,
+            height=ResponsiveHelper.get_button_layout_height
+        )
 
         # Botón Guardar Cambios
         btn_guardar = HoverButton(
@@ -450,13 +458,13 @@ class ActualizarDatosScreen(Screen):
     def update_background(self, instance, value):
         self.background_rect.size = instance.size
         self.background_rect.pos = instance.pos
-        
-    def on_window_resize(self, instance, width, height):
-        Clock.schedule_once(lambda dt: self.build_ui(), 0.1)
 
     def on_enter(self, *args):
         Clock.schedule_once(self.establecer_foco, 0.1)
 
+    def on_pre_leave(self, *args):
+        tasks.cancel_owner(self)
+
     def establecer_foco(self, dt):
         if hasattr(self, 'nombre_input'):
             self.nombre_input.focus = True
@@ -504,49 +512,45 @@ class ActualizarDatosScreen(Screen):
         if nueva_pass:
             payload['contraseniaAdministrador'] = nueva_pass
         
-        # Guardar en backend en un hilo separado
+        # Guardar en backend en segundo plano
         def _save_task():
-            try:
-                admin_id = session.get_admin_id()
-                print(f"[ActualizarDatosScreen] Actualizando admin ID: {admin_id}")
-                print(f"[ActualizarDatosScreen] Payload: {payload}")
-                
-                # Llamar al endpoint de actualización
-                updated_admin = api.update_administrador(admin_id, payload)
-                
-                # Actualizar sesión con los nuevos datos
-                session.update_admin_data(updated_admin)
-                
-                def _success(dt):
-                    self.mostrar_mensaje("Éxito", "Tus datos se han actualizado correctamente")
-                    # Limpiar campo de contraseña
-                    self.nueva_contraseña_input.text = ""
-                    # Volver a la pantalla de cuenta después de 1.5 segundos
-                    Clock.schedule_once(lambda dt: setattr(self.manager, 'current', 'cuenta'), 1.5)
-                
-                Clock.schedule_once(_success, 0)
-                
-            except Exception as e:
-                print(f"[ActualizarDatosScreen] Error al guardar: {e}")
-                error_msg = str(e)
-                
-                # Mensajes de error más amigables
-                if "ya está registrado" in error_msg.lower():
-                    error_msg = "El correo o usuario ya están en uso"
-                elif "404" in error_msg:
-                    error_msg = "No se encontró el administrador"
-                elif "401" in error_msg or "403" in error_msg:
-                    error_msg = "No tienes permisos para realizar esta acción"
-                else:
-                    error_msg = f"Error al actualizar: {error_msg}"
-                
-                def _error(dt):
-                    self.mostrar_mensaje("Error", error_msg)
-                
-                Clock.schedule_once(_error, 0)
+            admin_id = session.get_admin_id()
+            # Solo los nombres de los campos: el payload puede traer la contraseña
+            log.info("admin.actualizando", admin_id=admin_id, campos=sorted(payload))
+            
+            # Llamar al endpoint de actualización
+            updated_admin = api.update_administrador(admin_id, payload)
+            
+            # Actualizar sesión con los nuevos datos
+            session.update_admin_data(updated_admin)
+            return updated_admin
+        
+        def _success(updated_admin):
+            self.mostrar_mensaje("Éxito", "Tus datos se han actualizado correctamente")
+            # Limpiar campo de contraseña
+            self.nueva_contraseña_input.text = ""
+            # Volver a la pantalla de cuenta después de 1.5 segundos
+            Clock.schedule_once(lambda dt: setattr(self.manager, 'current', 'cuenta'), 1.5)
+        
+        def _error(e):
+            log.warning("admin.actualizar_fallido", error=e)
+            error_msg = str(e)
+            
+            # Mensajes de error más amigables
+            if "ya está registrado" in error_msg.lower():
+                error_msg = "El correo o usuario ya están en uso"
+            elif "404" in error_msg:
+                error_msg = "No se encontró el administrador"
+            elif "401" in error_msg or "403" in error_msg:
+                error_msg = "No tienes permisos para realizar esta acción"
+            else:
+                error_msg = f"Error al actualizar: {error_msg}"
+            
+            self.mostrar_mensaje("Error", error_msg)
         
-        # Ejecutar en hilo separado
-        Thread(target=_save_task, daemon=True).start()
+        # La escritura se completa aunque se salga de la pantalla
+        tasks.submit(_save_task, owner=self, priority=PRIORITY_HIGH, essential=True,
+                     on_success=_success, on_error=_error, name="admin.update")
 
     def cancelar(self, instance):
         # Limpiar campo de contraseña al cancelar
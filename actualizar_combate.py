@@ -3,7 +3,6 @@ from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.uix.textinput import TextInput
 from kivy.uix.button import Button
-from kivy.uix.image import Image
 from kivy.uix.scrollview import ScrollView
 from kivy.uix.popup import Popup
 from kivy.graphics import Color, RoundedRectangle, Rectangle
@@ -16,7 +15,8 @@ from kivy.uix.spinner import Spinner
 from kivy.properties import ObjectProperty
 from datetime import datetime, date
 import calendar
-from threading import Thread
+from task_executor import tasks, PRIORITY_HIGH
+from assets import assets
 
 # Importar el cliente API
 try:
@@ -525,8 +525,8 @@ class ActualizarCombateScreen(Screen):
         self.bind(size=self.update_background, pos=self.update_background)
 
         # Logo
-        logo = Image(
-            source="Imagen5-Photoroom.png",
+        logo = assets.image(
+            "Imagen5-Photoroom.png",
             size_hint=(1, None),
             height=dp(120),
             pos_hint={'center_x': 0.5}
@@ -838,6 +838,9 @@ class ActualizarCombateScreen(Screen):
         self.juez3_nombre_input.text = str(data.get('juez3_nombre', '') or '')
         self.juez3_apellidos_input.text = str(data.get('juez3_Apellidos', '') or '')
 
+    def on_pre_leave(self, *args):
+        tasks.cancel_owner(self)
+
     def update_background(self, *args):
         self.background_rect.size = Window.size
         self.background_rect.pos = self.pos
@@ -1070,23 +1073,18 @@ class ActualizarCombateScreen(Screen):
         
         payload = self.construir_payload()
         
-        def _do_create():
-            try:
-                result = api.create_combate(payload)
-                if result:
-                    Clock.schedule_once(lambda dt: self._on_create_success(result))
-                else:
-                    Clock.schedule_once(
-                        lambda dt: self.mostrar_mensaje("Error", "No se pudo crear el combate")
-                    )
-            except Exception as e:
-                Clock.schedule_once(
-                    lambda dt: self.mostrar_mensaje("Error", f"Error al crear: {str(e)}")
-                )
+        def _on_result(result):
+            if result:
+                self._on_create_success(result)
+            else:
+                self.mostrar_mensaje("Error", "No se pudo crear el combate")
         
-        thread = Thread(target=_do_create)
-        thread.daemon = True
-        thread.start()
+        tasks.submit(
+            api.create_combate, payload,
+            owner=self, priority=PRIORITY_HIGH, essential=True, name="combate.create",
+            on_success=_on_result,
+            on_error=lambda e: self.mostrar_mensaje("Error", f"Error al crear: {str(e)}")
+        )
 
     def _on_create_success(self, result):
         """Callback cuando se crea exitosamente"""
@@ -1117,23 +1115,18 @@ class ActualizarCombateScreen(Screen):
             "estado": self.combate_data.get('estado', 'PENDIENTE')
         }
         
-        def _do_update():
-            try:
-                result = api.update_combate(combate_id, payload)
-                if result:
-                    Clock.schedule_once(lambda dt: self._on_update_success())
-                else:
-                    Clock.schedule_once(
-                        lambda dt: self.mostrar_mensaje("Error", "No se pudo actualizar el combate")
-                    )
-            except Exception as e:
-                Clock.schedule_once(
-                    lambda dt: self.mostrar_mensaje("Error", f"Error al actualizar: {str(e)}")
-                )
+        def _on_result(result):
+            if result:
+                self._on_update_success()
+            else:
+                self.mostrar_mensaje("Error", "No se pudo actualizar el combate")
         
-        thread = Thread(target=_do_update)
-        thread.daemon = True
-        thread.start()
+        tasks.submit(
+            api.update_combate, combate_id, payload,
+            owner=self, priority=PRIORITY_HIGH, essential=True, name="combate.update",
+            on_success=_on_result,
+            on_error=lambda e: self.mostrar_mensaje("Error", f"Error al actualizar: {str(e)}")
+        )
 
     def _on_update_success(self):
         """Callback cuando se actualiza exitosamente"""
@@ -3,7 +3,6 @@ from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.uix.textinput import TextInput
 from kivy.uix.button import Button
-from kivy.uix.image import Image
 from kivy.uix.scrollview import ScrollView
 from kivy.uix.popup import Popup
 from kivy.graphics import Color, RoundedRectangle, Rectangle
@@ -19,6 +18,12 @@ from kivy.utils import platform
 from datetime import datetime, date
 import calendar
 from api_client import api
+from task_executor import tasks, PRIORITY_HIGH
+from responsive import responsive
+from assets import assets
+from app_logging import get_logger
+
+log = get_logger("actualizar_torneos")
 
 
 # ------------------ UTILIDADES RESPONSIVE ------------------
@@ -132,14 +137,10 @@ class DateSelector(BoxLayout):
         # Bind para actualizar días cuando cambia mes o año
         self.month_spinner.bind(text=self.update_days_on_change)
         self.year_spinner.bind(text=self.update_days_on_change)
-        Window.bind(on_resize=self.on_window_resize)
+        responsive.track(self.year_spinner, font_size=lambda: ResponsiveHelper.get_font_size(18))
+        responsive.track(self.month_spinner, font_size=lambda: ResponsiveHelper.get_font_size(18))
+        responsive.track(self.day_spinner, font_size=lambda: ResponsiveHelper.get_font_size(18))
 
-    def on_window_resize(self, instance, width, height):
-        self.year_spinner.font_size = ResponsiveHelper.get_font_size(18)
-        self.month_spinner.font_size = ResponsiveHelper.get_font_size(18)
-        self.day_spinner.font_size = ResponsiveHelper.get_font_size(18)
-        self.height = dp(55)
-        
     def update_days_on_change(self, *args):
         self.update_days()
         self.get_selected_date()
@@ -176,6 +177,21 @@ class DateSelector(BoxLayout):
         selected_date = self.get_selected_date()
         return selected_date.strftime("%d/%m/%Y")
 
+    def set_date(self, fecha):
+        """Selecciona una fecha DD/MM/YYYY sin recrear los spinners"""
+        try:
+            day, month, year = map(int, fecha.split('/'))
+            nueva = date(year, month, day)
+        except (ValueError, AttributeError):
+            return
+        if str(nueva.year) not in self.year_spinner.values:
+            self.year_spinner.values = [str(nueva.year)] + list(self.year_spinner.values)
+        self.year_spinner.text = str(nueva.year)
+        self.month_spinner.text = self.meses_espanol[nueva.month - 1]
+        self.update_days()
+        self.day_spinner.text = str(nueva.day)
+        self.get_selected_date()
+
 
 # ------------------ SELECTOR DE HORA RESPONSIVE ------------------
 class TimeSelector(BoxLayout):
@@ -236,13 +252,9 @@ class TimeSelector(BoxLayout):
        
         self.hour_spinner.bind(text=self.update_time)
         self.minute_spinner.bind(text=self.update_time)
-        Window.bind(on_resize=self.on_window_resize)
+        responsive.track(self.hour_spinner, font_size=lambda: ResponsiveHelper.get_font_size(18))
+        responsive.track(self.minute_spinner, font_size=lambda: ResponsiveHelper.get_font_size(18))
 
-    def on_window_resize(self, instance, width, height):
-        self.hour_spinner.font_size = ResponsiveHelper.get_font_size(18)
-        self.minute_spinner.font_size = ResponsiveHelper.get_font_size(18)
-        self.height = dp(55)
-        
     def update_time(self, *args):
         self.get_selected_time()
         
@@ -259,6 +271,16 @@ class TimeSelector(BoxLayout):
         selected_time = self.get_selected_time()
         return selected_time.strftime("%H:%M")
 
+    def set_time(self, hora):
+        """Selecciona una hora HH:MM (minutos redondeados a múltiplos de 5)"""
+        try:
+            hour, minute = map(int, hora.split(':'))
+        except (ValueError, AttributeError):
+            return
+        self.hour_spinner.text = f"{hour:02d}"
+        self.minute_spinner.text = f"{(minute // 5) * 5:02d}"
+        self.get_selected_time()
+
 
 # ------------------ TEXT INPUT REDONDEADO RESPONSIVE ------------------
 class RoundedTextInput(TextInput):
@@ -293,17 +315,13 @@ class RoundedTextInput(TextInput):
             )
 
         self.bind(pos=self._update_rects, size=self._update_rects)
-        Window.bind(on_resize=self.on_window_resize)
+        responsive.track(self, font_size=lambda: ResponsiveHelper.get_font_size(18))
 
     def _update_rects(self, *args):
         self.bg_rect.pos = self.pos
         self.bg_rect.size = self.size
         self.border_rect.pos = (self.pos[0]+dp(2), self.pos[1]+dp(2))
         self.border_rect.size = (self.size[0]-dp(4), self.size[1]-dp(4))
-    
-    def on_window_resize(self, instance, width, height):
-        self.font_size = ResponsiveHelper.get_font_size(18)
-        self.height = dp(55)
 
     def on_focus(self, instance, value):
         if value:
@@ -361,15 +379,11 @@ class HoverButton(Button):
             )
 
         self.bind(pos=self.update_rect, size=self.update_rect)
-        Window.bind(on_resize=self.on_window_resize)
+        responsive.track(self, font_size=lambda: ResponsiveHelper.get_font_size(18))
 
     def update_rect(self, *args):
         self.rect.pos = self.pos
         self.rect.size = self.size
-    
-    def on_window_resize(self, instance, width, height):
-        self.font_size = ResponsiveHelper.get_font_size(18)
-        self.height = dp(50)
 
 
 # ------------------ PANTALLA ACTUALIZAR TORNEO RESPONSIVE ------------------
@@ -379,45 +393,73 @@ class ActualizarTorneoScreen(Screen):
         self.torneo_data = torneo_data
         self.on_save = on_save
         self.torneo_completo = None  # Almacenará los datos completos del backend
-        self.cargar_datos_torneo()
         self.build_ui()
-        Window.bind(on_resize=self.on_window_resize)
+        self.cargar_datos_torneo()
     
     def cargar_datos_torneo(self):
-        """Carga los datos completos del torneo desde el backend"""
-        try:
-            torneo_id = self.torneo_data.get('idTorneo')
-            
-            if torneo_id:
-                # Obtener el torneo completo del backend
-                self.torneo_completo = api.get_torneo_by_id(torneo_id)
-                print(f"[DEBUG] Torneo cargado desde backend: {self.torneo_completo}")
-                
-                # Actualizar torneo_data con los datos completos
-                if self.torneo_completo:
-                    # Parsear fechaHora del formato ISO a fecha y hora separadas
-                    fecha_hora_iso = self.torneo_completo.get('fechaHora', '')
-                    if fecha_hora_iso:
-                        try:
-                            # Formato esperado: "2025-11-24T07:30:00" o "2025-11-24T07:30"
-                            fecha_parte, hora_parte = fecha_hora_iso.split('T')
-                            # Convertir fecha de YYYY-MM-DD a DD/MM/YYYY
-                            year, month, day = fecha_parte.split('-')
-                            self.torneo_data['fecha'] = f"{day}/{month}/{year}"
-                            # Obtener hora en formato HH:MM
-                            self.torneo_data['hora_inicio'] = hora_parte[:5]  # Solo HH:MM
-                        except Exception as e:
-                            print(f"[ERROR] Error parseando fechaHora: {e}")
-                    
-                    self.torneo_data['nombre'] = self.torneo_completo.get('nombre', '')
-                    self.torneo_data['Sede'] = self.torneo_completo.get('sede', '')
-                    self.torneo_data['estado'] = self.torneo_completo.get('estado', 'PENDIENTE')
-                    self.torneo_data['administrador'] = self.torneo_completo.get('administrador')
-                    
-        except Exception as e:
-            print(f"[ERROR] Error cargando datos del torneo: {e}")
+        """Pide el torneo completo en segundo plano; el formulario ya muestra los datos de la lista"""
+        torneo_id = self.torneo_data.get('idTorneo')
+        if not torneo_id:
+            return
+        
+        def _error(e):
+            log.warning("torneo.carga_fallida", torneo_id=torneo_id, error=e)
             # Si falla, usar los datos que ya tenemos en torneo_data
-            self.torneo_completo = self.torneo_data
+            if self.torneo_completo is None:
+                self.torneo_completo = self.torneo_data
+        
+        tasks.submit(api.get_torneo_by_id, torneo_id, owner=self, name="torneo.get",
+                     on_success=self._aplicar_torneo, on_error=_error)
+
+    def _aplicar_torneo(self, torneo):
+        """Actualiza torneo_data y los campos que el usuario no ha tocado"""
+        log.debug("torneo.cargado", torneo_id=(torneo or {}).get('idTorneo'))
+        if not torneo:
+            return
+        self.torneo_completo = torneo
+        
+        # Un campo que aún tiene el valor con el que se construyó no ha sido editado
+        fecha_inicial, hora_inicial = self._seleccion_inicial
+        sin_editar = {
+            'nombre': self.nombre_torneo_input.text == (self.torneo_data.get('nombre') or ''),
+            'Sede': self.sede_input.text == (self.torneo_data.get('Sede') or ''),
+            'fecha': self.date_selector.get_formatted_date() == fecha_inicial,
+            'hora_inicio': self.time_start_selector.get_formatted_time() == hora_inicial,
+        }
+        
+        # Parsear fechaHora del formato ISO a fecha y hora separadas
+        fecha_hora_iso = torneo.get('fechaHora', '')
+        if fecha_hora_iso:
+            try:
+                # Formato esperado: "2025-11-24T07:30:00" o "2025-11-24T07:30"
+                fecha_parte, hora_parte = fecha_hora_iso.split('T')
+                # Convertir fecha de YYYY-MM-DD a DD/MM/YYYY
+                year, month, day = fecha_parte.split('-')
+                self.torneo_data['fecha'] = f"{day}/{month}/{year}"
+                # Obtener hora en formato HH:MM
+                self.torneo_data['hora_inicio'] = hora_parte[:5]  # Solo HH:MM
+            except Exception as e:
+                log.warning("torneo.fecha_invalida", torneo_id=torneo.get('idTorneo'), error=e)
+        
+        self.torneo_data['nombre'] = torneo.get('nombre', '')
+        self.torneo_data['Sede'] = torneo.get('sede', '')
+        self.torneo_data['estado'] = torneo.get('estado', 'PENDIENTE')
+        self.torneo_data['administrador'] = torneo.get('administrador')
+        
+        # Parchar en su lugar, sin reconstruir el formulario
+        if sin_editar['nombre']:
+            self.nombre_torneo_input.text = self.torneo_data['nombre'] or ''
+        if sin_editar['Sede']:
+            self.sede_input.text = self.torneo_data['Sede'] or ''
+        if sin_editar['fecha'] and self.torneo_data.get('fecha'):
+            self.date_selector.set_date(self.torneo_data['fecha'])
+        if sin_editar['hora_inicio'] and self.torneo_data.get('hora_inicio'):
+            self.time_start_selector.set_time(self.torneo_data['hora_inicio'])
+        self._seleccion_inicial = (self.date_selector.get_formatted_date(),
+                                   self.time_start_selector.get_formatted_time())
+
+    def on_pre_leave(self, *args):
+        tasks.cancel_owner(self)
 
     def build_ui(self, *args):
         self.clear_widgets()
@@ -447,7 +489,9 @@ class ActualizarTorneoScreen(Screen):
         
         # Espaciador superior
         top_spacer_height = max(dp(20), Window.height * 0.03)
-        main_layout.add_widget(Widget(size_hint_y=None, height=top_spacer_height))
+        top_spacer = Widget(size_hint_y=None, height=top_spacer_height)
+        responsive.track(top_spacer, height=lambda: max(dp(20), Window.height * 0.03))
+        main_layout.add_widget(top_spacer)
 
         # Contenedor del formulario centrado
         form_container = BoxLayout(
@@ -457,16 +501,18 @@ class ActualizarTorneoScreen(Screen):
             spacing=dp(15)
         )
         form_container.bind(minimum_height=form_container.setter('height'))
+        responsive.track(form_container, size_hint_x=ResponsiveHelper.get_form_width)
 
         # Logo responsive
         logo_height = min(dp(120), Window.height * 0.15)
-        logo = Image(
-            source="Imagen5-Photoroom.png",
+        logo = assets.image(
+            "Imagen5-Photoroom.png",
             size_hint=(1, None),
             height=logo_height,
             allow_stretch=True,
             keep_ratio=True
         )
+        responsive.track(logo, height=lambda: min(dp(120), Window.height * 0.15))
         form_container.add_widget(logo)
 
         # Título
@@ -478,6 +524,7 @@ class ActualizarTorneoScreen(Screen):
             size_hint_y=None,
             height=dp(60)
         )
+        responsive.track(titulo, font_size=lambda: ResponsiveHelper.get_font_size(32))
         form_container.add_widget(titulo)
 
         # Espaciador
@@ -500,6 +547,7 @@ class ActualizarTorneoScreen(Screen):
                 height=dp(30),
                 halign='left'
             )
+            responsive.track(label, font_size=lambda: ResponsiveHelper.get_font_size(18))
             label.bind(size=label.setter('text_size'))
             campo_layout.add_widget(label)
             
@@ -538,6 +586,8 @@ class ActualizarTorneoScreen(Screen):
 
         # Selector de hora de término
         self.time_end_selector = TimeSelector(initial_time=self.torneo_data.get('hora_fin'))
+        self._seleccion_inicial = (self.date_selector.get_formatted_date(),
+                                   self.time_start_selector.get_formatted_time())
         hora_termino_layout, _ = crear_campo('Hora de Término', widget=self.time_end_selector)
         form_container.add_widget(hora_termino_layout)
 
@@ -552,6 +602,11 @@ class ActualizarTorneoScreen(Screen):
             height=dp(50) if Window.width > 600 else dp(110),
             padding=[0, dp(20), 0, 0]
         )
+        responsive.track(
+            botones_layout,
+            orientation=lambda: 'horizontal' if Window.width > 600 else 'vertical',
+            height=lambda: dp(50) if Window.width > 600 else dp(110)
+        )
 
         btn_guardar = HoverButton(text='GUARDAR CAMBIOS')
         btn_guardar.bind(on_press=self.guardar_cambios)
@@ -571,11 +626,6 @@ class ActualizarTorneoScreen(Screen):
         scroll_view.add_widget(main_layout)
         self.add_widget(scroll_view)
 
-    def on_window_resize(self, instance, width, height):
-        # Reconstruir la UI en resize para aplicar los ajustes de ResponsiveHelper
-        # usando Clock.schedule_once para evitar problemas de re-entrada/layout
-        Clock.schedule_once(self.build_ui, 0.1)
-
     def update_background(self, instance, value):
         self.background_rect.size = instance.size
         self.background_rect.pos = instance.pos
@@ -749,9 +799,8 @@ class ActualizarTorneoScreen(Screen):
         fecha_iso = f"{fecha_parts[2]}-{fecha_parts[1]}-{fecha_parts[0]}T{hora_inicio_str}:00"
         
         # Obtener el administrador del torneo completo cargado desde el backend
-        administrador = None
-        if self.torneo_completo and 'administrador' in self.torneo_completo:
-            administrador = self.torneo_completo['administrador']
+        # (o de los datos de la lista si la carga aún no termina)
+        administrador = (self.torneo_completo or self.torneo_data).get('administrador')
         
         # Preparar el payload para el backend
         # Según el controller, necesita: fechaHora, sede, estado, administrador
@@ -763,33 +812,44 @@ class ActualizarTorneoScreen(Screen):
             'administrador': administrador  # Objeto completo del administrador
         }
         
-        print(f"[DEBUG] Payload a enviar: {payload}")
+        torneo_id = self.torneo_data.get('idTorneo')
+        if not torneo_id:
+            self.mostrar_mensaje("Error", "No se pudo identificar el ID del torneo")
+            return
         
-        try:
-            torneo_id = self.torneo_data.get('idTorneo')
-            
-            if not torneo_id:
-                self.mostrar_mensaje("Error", "No se pudo identificar el ID del torneo")
-                return
-            
-            print(f"[DEBUG] Actualizando torneo ID: {torneo_id}")
-            
+        # Preparar datos actualizados para la pantalla anterior
+        nuevos_datos = {
+            'nombre': self.nombre_torneo_input.text.strip(),
+            'fecha': fecha_str,
+            'hora_inicio': hora_inicio_str,
+            'hora_fin': self.time_end_selector.get_formatted_time(),
+            'Sede': self.sede_input.text.strip(),
+            'idTorneo': torneo_id,
+            'estado': payload['estado'],
+            'administrador': administrador
+        }
+        
+        original_text = instance.text
+        instance.disabled = True
+        instance.text = "GUARDANDO..."
+        
+        def _task():
+            if payload['administrador'] is None:
+                # La carga inicial no llegó: el backend exige el administrador
+                torneo = api.get_torneo_by_id(torneo_id) or {}
+                payload['administrador'] = torneo.get('administrador')
+                nuevos_datos['administrador'] = payload['administrador']
+            log.debug("torneo.actualizando", torneo_id=torneo_id)
             # Actualizar el torneo en el backend
-            torneo_actualizado = api.update_torneo(torneo_id, payload)
-            
-            print(f"[DEBUG] Torneo actualizado: {torneo_actualizado}")
-            
-            # Preparar datos actualizados para la pantalla anterior
-            nuevos_datos = {
-                'nombre': self.nombre_torneo_input.text.strip(),
-                'fecha': fecha_str,
-                'hora_inicio': hora_inicio_str,
-                'hora_fin': self.time_end_selector.get_formatted_time(),
-                'Sede': self.sede_input.text.strip(),
-                'idTorneo': torneo_id,
-                'estado': payload['estado'],
-                'administrador': administrador
-            }
+            return api.update_torneo(torneo_id, payload)
+        
+        def _reset():
+            instance.disabled = False
+            instance.text = original_text
+        
+        def _ok(torneo_actualizado):
+            _reset()
+            log.info("torneo.actualizado", torneo_id=torneo_id)
             
             # Llamar al callback on_save si existe
             if self.on_save:
@@ -800,15 +860,19 @@ class ActualizarTorneoScreen(Screen):
             
             # Volver a la pantalla anterior después de un breve delay
             Clock.schedule_once(lambda dt: setattr(self.manager, 'current', 'torneos_anteriores'), 1.5)
-            
-        except RuntimeError as e:
-            print(f"[ERROR] RuntimeError: {e}")
-            self.mostrar_mensaje("Error", str(e))
-        except Exception as e:
-            print(f"[ERROR] Exception: {e}")
-            import traceback
-            traceback.print_exc()
-            self.mostrar_mensaje("Error", f"Error al actualizar el torneo: {str(e)}")
+        
+        def _error(e):
+            _reset()
+            if isinstance(e, RuntimeError):
+                log.warning("torneo.actualizar_fallido", torneo_id=torneo_id, error=e)
+                self.mostrar_mensaje("Error", str(e))
+            else:
+                log.error("torneo.actualizar_error", torneo_id=torneo_id, error=e)
+                self.mostrar_mensaje("Error", f"Error al actualizar el torneo: {str(e)}")
+        
+        # La escritura se completa aunque se salga de la pantalla
+        tasks.submit(_task, owner=self, priority=PRIORITY_HIGH, essential=True, name="torneo.update",
+                     on_success=_ok, on_error=_error)
 
     def cancelar(self, instance):
         self.manager.current = 'torneos_anteriores'
\ No newline at end of file
@@ -1,15 +1,47 @@
 import json
+import threading
+import time
 import requests
-from config import API_BASE_URL, DEFAULT_TIMEOUT
+from concurrent.futures import ThreadPoolExecutor
+from config import API_BASE_URL, DEFAULT_TIMEOUT, HTTP_POOL_SIZE
+from response_cache import ResponseCache, CacheEntry
+from single_flight import SingleFlight
+from stall_detector import GuardedAdapter
+from app_logging import get_logger
 from typing import Optional
 
 
+log = get_logger("api_client")
+
+# Una escritura invalida la caché de su recurso y de los que dependen de él
+# (al borrar un torneo también cambian sus combates)
+_INVALIDATES = {
+    "/apiTorneos/": ("/apiTorneos/", "/apiCombates/"),
+    "/apiCombates/": ("/apiCombates/",),
+    "/apiAdministradores/": ("/apiAdministradores/",),
+}
+
+
 class ApiClient:
-    def __init__(self, base_url=API_BASE_URL):
+    def __init__(self, base_url=API_BASE_URL, pool_size=HTTP_POOL_SIZE):
         self.base_url = base_url.rstrip("/")
+        # Una sola sesión con pool keep-alive: evita un handshake TCP por petición;
+        # el adaptador avisa si una petición sale del hilo de la interfaz
         self.session = requests.Session()
+        adapter = GuardedAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self._access_token = None
         self.timeout = DEFAULT_TIMEOUT
+        # None = aún no se sabe si el backend tiene el endpoint /snapshot
+        self._snapshot_bulk = None
+        self._snapshot_executor = None
+        self.cache = ResponseCache()
+        # GETs idénticos en curso al mismo tiempo comparten una sola petición
+        self.flights = SingleFlight()
+        # Escrituras terminadas por recurso (/apiPuntajes/, ...): separan los GETs de antes y después
+        self._write_epochs = {}
+        self._write_lock = threading.Lock()
 
     def _url(self, path: str) -> str:
         return f"{self.base_url}/{path.lstrip('/')}"
@@ -27,12 +59,20 @@ class ApiClient:
         h = {"Accept": "application/json"}
         if headers:
             h.update(headers)
-        return requests.get(
-            self._url(path),
+        url = self._url(path)
+        # Misma URL, parámetros y cabeceras = misma respuesta; el timeout no
+        # forma parte de la clave (los que esperan heredan el del primero).
+        # Las escrituras sí: un GET posterior a un POST/PUT/DELETE en su
+        # recurso (o a una invalidación de la caché) no se une a una petición
+        # que salió antes y traería el dato viejo, p.ej. un conteo de puntos
+        key = (url, json.dumps(params, sort_keys=True, default=str), tuple(sorted(h.items())),
+               self.cache.generation, self._write_epochs.get(self._resource(path), 0))
+        return self.flights.do(key, lambda: self.session.get(
+            url,
             params=params,
             headers=h,
             timeout=timeout or self.timeout,
-        )
+        ))
 
     def put_json(self, path, payload: dict, headers=None, timeout=None):
         h = {
@@ -41,36 +81,151 @@ class ApiClient:
         }
         if headers:
             h.update(headers)
-        return requests.put(
-            self._url(path),
-            data=json.dumps(payload),
-            headers=h,
-            timeout=timeout or self.timeout,
-        )
+        try:
+            return self.session.put(
+                self._url(path),
+                data=json.dumps(payload),
+                headers=h,
+                timeout=timeout or self.timeout,
+            )
+        finally:
+            self._after_write(path)
 
     def post_json(self, path, payload, timeout=None):
         url = f"{self.base_url}{path}"
         h = self.headers().copy()
         h["Content-Type"] = "application/json"
-        return self.session.post(
-            url, 
-            json=payload, 
-            headers=h, 
-            timeout=timeout or self.timeout
-        )
+        try:
+            return self.session.post(
+                url, 
+                json=payload, 
+                headers=h, 
+                timeout=timeout or self.timeout
+            )
+        finally:
+            self._after_write(path)
+
+    def post(self, path, params=None, headers=None, timeout=None):
+        h = {"Accept": "application/json"}
+        if headers:
+            h.update(headers)
+        try:
+            return self.session.post(
+                self._url(path),
+                params=params,
+                headers=h,
+                timeout=timeout or self.timeout
+            )
+        finally:
+            self._after_write(path)
 
     def delete(self, path, headers=None, timeout=None):
         h = {"Accept": "application/json"}
         if headers:
             h.update(headers)
-        return requests.delete(
-            self._url(path),
-            headers=h,
-            timeout=timeout or self.timeout
-        )
+        try:
+            return self.session.delete(
+                self._url(path),
+                headers=h,
+                timeout=timeout or self.timeout
+            )
+        finally:
+            self._after_write(path)
+
+    # ============ CACHÉ DE RESPUESTAS ============
+
+    @staticmethod
+    def _resource(path):
+        return "/" + path.lstrip("/").split("/", 1)[0] + "/"
+
+    def _after_write(self, path):
+        """Invalida lo que pudo cambiar con un POST/PUT/DELETE en `path`."""
+        resource = self._resource(path)
+        with self._write_lock:
+            self._write_epochs[resource] = self._write_epochs.get(resource, 0) + 1
+        scope = _INVALIDATES.get(resource)
+        if scope:
+            self.cache.invalidate(*scope)
+
+    def _cached_get(self, path, empty, not_found=None, timeout=None, on_update=None, owner=None):
+        """
+        GET con caché (response_cache.py):
+
+        - Entrada fresca: se devuelve sin tocar la red.
+        - Entrada vencida y `on_update`: se devuelve al instante y se
+          revalida en segundo plano; si el servidor trae otra versión,
+          `on_update(datos)` se llama en el hilo principal (las tareas de
+          `owner` se cancelan al salir de la pantalla).
+        - Entrada vencida sin `on_update`: petición condicional; con 304 se
+          reutiliza el cuerpo guardado.
+        """
+        key = "/" + path.lstrip("/")
+        entry, fresh = self.cache.lookup(key)
+        if fresh:
+            return entry.decode(empty)
+        if entry is not None and on_update is not None:
+            self._revalidate_async(key, entry, empty, not_found, timeout, on_update, owner)
+            return entry.decode(empty)
+        entry = self._conditional_get(key, entry, not_found, timeout)[0]
+        return entry.decode(empty)
+
+    def _conditional_get(self, key, entry, not_found, timeout):
+        """GET con If-None-Match/If-Modified-Since. Retorna (entrada, cambió)."""
+        since = self.cache.generation
+        r = self.get_json(key, headers=entry.validators() if entry else None, timeout=timeout)
+        if r.status_code == 304 and entry is not None:
+            self.cache.refresh(key, since)
+            return entry, False
+        if r.status_code == 404:
+            self.cache.discard(key)
+            if not_found:
+                raise RuntimeError(not_found)
+        r.raise_for_status()
+        etag, last_modified = r.headers.get("ETag"), r.headers.get("Last-Modified")
+        self.cache.put(key, r.content, etag, last_modified, since=since)
+        changed = entry is None or r.content != entry.body
+        return CacheEntry(r.content, etag, last_modified, 0, 0), changed
+
+    def _revalidate_async(self, key, entry, empty, not_found, timeout, on_update, owner):
+        # Importación diferida: el cliente HTTP no depende de Kivy
+        from task_executor import tasks, PRIORITY_LOW
+
+        def revalidate():
+            self.cache.revalidating()
+            fresh, changed = self._conditional_get(key, entry, not_found, timeout)
+            return fresh.decode(empty) if changed else None
+
+        def deliver(data):
+            if data is not None:
+                on_update(data)
+
+        tasks.submit(revalidate, owner=owner, priority=PRIORITY_LOW, name="cache.revalidate",
+                     on_success=deliver,
+                     on_error=lambda e: log.warning("cache.revalidacion_fallida", path=key, error=e))
+
+    def invalidate_cache(self, *prefixes):
+        """Invalida a mano (sin prefijos: toda la caché)."""
+        if prefixes:
+            self.cache.invalidate(*prefixes)
+        else:
+            self.cache.clear()
+
+    def cache_stats(self) -> dict:
+        return self.cache.stats()
+
+    def flight_stats(self) -> dict:
+        """GETs colapsados por SingleFlight (`collapsed` = peticiones ahorradas)."""
+        return self.flights.stats()
+
+    @staticmethod
+    def _idempotency(key: Optional[str]):
+        """Cabecera Idempotency-Key para que un reintento no duplique la operación."""
+        return {"Idempotency-Key": key} if key else None
 
     def clear_token(self):
         self._access_token = None
+        # Otra sesión no debe ver datos cacheados de la anterior
+        self.cache.clear()
 
     def post_logout(self, path="/api/auth/admin/logout", timeout=6):
         url = f"{self.base_url}{path}"
@@ -99,25 +254,22 @@ class ApiClient:
         r.raise_for_status()
         return r.text or "OK"
 
-    def get_all_combates(self, timeout=None) -> list:
+    def get_all_combates(self, timeout=None, on_update=None, owner=None) -> list:
         """
         GET /apiCombates/combates
-        Devuelve la lista de todos los combates.
+        Devuelve la lista de todos los combates (con caché, ver _cached_get).
         """
-        r = self.get_json("/apiCombates/combates", timeout=timeout)
-        r.raise_for_status()
-        return r.json() if r.content else []
+        return self._cached_get("/apiCombates/combates", [], timeout=timeout,
+                                on_update=on_update, owner=owner)
 
-    def get_combate_by_id(self, combate_id: int, timeout=None) -> dict:
+    def get_combate_by_id(self, combate_id: int, timeout=None, on_update=None, owner=None) -> dict:
         """
         GET /apiCombates/combate/{id}
-        Devuelve un combate específico por su ID.
+        Devuelve un combate específico por su ID (con caché, ver _cached_get).
         """
-        r = self.get_json(f"/apiCombates/combate/{combate_id}", timeout=timeout)
-        if r.status_code == 404:
-            raise RuntimeError(f"Combate {combate_id} no encontrado.")
-        r.raise_for_status()
-        return r.json() if r.content else {}
+        return self._cached_get(f"/apiCombates/combate/{combate_id}", {},
+                                not_found=f"Combate {combate_id} no encontrado.",
+                                timeout=timeout, on_update=on_update, owner=owner)
 
     def get_combates_by_area(self, nombre_area: str, timeout=None) -> list:
         """
@@ -161,44 +313,35 @@ class ApiClient:
         r.raise_for_status()
         return r.status_code in (200, 204)
     
-    def get_combates_by_torneo(self, torneo_id: int, timeout=None) -> list:
+    def get_combates_by_torneo(self, torneo_id: int, timeout=None, on_update=None, owner=None) -> list:
         """
         GET /apiCombates/combates/torneo/{idTorneo}
-        Devuelve combates de un torneo específico.
+        Devuelve combates de un torneo específico (con caché, ver _cached_get).
         """
-        r = self.get_json(f"/apiCombates/combates/torneo/{torneo_id}", timeout=timeout)
-        r.raise_for_status()
-        return r.json() if r.content else []
+        return self._cached_get(f"/apiCombates/combates/torneo/{torneo_id}", [], timeout=timeout,
+                                on_update=on_update, owner=owner)
     
     # ============ ENDPOINTS DE TORNEOS ============
     
-    def get_all_torneos(self, timeout=None) -> list:
+    def get_all_torneos(self, timeout=None, on_update=None, owner=None) -> list:
         """
         GET /apiTorneos/torneo
-        Devuelve la lista de todos los torneos.
+        Devuelve la lista de todos los torneos (con caché, ver _cached_get).
         """
-        r = self.get_json("/apiTorneos/torneo", timeout=timeout)
-        r.raise_for_status()
-        return r.json() if r.content else []
+        return self._cached_get("/apiTorneos/torneo", [], timeout=timeout,
+                                on_update=on_update, owner=owner)
 
-    def get_torneo_by_id(self, torneo_id: int, timeout=None) -> dict:
+    def get_torneo_by_id(self, torneo_id: int, timeout=None, on_update=None, owner=None) -> dict:
         """
         GET /apiTorneos/torneo/{id}
-        Devuelve un torneo específico por su ID.
+        Devuelve un torneo específico por su ID (con caché, ver _cached_get).
         """
-        print(f"[DEBUG API] Obteniendo torneo {torneo_id}")
-        
-        r = self.get_json(f"/apiTorneos/torneo/{torneo_id}", timeout=timeout)
+        log.debug("torneo.obtener", id=torneo_id)
         
-        print(f"[DEBUG API] Status code: {r.status_code}")
-        
-        if r.status_code == 404:
-            raise RuntimeError(f"Torneo {torneo_id} no encontrado.")
-        
-        r.raise_for_status()
-        
-        result = r.json() if r.content else {}
-        print(f"[DEBUG API] Torneo obtenido: {result}")
+        result = self._cached_get(f"/apiTorneos/torneo/{torneo_id}", {},
+                                  not_found=f"Torneo {torneo_id} no encontrado.",
+                                  timeout=timeout, on_update=on_update, owner=owner)
+        log.debug("torneo.obtenido", id=torneo_id, data=result)
         
         return result
 
@@ -217,22 +360,18 @@ class ApiClient:
         PUT /apiTorneos/torneo/{id}
         Actualiza un torneo existente.
         """
-        print(f"[DEBUG API] Actualizando torneo {torneo_id} con payload: {payload}")
+        log.debug("torneo.actualizar", id=torneo_id, campos=sorted(payload))
         
         r = self.put_json(f"/apiTorneos/torneo/{torneo_id}", payload, timeout=timeout)
         
-        print(f"[DEBUG API] Status code: {r.status_code}")
-        print(f"[DEBUG API] Response text: {r.text}")
+        log.debug("torneo.actualizar.respuesta", id=torneo_id, status=r.status_code, bytes=len(r.content))
         
         if r.status_code == 404:
             raise RuntimeError(f"Torneo {torneo_id} no encontrado.")
         
         r.raise_for_status()
         
-        result = r.json() if r.content else {}
-        print(f"[DEBUG API] Response JSON: {result}")
-        
-        return result
+        return r.json() if r.content else {}
 
     def delete_torneo(self, torneo_id: int, timeout=None) -> bool:
         """
@@ -325,9 +464,191 @@ class ApiClient:
             data = r.json() if r.content else {}
             return int(data.get('count', 0))
         except Exception as e:
-            print(f"[ApiClient] Error al obtener puntaje para alumno {alumno_id}: {e}")
+            log.warning("puntaje.conteo_fallido", alumno_id=alumno_id, error=e)
             return 0
+
+    def add_puntaje_simple(self, combate_id: int, alumno_id: int, valor_puntaje: int = 1,
+                           idempotency_key: Optional[str] = None, timeout=None) -> dict:
+        """
+        POST /apiPuntajes/puntaje/simple?combateId=..&alumnoId=..&valorPuntaje=..
+        Registra un punto para el alumno en el combate.
+        Retorna: {"newCount": N, ...}
+        """
+        params = {
+            "combateId": combate_id,
+            "alumnoId": alumno_id,
+            "valorPuntaje": valor_puntaje,
+        }
+        r = self.post("/apiPuntajes/puntaje/simple", params=params,
+                      headers=self._idempotency(idempotency_key), timeout=timeout)
+        r.raise_for_status()
+        return r.json() if r.content else {}
+
+    def delete_ultimo_puntaje(self, alumno_id: int, idempotency_key: Optional[str] = None, timeout=None) -> dict:
+        """
+        DELETE /apiPuntajes/puntaje/alumno/{alumnoId}/last
+        Elimina el último punto del alumno.
+        Retorna: {"newCount": N} o {} si el servidor responde 204.
+        """
+        r = self.delete(f"/apiPuntajes/puntaje/alumno/{alumno_id}/last",
+                        headers=self._idempotency(idempotency_key), timeout=timeout)
+        r.raise_for_status()
+        return r.json() if r.content else {}
+
+    def get_puntaje_count_strict(self, alumno_id: int, timeout=None) -> int:
+        """
+        GET /apiPuntajes/puntaje/alumno/{alumnoId}/count
+        Igual que get_puntaje_count pero propaga los errores en lugar de devolver 0.
+        """
+        r = self.get_json(f"/apiPuntajes/puntaje/alumno/{alumno_id}/count", timeout=timeout)
+        r.raise_for_status()
+        data = r.json() if r.content else {}
+        return int(data.get('count', 0))
+
+    # ============ ENDPOINTS DE GAM-JEOM ============
+
+    def add_falta_simple(self, combate_id: int, alumno_id: int, idempotency_key: Optional[str] = None,
+                         timeout=None) -> dict:
+        """
+        POST /apiGamJeom/falta/simple?combateId=..&alumnoId=..
+        Registra una falta GAM-JEOM.
+        Retorna: {"totalFaltas": N, "descalificado": bool, ...}
+        """
+        params = {"combateId": combate_id, "alumnoId": alumno_id}
+        r = self.post("/apiGamJeom/falta/simple", params=params,
+                      headers=self._idempotency(idempotency_key), timeout=timeout)
+        r.raise_for_status()
+        return r.json() if r.content else {}
+
+    def delete_ultima_falta(self, alumno_id: int, combate_id: int, idempotency_key: Optional[str] = None,
+                            timeout=None) -> dict:
+        """
+        DELETE /apiGamJeom/falta/alumno/{alumnoId}/combate/{combateId}/last
+        Elimina la última falta del alumno en el combate.
+        Retorna: {"newCount": N}
+        """
+        r = self.delete(f"/apiGamJeom/falta/alumno/{alumno_id}/combate/{combate_id}/last",
+                        headers=self._idempotency(idempotency_key), timeout=timeout)
+        r.raise_for_status()
+        return r.json() if r.content else {}
+
+    def get_falta_count(self, alumno_id: int, combate_id: int, timeout=None) -> int:
+        """
+        GET /apiGamJeom/falta/alumno/{alumnoId}/combate/{combateId}/count
+        Devuelve el número de faltas del alumno en el combate.
+        """
+        r = self.get_json(f"/apiGamJeom/falta/alumno/{alumno_id}/combate/{combate_id}/count", timeout=timeout)
+        r.raise_for_status()
+        data = r.json() if r.content else {}
+        return int(data.get('count', 0))
     
+    # ============ SNAPSHOT DEL COMBATE ============
+
+    def get_combate_snapshot(self, combate_id: int, id_alumno_rojo: Optional[int] = None,
+                             id_alumno_azul: Optional[int] = None, timeout=None) -> dict:
+        """
+        Estado completo del combate para hidratar un tablero:
+
+            {"combateId", "estado", "roundActual", "numeroRounds",
+             "rojo": {"alumnoId", "puntaje", "faltas"},
+             "azul": {"alumnoId", "puntaje", "faltas"},
+             "source": "bulk" | "concurrent", "elapsed_ms"}
+
+        Intenta GET /apiCombates/combate/{id}/snapshot (una sola petición).
+        Si el backend no lo tiene se recuerda y, desde entonces, se piden
+        combate, puntajes y faltas en paralelo sobre la misma sesión
+        keep-alive. Un conteo que falla queda en None.
+
+        405/501 significan que no hay endpoint. Un 404 puede ser solo que
+        ese combate no existe: se usa el camino paralelo para esta llamada
+        y el endpoint se descarta únicamente si el combate sí se encontró.
+        """
+        start = time.perf_counter()
+        snapshot = None
+        not_found = False
+        if self._snapshot_bulk is not False:
+            r = self.get_json(f"/apiCombates/combate/{combate_id}/snapshot", timeout=timeout)
+            if r.status_code in (405, 501):
+                self._snapshot_bulk = False
+            elif r.status_code == 404:
+                not_found = True
+            else:
+                r.raise_for_status()
+                self._snapshot_bulk = True
+                snapshot = self._normalize_snapshot(combate_id, r.json() if r.content else {},
+                                                    id_alumno_rojo, id_alumno_azul)
+                snapshot["source"] = "bulk"
+        if snapshot is None:
+            snapshot, found = self._snapshot_concurrent(combate_id, id_alumno_rojo, id_alumno_azul, timeout)
+            snapshot["source"] = "concurrent"
+            if not_found and found:
+                # El combate existe pero /snapshot no: el backend no tiene la ruta
+                self._snapshot_bulk = False
+        snapshot["elapsed_ms"] = round((time.perf_counter() - start) * 1000.0, 2)
+        return snapshot
+
+    @staticmethod
+    def _normalize_snapshot(combate_id, data: dict, id_rojo=None, id_azul=None) -> dict:
+        def side(key, alt_id):
+            s = data.get(key) or {}
+            return {
+                "alumnoId": s.get("alumnoId", s.get("id", alt_id)),
+                "puntaje": s.get("puntaje"),
+                "faltas": s.get("faltas"),
+            }
+        return {
+            "combateId": data.get("combateId", data.get("idCombate", combate_id)),
+            "estado": data.get("estado"),
+            "roundActual": data.get("roundActual"),
+            "numeroRounds": data.get("numeroRounds", data.get("numeroRound")),
+            "rojo": side("rojo", id_rojo),
+            "azul": side("azul", id_azul),
+        }
+
+    def _snapshot_concurrent(self, combate_id, id_rojo, id_azul, timeout) -> tuple:
+        """Snapshot armado con peticiones en paralelo. Retorna (snapshot, se encontró el combate)."""
+        if self._snapshot_executor is None:
+            self._snapshot_executor = ThreadPoolExecutor(max_workers=5, thread_name_prefix="snapshot")
+        pool = self._snapshot_executor
+
+        def combate():
+            r = self.get_json(f"/apiCombates/combate/{combate_id}", timeout=timeout)
+            r.raise_for_status()
+            return r.json() if r.content else {}
+
+        combate_future = pool.submit(combate)
+        if not id_rojo or not id_azul:
+            # Sin IDs no se pueden pedir los conteos: primero el combate
+            data = combate_future.result()
+            id_rojo = id_rojo or (data.get("competidorRojo") or {}).get("id")
+            id_azul = id_azul or (data.get("competidorAzul") or {}).get("id")
+
+        def count(fn, *args):
+            if not args[0]:
+                return None
+            try:
+                return fn(*args, timeout=timeout)
+            except Exception as e:
+                log.warning("snapshot.conteo_fallido", combate_id=combate_id, fn=fn.__name__, args=args, error=e)
+                return None
+
+        futures = {
+            ("rojo", "puntaje"): pool.submit(count, self.get_puntaje_count_strict, id_rojo),
+            ("rojo", "faltas"): pool.submit(count, self.get_falta_count, id_rojo, combate_id),
+            ("azul", "puntaje"): pool.submit(count, self.get_puntaje_count_strict, id_azul),
+            ("azul", "faltas"): pool.submit(count, self.get_falta_count, id_azul, combate_id),
+        }
+        try:
+            data = combate_future.result()
+        except Exception as e:
+            log.warning("snapshot.combate_fallido", combate_id=combate_id, error=e)
+            data = {}
+
+        snapshot = self._normalize_snapshot(combate_id, data, id_rojo, id_azul)
+        for (lado, campo), future in futures.items():
+            snapshot[lado][campo] = future.result()
+        return snapshot, bool(data)
+
     # Agregar estos métodos a la clase ApiClient en api_client.py
 
     # ============ ENDPOINTS DE ADMINISTRADOR ============
@@ -341,24 +662,17 @@ class ApiClient:
         r.raise_for_status()
         return r.json() if r.content else []
 
-    def get_administrador_by_id(self, admin_id: int, timeout=None) -> dict:
+    def get_administrador_by_id(self, admin_id: int, timeout=None, on_update=None, owner=None) -> dict:
         """
         GET /apiAdministradores/administrador/{id}
-        Devuelve un administrador específico por su ID.
+        Devuelve un administrador específico por su ID (con caché, ver _cached_get).
         """
-        print(f"[DEBUG API] Obteniendo administrador {admin_id}")
-        
-        r = self.get_json(f"/apiAdministradores/administrador/{admin_id}", timeout=timeout)
-        
-        print(f"[DEBUG API] Status code: {r.status_code}")
-        
-        if r.status_code == 404:
-            raise RuntimeError(f"Administrador {admin_id} no encontrado.")
-        
-        r.raise_for_status()
+        log.debug("administrador.obtener", id=admin_id)
         
-        result = r.json() if r.content else {}
-        print(f"[DEBUG API] Administrador obtenido: {result}")
+        result = self._cached_get(f"/apiAdministradores/administrador/{admin_id}", {},
+                                  not_found=f"Administrador {admin_id} no encontrado.",
+                                  timeout=timeout, on_update=on_update, owner=owner)
+        log.debug("administrador.obtenido", id=admin_id)
         
         return result
 
@@ -376,22 +690,19 @@ class ApiClient:
         PUT /apiAdministradores/administrador/{id}
         Actualiza un administrador existente.
         """
-        print(f"[DEBUG API] Actualizando administrador {admin_id} con payload: {payload}")
+        # Solo los nombres de los campos: el payload puede traer la contraseña
+        log.debug("administrador.actualizar", id=admin_id, campos=sorted(payload))
         
         r = self.put_json(f"/apiAdministradores/administrador/{admin_id}", payload, timeout=timeout)
         
-        print(f"[DEBUG API] Status code: {r.status_code}")
-        print(f"[DEBUG API] Response text: {r.text}")
+        log.debug("administrador.actualizar.respuesta", id=admin_id, status=r.status_code, bytes=len(r.content))
         
         if r.status_code == 404:
             raise RuntimeError(f"Administrador {admin_id} no encontrado.")
         
         r.raise_for_status()
         
-        result = r.json() if r.content else {}
-        print(f"[DEBUG API] Response JSON: {result}")
-        
-        return result
+        return r.json() if r.content else {}
 
     def delete_administrador(self, admin_id: int, timeout=None) -> bool:
         """
@@ -424,19 +735,6 @@ class ApiClient:
         Cierra sesión del administrador.
         """
         return self.post_logout("/api/auth/admin/logout", timeout=timeout)
-    
-    def get_combate_by_id(self, combate_id):
-        """
-        Obtiene los datos completos de un combate por su ID
-        GET /apiCombates/combate/{id}
-        """
-        url = f"{self.base_url}/apiCombates/combate/{combate_id}"
-        try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            raise RuntimeError(f"Error al obtener combate: {str(e)}")
 
 # Instancia global del cliente
 api = ApiClient()
\ No newline at end of file
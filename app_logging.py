@@ -0,0 +1,170 @@
+import atexit
+import itertools
+import logging
+import queue
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+from config import LOG_LEVEL, LOG_LEVELS, LOG_DEBUG_SAMPLE, LOG_QUEUE_SIZE, LOG_MAX_FIELD_CHARS
+
+_OFF = logging.CRITICAL + 10
+
+
+def _parse_level(value) -> int:
+    if isinstance(value, int):
+        return value
+    return _OFF if str(value).upper() == "OFF" else logging.getLevelName(str(value).upper())
+
+
+def _short(value) -> str:
+    text = value if isinstance(value, str) else repr(value)
+    if len(text) > LOG_MAX_FIELD_CHARS:
+        return f"{text[:LOG_MAX_FIELD_CHARS]}…(+{len(text) - LOG_MAX_FIELD_CHARS})"
+    return text
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Encola el record tal cual: el mensaje se arma en el hilo escritor, no en el que registra."""
+
+    def __init__(self, q):
+        super().__init__(q)
+        self.dropped = 0
+
+    def prepare(self, record):
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # Nunca bloquear al que registra (p.ej. el hilo de Kivy)
+            self.dropped += 1
+
+
+class StructuredFormatter(logging.Formatter):
+    """`HH:MM:SS.mmm NIVEL [modulo] evento clave=valor ...` con valores recortados."""
+
+    def format(self, record):
+        line = (f"{self.formatTime(record, '%H:%M:%S')}.{int(record.msecs):03d} "
+                f"{record.levelname:<7} [{record.name}] {record.getMessage()}")
+        fields = getattr(record, "fields", None)
+        if fields:
+            line += " " + " ".join(f"{key}={_short(value)}" for key, value in fields.items())
+        if record.exc_info:
+            line += "\n" + self.formatException(record.exc_info)
+        return line
+
+
+class _CountingHandler(logging.StreamHandler):
+    def __init__(self, stream=None):
+        super().__init__(stream)
+        self.written = 0
+
+    def emit(self, record):
+        super().emit(record)
+        self.written += 1
+
+
+class StructuredLogger:
+    """
+    Logger por módulo: `log.info("torneo.actualizado", id=torneo_id, status=r.status_code)`.
+
+    Desactivado (nivel por encima del mensaje) cuesta una llamada a
+    `isEnabledFor`; los campos no se formatean. Activo, el record va a
+    una cola y lo escribe el hilo de `QueueListener`. Los mensajes DEBUG
+    de los módulos en LOG_DEBUG_SAMPLE se muestrean (1 de cada N).
+    Los campos se convierten a texto en el hilo escritor: pasar valores
+    que no se vayan a modificar después (o una copia).
+    """
+
+    __slots__ = ("_logger", "_every", "_counter")
+
+    def __init__(self, logger, sample_every=1):
+        self._logger = logger
+        self._every = max(1, int(sample_every))
+        self._counter = itertools.count()
+
+    @property
+    def name(self):
+        return self._logger.name
+
+    def isEnabledFor(self, level) -> bool:
+        return self._logger.isEnabledFor(level)
+
+    def debug(self, event, **fields):
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            return
+        if self._every > 1 and next(self._counter) % self._every:
+            return
+        self._logger.debug(event, extra={"fields": fields})
+
+    def info(self, event, **fields):
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(event, extra={"fields": fields})
+
+    def warning(self, event, **fields):
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._logger.warning(event, extra={"fields": fields})
+
+    def error(self, event, **fields):
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._logger.error(event, extra={"fields": fields})
+
+    def exception(self, event, exc=None, **fields):
+        """Como error(), con la traza de `exc` (por defecto, la que se está manejando)."""
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._logger.error(event, exc_info=exc if exc is not None else True, extra={"fields": fields})
+
+
+_lock = threading.Lock()
+_loggers = {}
+_queue = queue.Queue(LOG_QUEUE_SIZE)
+_queue_handler = _DeferredQueueHandler(_queue)
+_stream_handler = _CountingHandler(sys.stdout)
+_stream_handler.setFormatter(StructuredFormatter())
+_listener = None
+
+
+def _ensure_listener():
+    global _listener
+    if _listener is None:
+        _listener = QueueListener(_queue, _stream_handler, respect_handler_level=False)
+        _listener.start()
+        atexit.register(shutdown)
+
+
+def get_logger(name) -> StructuredLogger:
+    """Logger estructurado de `name` (nivel y muestreo desde config.py)."""
+    with _lock:
+        logger = _loggers.get(name)
+        if logger is None:
+            base = logging.getLogger(name)
+            base.propagate = False
+            base.setLevel(_parse_level(LOG_LEVELS.get(name, LOG_LEVEL)))
+            base.addHandler(_queue_handler)
+            logger = _loggers[name] = StructuredLogger(base, LOG_DEBUG_SAMPLE.get(name, 1))
+            _ensure_listener()
+        return logger
+
+
+def set_level(name, level):
+    """Cambia el nivel de un módulo en caliente ("DEBUG", "INFO", ..., "OFF")."""
+    get_logger(name)._logger.setLevel(_parse_level(level))
+
+
+def shutdown():
+    """Escribe lo que quede en la cola y detiene el hilo escritor."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def stats() -> dict:
+    return {
+        "loggers": len(_loggers),
+        "queued": _queue.qsize(),
+        "written": _stream_handler.written,
+        "dropped": _queue_handler.dropped,
+    }
@@ -0,0 +1,308 @@
+import hashlib
+import io
+import math
+import os
+import time
+import weakref
+from collections import OrderedDict
+
+from kivy.clock import Clock
+from kivy.core.image import ImageLoader
+from kivy.graphics.texture import Texture
+from kivy.resources import resource_find
+from kivy.uix.image import Image
+
+from config import ASSET_CACHE_DIR, ASSET_SIZE_STEP, ASSET_MAX_SIDE, ASSET_TEXTURE_BUDGET_MB
+from metrics import LatencyStats
+from task_executor import tasks
+from app_logging import get_logger
+
+log = get_logger("assets")
+
+try:
+    from PIL import Image as PILImage
+    PIL_AVAILABLE = True
+except ImportError:
+    PILImage = None
+    PIL_AVAILABLE = False
+    log.warning("Pillow no instalado: imágenes sin reducir ni caché en disco")
+
+
+def _bucket(size, step=ASSET_SIZE_STEP, max_side=ASSET_MAX_SIDE) -> int:
+    """Lado (px) de la versión reducida para un widget de `size`: múltiplo de `step`."""
+    longest = max(1, int(math.ceil(max(size))))
+    return min(max_side, int(math.ceil(longest / step)) * step)
+
+
+class _Decoded:
+    """Resultado de decodificar en un hilo (sin objetos de GL)."""
+
+    __slots__ = ("digest", "size", "pixels", "core", "decode_ms", "from_disk", "source_side")
+
+    def __init__(self, digest, size, pixels=None, core=None, decode_ms=0.0, from_disk=False, source_side=0):
+        self.digest = digest
+        self.size = size
+        self.pixels = pixels
+        self.core = core
+        self.decode_ms = decode_ms
+        self.from_disk = from_disk
+        self.source_side = source_side
+
+
+class AssetService:
+    """
+    Imágenes de las pantallas decodificadas fuera del hilo principal.
+
+    Antes `Image(source="p1-Photoroom.png")` decodificaba el PNG completo
+    (~850 KB, resolución original) en el hilo de la interfaz al construir
+    la pantalla. Ahora:
+
+        logo = assets.image("Imagen5-Photoroom.png", size_hint=(1, None), fit_mode="contain")
+
+    crea el Image vacío y, cuando está en la ventana, pide al pool de
+    tareas la versión reducida al tamaño del widget (lado redondeado hacia
+    arriba a ASSET_SIZE_STEP). Con Pillow, la versión reducida se guarda en
+    ASSET_CACHE_DIR con nombre `<sha1 del archivo>_<lado>.png`, así el
+    siguiente arranque no vuelve a leer el original.
+
+    La textura se crea en el hilo principal y se comparte: todos los
+    widgets con el mismo archivo (por contenido) y el mismo lado usan la
+    misma. Si la memoria de texturas supera ASSET_TEXTURE_BUDGET_MB, se
+    liberan las menos usadas cuyos widgets no están en la ventana; esos
+    widgets la vuelven a pedir al mostrarse su pantalla (`watch_manager`).
+    """
+
+    def __init__(self, cache_dir=ASSET_CACHE_DIR, budget_mb=ASSET_TEXTURE_BUDGET_MB):
+        self.cache_dir = cache_dir
+        self.budget_bytes = int(budget_mb * 1024 * 1024)
+        self._textures = OrderedDict()   # (digest, lado) -> [texture, bytes, WeakSet de widgets]
+        self._aliases = {}               # (ruta, lado) -> (digest, lado)
+        self._source_sides = {}          # ruta -> lado mayor del original
+        self._widgets = {}               # id(widget) -> [weakref, ruta, clave actual, opacidad]
+        self._inflight = {}              # (ruta, lado) -> ids de widgets esperando
+        self._pending = set()
+        self._flush_trigger = Clock.create_trigger(self.flush_pending, 0)
+        self.texture_bytes = 0
+        # Métricas
+        self.decode = LatencyStats()
+        self.upload = LatencyStats()
+        self.requests = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.decodes = 0
+        self.evictions = 0
+        self.errors = 0
+
+    # ============ API PÚBLICA ============
+
+    def image(self, source, **kwargs) -> Image:
+        """Image de Kivy cuya textura llega de este servicio (mismos kwargs, sin `source`)."""
+        return self.bind(Image(**kwargs), source)
+
+    def bind(self, widget, source):
+        """Asigna a `widget.texture` la versión de `source` adecuada a su tamaño."""
+        path = resource_find(source) or source
+        key = id(widget)
+        entry = self._widgets.get(key)
+        if entry is None or entry[0]() is not widget:
+            ref = weakref.ref(widget, lambda r, key=key: self._forget(key, r))
+            entry = self._widgets[key] = [ref, path, None, widget.opacity]
+            widget.bind(size=self._on_size)
+        elif entry[1] != path:
+            entry[1] = path
+            entry[2] = None
+        if widget.texture is None:
+            # Sin textura el Image dibuja un rectángulo blanco
+            widget.opacity = 0
+        self._pending.add(key)
+        self._flush_trigger()
+        return widget
+
+    def watch_manager(self, manager):
+        """Al cambiar de pantalla, carga las imágenes pendientes de la que se muestra."""
+        manager.bind(current=lambda *args: self._flush_trigger())
+
+    def flush_pending(self, *args):
+        for key in list(self._pending):
+            entry = self._widgets.get(key)
+            widget = entry[0]() if entry is not None else None
+            if widget is None:
+                self._pending.discard(key)
+            elif widget.get_root_window() is not None:
+                self._pending.discard(key)
+                self._request(widget, entry)
+
+    def stats(self) -> dict:
+        return {
+            "backend": "pillow" if PIL_AVAILABLE else "kivy",
+            "textures": len(self._textures),
+            "texture_mb": round(self.texture_bytes / (1024 * 1024), 2),
+            "budget_mb": round(self.budget_bytes / (1024 * 1024), 2),
+            "widgets": len(self._widgets),
+            "pending": len(self._pending),
+            "inflight": len(self._inflight),
+            "requests": self.requests,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "decodes": self.decodes,
+            "evictions": self.evictions,
+            "errors": self.errors,
+            "decode": self.decode.snapshot(),
+            "upload": self.upload.snapshot(),
+        }
+
+    # ============ INTERNOS ============
+
+    def _on_size(self, widget, size):
+        key = id(widget)
+        if key in self._widgets:
+            self._pending.add(key)
+            self._flush_trigger()
+
+    def _forget(self, key, ref):
+        entry = self._widgets.get(key)
+        if entry is not None and entry[0] is ref:
+            del self._widgets[key]
+            self._pending.discard(key)
+
+    def _side_for(self, widget, path) -> int:
+        side = _bucket(widget.size)
+        source_side = self._source_sides.get(path)
+        if source_side:
+            side = min(side, _bucket((source_side, source_side)))
+        return side
+
+    def _request(self, widget, entry):
+        path = entry[1]
+        side = self._side_for(widget, path)
+        current = entry[2]
+        if current is not None and current in self._textures and current[1] >= side:
+            # Ya tiene una versión igual o mayor: achicar no vuelve a decodificar
+            self._textures.move_to_end(current)
+            return
+        self.requests += 1
+        alias = self._aliases.get((path, side))
+        if alias is not None and alias in self._textures:
+            self.memory_hits += 1
+            self._assign(widget, entry, alias)
+            return
+        waiting = self._inflight.get((path, side))
+        if waiting is not None:
+            waiting.add(id(widget))
+            return
+        self._inflight[(path, side)] = {id(widget)}
+        tasks.submit(
+            self._decode, path, side,
+            name="assets.decode",
+            on_success=lambda result, path=path, side=side: self._on_decoded(path, side, result),
+            on_error=lambda exc, path=path, side=side: self._on_failed(path, side, exc),
+        )
+
+    def _decode(self, path, side) -> _Decoded:
+        """Corre en un hilo del pool: lee, reduce y guarda en disco; no toca GL."""
+        start = time.perf_counter()
+        with open(path, "rb") as f:
+            raw = f.read()
+        digest = hashlib.sha1(raw).hexdigest()
+        if not PIL_AVAILABLE:
+            # Mismo camino que kivy.loader: decodifica sin crear la textura
+            core = ImageLoader.load(path, keep_data=True, nocache=True)
+            width, height = core.size
+            return _Decoded(digest, (width, height), core=core, source_side=max(width, height),
+                            decode_ms=(time.perf_counter() - start) * 1000.0)
+
+        cached = os.path.join(self.cache_dir, f"{digest}_{side}.png")
+        from_disk = os.path.exists(cached)
+        source_side = 0
+        if from_disk:
+            img = PILImage.open(cached)
+        else:
+            img = PILImage.open(io.BytesIO(raw))
+            source_side = max(img.size)
+            img = img.convert("RGBA")
+            img.thumbnail((side, side), PILImage.LANCZOS)
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                tmp = f"{cached}.{os.getpid()}.tmp"
+                img.save(tmp, format="PNG")
+                os.replace(tmp, cached)
+            except OSError as e:
+                log.warning("cache.no_guardada", archivo=cached, error=e)
+        img = img.convert("RGBA").transpose(PILImage.FLIP_TOP_BOTTOM)
+        return _Decoded(digest, img.size, pixels=img.tobytes(), from_disk=from_disk, source_side=source_side,
+                        decode_ms=(time.perf_counter() - start) * 1000.0)
+
+    def _on_decoded(self, path, side, result):
+        waiting = self._inflight.pop((path, side), set())
+        self.decode.record(result.decode_ms)
+        if result.from_disk:
+            self.disk_hits += 1
+        else:
+            self.decodes += 1
+        if result.source_side:
+            self._source_sides[path] = result.source_side
+
+        tex_key = (result.digest, side)
+        self._aliases[(path, side)] = tex_key
+        if tex_key not in self._textures:
+            start = time.perf_counter()
+            if result.core is not None:
+                texture = result.core.texture
+            else:
+                texture = Texture.create(size=result.size, colorfmt="rgba")
+                texture.blit_buffer(result.pixels, colorfmt="rgba", bufferfmt="ubyte")
+            self.upload.record((time.perf_counter() - start) * 1000.0)
+            nbytes = texture.width * texture.height * 4
+            self._textures[tex_key] = [texture, nbytes, weakref.WeakSet()]
+            self.texture_bytes += nbytes
+
+        for key in waiting:
+            entry = self._widgets.get(key)
+            widget = entry[0]() if entry is not None else None
+            if widget is not None and entry[1] == path:
+                self._assign(widget, entry, tex_key)
+        self._evict()
+
+    def _on_failed(self, path, side, exc):
+        self._inflight.pop((path, side), None)
+        self.errors += 1
+        self.decode.record(0.0, ok=False)
+        log.error("decodificar.error", archivo=path, error=exc)
+
+    def _assign(self, widget, entry, tex_key):
+        previous = entry[2]
+        if previous is not None and previous in self._textures and previous != tex_key:
+            self._textures[previous][2].discard(widget)
+        texture_entry = self._textures[tex_key]
+        texture_entry[2].add(widget)
+        self._textures.move_to_end(tex_key)
+        entry[2] = tex_key
+        widget.texture = texture_entry[0]
+        widget.opacity = entry[3]
+
+    def _evict(self):
+        """Libera las texturas menos usadas sin widgets en la ventana hasta entrar en el presupuesto."""
+        if self.texture_bytes <= self.budget_bytes:
+            return
+        for tex_key in list(self._textures):
+            if self.texture_bytes <= self.budget_bytes:
+                return
+            texture, nbytes, users = self._textures[tex_key]
+            if any(w.get_root_window() is not None for w in users):
+                continue
+            del self._textures[tex_key]
+            self.texture_bytes -= nbytes
+            self.evictions += 1
+            for widget in list(users):
+                entry = self._widgets.get(id(widget))
+                if entry is None:
+                    continue
+                entry[2] = None
+                widget.texture = None
+                widget.opacity = 0
+                # Se vuelve a pedir cuando su pantalla se muestre
+                self._pending.add(id(widget))
+
+
+# Instancia global de imágenes
+assets = AssetService()
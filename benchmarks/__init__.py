@@ -0,0 +1,15 @@
+"""
+Benchmarks de rendimiento de la interfaz (requieren Kivy con ventana).
+backend.py es un backend local de prueba (solo biblioteca estándar);
+wal_replay.py no necesita Kivy.
+
+Se ejecutan desde la raíz del proyecto, p.ej.:
+
+    python -m benchmarks.assets --runs 5
+    python -m benchmarks.e2e --points 200 --latency-ms 40
+    python -m benchmarks.leaks --iterations 500
+    python -m benchmarks.resize --resizes 20
+    python -m benchmarks.startup --runs 5
+    python -m benchmarks.venue --areas 1 2 4 8 12
+    python -m benchmarks.wal_replay --runs 5
+"""
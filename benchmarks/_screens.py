@@ -0,0 +1,76 @@
+"""Catálogo de pantallas y utilidades compartidas por los benchmarks."""
+import os
+import sys
+
+# Los módulos de la app viven en la raíz del proyecto
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+
+from kivy.base import EventLoop  # noqa: E402
+from kivy.uix.screenmanager import ScreenManager, Screen, NoTransition  # noqa: E402
+
+
+_TORNEO = {"nombre": "Torneo de prueba", "fecha": "01/01/2026", "hora_inicio": "09:00",
+           "hora_fin": "—", "Sede": "Gimnasio", "idTorneo": None}
+_COMBATE = {"id": None, "numero": 1, "fecha": "01/01/2026", "hora": "10:00", "categoria": "Infantil",
+            "competidor1": "Azul", "competidor2": "Rojo", "contrasenaCombate": ""}
+
+
+def _factory(module, cls, **fixed):
+    def build(name):
+        mod = __import__(module, fromlist=[cls])
+        return getattr(mod, cls)(name=name, **fixed)
+    return build
+
+
+# nombre en main.py -> constructor
+SCREENS = {
+    "main": _factory("main", "MainInScreen"),
+    "conocenos": _factory("main", "ConocenosScreen"),
+    "inicio_sesion": _factory("inicio", "InicioSesionScreen"),
+    "registro": _factory("registro", "RegistroScreen"),
+    "torneos_anteriores": _factory("torneos_anteriores", "TorneosAnterioresScreen"),
+    "crear_torneo": _factory("crear_torneo", "CrearTorneoScreen"),
+    "crear_combate": _factory("crear_combate", "CrearCombateScreen"),
+    "visualizar_combate": _factory("tablero", "MainScreentab"),
+    "visualizar_tablero_central": _factory("tablero_central", "MainScreentabc"),
+    "ini": _factory("ini", "MainInAuthScreen"),
+    "ini_juez": _factory("ini_juez", "InicioSesionJuezScreen"),
+    "cuenta": _factory("cuenta", "VerInfoScreen"),
+    "actualizar": _factory("actualizar", "ActualizarDatosScreen"),
+    "combates_anteriores": _factory("combates_anteriore", "CombatesScreen"),
+    "actualizar_torneos": _factory("actualizar_torneos", "ActualizarTorneoScreen",
+                                   torneo_data=_TORNEO, on_save=lambda *a: None),
+    "actualizar_combate": _factory("actualizar_combate", "ActualizarCombateScreen",
+                                   combate_data=_COMBATE, on_save=lambda *a: None),
+}
+
+
+def select(names):
+    """Pantallas pedidas por línea de comandos (todas si no se indica ninguna)."""
+    if not names:
+        return dict(SCREENS)
+    unknown = [n for n in names if n not in SCREENS]
+    if unknown:
+        raise SystemExit(f"Pantallas desconocidas: {', '.join(unknown)}")
+    return {n: SCREENS[n] for n in names}
+
+
+def make_manager():
+    """Ventana real con un ScreenManager vacío (pantalla base '_base')."""
+    EventLoop.ensure_window()
+    window = EventLoop.window
+    manager = ScreenManager(transition=NoTransition())
+    manager.add_widget(Screen(name="_base"))
+    window.add_widget(manager)
+    frame()
+    return window, manager
+
+
+def frame(count=1):
+    """Procesa `count` frames (Clock, layouts y dibujo)."""
+    for _ in range(count):
+        EventLoop.idle()
@@ -0,0 +1,142 @@
+"""
+Imágenes de las pantallas de inicio (main, conocenos, ini).
+
+Cada corrida es un proceso nuevo con su propio directorio de datos
+(SISTEMA_COMBATES_DATA) y mide, por pantalla:
+
+- listo ms: desde mostrar la pantalla hasta que todas sus imágenes tienen textura.
+- frame máx ms: el frame más largo mientras tanto (bloqueos del hilo principal).
+- decodificar ms: promedio de lo que tardó cada decodificación en el pool.
+- texturas / MB: texturas vivas en assets y su memoria.
+
+`frío` empieza con la caché en disco vacía; `tibio` reutiliza la que dejó
+la corrida anterior. La línea `original` carga los mismos archivos a
+resolución completa en el hilo principal (como Image(source=...) antes).
+
+    python -m benchmarks.assets --runs 5
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+_SCREENS = ("main", "conocenos", "ini")
+_SOURCES = ("Imagen5-Photoroom.png", "p1-Photoroom.png", "p2-Photoroom.png")
+
+
+def _images(screen):
+    from kivy.uix.image import Image
+    return [w for w in screen.walk(restrict=True) if isinstance(w, Image)]
+
+
+def child():
+    """Corre dentro del proceso medido; imprime una línea JSON."""
+    from benchmarks._screens import SCREENS, make_manager, frame
+    from assets import assets
+
+    window, manager = make_manager()
+    results = {}
+    for name in _SCREENS:
+        before_decodes = assets.decode.count
+        start = time.perf_counter()
+        screen = SCREENS[name](name)
+        manager.add_widget(screen)
+        manager.current = name
+        images = _images(screen)
+        max_frame = 0.0
+        deadline = start + 10.0
+        while time.perf_counter() < deadline:
+            t = time.perf_counter()
+            frame()
+            max_frame = max(max_frame, (time.perf_counter() - t) * 1000.0)
+            if all(img.texture is not None for img in images):
+                break
+        ready = (time.perf_counter() - start) * 1000.0
+        decoded = assets.decode.count - before_decodes
+        results[name] = {
+            "ready_ms": ready,
+            "max_frame_ms": max_frame,
+            "images": len(images),
+            "decoded": decoded,
+        }
+
+    stats = assets.stats()
+    print(json.dumps({
+        "screens": results,
+        "decode_ms": stats["decode"]["avg_ms"],
+        "textures": stats["textures"],
+        "texture_mb": stats["texture_mb"],
+        "disk_hits": stats["disk_hits"],
+    }))
+
+
+def original():
+    """Carga a resolución completa en el hilo principal; ms totales y MB de textura."""
+    from benchmarks._screens import make_manager
+    from kivy.core.image import Image as CoreImage
+
+    make_manager()
+    start = time.perf_counter()
+    nbytes = 0
+    for source in _SOURCES:
+        texture = CoreImage(source, nocache=True).texture
+        nbytes += texture.width * texture.height * 4
+    return {"load_ms": (time.perf_counter() - start) * 1000.0, "texture_mb": nbytes / (1024 * 1024)}
+
+
+def run(data_dir, flag="--child"):
+    env = dict(os.environ, KIVY_NO_ARGS="1", KIVY_NO_CONSOLELOG="1", SISTEMA_COMBATES_DATA=data_dir)
+    out = subprocess.run(
+        [sys.executable, "-m", "benchmarks.assets", flag],
+        capture_output=True, text=True, env=env, check=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--original", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        child()
+        return 0
+    if args.original:
+        print(json.dumps(original()))
+        return 0
+
+    cold, warm = [], []
+    for _ in range(args.runs):
+        data_dir = tempfile.mkdtemp(prefix="bench-assets-")
+        try:
+            cold.append(run(data_dir))
+            warm.append(run(data_dir))
+        finally:
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+    print(f"{'modo':<6} {'pantalla':<10} {'listo ms':>9} {'frame máx ms':>13} {'imágenes':>9} {'decodif.':>9}")
+    for mode, results in (("frío", cold), ("tibio", warm)):
+        for name in _SCREENS:
+            rows = [r["screens"][name] for r in results]
+            med = {key: statistics.median(row[key] for row in rows) for key in rows[0]}
+            print(f"{mode:<6} {name:<10} {med['ready_ms']:>9.1f} {med['max_frame_ms']:>13.1f} "
+                  f"{med['images']:>9.0f} {med['decoded']:>9.0f}")
+        print(f"{mode:<6} decodificar {statistics.median(r['decode_ms'] for r in results):.1f} ms, "
+              f"{statistics.median(r['textures'] for r in results):.0f} texturas, "
+              f"{statistics.median(r['texture_mb'] for r in results):.2f} MB, "
+              f"{statistics.median(r['disk_hits'] for r in results):.0f} de disco")
+
+    base = run(tempfile.gettempdir(), flag="--original")
+    print(f"original: {base['load_ms']:.1f} ms en el hilo principal, {base['texture_mb']:.2f} MB de texturas")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
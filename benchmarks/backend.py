@@ -0,0 +1,502 @@
+"""
+Backend local de prueba: los endpoints de puntajes, faltas y combates que
+usan api_client.py y los tableros, más el stream /ws/tablero/{id}, con
+latencia y jitter inyectados. Solo biblioteca estándar (sin Kivy).
+
+Cada sentido de la red tarda `--latency-ms` ± `--jitter-ms`: una petición
+HTTP espera al llegar y otra vez al responder (~2× latencia) y cada
+mensaje del WebSocket espera una vez antes de salir, sin desordenarse.
+Los combates 1..N existen desde el arranque (ver `combate()`).
+
+    python -m benchmarks.backend --port 8080 --latency-ms 40 --jitter-ms 15
+
+Con SISTEMA_COMBATES_API=http://127.0.0.1:8080 la aplicación entera
+funciona contra este servidor. GET /_bench/stats devuelve los contadores
+(no se cuenta a sí mismo).
+"""
+import argparse
+import base64
+import hashlib
+import json
+import random
+import re
+import struct
+import sys
+import threading
+import time
+from collections import Counter, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+_WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+_HISTORY = 1000   # eventos guardados por combate para reanudar con ?lastSeq=N
+
+
+def combate(index) -> dict:
+    """IDs del combate `index` (1..N): alumno rojo 2i-1, azul 2i."""
+    return {"idCombate": index, "idAlumnoRojo": 2 * index - 1, "idAlumnoAzul": 2 * index}
+
+
+def _frame(opcode, payload: bytes) -> bytes:
+    """Frame de servidor (sin máscara, no fragmentado)."""
+    n = len(payload)
+    if n < 126:
+        head = struct.pack("!BB", 0x80 | opcode, n)
+    elif n < 1 << 16:
+        head = struct.pack("!BBH", 0x80 | opcode, 126, n)
+    else:
+        head = struct.pack("!BBQ", 0x80 | opcode, 127, n)
+    return head + payload
+
+
+def _read_frame(rfile):
+    """(opcode, payload) del próximo frame del cliente; None si se cerró."""
+    head = rfile.read(2)
+    if len(head) < 2:
+        return None
+    opcode, n = head[0] & 0x0F, head[1] & 0x7F
+    if n == 126:
+        n = struct.unpack("!H", rfile.read(2))[0]
+    elif n == 127:
+        n = struct.unpack("!Q", rfile.read(8))[0]
+    mask = rfile.read(4) if head[1] & 0x80 else b""
+    payload = rfile.read(n)
+    if mask:
+        payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+    return opcode, payload
+
+
+class _Subscriber:
+    """Un cliente del stream: los mensajes salen en orden, cada uno tras su retraso."""
+
+    def __init__(self, backend, wfile):
+        self.backend = backend
+        self.wfile = wfile
+        self.closed = False
+        self._cond = threading.Condition()
+        self._outbox = deque()
+        self._last_due = 0.0
+        self._write_lock = threading.Lock()
+        threading.Thread(target=self._run, name="ws-sender", daemon=True).start()
+
+    def send(self, text):
+        delay = self.backend.delay()
+        with self._cond:
+            due = max(time.monotonic() + delay, self._last_due)
+            self._last_due = due
+            self._outbox.append((due, text))
+            self._cond.notify()
+
+    def write(self, opcode, payload):
+        with self._write_lock:
+            self.wfile.write(_frame(opcode, payload))
+            self.wfile.flush()
+
+    def close(self):
+        with self._cond:
+            self.closed = True
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._outbox and not self.closed:
+                    self._cond.wait()
+                if self.closed:
+                    return
+                due, text = self._outbox[0]
+                wait = due - time.monotonic()
+                if wait > 0:
+                    self._cond.wait(wait)
+                    continue
+                self._outbox.popleft()
+            try:
+                self.write(0x1, text.encode("utf-8"))
+                self.backend.count_ws("sent")
+            except OSError:
+                self.close()
+                return
+
+
+class _Stream:
+    """Stream de eventos de un combate: secuencia, historial y suscriptores."""
+
+    def __init__(self):
+        self.seq = 0
+        self.history = deque(maxlen=_HISTORY)
+        self.subscribers = set()
+
+
+class StandInBackend:
+    """Estado en memoria del backend y retrasos inyectados."""
+
+    def __init__(self, combates=1, latency_ms=0.0, jitter_ms=0.0, seed=None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self._random = random.Random(seed)
+        # Reentrante: cada mutación publica bajo el lock (el orden de seq sigue al de los conteos)
+        self._lock = threading.RLock()
+        self.combates = {}
+        self.combate_of = {}
+        self.puntos = Counter()      # alumnoId -> puntos (el conteo es por alumno)
+        self.faltas = Counter()      # (alumnoId, combateId) -> faltas
+        self.streams = {}
+        self._idempotent = {}        # Idempotency-Key -> respuesta ya enviada
+        self.http = Counter()
+        self.ws = Counter()
+        self.replays = 0
+        for index in range(1, combates + 1):
+            self.add_combate(index)
+
+    # ============ API PÚBLICA ============
+
+    def add_combate(self, index):
+        ids = combate(index)
+        with self._lock:
+            self.combates[index] = ids
+            self.combate_of[ids["idAlumnoRojo"]] = index
+            self.combate_of[ids["idAlumnoAzul"]] = index
+            self.streams.setdefault(index, _Stream())
+        return ids
+
+    def delay(self) -> float:
+        """Retraso (s) de un sentido de la red."""
+        with self._lock:
+            jitter = self._random.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0.0
+        return max(0.0, self.latency_ms + jitter) / 1000.0
+
+    def count_http(self, route):
+        with self._lock:
+            self.http[route] += 1
+
+    def count_ws(self, kind):
+        with self._lock:
+            self.ws[kind] += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "latency_ms": self.latency_ms,
+                "jitter_ms": self.jitter_ms,
+                "http_total": sum(self.http.values()),
+                "http": dict(self.http),
+                "ws": dict(self.ws),
+                "subscribers": sum(len(s.subscribers) for s in self.streams.values()),
+                "idempotent_replays": self.replays,
+            }
+
+    def idempotent(self, key, apply):
+        """Ejecuta `apply()` una sola vez por Idempotency-Key; un reintento recibe la misma respuesta."""
+        if key:
+            with self._lock:
+                if key in self._idempotent:
+                    self.replays += 1
+                    return self._idempotent[key]
+        result = apply()
+        if key:
+            with self._lock:
+                self._idempotent[key] = result
+        return result
+
+    # ============ MUTACIONES ============
+
+    def add_puntos(self, combate_id, alumno_id, valor):
+        with self._lock:
+            self.puntos[alumno_id] += valor
+            count = self.puntos[alumno_id]
+            self.publish(combate_id, {"event": "score_update", "combateId": combate_id,
+                                      "alumnoId": alumno_id, "count": count})
+        return {"newCount": count, "alumnoId": alumno_id, "combateId": combate_id}
+
+    def delete_punto(self, alumno_id):
+        with self._lock:
+            self.puntos[alumno_id] = max(0, self.puntos[alumno_id] - 1)
+            count = self.puntos[alumno_id]
+            combate_id = self.combate_of.get(alumno_id)
+            if combate_id is not None:
+                self.publish(combate_id, {"event": "score_update", "combateId": combate_id,
+                                          "alumnoId": alumno_id, "count": count})
+        return {"newCount": count}
+
+    def add_falta(self, combate_id, alumno_id):
+        with self._lock:
+            self.faltas[(alumno_id, combate_id)] += 1
+            total = self.faltas[(alumno_id, combate_id)]
+            self.publish(combate_id, {"event": "gamjeom_update", "combateId": combate_id,
+                                      "alumnoId": alumno_id, "count": total})
+        return {"totalFaltas": total, "descalificado": total >= 3}
+
+    def delete_falta(self, alumno_id, combate_id):
+        with self._lock:
+            key = (alumno_id, combate_id)
+            self.faltas[key] = max(0, self.faltas[key] - 1)
+            total = self.faltas[key]
+            self.publish(combate_id, {"event": "gamjeom_update", "combateId": combate_id,
+                                      "alumnoId": alumno_id, "count": total})
+        return {"newCount": total}
+
+    def snapshot(self, combate_id):
+        with self._lock:
+            ids = self.combates.get(combate_id)
+            if ids is None:
+                return None
+            rojo, azul = ids["idAlumnoRojo"], ids["idAlumnoAzul"]
+            return {
+                "combateId": combate_id, "estado": "EN_CURSO", "roundActual": 1, "numeroRounds": 3,
+                "rojo": {"alumnoId": rojo, "puntaje": self.puntos[rojo], "faltas": self.faltas[(rojo, combate_id)]},
+                "azul": {"alumnoId": azul, "puntaje": self.puntos[azul], "faltas": self.faltas[(azul, combate_id)]},
+            }
+
+    # ============ STREAM ============
+
+    def publish(self, combate_id, event, exclude=None):
+        """Asigna seq y ts (ms epoch, al generarse) y lo envía a los suscriptores del combate."""
+        with self._lock:
+            stream = self.streams.setdefault(combate_id, _Stream())
+            stream.seq += 1
+            text = json.dumps(dict(event, seq=stream.seq, ts=time.time() * 1000.0))
+            stream.history.append((stream.seq, text))
+            for subscriber in stream.subscribers:
+                if subscriber is not exclude:
+                    subscriber.send(text)
+
+    def subscribe(self, combate_id, subscriber, last_seq):
+        """Registra al suscriptor; con `last_seq` dentro del historial, reenvía lo que se perdió."""
+        with self._lock:
+            stream = self.streams.setdefault(combate_id, _Stream())
+            oldest = stream.history[0][0] if stream.history else stream.seq + 1
+            resumed = last_seq is not None and last_seq <= stream.seq and last_seq >= oldest - 1
+            subscriber.send(json.dumps({"status": "connected", "resumed": resumed}))
+            if resumed:
+                for seq, text in stream.history:
+                    if seq > last_seq:
+                        subscriber.send(text)
+            stream.subscribers.add(subscriber)
+            self.ws["connections"] += 1
+
+    def unsubscribe(self, combate_id, subscriber):
+        with self._lock:
+            self.streams[combate_id].subscribers.discard(subscriber)
+        subscriber.close()
+
+
+def _json_count(alumno_id, count):
+    return {"alumnoId": alumno_id, "count": count}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # keep-alive, como el pool de requests
+    # Cabeceras y cuerpo salen en dos send(): sin TCP_NODELAY, Nagle más el
+    # ACK retrasado del cliente suman ~40 ms a cada respuesta keep-alive
+    disable_nagle_algorithm = True
+    backend = None
+
+    # (método, ruta, nombre para las estadísticas, función)
+    ROUTES = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method):
+        parts = urlsplit(self.path)
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+
+        if parts.path == "/_bench/stats":
+            return self._reply(200, self.backend.stats())
+        match = re.fullmatch(r"/ws/tablero/(\d+)", parts.path)
+        if match and self.headers.get("Upgrade", "").lower() == "websocket":
+            last_seq = query.get("lastSeq")
+            return self._websocket(int(match.group(1)), int(last_seq) if last_seq is not None else None)
+
+        for route_method, pattern, name, handler in self.ROUTES:
+            match = re.fullmatch(pattern, parts.path) if route_method == method else None
+            if match is None:
+                continue
+            self.backend.count_http(name)
+            time.sleep(self.backend.delay())
+            try:
+                status, body = handler(self, *(int(g) for g in match.groups()), query=query)
+            except (KeyError, ValueError):
+                status, body = 400, {"error": "parámetros inválidos"}
+            time.sleep(self.backend.delay())
+            return self._reply(status, body)
+        self.backend.count_http("no_encontrado")
+        self._reply(404, {"error": "no encontrado"})
+
+    def _reply(self, status, body):
+        data = json.dumps(body).encode("utf-8") if body is not None else b""
+        self.send_response(status)
+        if data:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _idempotent(self, apply):
+        return self.backend.idempotent(self.headers.get("Idempotency-Key"), apply)
+
+    # ============ RUTAS ============
+
+    def puntaje_simple(self, query):
+        combate_id, alumno_id = int(query["combateId"]), int(query["alumnoId"])
+        valor = int(query.get("valorPuntaje", 1))
+        return 200, self._idempotent(lambda: self.backend.add_puntos(combate_id, alumno_id, valor))
+
+    def puntaje_last(self, alumno_id, query):
+        return 200, self._idempotent(lambda: self.backend.delete_punto(alumno_id))
+
+    def puntaje_count(self, alumno_id, query):
+        return 200, _json_count(alumno_id, self.backend.puntos[alumno_id])
+
+    def falta_simple(self, query):
+        combate_id, alumno_id = int(query["combateId"]), int(query["alumnoId"])
+        return 200, self._idempotent(lambda: self.backend.add_falta(combate_id, alumno_id))
+
+    def falta_last(self, alumno_id, combate_id, query):
+        return 200, self._idempotent(lambda: self.backend.delete_falta(alumno_id, combate_id))
+
+    def falta_count(self, alumno_id, combate_id, query):
+        return 200, _json_count(alumno_id, self.backend.faltas[(alumno_id, combate_id)])
+
+    def combate_get(self, combate_id, query):
+        ids = self.backend.combates.get(combate_id)
+        if ids is None:
+            return 404, {"error": f"Combate {combate_id} no encontrado"}
+        return 200, dict(ids, estado="EN_CURSO", numeroRounds=3,
+                         competidorRojo={"id": ids["idAlumnoRojo"]}, competidorAzul={"id": ids["idAlumnoAzul"]})
+
+    def combate_snapshot(self, combate_id, query):
+        snapshot = self.backend.snapshot(combate_id)
+        if snapshot is None:
+            return 404, {"error": f"Combate {combate_id} no encontrado"}
+        return 200, snapshot
+
+    def combates_list(self, query):
+        return 200, [self.combate_get(index, query)[1] for index in sorted(self.backend.combates)]
+
+    # ============ WEBSOCKET ============
+
+    def _websocket(self, combate_id, last_seq):
+        key = self.headers.get("Sec-WebSocket-Key", "")
+        accept = base64.b64encode(hashlib.sha1((key + _WS_GUID).encode()).digest()).decode()
+        self.send_response(101, "Switching Protocols")
+        self.send_header("Upgrade", "websocket")
+        self.send_header("Connection", "Upgrade")
+        self.send_header("Sec-WebSocket-Accept", accept)
+        self.end_headers()
+        self.wfile.flush()
+        self.close_connection = True
+
+        subscriber = _Subscriber(self.backend, self.wfile)
+        self.backend.subscribe(combate_id, subscriber, last_seq)
+        try:
+            while True:
+                frame = _read_frame(self.rfile)
+                if frame is None:
+                    break
+                opcode, payload = frame
+                if opcode == 0x8:
+                    subscriber.write(0x8, payload[:2])
+                    break
+                if opcode == 0x9:
+                    subscriber.write(0xA, payload)
+                elif opcode == 0x1:
+                    self._on_ws_message(combate_id, subscriber, payload)
+        except OSError:
+            pass
+        finally:
+            self.backend.unsubscribe(combate_id, subscriber)
+
+    def _on_ws_message(self, combate_id, subscriber, payload):
+        """Lo que publica un tablero (p.ej. el reloj) se retransmite a los demás."""
+        self.backend.count_ws("received")
+        try:
+            data = json.loads(payload.decode("utf-8"))
+        except ValueError:
+            return
+        if isinstance(data, dict):
+            data.pop("seq", None)
+            self.backend.publish(combate_id, data, exclude=subscriber)
+
+
+_Handler.ROUTES = [
+    ("POST", r"/apiPuntajes/puntaje/simple", "puntaje.simple", _Handler.puntaje_simple),
+    ("DELETE", r"/apiPuntajes/puntaje/alumno/(\d+)/last", "puntaje.last", _Handler.puntaje_last),
+    ("GET", r"/apiPuntajes/puntaje/alumno/(\d+)/count", "puntaje.count", _Handler.puntaje_count),
+    ("POST", r"/apiGamJeom/falta/simple", "falta.simple", _Handler.falta_simple),
+    ("DELETE", r"/apiGamJeom/falta/alumno/(\d+)/combate/(\d+)/last", "falta.last", _Handler.falta_last),
+    ("GET", r"/apiGamJeom/falta/alumno/(\d+)/combate/(\d+)/count", "falta.count", _Handler.falta_count),
+    ("GET", r"/apiCombates/combate/(\d+)/snapshot", "combate.snapshot", _Handler.combate_snapshot),
+    ("GET", r"/apiCombates/combate/(\d+)", "combate.get", _Handler.combate_get),
+    ("GET", r"/apiCombates/combates", "combate.list", _Handler.combates_list),
+]
+
+
+def serve(port=0, host="127.0.0.1", **kwargs):
+    """Arranca el servidor en un hilo; retorna (servidor, backend). `port=0` elige uno libre."""
+    backend = StandInBackend(**kwargs)
+    handler = type("Handler", (_Handler,), {"backend": backend})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="stand-in-backend", daemon=True).start()
+    return server, backend
+
+
+def fetch_stats(base_url) -> dict:
+    """Contadores de un backend que corre en otro proceso."""
+    from urllib.request import urlopen
+    with urlopen(f"{base_url.rstrip('/')}/_bench/stats", timeout=5) as r:
+        return json.loads(r.read().decode("utf-8"))
+
+
+def start_process(combates=1, latency_ms=0.0, jitter_ms=0.0, seed=None):
+    """Lanza el backend en otro proceso; retorna (proceso, url base)."""
+    import subprocess
+    cmd = [sys.executable, "-m", "benchmarks.backend", "--port", "0", "--combates", str(combates),
+           "--latency-ms", str(latency_ms), "--jitter-ms", str(jitter_ms)]
+    if seed is not None:
+        cmd += ["--seed", str(seed)]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True)
+    line = proc.stdout.readline().split()
+    if len(line) != 2 or line[0] != "LISTENING":
+        proc.kill()
+        raise RuntimeError("El backend de prueba no arrancó")
+    return proc, f"http://127.0.0.1:{line[1]}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--combates", type=int, default=1)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="retraso de cada sentido de la red")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="variación uniforme ± del retraso")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    server, _ = serve(args.port, combates=args.combates, latency_ms=args.latency_ms,
+                      jitter_ms=args.jitter_ms, seed=args.seed)
+    print(f"LISTENING {server.server_address[1]}", flush=True)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,417 @@
+"""
+Latencia de punta a punta contra el backend de prueba (benchmarks/backend.py).
+
+Levanta el backend con latencia y jitter inyectados y procesos de Kivy
+con ventana: un tablero central (tablero_central.MainScreentabc) que
+marca --points puntos alternando rojo y azul cada --interval-ms, y
+--viewers tableros de visualización (tablero.MainScreentab) suscritos al
+mismo combate. Mide:
+
+- clic → render: desde add_score_api() (lo que llama el botón +) hasta el
+  frame en que el CompetitorPanel muestra el punto.
+- clic → confirmado: hasta el frame en que el servidor ya lo confirmó (el
+  diario del panel queda sin operaciones pendientes).
+- evento WS → render: desde que el servidor emite el score_update (su
+  `ts`) hasta el frame en que el visor lo muestra.
+- peticiones por punto: peticiones HTTP que recibió el backend durante los
+  clics, dividido entre los puntos marcados.
+
+El resultado (configuración, p50/p95/p99 y contadores) se escribe en
+--output; --compare imprime la diferencia con una corrida anterior.
+
+    python -m benchmarks.e2e --points 200 --latency-ms 40 --jitter-ms 15
+    python -m benchmarks.e2e --output nuevo.json --compare base.json
+
+Sin pantalla: xvfb-run python -m benchmarks.e2e
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.backend import combate, fetch_stats, start_process
+
+_LATENCIES = (("click_render", "clic → render"), ("click_confirm", "clic → confirmado"),
+              ("ws_render", "evento WS → render"))
+
+
+def latency_summary(samples) -> dict:
+    """count, promedio, p50/p95/p99 y máximo (ms) de una lista de muestras."""
+    from metrics import LatencyStats
+    stats = LatencyStats(window=max(1, len(samples)))
+    for ms in samples:
+        stats.record(ms)
+    data = stats.snapshot()
+    return {key: data[key] for key in ("count", "avg_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms")}
+
+
+def pump(condition, timeout):
+    """Procesa frames hasta que `condition()` sea verdadera; False si se agotó el tiempo."""
+    from benchmarks._screens import frame
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        frame()
+        if condition():
+            return True
+    return False
+
+
+def settle(latency_ms):
+    """Deja terminar las hidrataciones del arranque antes de medir."""
+    pump(lambda: False, 0.5 + 6 * latency_ms / 1000.0)
+
+
+def http_delta(before, after) -> dict:
+    routes = set(before["http"]) | set(after["http"])
+    delta = {route: after["http"].get(route, 0) - before["http"].get(route, 0) for route in routes}
+    return {route: n for route, n in sorted(delta.items()) if n}
+
+
+class _Click:
+    __slots__ = ("panel", "expected", "t0", "render_ms", "confirm_ms")
+
+    def __init__(self, panel, expected, t0):
+        self.panel = panel
+        self.expected = expected
+        self.t0 = t0
+        self.render_ms = None
+        self.confirm_ms = None
+
+
+def click_loop(boards, points, interval, timeout):
+    """
+    Marca `points` puntos repartidos entre `boards` (MainScreentabc), cada
+    uno alternando rojo/azul, uno cada `interval` segundos. Retorna los
+    clics (confirmados o no) con sus tiempos.
+    """
+    from benchmarks._screens import frame
+
+    panels = [panel for board in boards for panel in (board.com1_panel, board.com2_panel)]
+    # Valor que debe mostrar cada panel tras su último clic (sirve con y sin OPTIMISTIC_SCORING)
+    target = {panel: int(panel.score_label.text or 0) for panel in panels}
+    clicks, pending = [], []
+    start = time.perf_counter()
+    deadline = start + points * interval + timeout
+    made = 0
+    while (made < points or pending) and time.perf_counter() < deadline:
+        if made < points and time.perf_counter() >= start + made * interval:
+            panel = panels[made % len(panels)]
+            target[panel] += 1
+            t0 = time.perf_counter()
+            panel.add_score_api()
+            click = _Click(panel, target[panel], t0)
+            clicks.append(click)
+            pending.append(click)
+            made += 1
+        frame()
+        now = time.perf_counter()
+        for click in list(pending):
+            if click.render_ms is None and int(click.panel.score_label.text or 0) >= click.expected:
+                click.render_ms = (now - click.t0) * 1000.0
+            if click.render_ms is not None and not click.panel.score_journal.has_pending():
+                click.confirm_ms = (now - click.t0) * 1000.0
+                pending.remove(click)
+    return clicks
+
+
+def open_central(manager, index, **config):
+    """
+    Tablero central del combate `index` (el WebSocket se conecta en segundo
+    plano); `config` reemplaza duracionRound, duracionDescanso o numeroRounds.
+    """
+    from tablero_central import MainScreentabc
+
+    combate_data = dict(combate(index), duracionRound="00:30:00", duracionDescanso="00:00:10", numeroRounds=1)
+    combate_data.update(config)
+    screen = MainScreentabc()
+    # MainScreentabc fija su nombre; con varios tableros en el mismo manager debe ser único
+    screen.name = f"central-{index}"
+    manager.add_widget(screen)
+    manager.current = screen.name
+    screen.set_competitors("ROJO", "", "AZUL", "", combate_data=combate_data)
+    return screen
+
+
+def central(args):
+    """Proceso del tablero central: marca los puntos e imprime una línea JSON."""
+    from benchmarks._screens import make_manager, frame
+    from mutation_coalescer import coalescer
+    from scoring_transport import scoring
+    import app_logging
+
+    window, manager = make_manager()
+    screen = open_central(manager, args.combate)
+    if not pump(lambda: screen.realtime.connected, args.timeout):
+        raise SystemExit("El tablero central no se conectó al WebSocket")
+    screen.center_panel.start_timer()
+    settle(args.latency_ms)
+
+    before = fetch_stats(args.api)
+    clicks = click_loop([screen], args.points, args.interval_ms / 1000.0, args.timeout)
+    frame(3)
+    after = fetch_stats(args.api)
+
+    render = screen.get_render_stats()
+    result = {
+        "clicks": len(clicks),
+        "unconfirmed": sum(1 for c in clicks if c.confirm_ms is None),
+        "click_render": latency_summary([c.render_ms for c in clicks if c.render_ms is not None]),
+        "click_confirm": latency_summary([c.confirm_ms for c in clicks if c.confirm_ms is not None]),
+        "http_requests": after["http_total"] - before["http_total"],
+        "http": http_delta(before, after),
+        "coalescer": coalescer.stats()["current_round"],
+        "journal": {p.lado: p.score_journal.stats() for p in (screen.com1_panel, screen.com2_panel)},
+        "scoring": scoring.get_latency_stats(),
+        "frames": render["frames"],
+        "realtime": render["realtime"],
+        "ws_lag": screen.realtime.stats()["lag"],
+    }
+    screen.disconnect_websocket()
+    app_logging.shutdown()
+    print(json.dumps(result))
+
+
+class RenderTracker(list):
+    """
+    ms desde que el servidor emitió cada score_update (su `ts`) hasta el
+    final del frame en que un widget lo muestra. Envuelve el `on_event` de
+    la conexión; `watch()` indica qué propiedad muestra qué conteo y
+    `flush()` se llama tras cada frame.
+    """
+
+    def __init__(self, connection):
+        super().__init__()
+        self.stamps = {}
+        self.changes = []
+        push = connection.on_event
+
+        def on_event(data):
+            # Hilo del socket: se guarda la hora del servidor de cada conteo
+            if data.get("event") == "score_update" and isinstance(data.get("ts"), (int, float)):
+                self.stamps[(data.get("alumnoId"), data.get("count"))] = data["ts"]
+            push(data)
+
+        connection.on_event = on_event
+
+    def watch(self, widget, prop, key):
+        """`key(widget, valor)` -> (alumnoId, conteo) mostrado."""
+        widget.bind(**{prop: lambda w, value: self.changes.append(key(w, value))})
+
+    def flush(self):
+        now_ms = time.time() * 1000.0
+        for key in self.changes:
+            ts = self.stamps.pop(key, None)
+            if ts is not None:
+                self.append(now_ms - ts)
+        self.changes.clear()
+
+
+def open_viewer(manager, index, name=None):
+    """Tablero de visualización del combate `index`; retorna (pantalla, RenderTracker)."""
+    from tablero import MainScreentab
+
+    ids = combate(index)
+    screen = MainScreentab(name=name or f"viewer-{index}")
+    manager.add_widget(screen)
+    manager.current = screen.name
+    tracker = RenderTracker(screen.realtime)
+    screen.set_combate_data({
+        "idCombate": ids["idCombate"], "competidor1": "AZUL", "competidor2": "ROJO",
+        "alumno_id_azul": ids["idAlumnoAzul"], "alumno_id_rojo": ids["idAlumnoRojo"],
+    })
+    for panel in (screen.com1_panel, screen.com2_panel):
+        tracker.watch(panel, "score", lambda p, value: (p.alumno_id, value))
+    return screen, tracker
+
+
+def viewer(args):
+    """Proceso de un visor: avisa READY al conectarse y mide hasta ver todos los puntos."""
+    from benchmarks._screens import make_manager, frame
+    import app_logging
+
+    window, manager = make_manager()
+    screen, samples = open_viewer(manager, args.combate)
+    if not pump(lambda: screen.ws_connected, args.timeout):
+        raise SystemExit("El visor no se conectó al WebSocket")
+    print("READY", flush=True)
+
+    ids = combate(args.combate)
+    expected = {ids["idAlumnoRojo"]: (args.points + 1) // 2, ids["idAlumnoAzul"]: args.points // 2}
+    panels = (screen.com1_panel, screen.com2_panel)
+    deadline = time.perf_counter() + args.points * args.interval_ms / 1000.0 + 2 * args.timeout
+    while time.perf_counter() < deadline:
+        frame()
+        samples.flush()
+        if all(p.score >= expected[p.alumno_id] for p in panels):
+            break
+
+    result = {
+        "ws_render_samples": list(samples),
+        "scores": {str(p.alumno_id): p.score for p in panels},
+        "dispatcher": screen.realtime_events.stats(),
+        "ws_lag": screen.realtime.stats()["lag"],
+    }
+    screen.disconnect_websocket()
+    app_logging.shutdown()
+    print(json.dumps(result))
+
+
+# ============ PROCESO PRINCIPAL ============
+
+def last_json(text) -> dict:
+    """Última línea JSON de la salida de un hijo (el registro escribe en la misma salida)."""
+    for line in reversed(text.strip().splitlines()):
+        if line.startswith("{"):
+            return json.loads(line)
+    raise RuntimeError("El proceso hijo no imprimió resultados")
+
+
+def child_cmd(module, kind, api_url, args, **extra):
+    cmd = [sys.executable, "-m", module, "--child", kind, "--api", api_url,
+           "--latency-ms", str(args.latency_ms), "--timeout", str(args.timeout)]
+    for key, value in extra.items():
+        cmd += [f"--{key.replace('_', '-')}", str(value)]
+    return cmd
+
+
+def child_env(api_url, data_dir):
+    return dict(os.environ, KIVY_NO_ARGS="1", KIVY_NO_CONSOLELOG="1",
+                SISTEMA_COMBATES_API=api_url, SISTEMA_COMBATES_DATA=data_dir)
+
+
+def wait_ready(proc):
+    for line in proc.stdout:
+        if line.strip() == "READY":
+            return
+    raise RuntimeError("Un visor terminó antes de conectarse")
+
+
+def measure(args) -> dict:
+    from config import OPTIMISTIC_SCORING, COALESCE_WINDOW_MS
+
+    backend, api_url = start_process(combates=1, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                                     seed=args.seed)
+    data_dir = tempfile.mkdtemp(prefix="bench-e2e-")
+    env = child_env(api_url, data_dir)
+    common = dict(combate=1, points=args.points, interval_ms=args.interval_ms)
+    viewers = []
+    try:
+        for _ in range(args.viewers):
+            viewers.append(subprocess.Popen(child_cmd("benchmarks.e2e", "viewer", api_url, args, **common),
+                                            stdout=subprocess.PIPE, text=True, env=env))
+        for proc in viewers:
+            wait_ready(proc)
+        out = subprocess.run(child_cmd("benchmarks.e2e", "central", api_url, args, **common),
+                             stdout=subprocess.PIPE, text=True, env=env, check=True).stdout
+        board = last_json(out)
+        seen = [last_json(proc.communicate(timeout=2 * args.timeout)[0]) for proc in viewers]
+    finally:
+        for proc in viewers:
+            if proc.poll() is None:
+                proc.kill()
+        backend.kill()
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+    ws_samples = [ms for v in seen for ms in v.pop("ws_render_samples")]
+    return dict(run_info("e2e"), **{
+        "config": {
+            "points": args.points, "interval_ms": args.interval_ms, "viewers": args.viewers,
+            "latency_ms": args.latency_ms, "jitter_ms": args.jitter_ms, "seed": args.seed,
+            "optimistic": OPTIMISTIC_SCORING, "coalesce_window_ms": COALESCE_WINDOW_MS,
+        },
+        "results": {
+            "click_render": board["click_render"],
+            "click_confirm": board["click_confirm"],
+            "ws_render": latency_summary(ws_samples),
+            "requests_per_point": round(board["http_requests"] / max(1, board["clicks"]), 3),
+            "http": board["http"],
+            "unconfirmed": board["unconfirmed"],
+        },
+        "central": board,
+        "viewers": seen,
+    })
+
+
+def run_info(name) -> dict:
+    """Datos para comparar corridas: benchmark, fecha, commit y plataforma."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "benchmark": name,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+
+
+def report(data):
+    results = data["results"]
+    print(f"{'métrica':<20} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'máx ms':>8} {'n':>6}")
+    for key, label in _LATENCIES:
+        row = results[key]
+        print(f"{label:<20} {row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f} "
+              f"{row['max_ms']:>8.1f} {row['count']:>6}")
+    http = ", ".join(f"{route} {n}" for route, n in results["http"].items())
+    print(f"peticiones por punto: {results['requests_per_point']:.2f} ({http})")
+    if results["unconfirmed"]:
+        print(f"sin confirmar: {results['unconfirmed']}")
+
+
+def compare(base, new):
+    """Diferencia por métrica entre dos archivos de resultados (negativo = mejor)."""
+    rows = [(f"{label} {p}", key, f"{p}_ms") for key, label in _LATENCIES for p in ("p50", "p95", "p99")]
+    print(f"\n{'comparación':<30} {'base':>9} {'nuevo':>9} {'cambio':>8}")
+    for label, key, field in rows + [("peticiones por punto", "requests_per_point", None)]:
+        old = base["results"][key] if field is None else base["results"][key][field]
+        cur = new["results"][key] if field is None else new["results"][key][field]
+        change = f"{(cur - old) / old * 100:+.1f}%" if old else "—"
+        print(f"{label:<30} {old:>9.2f} {cur:>9.2f} {change:>8}")
+    if base.get("config") != new.get("config"):
+        print("aviso: las corridas tienen configuraciones distintas")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--points", type=int, default=100)
+    parser.add_argument("--interval-ms", type=float, default=250.0, help="tiempo entre clics")
+    parser.add_argument("--viewers", type=int, default=1)
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="retraso de cada sentido de la red")
+    parser.add_argument("--jitter-ms", type=float, default=5.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--timeout", type=float, default=15.0)
+    parser.add_argument("--output", default="e2e.json")
+    parser.add_argument("--compare", default=None, help="resultados anteriores (JSON) para comparar")
+    parser.add_argument("--child", choices=["central", "viewer"], help=argparse.SUPPRESS)
+    parser.add_argument("--api", help=argparse.SUPPRESS)
+    parser.add_argument("--combate", type=int, default=1, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child == "central":
+        central(args)
+        return 0
+    if args.child == "viewer":
+        viewer(args)
+        return 0
+
+    data = measure(args)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    report(data)
+    print(f"resultados en {args.output}")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(json.load(f), data)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""
+Regresión de fugas: abre y cierra cada pantalla N veces.
+
+Cada ciclo crea la pantalla, la muestra, provoca un resize, vuelve a la
+pantalla base y la quita del ScreenManager. Tras un calentamiento se
+toma una línea base; al final se exige que los widgets con reglas de
+resize vivos (responsive.tracked()) vuelvan a la línea base y que la memoria
+de Python (tracemalloc) no crezca más de --max-growth-kb por ciclo.
+
+    python -m benchmarks.leaks --iterations 500
+    python -m benchmarks.leaks --iterations 50 --screens torneos_anteriores combates_anteriores
+"""
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+
+from benchmarks._screens import select, make_manager, frame
+
+
+def cycle(window, manager, name, factory):
+    screen = factory(name)
+    manager.add_widget(screen)
+    manager.current = name
+    frame()
+    window.dispatch("on_resize", *window.size)
+    frame()
+    manager.current = "_base"
+    frame()
+    manager.remove_widget(screen)
+
+
+def settle():
+    """Deja correr lo programado (Clock.schedule_once de los resizes) y recolecta."""
+    frame(3)
+    gc.collect()
+
+
+def measure(window, manager, name, factory, iterations, warmup):
+    from responsive import responsive
+    from task_executor import tasks
+
+    for _ in range(warmup):
+        cycle(window, manager, name, factory)
+    settle()
+    base_handlers = responsive.tracked()
+    base_memory = tracemalloc.get_traced_memory()[0]
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        cycle(window, manager, name, factory)
+    elapsed = time.perf_counter() - start
+    settle()
+
+    return {
+        "screen": name,
+        "cycles": iterations,
+        "ms_per_cycle": round(elapsed * 1000.0 / iterations, 2),
+        "handlers_before": base_handlers,
+        "handlers_after": responsive.tracked(),
+        "growth_kb_per_cycle": round((tracemalloc.get_traced_memory()[0] - base_memory) / 1024.0 / iterations, 3),
+        "pending_tasks": sum(tasks.depth().values()),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--max-growth-kb", type=float, default=1.0,
+                        help="crecimiento de memoria tolerado por ciclo (KB)")
+    parser.add_argument("--screens", nargs="*", default=None)
+    args = parser.parse_args(argv)
+
+    screens = select(args.screens)
+    window, manager = make_manager()
+    tracemalloc.start()
+
+    failures = []
+    print(f"{'pantalla':<28} {'ms/ciclo':>9} {'handlers':>13} {'KB/ciclo':>9}")
+    for name, factory in screens.items():
+        r = measure(window, manager, name, factory, args.iterations, args.warmup)
+        print(f"{name:<28} {r['ms_per_cycle']:>9} "
+              f"{r['handlers_before']:>6}->{r['handlers_after']:<6} {r['growth_kb_per_cycle']:>9}")
+        if r["handlers_after"] > r["handlers_before"]:
+            failures.append(f"{name}: handlers de resize {r['handlers_before']} -> {r['handlers_after']}")
+        if r["growth_kb_per_cycle"] > args.max_growth_kb:
+            failures.append(f"{name}: memoria +{r['growth_kb_per_cycle']} KB por ciclo")
+
+    tracemalloc.stop()
+    if failures:
+        print("\nFUGAS DETECTADAS:")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+    print("\nSin fugas: handlers y memoria estables.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
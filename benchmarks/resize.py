@@ -0,0 +1,133 @@
+"""
+Costo de un resize por pantalla.
+
+Muestra cada pantalla y alterna el tamaño de la ventana entre --sizes
+(por defecto cruza los breakpoints móvil/tablet/escritorio). Cada resize
+espera a que pase el debounce (responsive.RESIZE_DEBOUNCE) y mide:
+
+- ms por resize: desde el evento hasta que el reacomodo y el layout terminan.
+- reflow ms: lo que tardó ResponsiveLayout.reflow (reglas + reflow()).
+- widgets nuevos: widgets del árbol de la pantalla que no existían antes
+  del resize. Debe ser 0: reacomodar no reconstruye.
+- tareas: peticiones enviadas al pool durante los resizes. Debe ser 0.
+
+Además escribe un texto en cada TextInput de la pantalla y comprueba que
+sigue ahí después de los resizes.
+
+    python -m benchmarks.resize --resizes 20
+    python -m benchmarks.resize --screens registro visualizar_combate
+"""
+import argparse
+import sys
+import time
+
+from benchmarks._screens import select, make_manager, frame
+
+_SIZES = ((1280, 720), (800, 600), (500, 800))
+_MARKER = "resize-bench"
+
+
+def _uid_mark():
+    """uid de Kivy es creciente: todo widget creado después tendrá uno mayor."""
+    from kivy.uix.widget import Widget
+    return Widget().uid
+
+
+def _inputs(screen):
+    from kivy.uix.textinput import TextInput
+    return [w for w in screen.walk(restrict=True) if isinstance(w, TextInput) and not w.readonly]
+
+
+def settle(debounce):
+    """Espera el debounce y procesa los frames que dispare."""
+    deadline = time.perf_counter() + debounce * 1.5
+    while time.perf_counter() < deadline:
+        frame()
+    frame(2)
+
+
+def measure(window, manager, name, factory, resizes, sizes):
+    from config import RESIZE_DEBOUNCE
+    from responsive import responsive
+    from task_executor import tasks
+
+    screen = factory(name)
+    manager.add_widget(screen)
+    manager.current = name
+    settle(RESIZE_DEBOUNCE)
+
+    inputs = _inputs(screen)
+    for text_input in inputs:
+        text_input.text = _MARKER
+    mark = _uid_mark()
+    before_tasks = tasks.submitted
+    before_updates = responsive.updates
+
+    elapsed = 0.0
+    reflow_ms = []
+    for i in range(resizes):
+        window.size = sizes[i % len(sizes)]
+        start = time.perf_counter()
+        window.dispatch("on_resize", *window.size)
+        settle(RESIZE_DEBOUNCE)
+        # El debounce no es costo de la pantalla
+        elapsed += time.perf_counter() - start - RESIZE_DEBOUNCE
+        reflow_ms.append(responsive.last_ms)
+
+    new_widgets = sum(1 for w in screen.walk(restrict=True) if w.uid > mark)
+    lost_inputs = sum(1 for text_input in inputs if text_input.text != _MARKER)
+
+    manager.current = "_base"
+    frame()
+    manager.remove_widget(screen)
+
+    return {
+        "screen": name,
+        "resizes": resizes,
+        "ms_per_resize": round(max(elapsed, 0.0) * 1000.0 / resizes, 2),
+        "reflow_ms": round(sum(reflow_ms) / len(reflow_ms), 2),
+        "updates": responsive.updates - before_updates,
+        "new_widgets": new_widgets,
+        "tasks": tasks.submitted - before_tasks,
+        "inputs": len(inputs),
+        "lost_inputs": lost_inputs,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resizes", type=int, default=20)
+    parser.add_argument("--sizes", nargs="*", default=None,
+                        help="tamaños a alternar, p.ej. 1280x720 800x600")
+    parser.add_argument("--screens", nargs="*", default=None)
+    args = parser.parse_args(argv)
+
+    sizes = tuple(tuple(int(v) for v in s.lower().split("x")) for s in args.sizes) if args.sizes else _SIZES
+    screens = select(args.screens)
+    window, manager = make_manager()
+
+    failures = []
+    print(f"{'pantalla':<28} {'ms/resize':>10} {'reflow ms':>10} {'cambios':>8} "
+          f"{'widgets+':>9} {'tareas':>7} {'inputs':>9}")
+    for name, factory in screens.items():
+        r = measure(window, manager, name, factory, args.resizes, sizes)
+        print(f"{name:<28} {r['ms_per_resize']:>10} {r['reflow_ms']:>10} {r['updates']:>8} "
+              f"{r['new_widgets']:>9} {r['tasks']:>7} {r['inputs'] - r['lost_inputs']:>4}/{r['inputs']:<4}")
+        if r["new_widgets"]:
+            failures.append(f"{name}: {r['new_widgets']} widgets recreados al redimensionar")
+        if r["tasks"]:
+            failures.append(f"{name}: {r['tasks']} peticiones al redimensionar")
+        if r["lost_inputs"]:
+            failures.append(f"{name}: {r['lost_inputs']} campos perdieron su texto")
+
+    if failures:
+        print("\nREDIMENSIONAR RECONSTRUYE:")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+    print("\nReacomodo sin reconstrucciones ni peticiones.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
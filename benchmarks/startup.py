@@ -0,0 +1,96 @@
+"""
+Arranque en frío: import de main.py y primer frame de la pantalla inicial.
+
+Cada corrida es un proceso nuevo (import en frío) que mide:
+
+- import ms: `import main` (Kivy + módulos que main importa arriba).
+- build ms: MyApp.build(), es decir, crear el ScreenManager y sus pantallas.
+- primer frame ms: desde el inicio del proceso hasta dibujar el primer frame.
+- pantallas / módulos: pantallas construidas y módulos de pantallas
+  importados al momento del primer frame.
+
+El modo `eager` construye todas las pantallas registradas antes del
+primer frame (como antes de screen_registry) para comparar.
+
+    python -m benchmarks.startup --runs 5
+    python -m benchmarks.startup --runs 5 --modes lazy
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+_START = time.perf_counter()
+
+_SCREEN_MODULES = (
+    "inicio", "registro", "torneos_anteriores", "crear_torneo", "crear_combate", "tablero",
+    "tablero_central", "ini", "ini_juez", "cuenta", "actualizar", "combates_anteriore",
+    "actualizar_torneos", "actualizar_combate",
+)
+
+
+def child(mode):
+    """Corre dentro del proceso medido; imprime una línea JSON."""
+    # Sin benchmarks._screens: importaría Kivy antes de empezar a medir
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    t0 = time.perf_counter()
+    import main
+    t1 = time.perf_counter()
+
+    from kivy.base import EventLoop
+    EventLoop.ensure_window()
+    app = main.MyApp()
+    t2 = time.perf_counter()
+    root = app.build()
+    if mode == "eager":
+        root.build_all()
+    app.root = root
+    t3 = time.perf_counter()
+    EventLoop.window.add_widget(root)
+    EventLoop.idle()
+    t4 = time.perf_counter()
+
+    print(json.dumps({
+        "import_ms": (t1 - t0) * 1000.0,
+        "build_ms": (t3 - t2) * 1000.0,
+        "first_frame_ms": (t4 - _START) * 1000.0,
+        "screens": len(root.screens),
+        "modules": sum(1 for m in _SCREEN_MODULES if m in sys.modules),
+    }))
+
+
+def run(mode):
+    env = dict(os.environ, KIVY_NO_ARGS="1", KIVY_NO_CONSOLELOG="1")
+    out = subprocess.run(
+        [sys.executable, "-m", "benchmarks.startup", "--child", mode],
+        capture_output=True, text=True, env=env, check=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--modes", nargs="*", default=["lazy", "eager"], choices=["lazy", "eager"])
+    parser.add_argument("--child", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        child(args.child)
+        return 0
+
+    print(f"{'modo':<6} {'import ms':>10} {'build ms':>10} {'1er frame ms':>13} {'pantallas':>10} {'módulos':>8}")
+    for mode in args.modes:
+        results = [run(mode) for _ in range(args.runs)]
+        med = {key: statistics.median(r[key] for r in results) for key in results[0]}
+        print(f"{mode:<6} {med['import_ms']:>10.1f} {med['build_ms']:>10.1f} {med['first_frame_ms']:>13.1f} "
+              f"{med['screens']:>10.0f} {med['modules']:>8.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
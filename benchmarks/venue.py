@@ -0,0 +1,385 @@
+"""
+Simulador de sede: N áreas de combate a la vez contra el backend de prueba.
+
+Cada corrida levanta benchmarks/backend.py con N combates y un proceso de
+Kivy con ventana que aloja las N áreas en una cuadrícula (todos los
+tableros se dibujan). Cada área tiene:
+
+- un tablero central (tablero_central.MainScreentabc) con su operador en
+  el hilo principal: inicia cada round, pausa y reanuda (pausar_tiempo /
+  reanudar_tiempo), marca y corrige faltas (add/subtract_gamjeom_api) y
+  deja que el reloj cierre los rounds (save_round_scores, descanso y
+  round siguiente);
+- 3 jueces: hilos con su propio ApiClient que registran puntos
+  (add_puntaje_simple) mientras el cronómetro del área corre; los puntos
+  llegan a los tableros por el WebSocket del backend, como en la sede;
+- --viewers tableros de visualización (tablero.MainScreentab).
+
+Por corrida se reporta el rendimiento (peticiones HTTP/s, eventos WS/s,
+renders/s), los errores (jueces, rollbacks de faltas, cola offline,
+huecos y reconexiones del WebSocket) y la latencia de cola: petición del
+juez, falta clic → confirmado, evento WS → render en centrales y visores
+y tiempo de frame. --areas indica las N a recorrer; el resultado completo
+se escribe en --output.
+
+    python -m benchmarks.venue --areas 1 2 4 8 12 --duration 60
+    python -m benchmarks.venue --areas 8 --viewers 3 --latency-ms 40 --jitter-ms 15
+
+Límites conocidos: todas las áreas comparten un proceso, como un equipo
+que controla varias áreas; la cola offline es única por proceso y su WAL
+es el del último combate abierto. Sin pantalla: xvfb-run python -m benchmarks.venue
+"""
+import argparse
+import json
+import math
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+
+from benchmarks.backend import combate, fetch_stats, start_process
+from benchmarks.e2e import (RenderTracker, child_env, http_delta, last_json, latency_summary, open_central,
+                            open_viewer, pump, run_info, settle)
+
+JUECES = 3
+
+_LATENCIES = (("judge_http", "juez → backend"), ("foul_confirm", "falta clic → conf."),
+              ("ws_render_central", "WS → render central"), ("ws_render_viewer", "WS → render visor"),
+              ("frame", "frame"))
+
+
+class _Judge(threading.Thread):
+    """Juez virtual: marca puntos al azar mientras el cronómetro de su área corre."""
+
+    def __init__(self, api_url, ids, board, rng, press_s, stats, stop):
+        super().__init__(name=f"juez-{ids['idCombate']}", daemon=True)
+        self.api_url = api_url
+        self.ids = ids
+        self.board = board
+        self.rng = rng
+        self.press_s = press_s
+        self.stats = stats
+        self.stop = stop
+
+    def run(self):
+        from api_client import ApiClient
+        from config import SHORT_TIMEOUT
+
+        client = ApiClient(self.api_url)
+        alumnos = (self.ids["idAlumnoRojo"], self.ids["idAlumnoAzul"])
+        while not self.stop.wait(self.rng.expovariate(1.0 / self.press_s)):
+            # Fuera del round el juez no marca (lectura de un snapshot inmutable)
+            if not self.board.center_panel.timer_running:
+                continue
+            start = time.perf_counter()
+            ok = True
+            try:
+                client.add_puntaje_simple(self.ids["idCombate"], self.rng.choice(alumnos), 1,
+                                          idempotency_key=uuid.uuid4().hex, timeout=SHORT_TIMEOUT)
+            except Exception:
+                ok = False
+            self.stats.record((time.perf_counter() - start) * 1000.0, ok)
+
+
+class _Foul:
+    __slots__ = ("panel", "expected", "t0", "confirm_ms")
+
+    def __init__(self, panel, expected, t0):
+        self.panel = panel
+        self.expected = expected
+        self.t0 = t0
+        self.confirm_ms = None
+
+
+class _Operator:
+    """
+    Mesa de control de un área (hilo principal): inicia los rounds, pausa y
+    reanuda, y marca faltas. Con 2 faltas corrige una en lugar de sumar la
+    tercera, para que el combate no termine por descalificación.
+    """
+
+    def __init__(self, board, rng, args):
+        self.board = board
+        self.rng = rng
+        self.foul_s = args.foul_s
+        self.pause_s = args.pause_s
+        self.fouls = []
+        self.pauses = 0
+        self.starts = 0
+        self.phase = None
+        now = time.perf_counter()
+        self.start_at = now
+        self.resume_at = None
+        self.next_foul = now + rng.expovariate(1.0 / self.foul_s)
+        self.next_pause = now + rng.expovariate(1.0 / self.pause_s)
+
+    def step(self, now):
+        from combat_state import READY, RUNNING, PAUSED
+
+        snapshot = self.board.combat.snapshot
+        if snapshot.phase != self.phase:
+            if snapshot.phase == READY:
+                # Tras el descanso, la mesa tarda un momento en iniciar el round
+                self.start_at = now + self.rng.uniform(0.5, 1.5)
+            self.phase = snapshot.phase
+        if snapshot.phase == READY and now >= self.start_at:
+            self.board.center_panel.start_timer()
+            if self.board.combat.snapshot.phase == RUNNING:
+                self.starts += 1
+        elif snapshot.phase == RUNNING and now >= self.next_pause:
+            self.board.pausar_tiempo()
+            self.pauses += 1
+            self.resume_at = now + self.rng.uniform(2.0, 5.0)
+            self.next_pause = now + self.rng.expovariate(1.0 / self.pause_s)
+        elif snapshot.phase == RUNNING and now >= self.next_foul:
+            self.foul(snapshot, now)
+            self.next_foul = now + self.rng.expovariate(1.0 / self.foul_s)
+        elif snapshot.phase == PAUSED and self.resume_at is not None and now >= self.resume_at:
+            self.board.reanudar_tiempo()
+            self.resume_at = None
+
+    def foul(self, snapshot, now):
+        panel = self.rng.choice((self.board.com1_panel, self.board.com2_panel))
+        fouls = snapshot.athlete(panel.lado).fouls
+        if fouls >= 2:
+            panel.subtract_gamjeom_api()
+            expected = fouls - 1
+        else:
+            panel.add_gamjeom_api()
+            expected = fouls + 1
+        self.fouls.append(_Foul(panel, expected, now))
+
+    def confirm(self, now):
+        for foul in self.fouls:
+            if foul.confirm_ms is not None:
+                continue
+            panel = foul.panel
+            shown = self.board.combat.snapshot.athlete(panel.lado).fouls
+            if shown == foul.expected and not panel.gamjeom_journal.has_pending():
+                foul.confirm_ms = (now - foul.t0) * 1000.0
+
+
+def _hms(seconds) -> str:
+    return f"{seconds // 3600:02}:{seconds // 60 % 60:02}:{seconds % 60:02}"
+
+
+def _grid(window, boards):
+    """Cuadrícula con un ScreenManager por tablero: todos se dibujan a la vez."""
+    from kivy.uix.gridlayout import GridLayout
+    from kivy.uix.screenmanager import ScreenManager, NoTransition
+
+    grid = GridLayout(cols=int(math.ceil(math.sqrt(boards))))
+    window.add_widget(grid)
+    managers = []
+    for _ in range(boards):
+        manager = ScreenManager(transition=NoTransition())
+        grid.add_widget(manager)
+        managers.append(manager)
+    return managers
+
+
+def venue(args):
+    """Proceso de la sede: N áreas durante --duration segundos; imprime una línea JSON."""
+    from kivy.base import EventLoop
+    from benchmarks._screens import frame
+    from metrics import FrameTimeCounter, LatencyStats
+    from offline_queue import offline_queue
+    import app_logging
+
+    EventLoop.ensure_window()
+    managers = iter(_grid(EventLoop.window, args.areas * (1 + args.viewers)))
+    areas = []
+    for index in range(1, args.areas + 1):
+        board = open_central(next(managers), index, duracionRound=_hms(args.round_s),
+                             duracionDescanso=_hms(args.rest_s), numeroRounds=args.rounds)
+        tracker = RenderTracker(board.realtime)
+        for panel in (board.com1_panel, board.com2_panel):
+            tracker.watch(panel.score_label, "text",
+                          lambda label, value, panel=panel: (panel.alumno_id, int(value or 0)))
+        viewers = [open_viewer(next(managers), index, name=f"viewer-{index}-{v}") for v in range(args.viewers)]
+        areas.append((index, board, tracker, viewers))
+
+    connections = [board.realtime for _, board, _, _ in areas]
+    connections += [screen.realtime for _, _, _, viewers in areas for screen, _ in viewers]
+    if not pump(lambda: all(c.connected for c in connections), args.timeout):
+        raise SystemExit("No todos los tableros se conectaron al WebSocket")
+    settle(args.latency_ms)
+
+    rng = random.Random(args.seed)
+    judge_http = LatencyStats(window=1000000)
+    frames = FrameTimeCounter(window=1000000)
+    stop = threading.Event()
+    judges = [_Judge(args.api, combate(index), board, random.Random(rng.random()), args.press_s, judge_http, stop)
+              for index, board, _, _ in areas for _ in range(JUECES)]
+    operators = [_Operator(board, random.Random(rng.random()), args) for _, board, _, _ in areas]
+    trackers = [tracker for _, _, tracker, _ in areas]
+    viewer_trackers = [tracker for _, _, _, viewers in areas for _, tracker in viewers]
+    queue_before = offline_queue.stats()
+    before = fetch_stats(args.api)
+
+    start = time.perf_counter()
+    for judge in judges:
+        judge.start()
+    while time.perf_counter() - start < args.duration:
+        now = time.perf_counter()
+        for operator in operators:
+            operator.step(now)
+        frame()
+        frames.tick()
+        now = time.perf_counter()
+        for operator in operators:
+            operator.confirm(now)
+        for tracker in trackers + viewer_trackers:
+            tracker.flush()
+    stop.set()
+    for judge in judges:
+        judge.join(timeout=args.timeout)
+    elapsed = time.perf_counter() - start
+
+    # Lo que quedó en vuelo termina de llegar sin contar en el tiempo medido
+    deadline = time.perf_counter() + 0.5 + 6 * args.latency_ms / 1000.0
+    while time.perf_counter() < deadline:
+        frame()
+        now = time.perf_counter()
+        for operator in operators:
+            operator.confirm(now)
+        for tracker in trackers + viewer_trackers:
+            tracker.flush()
+    after = fetch_stats(args.api)
+    queue_after = offline_queue.stats()
+
+    fouls = [foul for operator in operators for foul in operator.fouls]
+    central_ms = [ms for tracker in trackers for ms in tracker]
+    viewer_ms = [ms for tracker in viewer_trackers for ms in tracker]
+    judge = judge_http.snapshot()
+    realtime = [c.stats() for c in connections]
+    frame_ms = frames.snapshot()
+    ws_sent = after["ws"].get("sent", 0) - before["ws"].get("sent", 0)
+    result = {
+        "areas": args.areas,
+        "boards": len(connections),
+        "duration_s": round(elapsed, 2),
+        "throughput": {
+            "http_rps": round((after["http_total"] - before["http_total"]) / elapsed, 2),
+            "ws_events_s": round(ws_sent / elapsed, 2),
+            "judge_points_s": round(judge["count"] / elapsed, 2),
+            "renders_s": round((len(central_ms) + len(viewer_ms)) / elapsed, 2),
+        },
+        "errors": {
+            "judge_errors": judge["errors"],
+            "judge_error_rate": round(judge["errors"] / judge["count"], 4) if judge["count"] else 0.0,
+            "foul_rollbacks": sum(p.gamjeom_journal.stats()["rollbacks"]
+                                  for _, board, _, _ in areas for p in (board.com1_panel, board.com2_panel)),
+            "unconfirmed_fouls": sum(1 for foul in fouls if foul.confirm_ms is None),
+            "queue_failed": queue_after["failed"] - queue_before["failed"],
+            "queue_depth": queue_after["depth"],
+            "ws_reconnects": sum(r["reconnects"] for r in realtime),
+            "ws_gaps": sum(r["gaps"] for r in realtime),
+        },
+        "latency": {
+            "judge_http": {key: judge[key] for key in ("count", "avg_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms")},
+            "foul_confirm": latency_summary([f.confirm_ms for f in fouls if f.confirm_ms is not None]),
+            "ws_render_central": latency_summary(central_ms),
+            "ws_render_viewer": latency_summary(viewer_ms),
+            "frame": {key: frame_ms[key] for key in ("count", "avg_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms")},
+        },
+        "slow_frames": frame_ms["slow_frames"],
+        "operator": {
+            "fouls": len(fouls),
+            "pauses": sum(o.pauses for o in operators),
+            "round_starts": sum(o.starts for o in operators),
+            "rounds_closed": sum(len(board.combat.snapshot.rojo.round_scores) for _, board, _, _ in areas),
+        },
+        "http": http_delta(before, after),
+    }
+    for _, board, _, viewers in areas:
+        board.disconnect_websocket()
+        for screen, _ in viewers:
+            screen.disconnect_websocket()
+    app_logging.shutdown()
+    print(json.dumps(result))
+
+
+# ============ PROCESO PRINCIPAL ============
+
+def run_areas(args, areas) -> dict:
+    """Una corrida con `areas` áreas: backend nuevo y un proceso de Kivy."""
+    backend, api_url = start_process(combates=areas, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                                     seed=args.seed)
+    data_dir = tempfile.mkdtemp(prefix="bench-venue-")
+    cmd = [sys.executable, "-m", "benchmarks.venue", "--child", "--api", api_url, "--areas", str(areas)]
+    for key in ("viewers", "duration", "press_s", "foul_s", "pause_s", "round_s", "rest_s", "rounds",
+                "latency_ms", "seed", "timeout"):
+        cmd += [f"--{key.replace('_', '-')}", str(getattr(args, key))]
+    try:
+        out = subprocess.run(cmd, stdout=subprocess.PIPE, text=True, env=child_env(api_url, data_dir),
+                             check=True, timeout=args.duration + 10 * args.timeout).stdout
+    finally:
+        backend.kill()
+        shutil.rmtree(data_dir, ignore_errors=True)
+    return last_json(out)
+
+
+def report(runs):
+    print(f"{'áreas':>5} {'tableros':>8} {'HTTP/s':>8} {'WS/s':>8} {'render/s':>9} {'err juez':>9} "
+          f"{'rollback':>8} {'cola ✗':>6} {'huecos':>6} {'frames lentos':>13}")
+    for run in runs:
+        t, e = run["throughput"], run["errors"]
+        print(f"{run['areas']:>5} {run['boards']:>8} {t['http_rps']:>8.1f} {t['ws_events_s']:>8.1f} "
+              f"{t['renders_s']:>9.1f} {e['judge_error_rate'] * 100:>8.2f}% {e['foul_rollbacks']:>8} "
+              f"{e['queue_failed']:>6} {e['ws_gaps']:>6} {run['slow_frames']:>13}")
+    print(f"\n{'p99 ms':<22}" + "".join(f"{run['areas']:>9}" for run in runs))
+    for key, label in _LATENCIES:
+        print(f"{label:<22}" + "".join(f"{run['latency'][key]['p99_ms']:>9.1f}" for run in runs))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--areas", type=int, nargs="+", default=[1, 2, 4, 8, 12])
+    parser.add_argument("--viewers", type=int, default=2, help="tableros de visualización por área")
+    parser.add_argument("--duration", type=float, default=60.0, help="segundos medidos por corrida")
+    parser.add_argument("--press-s", type=float, default=3.0, help="tiempo medio entre puntos de cada juez")
+    parser.add_argument("--foul-s", type=float, default=20.0, help="tiempo medio entre faltas por área")
+    parser.add_argument("--pause-s", type=float, default=30.0, help="tiempo medio entre pausas por área")
+    parser.add_argument("--round-s", type=int, default=20, help="duración de cada round")
+    parser.add_argument("--rest-s", type=int, default=5, help="duración del descanso")
+    parser.add_argument("--rounds", type=int, default=99, help="rounds por combate (alcanza para toda la corrida)")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="retraso de cada sentido de la red")
+    parser.add_argument("--jitter-ms", type=float, default=5.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--timeout", type=float, default=15.0)
+    parser.add_argument("--output", default="venue.json")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--api", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        args.areas = args.areas[0]
+        venue(args)
+        return 0
+
+    runs = []
+    for areas in args.areas:
+        print(f"{areas} área(s)...", flush=True)
+        runs.append(run_areas(args, areas))
+    data = dict(run_info("venue"), **{
+        "config": {
+            "viewers": args.viewers, "judges": JUECES, "duration_s": args.duration, "press_s": args.press_s,
+            "foul_s": args.foul_s, "pause_s": args.pause_s, "round_s": args.round_s, "rest_s": args.rest_s,
+            "latency_ms": args.latency_ms, "jitter_ms": args.jitter_ms, "seed": args.seed,
+        },
+        "runs": runs,
+    })
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    report(runs)
+    print(f"resultados en {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
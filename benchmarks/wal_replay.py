@@ -0,0 +1,165 @@
+"""
+Recuperación del WAL tras un cierre inesperado (offline_queue.py).
+
+Escribe el WAL de un combate completo (--rounds rounds con --points
+puntos, --undos restas y --fouls faltas por competidor y round, más el
+cierre de cada round) sin confirmar nada, como si el backend hubiera
+estado caído todo el combate, y mide contra benchmarks/backend.py:
+
+- carga: OfflineQueue.open() (leer y compactar el WAL).
+- reenvío: desde open() hasta que la cola se vacía y llama a on_drained
+  (lo que reporta `last_replay_ms`), con la red real (ScoringTransport).
+
+También comprueba que el backend recibió cada operación exactamente una
+vez. El objetivo es reenviar un combate de 3 rounds en menos de --target-ms;
+si alguna corrida lo supera el proceso termina con código 1. Cada carril
+(alumno y tipo) se reenvía en serie para conservar el orden, así que el
+tiempo es ~ operaciones del carril más largo × ida y vuelta: la latencia
+por defecto es la de la red local de la sede.
+
+    python -m benchmarks.wal_replay --runs 5 --latency-ms 2
+    python -m benchmarks.wal_replay --points 30 --acked 0.5
+
+No necesita Kivy.
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import uuid
+
+from benchmarks.backend import combate, fetch_stats, start_process
+
+# tipo de operación -> ruta que cuenta el backend
+_ROUTES = {"puntaje.add": "puntaje.simple", "puntaje.delete": "puntaje.last",
+           "falta.add": "falta.simple", "falta.delete": "falta.last"}
+
+
+def combat_records(ids, rounds, points, undos, fouls, rng):
+    """Registros de WAL ("put" y "local") de un combate completo, en orden de marcado."""
+    records = []
+    for round_number in range(1, rounds + 1):
+        ops = []
+        for alumno in (ids["idAlumnoRojo"], ids["idAlumnoAzul"]):
+            lane = f"{ids['idCombate']}:{alumno}"
+            ops += [(f"{lane}:puntaje", "puntaje.add",
+                     {"combateId": ids["idCombate"], "alumnoId": alumno, "valorPuntaje": 1})] * points
+            ops += [(f"{lane}:puntaje", "puntaje.delete", {"alumnoId": alumno})] * undos
+            ops += [(f"{lane}:falta", "falta.add", {"combateId": ids["idCombate"], "alumnoId": alumno})] * fouls
+        # Mezcla realista entre carriles sin romper el orden dentro de cada uno
+        by_lane = {}
+        for op in ops:
+            by_lane.setdefault(op[0], []).append(op)
+        while by_lane:
+            lane = rng.choice(sorted(by_lane))
+            lane_name, kind, args = by_lane[lane].pop(0)
+            if not by_lane[lane]:
+                del by_lane[lane]
+            records.append({"op": "put", "key": uuid.uuid4().hex, "lane": lane_name, "kind": kind,
+                            "args": dict(args), "ts": time.time()})
+        records.append({"op": "local", "kind": "round_end",
+                        "args": {"round": round_number, "rojo": points - undos, "azul": points - undos},
+                        "ts": time.time()})
+    return records
+
+
+def write_wal(path, records, acked, rng):
+    """Escribe el WAL; una fracción `acked` de las operaciones ya tiene su "ack"."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    expected = {}
+    with open(path, "w", encoding="utf-8") as fh:
+        for record in records:
+            fh.write(json.dumps(record, separators=(",", ":")) + "\n")
+            if record["op"] != "put":
+                continue
+            if rng.random() < acked:
+                fh.write(json.dumps({"op": "ack", "key": record["key"]}) + "\n")
+            else:
+                route = _ROUTES[record["kind"]]
+                expected[route] = expected.get(route, 0) + 1
+    return expected
+
+
+def replay_once(api_url, args, run):
+    """Una recuperación con una cola nueva; retorna sus tiempos y contadores."""
+    from offline_queue import OfflineQueue
+
+    rng = random.Random(args.seed + run)
+    data_dir = tempfile.mkdtemp(prefix="bench-wal-")
+    queue = OfflineQueue(data_dir=data_dir)
+    ids = combate(1)
+    records = combat_records(ids, args.rounds, args.points, args.undos, args.fouls, rng)
+    expected = write_wal(queue.wal_path(ids["idCombate"]), records, args.acked, rng)
+    pending = sum(expected.values())
+
+    drained = threading.Event()
+    queue.on_drained = drained.set
+    before = fetch_stats(api_url)
+    start = time.perf_counter()
+    queue.open(ids["idCombate"])
+    if pending and not drained.wait(args.timeout):
+        raise SystemExit(f"La cola no se vació en {args.timeout} s")
+    elapsed_ms = (time.perf_counter() - start) * 1000.0
+    after = fetch_stats(api_url)
+    stats = queue.stats()
+    queue.finish(ids["idCombate"])
+    shutil.rmtree(data_dir, ignore_errors=True)
+
+    received = {route: after["http"].get(route, 0) - before["http"].get(route, 0) for route in _ROUTES.values()}
+    return {
+        "records": len(records),
+        "pending": pending,
+        "load_ms": round(queue.last_recovery_ms, 2),
+        "replay_ms": round(queue.last_replay_ms if pending else elapsed_ms, 2),
+        "sent": stats["sent"],
+        "failed": stats["failed"],
+        "wal_batches": stats["wal_batches"],
+        "exactly_once": all(received[route] == expected.get(route, 0) for route in received),
+        "received": {route: n for route, n in received.items() if n},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--points", type=int, default=15, help="puntos por competidor y round")
+    parser.add_argument("--undos", type=int, default=2, help="restas por competidor y round")
+    parser.add_argument("--fouls", type=int, default=1, help="faltas por competidor y round")
+    parser.add_argument("--acked", type=float, default=0.0, help="fracción de operaciones ya confirmadas")
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="retraso de cada sentido de la red")
+    parser.add_argument("--jitter-ms", type=float, default=0.5)
+    parser.add_argument("--target-ms", type=float, default=1000.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args(argv)
+
+    backend, api_url = start_process(combates=1, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                                     seed=args.seed)
+    data_dir = tempfile.mkdtemp(prefix="bench-wal-app-")
+    # La configuración se lee al importar: el cliente apunta al backend de prueba
+    os.environ.update(SISTEMA_COMBATES_API=api_url, SISTEMA_COMBATES_DATA=data_dir)
+    try:
+        results = [replay_once(api_url, args, run) for run in range(args.runs)]
+    finally:
+        backend.kill()
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+    print(f"{'corrida':>7} {'registros':>9} {'pendientes':>10} {'carga ms':>9} {'reenvío ms':>10} "
+          f"{'fallidas':>8} {'lotes WAL':>9} {'una vez':>7}")
+    for run, r in enumerate(results, 1):
+        print(f"{run:>7} {r['records']:>9} {r['pending']:>10} {r['load_ms']:>9.1f} {r['replay_ms']:>10.1f} "
+              f"{r['failed']:>8} {r['wal_batches']:>9} {'sí' if r['exactly_once'] else 'NO':>7}")
+    worst = max(r["replay_ms"] for r in results)
+    ok = worst < args.target_ms and all(r["exactly_once"] and not r["failed"] for r in results)
+    print(f"peor reenvío: {worst:.1f} ms (objetivo < {args.target_ms:.0f} ms) — {'OK' if ok else 'FALLA'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+from kivy.metrics import dp
+from kivy.uix.recyclegridlayout import RecycleGridLayout
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+
+
+class RecycledCard(RecycleDataViewBehavior):
+    """
+    Mezcla para tarjetas que se reutilizan dentro de un CardList.
+
+    La tarjeta construye sus widgets una sola vez; cuando RecycleView la
+    asigna a otro registro llama a `refresh_view_attrs`, que copia las
+    claves del dict de datos como atributos y luego llama a `show()` para
+    actualizar textos. Las subclases redefinen `show()`; si no lo hacen la
+    tarjeta solo recibe los atributos.
+    """
+
+    index = None
+
+    def refresh_view_attrs(self, rv, index, data):
+        self.index = index
+        super().refresh_view_attrs(rv, index, data)
+        self.show()
+
+    def show(self):
+        """Actualiza los widgets con los atributos recién copiados (por defecto nada)."""
+
+
+class CardList(RecycleView):
+    """
+    Lista virtualizada de tarjetas (torneos, combates).
+
+    Solo existen las tarjetas visibles más un pequeño margen: al hacer
+    scroll RecycleView reutiliza las que salen de pantalla con los datos
+    de las que entran, así que abrir o desplazar una lista de 600 combates
+    cuesta lo mismo que una de 10. Todas las filas miden `row_height`.
+    """
+
+    def __init__(self, viewclass, cols=1, row_height=dp(300), spacing=dp(10), padding=dp(10), **kwargs):
+        super().__init__(**kwargs)
+        self.viewclass = viewclass
+        self.grid = RecycleGridLayout(
+            cols=cols,
+            spacing=spacing,
+            padding=padding,
+            size_hint_y=None,
+            default_size=(None, row_height),
+            default_size_hint=(1, None)
+        )
+        self.grid.bind(minimum_height=self.grid.setter('height'))
+        self.add_widget(self.grid)
+
+    def set_items(self, items, **shared):
+        """Un registro por tarjeta; `shared` (callbacks) se agrega a cada uno."""
+        self.data = [dict(shared, **item) for item in items]
+        self.scroll_y = 1
+
+    def clear(self):
+        self.data = []
+
+    def set_layout(self, cols=None, row_height=None, spacing=None, padding=None):
+        """Ajusta la grilla sin recrear tarjetas (p.ej. al redimensionar)."""
+        if cols is not None:
+            self.grid.cols = cols
+        if row_height is not None:
+            self.grid.default_size = (None, row_height)
+        if spacing is not None:
+            self.grid.spacing = spacing
+        if padding is not None:
+            self.grid.padding = padding
+        self.refresh_from_layout()
+
+    def views(self):
+        """Tarjetas materializadas en este momento."""
+        return list(self.grid.children)
+
+    def stats(self) -> dict:
+        return {"items": len(self.data), "views": len(self.grid.children)}
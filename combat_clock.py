@@ -0,0 +1,96 @@
+import math
+import threading
+import time
+
+
+RESOLUTION = 0.01   # 10 ms
+
+
+def format_clock(seconds):
+    """mm:ss de un tiempo restante; el segundo en curso se muestra completo (03:00 hasta 02:59.99)."""
+    whole = int(math.ceil(round(max(0.0, seconds), 2)))
+    return f"{whole // 60:02}:{whole % 60:02}"
+
+
+class CountdownClock:
+    """
+    Cuenta regresiva basada en time.monotonic() con resolución de 10 ms.
+
+    No acumula ticks: guarda un instante límite (deadline) mientras corre y
+    el tiempo restante exacto mientras está en pausa, así que la frecuencia
+    con la que se consulta (o los tirones de frames) no introduce deriva, y
+    pausar/reanudar conserva el tiempo al centésimo. La pantalla decide cada
+    cuánto pintar; el reloj solo responde `remaining()`.
+
+    `state()` / `sync()` permiten publicar el tiempo autoritativo (tablero
+    central) y aplicarlo en otros tableros para que todos coincidan.
+    """
+
+    def __init__(self, duration=0.0, time_source=time.monotonic):
+        self._now = time_source
+        self._lock = threading.Lock()
+        self.duration = float(duration)
+        self._remaining = float(duration)
+        self._deadline = None
+
+    @staticmethod
+    def _quantize(seconds):
+        return max(0.0, round(seconds / RESOLUTION) * RESOLUTION)
+
+    @property
+    def running(self):
+        return self._deadline is not None
+
+    def start(self):
+        """Arranca o reanuda; no hace nada si ya corre o no queda tiempo."""
+        with self._lock:
+            if self._deadline is None and self._remaining > 0:
+                self._deadline = self._now() + self._remaining
+
+    def pause(self):
+        """Detiene el reloj conservando el tiempo restante exacto."""
+        with self._lock:
+            if self._deadline is not None:
+                self._remaining = max(0.0, self._deadline - self._now())
+                self._deadline = None
+
+    def reset(self, duration=None):
+        """Detiene el reloj y lo deja en `duration` (por defecto la duración original)."""
+        with self._lock:
+            if duration is not None:
+                self.duration = float(duration)
+            self._remaining = self.duration
+            self._deadline = None
+
+    def sync(self, remaining, running):
+        """Ajusta el reloj a un valor autoritativo recibido de otro tablero."""
+        with self._lock:
+            remaining = max(0.0, float(remaining))
+            if running and remaining > 0:
+                self._deadline = self._now() + remaining
+            else:
+                self._remaining = remaining
+                self._deadline = None
+
+    def remaining(self):
+        """Segundos restantes, redondeados a 10 ms."""
+        with self._lock:
+            if self._deadline is None:
+                value = self._remaining
+            else:
+                value = self._deadline - self._now()
+        return self._quantize(value)
+
+    def remaining_ms(self):
+        return int(round(self.remaining() * 1000))
+
+    @property
+    def expired(self):
+        return self.remaining() <= 0
+
+    def display(self):
+        return format_clock(self.remaining())
+
+    def state(self) -> dict:
+        """Estado publicable: {"remaining_ms", "running"}."""
+        return {"remaining_ms": self.remaining_ms(), "running": self.running and not self.expired}
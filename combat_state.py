@@ -0,0 +1,292 @@
+import threading
+import time
+from collections import namedtuple
+from app_logging import get_logger
+
+log = get_logger("combat_state")
+
+
+# Fases del combate
+READY = "ready"          # round listo, cronómetro detenido
+RUNNING = "running"      # cronómetro corriendo
+PAUSED = "paused"        # round iniciado y pausado
+REST = "rest"            # descanso entre rounds
+MEDICAL = "medical"      # tiempo médico
+FINISHED = "finished"
+
+LADOS = ("rojo", "azul")
+
+
+AthleteState = namedtuple("AthleteState", "score round_scores fouls disqualified")
+
+CombatEvent = namedtuple("CombatEvent", "seq kind data ts")
+
+
+class CombatSnapshot(namedtuple("CombatSnapshot", (
+        "seq phase last_event started round_number numero_rounds duracion_round "
+        "duracion_descanso remaining rojo azul medical resume_phase result winner"))):
+    """
+    Estado inmutable del combate tras aplicar el evento `seq`.
+
+    `resume_phase` es la fase a la que vuelve el combate al terminar el
+    tiempo médico (None fuera de él).
+    """
+    __slots__ = ()
+
+    @property
+    def combat_active(self):
+        """Se pueden marcar puntos y faltas (round iniciado, corriendo o en pausa)."""
+        return self.phase in (RUNNING, PAUSED)
+
+    @property
+    def is_rest(self):
+        return self.phase == REST
+
+    @property
+    def finished(self):
+        return self.phase == FINISHED
+
+    def athlete(self, lado):
+        return self.rojo if lado == "rojo" else self.azul
+
+    def total(self, lado):
+        a = self.athlete(lado)
+        return sum(a.round_scores) + a.score
+
+
+def _otro(lado):
+    return "azul" if lado == "rojo" else "rojo"
+
+
+class CombatStateMachine:
+    """
+    Máquina de estados del combate, sin dependencias de Kivy.
+
+    Consume un flujo ordenado de eventos y produce instantáneas inmutables
+    (CombatSnapshot). Las pantallas solo envían eventos con `apply()` y
+    pintan lo que reciben en `subscribe()`; toda la lógica de rounds,
+    puntajes y faltas vive aquí, bajo un único lock, de modo que una
+    actualización de puntaje y un cierre de round nunca se pisan.
+
+    Eventos (kind, datos):
+        configure     numero_rounds, duracion_round, duracion_descanso
+        start / pause
+        time          remaining                (segundos restantes)
+        point / undo  lado, value=None         (+1 / -1 o valor mostrado)
+        score_sync    lado, value              (valor autoritativo)
+        foul / foul_undo / foul_sync  lado, value=None
+        round_end                              (cronómetro a cero)
+        rest_end
+        next_round / finish                    (avance o final manual)
+        medical_start lado
+        medical_end   lado, result             (continuar | abandono | descalificacion)
+        disqualification  lado
+        restore       rounds=[{round, rojo, azul}, ...]   (desde el WAL)
+
+    Los eventos que no aplican a la fase actual se descartan (`rejected`).
+    El registro completo queda en `events` y puede reproducirse con
+    `replay()` para reconstruir o avanzar un combate sin interfaz.
+    """
+
+    def __init__(self, numero_rounds=3, duracion_round=180, duracion_descanso=60):
+        self._lock = threading.RLock()
+        self._listeners = []
+        self.events = []
+        self.rejected = 0
+        athlete = AthleteState(0, (), 0, False)
+        self._snapshot = CombatSnapshot(
+            seq=0, phase=READY, last_event=None, started=False, round_number=1,
+            numero_rounds=numero_rounds, duracion_round=duracion_round,
+            duracion_descanso=duracion_descanso, remaining=duracion_round,
+            rojo=athlete, azul=athlete, medical=None, resume_phase=None, result=None, winner=None
+        )
+
+    # ============ API PÚBLICA ============
+
+    @property
+    def snapshot(self) -> CombatSnapshot:
+        return self._snapshot
+
+    def subscribe(self, listener):
+        """listener(snapshot) se llama tras cada evento aceptado (en el hilo que lo aplicó)."""
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def apply(self, kind, **data) -> CombatSnapshot:
+        """Aplica un evento y devuelve la instantánea resultante."""
+        with self._lock:
+            handler = getattr(self, f"_on_{kind}", None)
+            if handler is None:
+                raise ValueError(f"Evento de combate desconocido: {kind}")
+            current = self._snapshot
+            changes = handler(current, **data)
+            if changes is None:
+                self.rejected += 1
+                log.debug("evento.ignorado", evento=kind, fase=current.phase)
+                return current
+            seq = current.seq + 1
+            self.events.append(CombatEvent(seq, kind, dict(data), time.time()))
+            snapshot = current._replace(seq=seq, last_event=kind, **changes)
+            self._snapshot = snapshot
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener(snapshot)
+        return snapshot
+
+    @classmethod
+    def replay(cls, events, until_seq=None, **config):
+        """Reconstruye una máquina a partir de un registro de eventos (hasta `until_seq`)."""
+        machine = cls(**config)
+        for event in events:
+            if until_seq is not None and event.seq > until_seq:
+                break
+            machine.apply(event.kind, **event.data)
+        return machine
+
+    # ============ CRONÓMETRO ============
+
+    def _on_configure(self, s, numero_rounds=None, duracion_round=None, duracion_descanso=None):
+        if s.started:
+            return None
+        numero_rounds = numero_rounds or s.numero_rounds
+        duracion_round = duracion_round or s.duracion_round
+        return {
+            "numero_rounds": numero_rounds,
+            "duracion_round": duracion_round,
+            "duracion_descanso": duracion_descanso or s.duracion_descanso,
+            "remaining": duracion_round,
+        }
+
+    def _on_start(self, s):
+        if s.phase not in (READY, PAUSED):
+            return None
+        return {"phase": RUNNING, "started": True}
+
+    def _on_pause(self, s):
+        if s.phase != RUNNING:
+            return None
+        return {"phase": PAUSED}
+
+    def _on_time(self, s, remaining):
+        if s.phase == FINISHED:
+            return None
+        return {"remaining": max(0, remaining)}
+
+    # ============ PUNTAJES Y FALTAS ============
+
+    def _athlete_change(self, s, lado, **fields):
+        if lado not in LADOS:
+            return None
+        return {lado: s.athlete(lado)._replace(**fields)}
+
+    def _on_point(self, s, lado, value=None):
+        if not s.combat_active:
+            return None
+        score = s.athlete(lado).score + 1 if value is None else value
+        return self._athlete_change(s, lado, score=max(0, score))
+
+    def _on_undo(self, s, lado, value=None):
+        if not s.combat_active:
+            return None
+        score = s.athlete(lado).score - 1 if value is None else value
+        return self._athlete_change(s, lado, score=max(0, score))
+
+    def _on_score_sync(self, s, lado, value):
+        return self._athlete_change(s, lado, score=max(0, value))
+
+    def _on_foul(self, s, lado, value=None):
+        if not s.combat_active:
+            return None
+        fouls = s.athlete(lado).fouls + 1 if value is None else value
+        return self._athlete_change(s, lado, fouls=max(0, fouls))
+
+    def _on_foul_undo(self, s, lado, value=None):
+        if not s.combat_active:
+            return None
+        fouls = s.athlete(lado).fouls - 1 if value is None else value
+        return self._athlete_change(s, lado, fouls=max(0, fouls))
+
+    def _on_foul_sync(self, s, lado, value):
+        return self._athlete_change(s, lado, fouls=max(0, value))
+
+    # ============ ROUNDS ============
+
+    def _close_round(self, s):
+        """Congela el puntaje actual de ambos competidores en su historial."""
+        return {
+            lado: s.athlete(lado)._replace(round_scores=s.athlete(lado).round_scores + (s.athlete(lado).score,))
+            for lado in LADOS
+        }
+
+    def _finish(self, s, changes, result, winner=None):
+        changes.update(phase=FINISHED, result=result, medical=None, resume_phase=None)
+        if winner is None:
+            closed = s._replace(**changes)
+            total_rojo, total_azul = closed.total("rojo"), closed.total("azul")
+            winner = "rojo" if total_rojo > total_azul else "azul" if total_azul > total_rojo else None
+        changes["winner"] = winner
+        return changes
+
+    def _on_round_end(self, s):
+        if s.phase not in (RUNNING, PAUSED, READY):
+            return None
+        changes = self._close_round(s)
+        if s.round_number >= s.numero_rounds:
+            return self._finish(s, changes, "puntos")
+        changes.update(phase=REST, remaining=s.duracion_descanso)
+        return changes
+
+    def _on_rest_end(self, s):
+        if s.phase != REST:
+            return None
+        return {"phase": READY, "round_number": s.round_number + 1, "remaining": s.duracion_round}
+
+    def _on_next_round(self, s):
+        if s.phase not in (RUNNING, PAUSED, READY) or s.round_number >= s.numero_rounds:
+            return None
+        changes = self._close_round(s)
+        changes.update(phase=READY, round_number=s.round_number + 1, remaining=s.duracion_round)
+        return changes
+
+    def _on_finish(self, s):
+        if s.phase == FINISHED:
+            return None
+        changes = self._close_round(s) if s.phase != REST else {}
+        return self._finish(s, changes, "manual")
+
+    def _on_restore(self, s, rounds):
+        if s.started or not rounds:
+            return None
+        changes = {
+            lado: s.athlete(lado)._replace(round_scores=tuple(r.get(lado, 0) for r in rounds))
+            for lado in LADOS
+        }
+        last_round = rounds[-1].get("round", len(rounds))
+        if last_round >= s.numero_rounds:
+            return self._finish(s, changes, "puntos")
+        changes.update(phase=READY, round_number=last_round + 1, remaining=s.duracion_round)
+        return changes
+
+    # ============ TIEMPO MÉDICO Y DESCALIFICACIÓN ============
+
+    def _on_medical_start(self, s, lado):
+        if s.phase not in (READY, RUNNING, PAUSED) or lado not in LADOS:
+            return None
+        return {"phase": MEDICAL, "medical": lado,
+                "resume_phase": PAUSED if s.phase == RUNNING else s.phase}
+
+    def _on_medical_end(self, s, lado, result="continuar"):
+        if s.phase != MEDICAL:
+            return None
+        if result == "continuar":
+            return {"phase": s.resume_phase or PAUSED, "medical": None, "resume_phase": None}
+        return self._finish(s, {}, result, winner=_otro(lado))
+
+    def _on_disqualification(self, s, lado):
+        if s.phase == FINISHED or lado not in LADOS:
+            return None
+        changes = self._athlete_change(s, lado, disqualified=True)
+        return self._finish(s, changes, "descalificacion", winner=_otro(lado))
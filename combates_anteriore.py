@@ -2,11 +2,10 @@ from kivy.uix.screenmanager import Screen
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.uix.button import Button
-from kivy.uix.scrollview import ScrollView
+from kivy.uix.gridlayout import GridLayout
 from kivy.graphics import Color, RoundedRectangle, Line
 from kivy.metrics import dp, sp
 from kivy.core.window import Window
-from kivy.uix.gridlayout import GridLayout
 from kivy.properties import ListProperty, StringProperty, NumericProperty
 from kivy.uix.popup import Popup
 from kivy.app import App
@@ -15,7 +14,9 @@ from kivy.utils import platform
 from kivy.clock import Clock
 from kivy.animation import Animation
 from api_client import api
-from threading import Thread
+from task_executor import tasks, PRIORITY_HIGH
+from card_list import CardList, RecycledCard
+from responsive import responsive
 
 
 # ------------------ UTILIDADES RESPONSIVE ------------------
@@ -87,14 +88,11 @@ class LightBlueButton(Button):
         self.bind(pos=self.update_rect, size=self.update_rect)
         self.bind(on_press=self.on_button_press)
         self.bind(on_release=self.on_button_release)
-        Window.bind(on_resize=self.on_window_resize)
+        responsive.track(self, font_size=lambda: ResponsiveHelper.get_font_size(16))
 
     def update_rect(self, *args):
         self.rect.pos = self.pos
         self.rect.size = self.size
-    
-    def on_window_resize(self, instance, width, height):
-        self.font_size = ResponsiveHelper.get_font_size(16)
 
     def on_button_press(self, instance):
         anim = Animation(
@@ -406,46 +404,50 @@ class ConfirmDeleteCombatePopup(Popup):
         self.dismiss()
 
 
-class CombateCard(BoxLayout):
+class CombateCard(RecycledCard, BoxLayout):
+    """Tarjeta reutilizable: CardList le asigna combate_data y callbacks."""
     bg_color = ListProperty([0.1, 0.4, 0.7, 1])
 
-    def __init__(self, combate_data, on_delete, on_edit, **kwargs):
+    @staticmethod
+    def card_height():
+        # 2x2 botones en horizontal, 4x1 en vertical (50 de alto + 12 de separación)
+        button_rows_height = dp(112) if Window.width > 600 else dp(236)
+        return dp(180) + button_rows_height
+
+    def __init__(self, combate_data=None, on_delete=None, on_edit=None, **kwargs):
         super().__init__(**kwargs)
         self.orientation = 'vertical'
         self.spacing = dp(15)
         self.padding = [dp(25), dp(20)]
-        self.size_hint = (ResponsiveHelper.get_card_width(), None)
-        self.pos_hint = {'center_x': 0.5}
+        self.size_hint = (1, None)
         self.combate_data = combate_data
         self.on_delete_callback = on_delete
         self.on_edit_callback = on_edit
+
+        with self.canvas.before:
+            Color(*self.bg_color)
+            self.rect = RoundedRectangle(pos=self.pos, size=self.size, radius=[dp(18)])
+        self.bind(pos=self.update_graphics, size=self.update_graphics)
         
         self.build_card()
-        Window.bind(on_resize=self.on_window_resize)
+        if combate_data is not None:
+            self.show()
 
     def build_card(self):
         self.clear_widgets()
-        
-        button_rows_height = dp(110) if Window.width > 600 else dp(220)
-        self.height = dp(180) + button_rows_height
-
-        with self.canvas.before:
-            Color(*self.bg_color)
-            self.rect = RoundedRectangle(pos=self.pos, size=self.size, radius=[dp(18)])
-            
-            self.bind(pos=self.update_graphics, size=self.update_graphics)
+        self.height = self.card_height()
 
         # Header con badge
         header_box = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(40), spacing=dp(10))
         
-        badge_label = Label(
-            text=f'#{self.combate_data["numero"]}',
+        self.badge_label = badge_label = Label(
             font_size=ResponsiveHelper.get_font_size(18),
             color=(0.2, 0.6, 1, 1),
             size_hint=(None, None),
             size=(dp(55), dp(35)),
             bold=True
         )
+        responsive.track(badge_label, font_size=lambda: ResponsiveHelper.get_font_size(18))
         
         with badge_label.canvas.before:
             Color(1, 1, 1, 0.95)
@@ -471,75 +473,33 @@ class CombateCard(BoxLayout):
             padding=[dp(5), dp(2), dp(5), dp(2)]
         )
         
-        self.add_info_row("Fecha:", self.combate_data['fecha'])
-        self.add_info_row("Hora:", self.combate_data.get('hora', 'No disponible'))
-        self.add_info_row("Categoría:", self.combate_data['categoria'])
-
-        participantes_text = (
-            f"[color=5BC0EB]{self.combate_data.get('competidor1', 'No disponible')}[/color] vs "
-            f"[color=ff3333]{self.combate_data.get('competidor2', 'No disponible')}[/color]"
-        )
-        self.add_info_row("Participantes:", participantes_text, is_participants=True)
+        self.fecha_value = self.add_info_row("Fecha:", "")
+        self.hora_value = self.add_info_row("Hora:", "")
+        self.categoria_value = self.add_info_row("Categoría:", "")
+        self.participantes_value = self.add_info_row("Participantes:", "", is_participants=True)
 
         self.add_widget(self.info_layout)
 
-        # Botones
-        if Window.width > 600:
-            self.create_horizontal_buttons()
-        else:
-            self.create_vertical_buttons()
+        # Botones: 2 columnas en horizontal, 1 en vertical
+        self.create_buttons()
 
-    def create_horizontal_buttons(self):
-        buttons_main_layout = BoxLayout(
-            orientation='vertical',
+    def create_buttons(self):
+        buttons_main_layout = GridLayout(
             spacing=dp(12),
-            size_hint_y=None,
-            height=dp(110)
-        )
-
-        button_row1 = BoxLayout(orientation='horizontal', spacing=dp(12), size_hint_y=None, height=dp(50))
-        edit_btn = LightBlueButton(text='EDITAR')
-        edit_btn.bind(on_press=self.open_edit_screen)
-        delete_btn = LightBlueButton(text='ELIMINAR')
-        delete_btn.bind(on_press=self.open_delete_popup)
-        button_row1.add_widget(edit_btn)
-        button_row1.add_widget(delete_btn)
-
-        button_row2 = BoxLayout(orientation='horizontal', spacing=dp(12), size_hint_y=None, height=dp(50))
-        password_btn = LightBlueButton(text='CONTRASEÑA')
-        password_btn.bind(on_press=self.open_password_flow)
-        tablero_btn = LightBlueButton(text='TABLERO')
-        tablero_btn.bind(on_press=self.navigate_to_tablero)
-        button_row2.add_widget(password_btn)
-        button_row2.add_widget(tablero_btn)
-
-        buttons_main_layout.add_widget(button_row1)
-        buttons_main_layout.add_widget(button_row2)
-        self.add_widget(buttons_main_layout)
-
-    def create_vertical_buttons(self):
-        buttons_main_layout = BoxLayout(
-            orientation='vertical',
-            spacing=dp(12),
-            size_hint_y=None,
-            height=dp(220)
+            size_hint_y=None
         )
-
-        edit_btn = LightBlueButton(text='EDITAR')
-        edit_btn.bind(on_press=self.open_edit_screen)
-        buttons_main_layout.add_widget(edit_btn)
-
-        delete_btn = LightBlueButton(text='ELIMINAR')
-        delete_btn.bind(on_press=self.open_delete_popup)
-        buttons_main_layout.add_widget(delete_btn)
-
-        password_btn = LightBlueButton(text='CONTRASEÑA')
-        password_btn.bind(on_press=self.open_password_flow)
-        buttons_main_layout.add_widget(password_btn)
-
-        tablero_btn = LightBlueButton(text='TABLERO')
-        tablero_btn.bind(on_press=self.navigate_to_tablero)
-        buttons_main_layout.add_widget(tablero_btn)
+        buttons_main_layout.bind(minimum_height=buttons_main_layout.setter('height'))
+        responsive.track(buttons_main_layout, cols=lambda: 2 if Window.width > 600 else 1)
+
+        for text, action in (
+            ('EDITAR', self.open_edit_screen),
+            ('ELIMINAR', self.open_delete_popup),
+            ('CONTRASEÑA', self.open_password_flow),
+            ('TABLERO', self.navigate_to_tablero),
+        ):
+            btn = LightBlueButton(text=text)
+            btn.bind(on_press=action)
+            buttons_main_layout.add_widget(btn)
 
         self.add_widget(buttons_main_layout)
 
@@ -548,44 +508,58 @@ class CombateCard(BoxLayout):
         
         lbl_label = Label(
             text=label,
-            font_size=ResponsiveHelper.get_font_size(14),
             color=(0.95, 0.95, 0.95, 0.9),
             halign='left',
             valign='middle',
-            size_hint_x=0.35 if Window.width < 600 else 0.3,
             text_size=(None, None),
             bold=True
         )
-        
-        card_width = Window.width * ResponsiveHelper.get_card_width() - dp(60)
-        value_width = card_width * (0.65 if Window.width < 600 else 0.7)
+        responsive.track(
+            lbl_label,
+            font_size=lambda: ResponsiveHelper.get_font_size(14),
+            size_hint_x=lambda: 0.35 if Window.width < 600 else 0.3
+        )
         
         lbl_value = Label(
             text=value,
-            font_size=ResponsiveHelper.get_font_size(13 if Window.width < 600 else 14),
             color=(1, 1, 1, 1) if not is_participants else (1, 1, 1, 1),
             halign='left',
             valign='middle',
-            size_hint_x=0.65 if Window.width < 600 else 0.7,
-            text_size=(value_width, None),
             shorten=False,
             markup=True
         )
+        responsive.track(
+            lbl_value,
+            font_size=lambda: ResponsiveHelper.get_font_size(13 if Window.width < 600 else 14),
+            size_hint_x=lambda: 0.65 if Window.width < 600 else 0.7,
+            text_size=self._value_text_size
+        )
         
         row.add_widget(lbl_label)
         row.add_widget(lbl_value)
         self.info_layout.add_widget(row)
+        return lbl_value
+
+    def show(self):
+        """Pinta los datos del combate actual en los widgets ya creados."""
+        data = self.combate_data
+        self.badge_label.text = f'#{data["numero"]}'
+        self.fecha_value.text = data['fecha']
+        self.hora_value.text = data.get('hora', 'No disponible')
+        self.categoria_value.text = data['categoria']
+        self.participantes_value.text = (
+            f"[color=5BC0EB]{data.get('competidor1', 'No disponible')}[/color] vs "
+            f"[color=ff3333]{data.get('competidor2', 'No disponible')}[/color]"
+        )
 
     def update_graphics(self, *args):
         self.rect.pos = self.pos
         self.rect.size = self.size
 
-    def on_window_resize(self, instance, width, height):
-        Clock.schedule_once(lambda dt: self.rebuild_card(), 0.1)
-
-    def rebuild_card(self):
-        self.size_hint = (ResponsiveHelper.get_card_width(), None)
-        self.build_card()
+    @staticmethod
+    def _value_text_size():
+        card_width = Window.width * ResponsiveHelper.get_card_width() - dp(60)
+        return (card_width * (0.65 if Window.width < 600 else 0.7), None)
 
     def open_delete_popup(self, instance):
         ConfirmDeleteCombatePopup(
@@ -636,25 +610,18 @@ class CombateCard(BoxLayout):
         combate_id = self.combate_data.get('id')
     
         def _fetch():
-            try:
-                # Obtener datos completos del combate desde la API
-                combate_completo = api.get_combate_by_id(combate_id)
-                contrasena = combate_completo.get('contrasenaCombate', 'No configurada')
-                
-                Clock.schedule_once(
-                    lambda dt: PasswordDisplayPopup(
-                        combate_numero=self.combate_data['numero'],
-                        password=contrasena
-                    ).open()
-                )
-            except Exception as e:
-                Clock.schedule_once(
-                    lambda dt: self.show_error_popup(f"Error al obtener contraseña: {str(e)}")
-                )
-        
-        thread = Thread(target=_fetch)
-        thread.daemon = True
-        thread.start()
+            # Obtener datos completos del combate desde la API
+            combate_completo = api.get_combate_by_id(combate_id)
+            return combate_completo.get('contrasenaCombate', 'No configurada')
+        
+        tasks.submit(
+            _fetch, owner=self, priority=PRIORITY_HIGH, name="combate.password",
+            on_success=lambda contrasena: PasswordDisplayPopup(
+                combate_numero=self.combate_data['numero'],
+                password=contrasena
+            ).open(),
+            on_error=lambda e: self.show_error_popup(f"Error al obtener contraseña: {str(e)}")
+        )
 
     def show_error_popup(self, message):
         """Muestra un popup de error"""
@@ -721,7 +688,7 @@ class CombatesScreen(Screen):
         super().__init__(**kwargs)
         self.combates = []
         self.build_ui()
-        Window.bind(on_resize=self.on_window_resize)
+        responsive.subscribe(self)
         print(f"[CombatesScreen] Inicializado para torneo: {self.torneo_nombre} (ID: {self.torneo_id})")
 
     def build_ui(self):
@@ -741,29 +708,39 @@ class CombatesScreen(Screen):
         titulo = Label(
             text=f"[b]Combates del Torneo[/b]",
             markup=True,
-            font_size=ResponsiveHelper.get_font_size(24),
             color=(0.1, 0.4, 0.7, 1),
             halign='center',
             valign='bottom',
             size_hint_y=0.6
         )
+        responsive.track(titulo, font_size=lambda: ResponsiveHelper.get_font_size(24))
         
         subtitulo = Label(
             text=self.torneo_nombre,
-            font_size=ResponsiveHelper.get_font_size(18),
             color=(0.2, 0.5, 0.8, 1),
             halign='center',
             valign='top',
             size_hint_y=0.4
         )
+        responsive.track(subtitulo, font_size=lambda: ResponsiveHelper.get_font_size(18))
+        # El torneo cambia sin reconstruir la pantalla
+        self.bind(torneo_nombre=subtitulo.setter('text'))
         
         header_content.add_widget(titulo)
         header_content.add_widget(subtitulo)
         header.add_widget(header_content)
         self.layout.add_widget(header)
         
-        # ScrollView
-        scroll = ScrollView(
+        # Zona de estado (cargando / vacío / error con reintentar)
+        self.status_box = BoxLayout(orientation='vertical', size_hint_y=None, height=0)
+        self.layout.add_widget(self.status_box)
+
+        # Lista reciclable: solo existen las tarjetas visibles
+        self.card_list = CardList(
+            CombateCard,
+            row_height=CombateCard.card_height(),
+            spacing=dp(20),
+            padding=self._list_padding(),
             size_hint=(1, 1),
             scroll_type=['bars', 'content'],
             bar_width=dp(8),
@@ -772,17 +749,7 @@ class CombatesScreen(Screen):
             do_scroll_x=False,
             effect_cls='ScrollEffect'
         )
-        
-        self.grid = GridLayout(
-            cols=1,
-            spacing=dp(20),
-            padding=[dp(15), dp(25), dp(15), dp(25)],
-            size_hint_y=None
-        )
-        self.grid.bind(minimum_height=self.grid.setter('height'))
-        
-        scroll.add_widget(self.grid)
-        self.layout.add_widget(scroll)
+        self.layout.add_widget(self.card_list)
 
         # Footer
         footer = BoxLayout(size_hint_y=None, height=dp(70), padding=[dp(30), dp(15), dp(30), dp(15)])
@@ -795,6 +762,7 @@ class CombatesScreen(Screen):
             bold=True,
             on_press=lambda x: setattr(self.manager, 'current', 'torneos_anteriores')
         )
+        responsive.track(btn_volver, font_size=lambda: ResponsiveHelper.get_font_size(18))
         
         with btn_volver.canvas.before:
             Color(0.2, 0.6, 1, 1)
@@ -815,53 +783,84 @@ class CombatesScreen(Screen):
         self.rect.pos = self.layout.pos
         self.rect.size = self.layout.size
 
-    def on_window_resize(self, instance, width, height):
-        Clock.schedule_once(lambda dt: self.build_ui(), 0.1)
+    def reflow(self):
+        """Ajusta la grilla de tarjetas al nuevo ancho sin recargar los combates"""
+        self.card_list.set_layout(row_height=CombateCard.card_height(), padding=self._list_padding())
     
     def on_enter(self):
         """Se ejecuta cada vez que se entra a la pantalla"""
         # Recargar combates para mostrar cambios
         self.load_combates()
 
+    def on_pre_leave(self, *args):
+        tasks.cancel_owner(self)
+        for card in self.card_list.views():
+            tasks.cancel_owner(card)
+
+    def _list_padding(self):
+        """Margen lateral para que las tarjetas ocupen get_card_width() del ancho, centradas."""
+        side = max(dp(15), Window.width * (1 - ResponsiveHelper.get_card_width()) / 2)
+        return [side, dp(25), side, dp(25)]
+
+    def _set_status(self, *widgets, height=dp(60)):
+        """Reemplaza el contenido de la zona de estado; sin widgets la oculta."""
+        self.status_box.clear_widgets()
+        for widget in widgets:
+            self.status_box.add_widget(widget)
+        self.status_box.height = height if widgets else 0
+
     def load_combates(self):
         """Carga los combates desde la API"""
         print("[CombatesScreen] Iniciando carga de combates...")
-        self.grid.clear_widgets()
+        self.card_list.clear()
         
         loading_label = Label(
             text='Cargando combates...',
             font_size=ResponsiveHelper.get_font_size(18),
             color=(0.2, 0.6, 1, 1)
         )
-        self.grid.add_widget(loading_label)
+        self._set_status(loading_label)
         
-        thread = Thread(target=self._fetch_combates)
-        thread.daemon = True
-        thread.start()
+        # Una recarga reemplaza a la anterior que siga en curso
+        if getattr(self, '_load_task', None):
+            self._load_task.cancel()
+        self._load_task = tasks.submit(self._fetch_combates, owner=self, name="combates.list",
+                                       on_success=self._on_combates_loaded,
+                                       on_error=self._on_combates_error)
 
     def _fetch_combates(self):
         """Obtiene los combates de la API en segundo plano"""
         print("[CombatesScreen] Fetching combates from API...")
-        try:
-            if self.torneo_id:
-                combates_data = api.get_combates_by_torneo(self.torneo_id)
-                print(f"[CombatesScreen] Recibidos {len(combates_data)} combates del torneo {self.torneo_id}")
-            else:
-                combates_data = api.get_all_combates()
-                print(f"[CombatesScreen] Recibidos {len(combates_data)} combates de la API")
-            
-            self.combates = [self._transform_combate(c) for c in combates_data]
-            print(f"[CombatesScreen] Combates transformados: {len(self.combates)}")
-            
-            Clock.schedule_once(lambda dt: self._display_combates())
-                
-        except RuntimeError as e:
+        # Con caché vencida se devuelve lo guardado y la lista fresca llega
+        # después por _on_combates_refreshed
+        if self.torneo_id:
+            combates_data = api.get_combates_by_torneo(self.torneo_id, on_update=self._on_combates_refreshed,
+                                                       owner=self)
+            print(f"[CombatesScreen] Recibidos {len(combates_data)} combates del torneo {self.torneo_id}")
+        else:
+            combates_data = api.get_all_combates(on_update=self._on_combates_refreshed, owner=self)
+            print(f"[CombatesScreen] Recibidos {len(combates_data)} combates de la API")
+        
+        combates = [self._transform_combate(c) for c in combates_data]
+        print(f"[CombatesScreen] Combates transformados: {len(combates)}")
+        return combates
+
+    def _on_combates_loaded(self, combates):
+        self.combates = combates
+        self._display_combates()
+
+    def _on_combates_refreshed(self, combates_data):
+        print(f"[CombatesScreen] Lista actualizada: {len(combates_data)} combates")
+        self._on_combates_loaded([self._transform_combate(c) for c in combates_data])
+
+    def _on_combates_error(self, e):
+        if isinstance(e, RuntimeError):
             print(f"[CombatesScreen] RuntimeError: {e}")
-            Clock.schedule_once(lambda dt: self._show_error(str(e)))
-        except Exception as e:
-            print(f"[CombatesScreen] Exception: {type(e).__name__}: {e}")
-            error_msg = "No se pudo conectar al servidor" if "Connection" in str(e) else f"Error: {str(e)}"
-            Clock.schedule_once(lambda dt: self._show_error(error_msg))
+            self._show_error(str(e))
+            return
+        print(f"[CombatesScreen] Exception: {type(e).__name__}: {e}")
+        error_msg = "No se pudo conectar al servidor" if "Connection" in str(e) else f"Error: {str(e)}"
+        self._show_error(error_msg)
 
     def _transform_combate(self, api_data):
         """Transforma los datos de la API al formato que espera la UI"""
@@ -968,29 +967,26 @@ class CombatesScreen(Screen):
             return 0
 
     def _display_combates(self):
-        """Muestra los combates en la UI"""
-        self.grid.clear_widgets()
-        
+        """Entrega los combates a la lista reciclable"""
         if not self.combates:
             no_data_label = Label(
                 text='No hay combates registrados',
                 font_size=ResponsiveHelper.get_font_size(18),
                 color=(0.5, 0.5, 0.5, 1)
             )
-            self.grid.add_widget(no_data_label)
-            return
+            self._set_status(no_data_label)
+        else:
+            self._set_status()
         
-        for combate in self.combates:
-            card = CombateCard(
-                combate_data=combate,
-                on_delete=self.delete_combate,
-                on_edit=self.edit_combate
-            )
-            self.grid.add_widget(card)
+        self.card_list.set_items(
+            [{"combate_data": combate} for combate in self.combates],
+            on_delete_callback=self.delete_combate,
+            on_edit_callback=self.edit_combate
+        )
 
     def _show_error(self, message):
         """Muestra un mensaje de error en la UI"""
-        self.grid.clear_widgets()
+        self.card_list.clear()
         
         error_box = BoxLayout(
             orientation='vertical',
@@ -1024,33 +1020,27 @@ class CombatesScreen(Screen):
         retry_btn.bind(on_press=lambda x: self.load_combates())
         error_box.add_widget(retry_btn)
         
-        self.grid.add_widget(error_box)
+        self._set_status(error_box, height=dp(150))
 
     def delete_combate(self, combate_data):
         """Elimina un combate mediante la API"""
         combate_id = combate_data['id']
         
-        def _do_delete():
-            try:
-                success = api.delete_combate(combate_id)
-                if success:
-                    Clock.schedule_once(lambda dt: self._on_delete_success(combate_data))
-                else:
-                    Clock.schedule_once(
-                        lambda dt: self.show_message("Error", "No se pudo eliminar el combate")
-                    )
-            except RuntimeError as e:
-                Clock.schedule_once(
-                    lambda dt: self.show_message("Error", str(e))
-                )
-            except Exception as e:
-                Clock.schedule_once(
-                    lambda dt: self.show_message("Error", f"Error al eliminar: {str(e)}")
-                )
-        
-        thread = Thread(target=_do_delete)
-        thread.daemon = True
-        thread.start()
+        def _on_result(success):
+            if success:
+                self._on_delete_success(combate_data)
+            else:
+                self.show_message("Error", "No se pudo eliminar el combate")
+        
+        def _on_error(e):
+            if isinstance(e, RuntimeError):
+                self.show_message("Error", str(e))
+            else:
+                self.show_message("Error", f"Error al eliminar: {str(e)}")
+        
+        tasks.submit(api.delete_combate, combate_id, owner=self, priority=PRIORITY_HIGH,
+                     essential=True, name="combate.delete",
+                     on_success=_on_result, on_error=_on_error)
 
     def _on_delete_success(self, combate_data):
         """Callback cuando se elimina exitosamente"""
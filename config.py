@@ -1,5 +1,7 @@
+import os
 
-API_BASE_URL = "http://localhost:8080"
+# SISTEMA_COMBATES_API apunta la aplicación a otro backend (p.ej. benchmarks/backend.py)
+API_BASE_URL = os.environ.get("SISTEMA_COMBATES_API", "http://localhost:8080")
 
 DEFAULT_TIMEOUT = 15
 SHORT_TIMEOUT = 5
@@ -8,7 +10,103 @@ LONG_TIMEOUT = 30
 
 WEBSOCKET_PORT = 8080
 WEBSOCKET_RECONNECT_DELAY = 5
+WEBSOCKET_BASE_URL = API_BASE_URL.replace("http", "ws", 1)
+
+# Conexión en tiempo real (realtime.py)
+REALTIME_BACKOFF_BASE = 0.5  # primer reintento (s), se duplica en cada fallo
+REALTIME_BACKOFF_MAX = 30.0  # tope del backoff (s)
+REALTIME_PING_INTERVAL = 10  # ping del protocolo WebSocket (s)
+REALTIME_PING_TIMEOUT = 5    # sin pong en este tiempo = conexión muerta
+
+# Cronómetro del combate (combat_clock.py)
+CLOCK_DISPLAY_INTERVAL = 0.05  # cada cuánto se repinta el tiempo (s); no afecta la precisión
+CLOCK_PUBLISH_INTERVAL = 1.0   # cada cuánto el tablero central publica el tiempo mientras corre
+CLOCK_MAX_LAG_COMPENSATION = 2.0  # tope (s) de la corrección por retraso en los visores
+
+# Rendimiento de la interfaz (metrics.FrameTimeCounter)
+FRAME_BUDGET_MS = 1000.0 / 60  # un frame más largo que esto cuenta como lento
+
+# Reacomodo al redimensionar (responsive.py)
+RESIZE_DEBOUNCE = 0.1        # espera (s) tras el último resize antes de reacomodar
+BREAKPOINTS = (              # (nombre, ancho máximo exclusivo); None = sin tope
+    ("mobile", 600),
+    ("tablet", 900),
+    ("desktop", 1200),
+    ("wide", None),
+)
+
+# Arranque (screen_registry.py): pantallas construidas en frames ociosos tras la inicial;
+# el resto se construye al navegar a ellas
+SCREEN_PREWARM = ("inicio_sesion", "registro", "conocenos", "ini_juez")
+SCREEN_PREWARM_DELAY = 0.5   # espera (s) tras el primer frame antes de precalentar
+
+# Tablero de visualización: polling de respaldo solo mientras el WebSocket está caído
+VIEWER_POLL_BASE = 2.0       # primer intervalo (s)
+VIEWER_POLL_MAX = 30.0       # tope del backoff (s)
+
+
+# Transporte HTTP de puntajes (tablero central)
+HTTP_POOL_SIZE = 10          # conexiones keep-alive por host
+SCORING_WORKERS = 4          # hilos máximos para peticiones de puntaje/faltas
+SCORING_REFRESH_TIMEOUT = 2  # timeout de los GET de conteo
+OPTIMISTIC_SCORING = True    # mostrar el clic al instante y reconciliar con el servidor
+COALESCE_WINDOW_MS = 100     # ventana para agrupar puntos seguidos (0 = sin agrupar)
+
+
+# Trabajo en segundo plano de las pantallas (task_executor.py)
+BACKGROUND_WORKERS = 4       # hilos compartidos por todas las pantallas
+UI_NETWORK_GUARD = "warn"    # peticiones HTTP en el hilo de Kivy (stall_detector.py): "off", "warn" o "raise"
+
+
+# Caché de respuestas GET del ApiClient (response_cache.py)
+RESPONSE_CACHE_MAX_ENTRIES = 256   # entradas máximas (se descarta la menos usada)
+RESPONSE_CACHE_DEFAULT_TTL = 0     # rutas sin regla: sin caché
+RESPONSE_CACHE_TTLS = {            # segundos de frescura por prefijo de ruta
+    "/apiTorneos/": 60,
+    "/apiCombates/": 15,
+    "/apiAdministradores/": 300,
+}
+
+
+# Datos locales de la aplicación (cola offline / WAL)
+APP_DATA_DIR = os.environ.get(
+    "SISTEMA_COMBATES_DATA",
+    os.path.join(os.path.expanduser("~"), ".sistema_combates")
+)
+WAL_FSYNC = True             # fsync tras cada escritura del WAL (agrupadas por su hilo escritor)
+OFFLINE_RETRY_BASE = 1.0     # segundos del primer reintento sin conexión
+OFFLINE_RETRY_MAX = 10.0     # tope del backoff de reintentos
+
+# Registro (app_logging.py): los mensajes se encolan y los escribe un hilo aparte
+LOG_LEVEL = "INFO"             # nivel por defecto: "DEBUG", "INFO", "WARNING", "ERROR" u "OFF"
+LOG_LEVELS = {                 # nivel por módulo (nombre del logger)
+    "api_client": "INFO",
+    "tablero_central": "INFO",
+    "realtime_dispatcher": "INFO",
+}
+LOG_DEBUG_SAMPLE = {           # con DEBUG activo, escribir 1 de cada N mensajes de depuración
+    "api_client": 10,
+    "tablero_central": 10,
+    "realtime_dispatcher": 10,
+}
+LOG_QUEUE_SIZE = 10000         # mensajes en espera; con la cola llena se descartan (nunca bloquea)
+LOG_MAX_FIELD_CHARS = 200      # los campos largos (payloads completos) se recortan
+
+# Vigilante del hilo principal (stall_detector.py)
+WATCHDOG_BUDGET_MS = 50        # un frame más largo que esto se registra como congelamiento
+WATCHDOG_POLL_MS = 10          # cada cuánto revisa el hilo vigilante
+WATCHDOG_MAX_SAMPLES = 20      # pilas copiadas como máximo por congelamiento
+WATCHDOG_STACK_DEPTH = 40      # frames guardados por pila
+WATCHDOG_LOG_FILE = os.path.join(APP_DATA_DIR, "stalls.log")
+WATCHDOG_LOG_MAX_BYTES = 1024 * 1024
+WATCHDOG_LOG_BACKUPS = 3
+
+# Imágenes (assets.py): versiones reducidas en disco y texturas compartidas
+ASSET_CACHE_DIR = os.path.join(APP_DATA_DIR, "assets")
+ASSET_SIZE_STEP = 128          # el lado pedido se redondea hacia arriba a múltiplos de esto (px)
+ASSET_MAX_SIDE = 2048          # tope del lado de una versión reducida (px)
+ASSET_TEXTURE_BUDGET_MB = 64   # memoria de texturas antes de liberar las que no están en pantalla
 
 
 APP_NAME = "Sistema de Combates"
-APP_VERSION = "1.0.0"
\ No newline at end of file
+APP_VERSION = "1.0.0"
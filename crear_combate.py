@@ -3,7 +3,6 @@ from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.uix.textinput import TextInput
 from kivy.uix.button import Button
-from kivy.uix.image import Image
 from kivy.uix.scrollview import ScrollView
 from kivy.uix.popup import Popup
 from kivy.graphics import Color, RoundedRectangle, Rectangle
@@ -18,11 +17,12 @@ from kivy.utils import platform
 from datetime import datetime, date
 import calendar
 from datetime import datetime
-from threading import Thread
-from kivy.clock import mainthread
+from task_executor import tasks, PRIORITY_HIGH
 from api_client import api
 
 from datetime import datetime
+from responsive import responsive
+from assets import assets
 
 def join_date_time_iso(date_ddmmyyyy: str, time_hhmm: str) -> str:
     # "dd/MM/YYYY" + "HH:MM" -> "YYYY-MM-DDTHH:MM:SS"
@@ -174,12 +174,10 @@ class DateSelector(BoxLayout):
         self.update_days()
         self.month_spinner.bind(text=self.update_days_on_change)
         self.year_spinner.bind(text=self.update_days_on_change)
-        Window.bind(on_resize=self.on_window_resize)
-        
-    def on_window_resize(self, instance, width, height):
-        for spinner in [self.year_spinner, self.month_spinner, self.day_spinner]:
-            spinner.font_size = ResponsiveHelper.get_font_size(18)
-        
+        responsive.track(self.year_spinner, font_size=lambda: ResponsiveHelper.get_font_size(18))
+        responsive.track(self.month_spinner, font_size=lambda: ResponsiveHelper.get_font_size(18))
+        responsive.track(self.day_spinner, font_size=lambda: ResponsiveHelper.get_font_size(18))
+
     def update_days_on_change(self, *args):
         self.update_days()
         self.get_selected_date()
@@ -265,12 +263,9 @@ class TimeSelector(BoxLayout):
         self.get_selected_time()
         self.hour_spinner.bind(text=self.update_time)
         self.minute_spinner.bind(text=self.update_time)
-        Window.bind(on_resize=self.on_window_resize)
-        
-    def on_window_resize(self, instance, width, height):
-        self.hour_spinner.font_size = ResponsiveHelper.get_font_size(18)
-        self.minute_spinner.font_size = ResponsiveHelper.get_font_size(18)
-        
+        responsive.track(self.hour_spinner, font_size=lambda: ResponsiveHelper.get_font_size(18))
+        responsive.track(self.minute_spinner, font_size=lambda: ResponsiveHelper.get_font_size(18))
+
     def update_time(self, *args):
         self.get_selected_time()
         
@@ -309,11 +304,8 @@ class RoundsSelector(BoxLayout):
         self.add_widget(self.rounds_spinner)
         self.get_selected_rounds()
         self.rounds_spinner.bind(text=self.update_rounds)
-        Window.bind(on_resize=self.on_window_resize)
-        
-    def on_window_resize(self, instance, width, height):
-        self.rounds_spinner.font_size = ResponsiveHelper.get_font_size(18)
-        
+        responsive.track(self.rounds_spinner, font_size=lambda: ResponsiveHelper.get_font_size(18))
+
     def update_rounds(self, *args):
         self.get_selected_rounds()
         
@@ -365,12 +357,9 @@ class DurationSelector(BoxLayout):
         self.get_selected_duration()
         self.minutes_spinner.bind(text=self.update_duration)
         self.seconds_spinner.bind(text=self.update_duration)
-        Window.bind(on_resize=self.on_window_resize)
-        
-    def on_window_resize(self, instance, width, height):
-        self.minutes_spinner.font_size = ResponsiveHelper.get_font_size(18)
-        self.seconds_spinner.font_size = ResponsiveHelper.get_font_size(18)
-        
+        responsive.track(self.minutes_spinner, font_size=lambda: ResponsiveHelper.get_font_size(18))
+        responsive.track(self.seconds_spinner, font_size=lambda: ResponsiveHelper.get_font_size(18))
+
     def update_duration(self, *args):
         self.get_selected_duration()
         
@@ -409,11 +398,8 @@ class CategoriaPesoSelector(BoxLayout):
         self.add_widget(self.category_spinner)
         self.get_selected_category()
         self.category_spinner.bind(text=self.update_category)
-        Window.bind(on_resize=self.on_window_resize)
-        
-    def on_window_resize(self, instance, width, height):
-        self.category_spinner.font_size = ResponsiveHelper.get_font_size(18)
-        
+        responsive.track(self.category_spinner, font_size=lambda: ResponsiveHelper.get_font_size(18))
+
     def update_category(self, *args):
         self.get_selected_category()
         
@@ -449,16 +435,13 @@ class RoundedTextInput(TextInput):
                 radius=[dp(10)])
 
         self.bind(pos=self._update_rects, size=self._update_rects)
-        Window.bind(on_resize=self.on_window_resize)
+        responsive.track(self, font_size=lambda: ResponsiveHelper.get_font_size(18))
 
     def _update_rects(self, *args):
         self.bg_rect.pos = self.pos
         self.bg_rect.size = self.size
         self.border_rect.pos = (self.pos[0]+dp(2), self.pos[1]+dp(2))
         self.border_rect.size = (self.size[0]-dp(4), self.size[1]-dp(4))
-    
-    def on_window_resize(self, instance, width, height):
-        self.font_size = ResponsiveHelper.get_font_size(18)
 
     def on_focus(self, instance, value):
         self.canvas.before.clear()
@@ -496,21 +479,17 @@ class HoverButton(Button):
             self.rect = RoundedRectangle(pos=self.pos, size=self.size, radius=[self.border_radius])
 
         self.bind(pos=self.update_rect, size=self.update_rect)
-        Window.bind(on_resize=self.on_window_resize)
+        responsive.track(self, font_size=lambda: ResponsiveHelper.get_font_size(18))
 
     def update_rect(self, *args):
         self.rect.pos = self.pos
         self.rect.size = self.size
-    
-    def on_window_resize(self, instance, width, height):
-        self.font_size = ResponsiveHelper.get_font_size(18)
 
 
 class CrearCombateScreen(Screen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.build_ui()
-        Window.bind(on_resize=self.on_window_resize)
 
     def build_ui(self):
         self.clear_widgets()
@@ -526,18 +505,21 @@ class CrearCombateScreen(Screen):
             self.background_rect = Rectangle(size=main_layout.size, pos=main_layout.pos)
         main_layout.bind(size=self.update_background, pos=self.update_background)
 
-        main_layout.add_widget(Widget(size_hint_y=None, height=max(dp(15), Window.height * 0.02)))
+        top_spacer = Widget(size_hint_y=None)
+        responsive.track(top_spacer, height=lambda: max(dp(15), Window.height * 0.02))
+        main_layout.add_widget(top_spacer)
 
         form_container = BoxLayout(orientation='vertical', size_hint=(ResponsiveHelper.get_form_width(), None),
                                   pos_hint={'center_x': 0.5}, spacing=dp(12))
         form_container.bind(minimum_height=form_container.setter('height'))
+        responsive.track(form_container, size_hint_x=ResponsiveHelper.get_form_width)
 
-        logo = Image(source="Imagen5-Photoroom.png", size_hint=(1, None), 
-                    height=min(dp(100), Window.height * 0.12), allow_stretch=True, keep_ratio=True)
+        logo = assets.image("Imagen5-Photoroom.png", size_hint=(1, None), allow_stretch=True, keep_ratio=True)
+        responsive.track(logo, height=lambda: min(dp(100), Window.height * 0.12))
         form_container.add_widget(logo)
 
-        titulo = Label(text='CREAR COMBATE', font_size=ResponsiveHelper.get_font_size(32),
-                      color=(0.1, 0.4, 0.7, 1), bold=True, size_hint_y=None, height=dp(60))
+        titulo = Label(text='CREAR COMBATE', color=(0.1, 0.4, 0.7, 1), bold=True, size_hint_y=None, height=dp(60))
+        responsive.track(titulo, font_size=lambda: ResponsiveHelper.get_font_size(32))
         form_container.add_widget(titulo)
         form_container.add_widget(Widget(size_hint_y=None, height=dp(10)))
 
@@ -545,8 +527,8 @@ class CrearCombateScreen(Screen):
             campo_layout = BoxLayout(orientation='vertical', spacing=dp(8), size_hint_y=None)
             campo_layout.bind(minimum_height=campo_layout.setter('height'))
             
-            label = Label(text=texto, font_size=ResponsiveHelper.get_font_size(18),
-                         color=(0.1, 0.1, 0.2, 1), size_hint_y=None, height=dp(30), halign='left')
+            label = Label(text=texto, color=(0.1, 0.1, 0.2, 1), size_hint_y=None, height=dp(30), halign='left')
+            responsive.track(label, font_size=lambda: ResponsiveHelper.get_font_size(18))
             label.bind(size=label.setter('text_size'))
             campo_layout.add_widget(label)
             
@@ -559,8 +541,10 @@ class CrearCombateScreen(Screen):
                 return campo_layout, input_field
 
         def crear_titulo_seccion(texto, size=26):
-            return Label(text=texto, font_size=ResponsiveHelper.get_font_size(size),
-                        color=(0.1, 0.4, 0.7, 1), bold=True, size_hint_y=None, height=dp(45))
+            return responsive.track(
+                Label(text=texto, color=(0.1, 0.4, 0.7, 1), bold=True, size_hint_y=None, height=dp(45)),
+                font_size=lambda: ResponsiveHelper.get_font_size(size)
+            )
 
         # COMPETIDORES
         form_container.add_widget(crear_titulo_seccion('Datos de los Competidores'))
@@ -698,6 +682,11 @@ class CrearCombateScreen(Screen):
             size_hint_y=None,
             height=dp(50) if Window.width > 600 else dp(110)
         )
+        responsive.track(
+            botones_layout,
+            orientation=lambda: 'horizontal' if Window.width > 600 else 'vertical',
+            height=lambda: dp(50) if Window.width > 600 else dp(110)
+        )
 
         btn_crear = HoverButton(text='CREAR COMBATE')
         btn_crear.bind(on_press=self.crear_combate)
@@ -727,8 +716,8 @@ class CrearCombateScreen(Screen):
         self.background_rect.size = instance.size
         self.background_rect.pos = instance.pos
 
-    def on_window_resize(self, instance, width, height):
-        Clock.schedule_once(lambda dt: self.build_ui(), 0.1)
+    def on_pre_leave(self, *args):
+        tasks.cancel_owner(self)
 
     def mostrar_mensaje(self, titulo, mensaje):
         content = BoxLayout(orientation='vertical', spacing=dp(15), padding=dp(20))
@@ -996,44 +985,45 @@ class CrearCombateScreen(Screen):
 
         def work():
             try:
-                try:
-                    ultimo_torneo = api.get_ultimo_torneo()
-                    if ultimo_torneo:
-                        print(f"[CrearCombate] Usando torneo: {ultimo_torneo.get('nombre')} (ID: {ultimo_torneo.get('idTorneo')})")
-                except:
-                    pass
-                
-                # ✅ Solo crear el combate, NO llamar a prepare
-                creado = api.create_combate(payload)
-                combate_id = creado.get("id") or creado.get("idCombate")
-                if not combate_id:
-                    raise RuntimeError("El servidor no devolvió un id de combate.")
-
-                torneo_asignado = creado.get("idTorneo")
-                if torneo_asignado:
-                    print(f"[CrearCombate] Combate asignado al torneo ID: {torneo_asignado}")
-                else:
-                    print("[CrearCombate] ADVERTENCIA: No se asignó ningún torneo al combate")
-
-                # ✅ NO llamar a prepare aquí
-                # api.prepare_combate(int(combate_id))
-                
-                self._on_success(creado, fecha_combate_dmy, hora_combate_hm)
-            except Exception as e:
-                self._on_error(str(e))
-            finally:
-                self._close_loading(loading)
-
-        Thread(target=work, daemon=True).start()
-
-    @mainthread
+                ultimo_torneo = api.get_ultimo_torneo()
+                if ultimo_torneo:
+                    print(f"[CrearCombate] Usando torneo: {ultimo_torneo.get('nombre')} (ID: {ultimo_torneo.get('idTorneo')})")
+            except:
+                pass
+            
+            # ✅ Solo crear el combate, NO llamar a prepare
+            creado = api.create_combate(payload)
+            combate_id = creado.get("id") or creado.get("idCombate")
+            if not combate_id:
+                raise RuntimeError("El servidor no devolvió un id de combate.")
+
+            torneo_asignado = creado.get("idTorneo")
+            if torneo_asignado:
+                print(f"[CrearCombate] Combate asignado al torneo ID: {torneo_asignado}")
+            else:
+                print("[CrearCombate] ADVERTENCIA: No se asignó ningún torneo al combate")
+
+            # ✅ NO llamar a prepare aquí
+            # api.prepare_combate(int(combate_id))
+            return creado
+
+        def on_success(creado):
+            self._close_loading(loading)
+            self._on_success(creado, fecha_combate_dmy, hora_combate_hm)
+
+        def on_error(e):
+            self._close_loading(loading)
+            self._on_error(str(e))
+
+        tasks.submit(work, owner=self, priority=PRIORITY_HIGH, essential=True, name="combate.create",
+                     on_success=on_success, on_error=on_error)
+
     def _close_loading(self, popup):
         try:
             popup.dismiss()
         except:
             pass
 
-    @mainthread
     def _on_success(self, creado, fecha_dmy, hora_hm):
         """Callback cuando el combate se crea exitosamente"""
         c1 = self.competidor1_input.text
@@ -1074,7 +1064,6 @@ class CrearCombateScreen(Screen):
         except Exception as e:
             print(f"[CrearCombate] ✗ Error al volver: {e}")
 
-    @mainthread
     def _on_error(self, msg):
         self.mostrar_mensaje("Error", f"Ocurrió un problema al crear el combate:\n{msg}")
 
@@ -3,7 +3,6 @@ from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.uix.textinput import TextInput
 from kivy.uix.button import Button
-from kivy.uix.image import Image
 from kivy.uix.scrollview import ScrollView
 from kivy.uix.popup import Popup
 from kivy.graphics import Color, RoundedRectangle, Rectangle
@@ -18,8 +17,10 @@ from kivy.properties import StringProperty, ObjectProperty
 from kivy.utils import platform
 from datetime import datetime, date
 import calendar
-from threading import Thread
+from task_executor import tasks, PRIORITY_HIGH
 from api_client import api
+from responsive import responsive
+from assets import assets
 
 
 # ------------------ UTILIDADES RESPONSIVE ------------------
@@ -120,14 +121,10 @@ class DateSelector(BoxLayout):
         # Bind para actualizar días cuando cambia mes o año
         self.month_spinner.bind(text=self.update_days_on_change)
         self.year_spinner.bind(text=self.update_days_on_change)
-        Window.bind(on_resize=self.on_window_resize)
-        
-    def on_window_resize(self, instance, width, height):
-        self.year_spinner.font_size = ResponsiveHelper.get_font_size(18)
-        self.month_spinner.font_size = ResponsiveHelper.get_font_size(18)
-        self.day_spinner.font_size = ResponsiveHelper.get_font_size(18)
-        self.height = dp(55)
-        
+        responsive.track(self.year_spinner, font_size=lambda: ResponsiveHelper.get_font_size(18))
+        responsive.track(self.month_spinner, font_size=lambda: ResponsiveHelper.get_font_size(18))
+        responsive.track(self.day_spinner, font_size=lambda: ResponsiveHelper.get_font_size(18))
+
     def update_days_on_change(self, *args):
         self.update_days()
         self.get_selected_date()
@@ -217,13 +214,9 @@ class TimeSelector(BoxLayout):
         # Bind para actualizar cuando cambia
         self.hour_spinner.bind(text=self.update_time)
         self.minute_spinner.bind(text=self.update_time)
-        Window.bind(on_resize=self.on_window_resize)
-        
-    def on_window_resize(self, instance, width, height):
-        self.hour_spinner.font_size = ResponsiveHelper.get_font_size(18)
-        self.minute_spinner.font_size = ResponsiveHelper.get_font_size(18)
-        self.height = dp(55)
-        
+        responsive.track(self.hour_spinner, font_size=lambda: ResponsiveHelper.get_font_size(18))
+        responsive.track(self.minute_spinner, font_size=lambda: ResponsiveHelper.get_font_size(18))
+
     def update_time(self, *args):
         self.get_selected_time()
         
@@ -270,17 +263,13 @@ class RoundedTextInput(TextInput):
             )
 
         self.bind(pos=self._update_rects, size=self._update_rects)
-        Window.bind(on_resize=self.on_window_resize)
+        responsive.track(self, font_size=lambda: ResponsiveHelper.get_font_size(18))
 
     def _update_rects(self, *args):
         self.bg_rect.pos = self.pos
         self.bg_rect.size = self.size
         self.border_rect.pos = (self.pos[0]+dp(2), self.pos[1]+dp(2))
         self.border_rect.size = (self.size[0]-dp(4), self.size[1]-dp(4))
-    
-    def on_window_resize(self, instance, width, height):
-        self.font_size = ResponsiveHelper.get_font_size(18)
-        self.height = dp(55)
 
     def on_focus(self, instance, value):
         if value:
@@ -338,15 +327,11 @@ class HoverButton(Button):
             )
 
         self.bind(pos=self.update_rect, size=self.update_rect)
-        Window.bind(on_resize=self.on_window_resize)
+        responsive.track(self, font_size=lambda: ResponsiveHelper.get_font_size(18))
 
     def update_rect(self, *args):
         self.rect.pos = self.pos
         self.rect.size = self.size
-    
-    def on_window_resize(self, instance, width, height):
-        self.font_size = ResponsiveHelper.get_font_size(18)
-        self.height = dp(50)
 
 
 # ------------------ PANTALLA CREAR TORNEO RESPONSIVE ------------------
@@ -355,7 +340,6 @@ class CrearTorneoScreen(Screen):
         super().__init__(**kwargs)
         self._submitting = False
         self.build_ui()
-        Window.bind(on_resize=self.on_window_resize)
 
     def build_ui(self):
         self.clear_widgets()
@@ -385,7 +369,9 @@ class CrearTorneoScreen(Screen):
 
         # Espaciador superior
         top_spacer_height = max(dp(20), Window.height * 0.03)
-        main_layout.add_widget(Widget(size_hint_y=None, height=top_spacer_height))
+        top_spacer = Widget(size_hint_y=None, height=top_spacer_height)
+        responsive.track(top_spacer, height=lambda: max(dp(20), Window.height * 0.03))
+        main_layout.add_widget(top_spacer)
 
         # Contenedor del formulario centrado
         form_container = BoxLayout(
@@ -395,16 +381,18 @@ class CrearTorneoScreen(Screen):
             spacing=dp(15)
         )
         form_container.bind(minimum_height=form_container.setter('height'))
+        responsive.track(form_container, size_hint_x=ResponsiveHelper.get_form_width)
 
         # Logo responsive
         logo_height = min(dp(120), Window.height * 0.15)
-        logo = Image(
-            source="Imagen5-Photoroom.png",
+        logo = assets.image(
+            "Imagen5-Photoroom.png",
             size_hint=(1, None),
             height=logo_height,
             allow_stretch=True,
             keep_ratio=True
         )
+        responsive.track(logo, height=lambda: min(dp(120), Window.height * 0.15))
         form_container.add_widget(logo)
 
         # Título
@@ -416,6 +404,7 @@ class CrearTorneoScreen(Screen):
             size_hint_y=None,
             height=dp(60)
         )
+        responsive.track(titulo, font_size=lambda: ResponsiveHelper.get_font_size(32))
         form_container.add_widget(titulo)
 
         # Espaciador
@@ -438,6 +427,7 @@ class CrearTorneoScreen(Screen):
                 height=dp(30),
                 halign='left'
             )
+            responsive.track(label, font_size=lambda: ResponsiveHelper.get_font_size(18))
             label.bind(size=label.setter('text_size'))
             campo_layout.add_widget(label)
             
@@ -484,6 +474,11 @@ class CrearTorneoScreen(Screen):
             size_hint_y=None,
             height=dp(50) if Window.width > 600 else dp(110)
         )
+        responsive.track(
+            botones_layout,
+            orientation=lambda: 'horizontal' if Window.width > 600 else 'vertical',
+            height=lambda: dp(50) if Window.width > 600 else dp(110)
+        )
 
         btn_crear = HoverButton(text='CREAR TORNEO')
         btn_crear.bind(on_press=self.crear_torneo)
@@ -515,9 +510,6 @@ class CrearTorneoScreen(Screen):
         self.background_rect.size = instance.size
         self.background_rect.pos = instance.pos
 
-    def on_window_resize(self, instance, width, height):
-        Clock.schedule_once(lambda dt: self.build_ui(), 0.1)
-
     def mostrar_mensaje(self, titulo, mensaje, on_close=None):
         content = BoxLayout(
             orientation='vertical',
@@ -714,63 +706,65 @@ class CrearTorneoScreen(Screen):
         instance.text = "Creando..."
 
         def _task():
+            resp = api.post_json("/apiTorneos/torneo", payload)
+            status = resp.status_code
+            if status in (200, 201):
+                try:
+                    return resp.json()
+                except Exception:
+                    return None
             try:
-                resp = api.post_json("/apiTorneos/torneo", payload)
-                status = resp.status_code
-                if status in (200, 201):
-                    try:
-                        data = resp.json()
-                    except Exception:
-                        data = None
-
-                    def _ok(dt):
-                        nombre = self.nombre_torneo_input.text.strip()
-                        self.mostrar_mensaje(
-                            "¡Torneo creado!",
-                            f"El torneo {self.nombre_torneo_input.text} ha sido creado con éxito\n"
-                            f"Fecha: {fecha.strftime('%d/%m/%Y')}  "
-                            f"Hora: {hora_inicio.strftime('%H:%M')} - {hora_termino.strftime('%H:%M')}"
-                        )
-                        # limpiar campos
-                        self.nombre_torneo_input.text = ""
-                        self.ubicacion_input.text = ""
-                        
-                        def go_home():
-                            App.get_running_app().root.current = 'ini'
-
-                        self.mostrar_mensaje(
-                            "¡Torneo creado!",
-                            f"El torneo {nombre} ha sido creado con éxito\n"
-                            f"Fecha: {fecha.strftime('%d/%m/%Y')}  "
-                            f"Hora: {hora_inicio.strftime('%H:%M')} - {hora_termino.strftime('%H:%M')}",
-                            on_close=go_home
-                        )
-                        
-                    Clock.schedule_once(_ok, 0)
-
-                else:
-                    try:
-                        err = resp.json().get("message", f"Error del servidor ({status})")
-                    except Exception:
-                        err = f"Error del servidor ({status})"
-                    Clock.schedule_once(lambda dt, m=err: self.mostrar_mensaje("Error", m), 0)
-            except Exception as e:
-                Clock.schedule_once(lambda dt, m=str(e): self.mostrar_mensaje("Error", f"No se pudo crear el torneo.\n{m}"), 0)
-            finally:
-                def _reset(dt):
-                    self._submitting = False
-                    instance.disabled = False
-                    instance.text = original_text
-                Clock.schedule_once(_reset, 0)
-
-        Thread(target=_task, daemon=True).start()
+                err = resp.json().get("message", f"Error del servidor ({status})")
+            except Exception:
+                err = f"Error del servidor ({status})"
+            raise RuntimeError(err)
+
+        def _reset():
+            self._submitting = False
+            instance.disabled = False
+            instance.text = original_text
+
+        def _ok(data):
+            _reset()
+            nombre = self.nombre_torneo_input.text.strip()
+            self.mostrar_mensaje(
+                "¡Torneo creado!",
+                f"El torneo {self.nombre_torneo_input.text} ha sido creado con éxito\n"
+                f"Fecha: {fecha.strftime('%d/%m/%Y')}  "
+                f"Hora: {hora_inicio.strftime('%H:%M')} - {hora_termino.strftime('%H:%M')}"
+            )
+            # limpiar campos
+            self.nombre_torneo_input.text = ""
+            self.ubicacion_input.text = ""
+            
+            def go_home():
+                App.get_running_app().root.current = 'ini'
+
+            self.mostrar_mensaje(
+                "¡Torneo creado!",
+                f"El torneo {nombre} ha sido creado con éxito\n"
+                f"Fecha: {fecha.strftime('%d/%m/%Y')}  "
+                f"Hora: {hora_inicio.strftime('%H:%M')} - {hora_termino.strftime('%H:%M')}",
+                on_close=go_home
+            )
+
+        def _error(e):
+            _reset()
+            if isinstance(e, RuntimeError):
+                self.mostrar_mensaje("Error", str(e))
+            else:
+                self.mostrar_mensaje("Error", f"No se pudo crear el torneo.\n{e}")
+
+        tasks.submit(_task, owner=self, priority=PRIORITY_HIGH, essential=True, name="torneo.create",
+                     on_success=_ok, on_error=_error)
 
     def volver(self, instance):
         App.get_running_app().root.current = 'ini'
 
+    def on_pre_leave(self, *args):
+        tasks.cancel_owner(self)
+        self._submitting = False
+
     def update_background(self, instance, value):
         self.background_rect.size = instance.size
-        self.background_rect.pos = instance.pos
-
-    def on_window_resize(self, instance, width, height):
-        Clock.schedule_once(lambda dt: self.build_ui(), 0.1)
\ No newline at end of file
+        self.background_rect.pos = instance.pos
\ No newline at end of file
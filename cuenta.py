@@ -3,7 +3,6 @@ from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.uix.button import Button
 from kivy.uix.scrollview import ScrollView
-from kivy.uix.image import Image
 from kivy.core.window import Window
 from kivy.uix.widget import Widget
 from kivy.graphics import Color, Rectangle, RoundedRectangle
@@ -15,6 +14,9 @@ from kivy.clock import Clock
 from kivy.app import App
 from api_client import api
 from session_manager import session
+from task_executor import tasks
+from responsive import responsive
+from assets import assets
 
 
 # ------------------ UTILIDADES RESPONSIVE ------------------
@@ -136,7 +138,7 @@ class ResponsiveDataDisplay(BoxLayout):
             text=self._update_text
         )
         
-        Window.bind(on_resize=self.on_window_resize)
+        responsive.track(self.label, font_size=lambda: ResponsiveHelper.get_font_size(18))
     
     def _update_label_text_size(self, instance, value):
         """Actualiza el text_size del label para mantener el centrado"""
@@ -152,9 +154,6 @@ class ResponsiveDataDisplay(BoxLayout):
     
     def _update_text(self, instance, value):
         self.label.text = value
-    
-    def on_window_resize(self, instance, width, height):
-        self.label.font_size = ResponsiveHelper.get_font_size(18)
 
 
 # ------------------ BOTÓN HOVER RESPONSIVE ------------------
@@ -180,15 +179,13 @@ class HoverButton(Button):
             )
 
         self.bind(pos=self.update_rect, size=self.update_rect)
-        Window.bind(on_resize=self.on_window_resize)
+        responsive.track(self,
+                         font_size=lambda: ResponsiveHelper.get_font_size(18),
+                         height=ResponsiveHelper.get_button_height)
 
     def update_rect(self, *args):
         self.rect.pos = self.pos
         self.rect.size = self.size
-    
-    def on_window_resize(self, instance, width, height):
-        self.font_size = ResponsiveHelper.get_font_size(18)
-        self.height = ResponsiveHelper.get_button_height()
 
 
 # ------------------ PANTALLA VER INFORMACIÓN ------------------
@@ -197,50 +194,56 @@ class VerInfoScreen(Screen):
         super().__init__(**kwargs)
         self.admin_data = None
         self.build_ui()
-        Window.bind(on_resize=self.on_window_resize)
 
     def on_pre_enter(self):
         """Se ejecuta antes de mostrar la pantalla"""
         self.cargar_datos_administrador()
 
+    def on_pre_leave(self, *args):
+        tasks.cancel_owner(self)
+
     def cargar_datos_administrador(self):
-        """Carga los datos del administrador desde el backend"""
-        try:
-            # Primero intentar obtener de la app
-            app = App.get_running_app()
-            
-            # Si no hay sesión en SessionManager, intentar recuperarla de app.auth
-            if not session.is_logged_in() and hasattr(app, 'auth') and app.auth:
-                session.set_session_from_app(app)
-            
-            # Verificar si hay sesión activa
-            if not session.is_logged_in():
-                self.mostrar_mensaje("Error", "No hay sesión activa. Por favor inicia sesión.")
-                Clock.schedule_once(lambda dt: setattr(self.manager, 'current', 'inicio_sesion'), 2)
+        """Muestra los datos de la sesión y los refresca desde el backend en segundo plano"""
+        # Primero intentar obtener de la app
+        app = App.get_running_app()
+        
+        # Si no hay sesión en SessionManager, intentar recuperarla de app.auth
+        if not session.is_logged_in() and hasattr(app, 'auth') and app.auth:
+            session.set_session_from_app(app)
+        
+        # Verificar si hay sesión activa
+        if not session.is_logged_in():
+            self.mostrar_mensaje("Error", "No hay sesión activa. Por favor inicia sesión.")
+            Clock.schedule_once(lambda dt: setattr(self.manager, 'current', 'inicio_sesion'), 2)
+            return
+        
+        # Lo que ya hay en la sesión se muestra sin esperar a la red
+        self.mostrar_datos_cache()
+        
+        admin_id = session.get_admin_id()
+        print(f"[VerInfoScreen] Cargando datos del administrador ID: {admin_id}")
+        
+        def _ok(admin_data):
+            # La sesión pudo cambiar mientras llegaba la respuesta
+            if session.get_admin_id() != admin_id:
                 return
-            
-            admin_id = session.get_admin_id()
-            print(f"[VerInfoScreen] Cargando datos del administrador ID: {admin_id}")
-            
-            # Obtener datos actualizados del administrador desde la API
-            self.admin_data = api.get_administrador_by_id(admin_id)
-            
+            self.admin_data = admin_data
             # Actualizar la sesión con los datos más recientes
-            session.update_admin_data(self.admin_data)
-            
-            # Actualizar la interfaz con los datos
+            session.update_admin_data(admin_data)
             self.actualizar_campos_ui()
-            
             print(f"[VerInfoScreen] Datos cargados exitosamente")
-            
-        except Exception as e:
+        
+        def _error(e):
             print(f"[VerInfoScreen] Error al cargar datos: {e}")
-            self.mostrar_mensaje("Error", f"No se pudieron cargar los datos: {str(e)}")
-            # Si hay error, mostrar datos en caché de la sesión
-            self.mostrar_datos_cache()
+            # Con datos de la sesión en pantalla el error no interrumpe
+            if not session.get_admin_data():
+                self.mostrar_mensaje("Error", f"No se pudieron cargar los datos: {str(e)}")
+        
+        tasks.submit(api.get_administrador_by_id, admin_id, owner=self, name="admin.get",
+                     on_success=_ok, on_error=_error)
 
     def mostrar_datos_cache(self):
-        """Muestra los datos en caché de la sesión si hay error al cargar del backend"""
+        """Muestra los datos en caché de la sesión mientras llegan los del backend"""
         cached_data = session.get_admin_data()
         if cached_data:
             self.admin_data = cached_data
@@ -290,13 +293,14 @@ class VerInfoScreen(Screen):
 
         # Logo responsive
         logo_height = ResponsiveHelper.get_logo_height()
-        logo = Image(
-            source="Imagen5-Photoroom.png",
+        logo = assets.image(
+            "Imagen5-Photoroom.png",
             size_hint=(1, None),
             height=logo_height,
             pos_hint={'center_x': 0.5},
             fit_mode="contain"
         )
+        responsive.track(logo, height=ResponsiveHelper.get_logo_height)
         main_layout.add_widget(logo)
 
         # ScrollView para el contenido
@@ -325,6 +329,7 @@ class VerInfoScreen(Screen):
             pos_hint={'center_x': 0.5}
         )
         form_container.bind(minimum_height=form_container.setter('height'))
+        responsive.track(form_container, size_hint_x=ResponsiveHelper.get_form_width)
 
         # Título con diseño mejorado
         titulo = Label(
@@ -335,6 +340,7 @@ class VerInfoScreen(Screen):
             size_hint_y=None,
             height=dp(50)
         )
+        responsive.track(titulo, font_size=lambda: ResponsiveHelper.get_font_size(36))
         form_container.add_widget(titulo)
 
         # Espaciador reducido
@@ -359,6 +365,7 @@ class VerInfoScreen(Screen):
                 bold=True,
                 halign='left'
             )
+            responsive.track(lbl_etiqueta, font_size=lambda: ResponsiveHelper.get_font_size(18))
             lbl_etiqueta.bind(size=lbl_etiqueta.setter('text_size'))
             campo_layout.add_widget(lbl_etiqueta)
 
@@ -392,6 +399,12 @@ class VerInfoScreen(Screen):
             size_hint_y=None,
             height=ResponsiveHelper.get_button_height() if Window.width > 800 else ResponsiveHelper.get_button_height() * 2 + dp(15)
         )
+        responsive.track(
+            botones_layout,
+            orientation=lambda: 'horizontal' if Window.width > 800 else 'vertical',
+            height=lambda: (ResponsiveHelper.get_button_height() if Window.width > 800
+                            else ResponsiveHelper.get_button_height() * 2 + dp(15))
+        )
 
         btn_actualizar = HoverButton(
             text='ACTUALIZAR',
@@ -417,9 +430,6 @@ class VerInfoScreen(Screen):
         main_layout.add_widget(scroll_view)
         self.add_widget(main_layout)
 
-    def on_window_resize(self, instance, width, height):
-        Clock.schedule_once(lambda dt: self.build_ui(), 0.1)
-
     def actualizar_datos(self, instance):
         """Navega a la pantalla de actualización"""
         # Pasar los datos actuales a la pantalla de actualización
@@ -2,7 +2,6 @@ from kivy.uix.screenmanager import Screen
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.button import Button
 from kivy.uix.label import Label
-from kivy.uix.image import Image
 from kivy.uix.widget import Widget
 from kivy.uix.popup import Popup
 from kivy.uix.scrollview import ScrollView
@@ -15,6 +14,8 @@ from kivy.utils import platform
 from api_client import api
 from session_manager import session
 from cuenta import VerInfoScreen
+from responsive import responsive
+from assets import assets
 
 # ------------------ UTILIDADES RESPONSIVE ------------------
 class ResponsiveHelper:
@@ -112,17 +113,15 @@ class HoverButton(Button):
             )
         
         self.bind(size=self.update_rect, pos=self.update_rect)
-        Window.bind(on_resize=self.on_window_resize)
+        responsive.track(self,
+                         font_size=lambda: ResponsiveHelper.get_font_size(18),
+                         height=ResponsiveHelper.get_button_height)
 
     def update_rect(self, *args):
         self.rect.pos = self.pos
         self.rect.size = self.size
         self.rect.radius = [self.border_radius]
 
-    def on_window_resize(self, instance, width, height):
-        self.font_size = ResponsiveHelper.get_font_size(18)
-        self.height = ResponsiveHelper.get_button_height()
-
 
 # ------------------ NAVBAR RESPONSIVE ------------------
 class NavbarAuth(BoxLayout):
@@ -132,14 +131,16 @@ class NavbarAuth(BoxLayout):
         self.size_hint = (None, 1)
         self.spacing = dp(10)
         
-        self.update_dimensions()
-        
         with self.canvas.before:
             Color(0.1, 0.4, 0.7, 1)
             self.rect = Rectangle(size=self.size, pos=self.pos)
 
         self.bind(size=self.update_rect, pos=self.update_rect)
-        Window.bind(on_resize=self.on_window_resize)
+        responsive.track(
+            self,
+            width=ResponsiveHelper.get_navbar_width,
+            padding=lambda: [dp(20) if Window.width >= 600 else dp(10)] * 4
+        )
         
         self.build_navbar()
 
@@ -148,17 +149,20 @@ class NavbarAuth(BoxLayout):
         
         # Logo
         logo_height = ResponsiveHelper.get_logo_height()
-        self.logo = Image(
-            source="Imagen5-Photoroom.png",
+        self.logo = assets.image(
+            "Imagen5-Photoroom.png",
             size_hint=(1, None),
             height=logo_height,
             fit_mode="contain"
         )
+        responsive.track(self.logo, height=ResponsiveHelper.get_logo_height)
         self.add_widget(self.logo)
 
         # Espaciador después del logo
         spacer_height = dp(50) if Window.width >= 900 else dp(30)
-        self.add_widget(Widget(size_hint_y=None, height=spacer_height))
+        spacer = Widget(size_hint_y=None, height=spacer_height)
+        responsive.track(spacer, height=lambda: dp(50) if Window.width >= 900 else dp(30))
+        self.add_widget(spacer)
 
         # Contenedor de botones
         self.botones_navbar = BoxLayout(
@@ -173,11 +177,6 @@ class NavbarAuth(BoxLayout):
         # Espaciador flexible
         self.add_widget(Widget(size_hint_y=1))
 
-    def update_dimensions(self):
-        self.width = ResponsiveHelper.get_navbar_width()
-        padding_size = dp(20) if Window.width >= 600 else dp(10)
-        self.padding = [padding_size, padding_size]
-
     def agregar_botones(self):
         menu_items = [
             ("Torneos", self.ir_a_torneos),
@@ -188,23 +187,23 @@ class NavbarAuth(BoxLayout):
             ("Cerrar Sesión", self.mostrar_popup_confirmacion)
         ]
 
-        show_text = ResponsiveHelper.should_show_text()
+        # En pantallas pequeñas, usar versiones cortas o iconos
+        short_texts = {
+            "Crear Torneo": "C.T.",
+            "Crear Combate": "C.C.",
+            "Mi cuenta": "Cuenta",
+            "Cerrar Sesión": "Salir",
+        }
 
         for text, action in menu_items:
             bg_color = (0.7, 0.1, 0.1, 1) if text == "Cerrar Sesión" else (0.1, 0.4, 0.7, 1)
-            
-            # En pantallas pequeñas, usar versiones cortas o iconos
-            if not show_text:
-                if text == "Crear Torneo":
-                    text = "C.T."
-                elif text == "Crear Combate":
-                    text = "C.C."
-                elif text == "Mi cuenta":
-                    text = "Cuenta"
-                elif text == "Cerrar Sesión":
-                    text = "Salir"
+            short = short_texts.get(text, text)
             
             boton = HoverButton(text=text, bg_color=bg_color)
+            responsive.track(
+                boton,
+                text=lambda text=text, short=short: text if ResponsiveHelper.should_show_text() else short
+            )
             boton.bind(on_press=action)
             self.botones_navbar.add_widget(boton)
 
@@ -212,13 +211,6 @@ class NavbarAuth(BoxLayout):
         self.rect.size = self.size
         self.rect.pos = self.pos
 
-    def on_window_resize(self, instance, width, height):
-        Clock.schedule_once(lambda dt: self.rebuild_navbar(), 0.1)
-
-    def rebuild_navbar(self):
-        self.update_dimensions()
-        self.build_navbar()
-
     def ir_a_torneos(self, instance):
         App.get_running_app().root.current = 'torneos_anteriores'
     
@@ -381,7 +373,7 @@ class MainInAuthScreen(Screen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.build_ui()
-        Window.bind(on_resize=self.on_window_resize)
+        responsive.subscribe(self)
 
     def on_pre_enter(self):
         """Verifica la sesión antes de entrar a la pantalla"""
@@ -488,20 +480,18 @@ class MainInAuthScreen(Screen):
         )
 
         # Contenido principal
-        padding_h = max(dp(30), Window.width * 0.05)
-        padding_v = max(dp(20), Window.height * 0.03)
-        
         self.content_layout = BoxLayout(
             orientation='vertical',
             spacing=dp(20),
-            padding=[padding_h, padding_v, padding_h, padding_v],
             size_hint_y=None
         )
         self.content_layout.bind(minimum_height=self.content_layout.setter('height'))
+        responsive.track(self.content_layout, padding=self.calculate_content_padding)
 
         # Espaciador superior
-        top_spacer = max(dp(20), Window.height * 0.05)
-        self.content_layout.add_widget(Widget(size_hint_y=None, height=top_spacer))
+        top_spacer = Widget(size_hint_y=None)
+        responsive.track(top_spacer, height=lambda: max(dp(20), Window.height * 0.05))
+        self.content_layout.add_widget(top_spacer)
 
         # Título
         self.titulo = Label(
@@ -514,6 +504,7 @@ class MainInAuthScreen(Screen):
             size_hint_y=None,
             height=dp(80)
         )
+        responsive.track(self.titulo, font_size=lambda: ResponsiveHelper.get_font_size(40))
         self.content_layout.add_widget(self.titulo)
 
         # Eslogan
@@ -526,6 +517,7 @@ class MainInAuthScreen(Screen):
             size_hint_y=None,
             height=dp(60)
         )
+        responsive.track(self.eslogan, font_size=lambda: ResponsiveHelper.get_font_size(24))
         self.content_layout.add_widget(self.eslogan)
 
         # Espaciador
@@ -533,37 +525,39 @@ class MainInAuthScreen(Screen):
 
         # Contenedor de imágenes responsive
         self.imagenes_layout = BoxLayout(
-            orientation='horizontal' if Window.width > 600 else 'vertical',
             size_hint_y=None,
             spacing=dp(20)
         )
-        
-        # Altura responsive para las imágenes
-        img_height = self.calculate_image_height()
-        self.imagenes_layout.height = img_height
+        responsive.track(
+            self.imagenes_layout,
+            orientation=lambda: 'horizontal' if Window.width > 600 else 'vertical',
+            height=self.calculate_image_height
+        )
 
-        self.img1 = Image(
-            source="p1-Photoroom.png",
-            size_hint_x=1 if Window.width > 600 else None,
+        self.img1 = assets.image(
+            "p1-Photoroom.png",
             size_hint_y=None,
-            height=img_height if Window.width <= 600 else img_height,
-            width=Window.width * 0.8 if Window.width <= 600 else 0,
             fit_mode="contain"
         )
         
-        self.img2 = Image(
-            source="p2-Photoroom.png",
-            size_hint_x=1 if Window.width > 600 else None,
+        self.img2 = assets.image(
+            "p2-Photoroom.png",
             size_hint_y=None,
-            height=img_height if Window.width <= 600 else img_height,
-            width=Window.width * 0.8 if Window.width <= 600 else 0,
             fit_mode="contain"
         )
+        for img in (self.img1, self.img2):
+            responsive.track(
+                img,
+                size_hint_x=lambda: 1 if Window.width > 600 else None,
+                height=self.calculate_image_height,
+                width=lambda: Window.width * 0.8 if Window.width <= 600 else 0
+            )
+        # Separador entre imágenes, solo en vertical (lo agrega/quita reflow)
+        self.imagenes_spacer = Widget(size_hint_y=None, height=dp(20))
         
         self.imagenes_layout.add_widget(self.img1)
-        if Window.width <= 600:
-            self.imagenes_layout.add_widget(Widget(size_hint_y=None, height=dp(20)))
         self.imagenes_layout.add_widget(self.img2)
+        self.reflow()
         
         self.content_layout.add_widget(self.imagenes_layout)
 
@@ -579,6 +573,7 @@ class MainInAuthScreen(Screen):
             height=dp(40),
             halign="center"
         )
+        responsive.track(self.copyright, font_size=lambda: ResponsiveHelper.get_font_size(14))
         self.content_layout.add_widget(self.copyright)
 
         # Espaciador inferior
@@ -601,8 +596,18 @@ class MainInAuthScreen(Screen):
         else:
             return min(dp(300), Window.height * 0.35)
 
-    def on_window_resize(self, instance, width, height):
-        Clock.schedule_once(lambda dt: self.build_ui(), 0.1)
+    def calculate_content_padding(self):
+        padding_h = max(dp(30), Window.width * 0.05)
+        padding_v = max(dp(20), Window.height * 0.03)
+        return [padding_h, padding_v, padding_h, padding_v]
+
+    def reflow(self):
+        """Separador entre las imágenes solo cuando se apilan en vertical"""
+        vertical = Window.width <= 600
+        if vertical and self.imagenes_spacer.parent is None:
+            self.imagenes_layout.add_widget(self.imagenes_spacer, index=1)
+        elif not vertical and self.imagenes_spacer.parent is not None:
+            self.imagenes_layout.remove_widget(self.imagenes_spacer)
 
 
 # ------------------ APP PRINCIPAL ------------------
@@ -3,7 +3,6 @@ from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.uix.textinput import TextInput
 from kivy.uix.button import Button
-from kivy.uix.image import Image
 from kivy.graphics import Color, RoundedRectangle, Rectangle
 from kivy.core.window import Window
 from kivy.clock import Clock
@@ -12,8 +11,13 @@ from kivy.app import App
 from kivy.metrics import dp, sp
 from kivy.uix.widget import Widget
 from kivy.utils import platform
-from threading import Thread
+from task_executor import tasks, PRIORITY_HIGH
 from api_client import api  
+from responsive import responsive
+from assets import assets
+from app_logging import get_logger
+
+log = get_logger("ini_juez")
 
 
 # ------------------ UTILIDADES RESPONSIVE ------------------
@@ -104,17 +108,13 @@ class RoundedTextInput(TextInput):
             )
 
         self.bind(pos=self._update_rects, size=self._update_rects)
-        Window.bind(on_resize=self.on_window_resize)
+        responsive.track(self, font_size=lambda: ResponsiveHelper.get_font_size(18))
 
     def _update_rects(self, *args):
         self.bg_rect.pos = self.pos
         self.bg_rect.size = self.size
         self.border_rect.pos = (self.pos[0]+dp(2), self.pos[1]+dp(2))
         self.border_rect.size = (self.size[0]-dp(4), self.size[1]-dp(4))
-    
-    def on_window_resize(self, instance, width, height):
-        self.font_size = ResponsiveHelper.get_font_size(18)
-        self.height = dp(55)
 
     def on_focus(self, instance, value):
         if value:
@@ -177,15 +177,11 @@ class HoverButton(Button):
             )
         
         self.bind(pos=self.update_rect, size=self.update_rect)
-        Window.bind(on_resize=self.on_window_resize)
+        responsive.track(self, font_size=lambda: ResponsiveHelper.get_font_size(18))
 
     def update_rect(self, *args):
         self.rect.pos = self.pos
         self.rect.size = self.size
-    
-    def on_window_resize(self, instance, width, height):
-        self.font_size = ResponsiveHelper.get_font_size(18)
-        self.height = dp(50)
 
 
 # ------------------ PANTALLA INICIO SESIÓN JUEZ RESPONSIVE ------------------
@@ -200,7 +196,6 @@ class InicioSesionJuezScreen(Screen):
         self.bind(size=self._update_screen_bg, pos=self._update_screen_bg)
         
         self.build_ui()
-        Window.bind(on_resize=self.on_window_resize)
     
     def _update_screen_bg(self, *args):
         self.screen_bg.size = self.size
@@ -225,14 +220,16 @@ class InicioSesionJuezScreen(Screen):
             spacing=dp(12)
         )
         form_container.bind(minimum_height=form_container.setter('height'))
+        responsive.track(form_container, size_hint_x=ResponsiveHelper.get_form_width)
 
         logo_height = ResponsiveHelper.get_logo_height()
-        logo = Image(
-            source="Imagen5-Photoroom.png",
+        logo = assets.image(
+            "Imagen5-Photoroom.png",
             size_hint=(1, None),
             height=logo_height,
             fit_mode="contain"
         )
+        responsive.track(logo, height=ResponsiveHelper.get_logo_height)
         form_container.add_widget(logo)
 
         titulo = Label(
@@ -243,6 +240,7 @@ class InicioSesionJuezScreen(Screen):
             size_hint_y=None,
             height=dp(50)
         )
+        responsive.track(titulo, font_size=lambda: ResponsiveHelper.get_font_size(32))
         form_container.add_widget(titulo)
 
         titulo2 = Label(
@@ -253,6 +251,7 @@ class InicioSesionJuezScreen(Screen):
             size_hint_y=None,
             height=dp(60)
         )
+        responsive.track(titulo2, font_size=lambda: ResponsiveHelper.get_font_size(40))
         form_container.add_widget(titulo2)
 
         form_container.add_widget(Widget(size_hint_y=None, height=dp(8)))
@@ -279,6 +278,7 @@ class InicioSesionJuezScreen(Screen):
             height=dp(25),
             halign='left'
         )
+        responsive.track(contrasena_label, font_size=lambda: ResponsiveHelper.get_font_size(18))
         contrasena_label.bind(size=contrasena_label.setter('text_size'))
         contrasena_layout.add_widget(contrasena_label)
         
@@ -295,6 +295,11 @@ class InicioSesionJuezScreen(Screen):
             size_hint_y=None,
             height=dp(50) if Window.width > 600 else dp(110)
         )
+        responsive.track(
+            botones_layout,
+            orientation=lambda: 'horizontal' if Window.width > 600 else 'vertical',
+            height=lambda: dp(50) if Window.width > 600 else dp(110)
+        )
 
         btn_iniciar = HoverButton(
             text='ACCEDER AL COMBATE',
@@ -326,12 +331,12 @@ class InicioSesionJuezScreen(Screen):
 
         self.add_widget(main_layout)
 
-    def on_window_resize(self, instance, width, height):
-        Clock.schedule_once(lambda dt: self.build_ui(), 0.1)
-
     def on_enter(self, *args):
         Clock.schedule_once(self.establecer_foco, 0.1)
 
+    def on_pre_leave(self, *args):
+        tasks.cancel_owner(self)
+
     def establecer_foco(self, dt):
         if hasattr(self, 'contrasena_input'):
             self.contrasena_input.focus = True
@@ -347,106 +352,94 @@ class InicioSesionJuezScreen(Screen):
         self.mostrar_loading()
     
         def hacer_login():
-            try:
-                print(f"[InicioSesionJuez] 🔐 Intentando login con contraseña: {contrasena}")
-                
-                # ✅ PASO 1: Login usando api_client
-                response = api.session.post(
-                    f"{api.base_url}/api/auth/juez/login",
-                    json={'password': contrasena},
-                    headers={'Content-Type': 'application/json'},
-                    timeout=5
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    combate_id = result.get('combateId')
-                    
-                    print(f"[InicioSesionJuez] ✓ Login exitoso - CombateId: {combate_id}")
-                    
-                    # ✅ PASO 2: Preparar el combate (WebSocket)
-                    try:
-                        print(f"[InicioSesionJuez] 🔌 Preparando WebSocket para combate {combate_id}...")
-                        prepare_response = api.prepare_combate(combate_id)
-                        print(f"[InicioSesionJuez] ✓ Combate preparado: {prepare_response}")
-                    except Exception as e:
-                        print(f"[InicioSesionJuez] ⚠️ Error preparando combate (continuando): {e}")
-                    
-                    # ✅ PASO 3: Obtener datos del combate usando api_client
-                    combate_data = api.get_combate_by_id(combate_id)
-                    print(f"[InicioSesionJuez] 📋 Datos del combate: {combate_data}")
-                    
-                    # ✅ PASO 4: Extraer competidores directamente del combate
-                    competidor_rojo = combate_data.get('competidorRojo', {})
-                    competidor_azul = combate_data.get('competidorAzul', {})
+            # La contraseña del combate no se registra
+            log.info("login.intento")
+            
+            # ✅ PASO 1: Login usando api_client
+            response = api.session.post(
+                f"{api.base_url}/api/auth/juez/login",
+                json={'password': contrasena},
+                headers={'Content-Type': 'application/json'},
+                timeout=5
+            )
+            
+            if response.status_code != 200:
+                error_msg = "Contraseña incorrecta"
+                try:
+                    error_data = response.json()
+                    error_msg = error_data.get('message', error_msg)
+                except:
+                    pass
                 
-                    # Extraer nombres (pueden venir como 'nombres' o 'nombreAlumno')
-                    nombre_rojo = competidor_rojo.get('nombres') or competidor_rojo.get('nombreAlumno', 'ROJO')
-                    nombre_azul = competidor_azul.get('nombres') or competidor_azul.get('nombreAlumno', 'AZUL')
-                    
-                    # Extraer nacionalidades (si existen)
-                    nacionalidad_rojo = competidor_rojo.get('nacionalidad', 'MX')
-                    nacionalidad_azul = competidor_azul.get('nacionalidad', 'MX')
-                    
-                    # IDs de los alumnos
-                    id_rojo = competidor_rojo.get('id')
-                    id_azul = competidor_azul.get('id')
-                    
-                    # Preparar datos del combate
-                    combate_completo = {
-                        'idCombate': combate_id,
-                        'idAlumnoRojo': id_rojo,
-                        'idAlumnoAzul': id_azul,
-                        'duracionRound': combate_data.get('duracionRound', '00:03:00'),
-                        'duracionDescanso': combate_data.get('duracionDescanso', '00:01:00'),
-                        'numeroRounds': combate_data.get('numeroRound', 3)
-                    }
-                    
-                    print(f"[InicioSesionJuez] ✅ Datos completos:")
-                    print(f"  Combate ID: {combate_id}")
-                    print(f"  🔴 ROJO: {nombre_rojo} (ID: {id_rojo})")
-                    print(f"  🔵 AZUL: {nombre_azul} (ID: {id_azul})")
-                    
-                    # Programar la transición
-                    Clock.schedule_once(lambda dt: self.ir_a_tablero(
-                        nombre_rojo,
-                        nacionalidad_rojo,
-                        nombre_azul,
-                        nacionalidad_azul,
-                        combate_completo
-                    ), 0)
-                    
-                else:
-                    error_msg = "Contraseña incorrecta"
-                    try:
-                        error_data = response.json()
-                        error_msg = error_data.get('message', error_msg)
-                    except:
-                        pass
-                    
-                    print(f"[InicioSesionJuez] ✗ Login fallido: {error_msg}")
-                    Clock.schedule_once(lambda dt: self.mostrar_mensaje("Error", error_msg), 0)
-                    
+                log.warning("login.fallido", status=response.status_code, mensaje=error_msg)
+                return False, error_msg
+            
+            result = response.json()
+            combate_id = result.get('combateId')
+            
+            log.info("login.exitoso", combate_id=combate_id)
+            
+            # ✅ PASO 2: Preparar el combate (WebSocket)
+            try:
+                prepare_response = api.prepare_combate(combate_id)
+                log.debug("combate.preparado", combate_id=combate_id, respuesta=prepare_response)
             except Exception as e:
-                print(f"[InicioSesionJuez] ✗ Error inesperado: {e}")
-                import traceback
-                traceback.print_exc()
-                Clock.schedule_once(lambda dt: self.mostrar_mensaje(
-                    "Error", 
-                    f"Error de conexión: {str(e)}"
-                ), 0)
-            finally:
-                Clock.schedule_once(lambda dt: self.cerrar_loading(), 0)
+                log.warning("combate.preparar_fallido", combate_id=combate_id, error=e)
+            
+            # ✅ PASO 3: Obtener datos del combate usando api_client
+            combate_data = api.get_combate_by_id(combate_id)
+            log.debug("combate.datos", combate_id=combate_id, data=combate_data)
+            
+            # ✅ PASO 4: Extraer competidores directamente del combate
+            competidor_rojo = combate_data.get('competidorRojo', {})
+            competidor_azul = combate_data.get('competidorAzul', {})
+        
+            # Extraer nombres (pueden venir como 'nombres' o 'nombreAlumno')
+            nombre_rojo = competidor_rojo.get('nombres') or competidor_rojo.get('nombreAlumno', 'ROJO')
+            nombre_azul = competidor_azul.get('nombres') or competidor_azul.get('nombreAlumno', 'AZUL')
+            
+            # Extraer nacionalidades (si existen)
+            nacionalidad_rojo = competidor_rojo.get('nacionalidad', 'MX')
+            nacionalidad_azul = competidor_azul.get('nacionalidad', 'MX')
+            
+            # IDs de los alumnos
+            id_rojo = competidor_rojo.get('id')
+            id_azul = competidor_azul.get('id')
+            
+            # Preparar datos del combate
+            combate_completo = {
+                'idCombate': combate_id,
+                'idAlumnoRojo': id_rojo,
+                'idAlumnoAzul': id_azul,
+                'duracionRound': combate_data.get('duracionRound', '00:03:00'),
+                'duracionDescanso': combate_data.get('duracionDescanso', '00:01:00'),
+                'numeroRounds': combate_data.get('numeroRound', 3)
+            }
+            
+            log.info("combate.listo", combate_id=combate_id, rojo=nombre_rojo, id_rojo=id_rojo,
+                     azul=nombre_azul, id_azul=id_azul)
+            
+            return True, (nombre_rojo, nacionalidad_rojo, nombre_azul, nacionalidad_azul, combate_completo)
+        
+        def on_login(result):
+            self.cerrar_loading()
+            ok, data = result
+            if ok:
+                self.ir_a_tablero(*data)
+            else:
+                self.mostrar_mensaje("Error", data)
+        
+        def on_error(e):
+            log.exception("login.error", exc=e)
+            self.cerrar_loading()
+            self.mostrar_mensaje("Error", f"Error de conexión: {str(e)}")
     
-        login_thread = Thread(target=hacer_login)
-        login_thread.daemon = True
-        login_thread.start()
+        tasks.submit(hacer_login, owner=self, priority=PRIORITY_HIGH, name="juez.login",
+                     on_success=on_login, on_error=on_error)
 
     def ir_a_tablero(self, nombre_rojo, nat_rojo, nombre_azul, nat_azul, combate_data):
         """Navega al tablero central con los datos del combate"""
         try:
-            print("[InicioSesionJuez] 🎯 Navegando al tablero central...")
-            
             # Obtener la pantalla del tablero
             tablero_screen = self.manager.get_screen('tablero_central')
             
@@ -462,12 +455,10 @@ class InicioSesionJuezScreen(Screen):
             # Cambiar a la pantalla del tablero
             self.manager.current = 'tablero_central'
             
-            print("[InicioSesionJuez] ✓ Navegando al tablero central")
+            log.info("tablero.abierto", combate_id=combate_data.get('idCombate'))
             
         except Exception as e:
-            print(f"[InicioSesionJuez] ✗ Error navegando al tablero: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("tablero.error", error=e)
             self.mostrar_mensaje("Error", f"No se pudo acceder al tablero: {str(e)}")
 
     def volver(self, instance):
@@ -479,9 +470,8 @@ class InicioSesionJuezScreen(Screen):
             
             # Navegar a la pantalla principal
             self.manager.current = 'main'
-            print("[InicioSesionJuez] 👈 Volviendo a pantalla principal")
         except Exception as e:
-            print(f"[InicioSesionJuez] ✗ Error al volver: {e}")
+            log.error("volver.error", error=e)
 
     def mostrar_loading(self):
         """Muestra un popup de carga"""
@@ -3,7 +3,6 @@ from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.uix.textinput import TextInput
 from kivy.uix.button import Button
-from kivy.uix.image import Image
 from kivy.uix.scrollview import ScrollView
 from kivy.graphics import Color, RoundedRectangle, Rectangle
 from kivy.core.window import Window
@@ -15,10 +14,12 @@ from kivy.uix.widget import Widget
 from kivy.uix.behaviors import ButtonBehavior
 from kivy.utils import platform
 import requests, json
-from threading import Thread
+from task_executor import tasks, PRIORITY_HIGH
 from kivy.app import App
 from kivy.clock import Clock
 from api_client import api
+from responsive import responsive
+from assets import assets
 
 # ------------------ UTILIDADES RESPONSIVE ------------------
 class ResponsiveHelper:
@@ -98,17 +99,13 @@ class RoundedTextInput(TextInput):
             )
 
         self.bind(pos=self._update_rects, size=self._update_rects)
-        Window.bind(on_resize=self.on_window_resize)
+        responsive.track(self, font_size=lambda: ResponsiveHelper.get_font_size(18))
 
     def _update_rects(self, *args):
         self.bg_rect.pos = self.pos
         self.bg_rect.size = self.size
         self.border_rect.pos = (self.pos[0]+dp(2), self.pos[1]+dp(2))
         self.border_rect.size = (self.size[0]-dp(4), self.size[1]-dp(4))
-    
-    def on_window_resize(self, instance, width, height):
-        self.font_size = ResponsiveHelper.get_font_size(18)
-        self.height = dp(55)
 
     def on_focus(self, instance, value):
         if value:
@@ -168,25 +165,18 @@ class HoverButton(Button):
             )
 
         self.bind(pos=self.update_rect, size=self.update_rect)
-        Window.bind(on_resize=self.on_window_resize)
+        responsive.track(self, font_size=lambda: ResponsiveHelper.get_font_size(18))
 
     def update_rect(self, *args):
         self.rect.pos = self.pos
         self.rect.size = self.size
-    
-    def on_window_resize(self, instance, width, height):
-        self.font_size = ResponsiveHelper.get_font_size(18)
-        self.height = dp(50)
 
 
 # ------------------ ENLACE RECUPERAR ------------------
 class EnlaceRecuperar(ButtonBehavior, Label):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        Window.bind(on_resize=self.on_window_resize)
-    
-    def on_window_resize(self, instance, width, height):
-        self.font_size = ResponsiveHelper.get_font_size(16)
+        responsive.track(self, font_size=lambda: ResponsiveHelper.get_font_size(16))
 
 
 # ------------------ PANTALLA INICIO SESIÓN RESPONSIVE ------------------
@@ -196,7 +186,6 @@ class InicioSesionScreen(Screen):
         self.build_ui()
         self.popup_usuario = None
         self.popup_correo = None
-        Window.bind(on_resize=self.on_window_resize)
 
     def build_ui(self):
         self.clear_widgets()
@@ -224,7 +213,9 @@ class InicioSesionScreen(Screen):
 
         # Espaciador superior responsive
         top_spacer_height = max(dp(20), Window.height * 0.05)
-        main_layout.add_widget(Widget(size_hint_y=None, height=top_spacer_height))
+        top_spacer = Widget(size_hint_y=None, height=top_spacer_height)
+        responsive.track(top_spacer, height=lambda: max(dp(20), Window.height * 0.05))
+        main_layout.add_widget(top_spacer)
 
         # Contenedor del formulario centrado
         form_container = BoxLayout(
@@ -234,16 +225,18 @@ class InicioSesionScreen(Screen):
             spacing=dp(15)
         )
         form_container.bind(minimum_height=form_container.setter('height'))
+        responsive.track(form_container, size_hint_x=ResponsiveHelper.get_form_width)
 
         # Logo responsive
         logo_height = min(dp(150), Window.height * 0.2)
-        logo = Image(
-            source="Imagen5-Photoroom.png",
+        logo = assets.image(
+            "Imagen5-Photoroom.png",
             size_hint=(1, None),
             height=logo_height,
             allow_stretch=True,
             keep_ratio=True
         )
+        responsive.track(logo, height=lambda: min(dp(150), Window.height * 0.2))
         form_container.add_widget(logo)
 
         # Título
@@ -255,6 +248,7 @@ class InicioSesionScreen(Screen):
             size_hint_y=None,
             height=dp(60)
         )
+        responsive.track(titulo, font_size=lambda: ResponsiveHelper.get_font_size(32))
         form_container.add_widget(titulo)
 
         # Espaciador
@@ -285,6 +279,7 @@ class InicioSesionScreen(Screen):
             halign='left'
         )
         correo_label.bind(size=correo_label.setter('text_size'))
+        responsive.track(correo_label, font_size=lambda: ResponsiveHelper.get_font_size(18))
         correo_layout.add_widget(correo_label)
         
         self.correo_input = RoundedTextInput(hint_text='usuario@ejemplo.com')
@@ -308,6 +303,7 @@ class InicioSesionScreen(Screen):
             halign='left'
         )
         contraseña_label.bind(size=contraseña_label.setter('text_size'))
+        responsive.track(contraseña_label, font_size=lambda: ResponsiveHelper.get_font_size(18))
         contraseña_layout.add_widget(contraseña_label)
         
         self.contraseña_input = RoundedTextInput(hint_text='********', password=True)
@@ -326,6 +322,11 @@ class InicioSesionScreen(Screen):
             size_hint_y=None,
             height=dp(50) if Window.width > 600 else dp(110)
         )
+        responsive.track(
+            botones_layout,
+            orientation=lambda: 'horizontal' if Window.width > 600 else 'vertical',
+            height=lambda: dp(50) if Window.width > 600 else dp(110)
+        )
 
         btn_iniciar = HoverButton(text='INICIAR SESIÓN')
         btn_iniciar.bind(on_press=self.iniciar_sesion)
@@ -373,12 +374,12 @@ class InicioSesionScreen(Screen):
         self.background_rect.size = instance.size
         self.background_rect.pos = instance.pos
 
-    def on_window_resize(self, instance, width, height):
-        Clock.schedule_once(lambda dt: self.build_ui(), 0.1)
-
     def on_enter(self, *args):
         Clock.schedule_once(self.establecer_foco, 0.1)
 
+    def on_pre_leave(self, *args):
+        tasks.cancel_owner(self)
+
     def establecer_foco(self, dt):
         if hasattr(self, 'correo_input'):
             self.correo_input.focus = True
@@ -392,69 +393,64 @@ class InicioSesionScreen(Screen):
             return
     
         def _task():
-            try:
-                resp = api.post_json("/api/auth/admin/login", {"login": login, "password": password})
+            resp = api.post_json("/api/auth/admin/login", {"login": login, "password": password})
+            
+            if resp.status_code == 200:
+                data = resp.json()
+                access_token = data.get("accessToken")
+                admin = data.get("admin")
+                
+                if not access_token:
+                    raise Exception("Respuesta sin token")
+                
+                # Configurar el token en el API client
+                api.set_access_token(access_token)
+                
+                # Guardar en app.auth (tu método actual)
+                app = App.get_running_app()
+                app.auth = {"access_token": access_token, "admin": admin}
+                
+                # NUEVO: Guardar la contraseña del administrador
+                app.admin_password = password  # <--- AGREGAR ESTA LÍNEA
                 
-                if resp.status_code == 200:
-                    data = resp.json()
-                    access_token = data.get("accessToken")
-                    admin = data.get("admin")
-                    
-                    if not access_token:
-                        raise Exception("Respuesta sin token")
-                    
-                    # Configurar el token en el API client
-                    api.set_access_token(access_token)
-                    
-                    # Guardar en app.auth (tu método actual)
-                    app = App.get_running_app()
-                    app.auth = {"access_token": access_token, "admin": admin}
-                    
-                    # NUEVO: Guardar la contraseña del administrador
-                    app.admin_password = password  # <--- AGREGAR ESTA LÍNEA
-                    
-                    # NUEVO: También guardar en SessionManager
-                    from session_manager import session
-                    session.set_session(
-                        admin_id=admin.get('idAdministrador'),
-                        admin_data=admin,
-                        access_token=access_token
-                    )
-                    
-                    def _ok(dt):
-                        self.manager.current = 'ini'
-                        self.mostrar_mensaje("Éxito", f"Bienvenido {admin.get('usuarioAdministrador')}")
-                    
-                    Clock.schedule_once(_ok, 0)
-                    
-                elif resp.status_code in (400, 401):
-                    try:
-                        msg = resp.json().get("message", "Credenciales inválidas")
-                    except Exception:
-                        msg = "Credenciales inválidas"
-                    
-                    def _err(dt):
-                        self.mostrar_mensaje("Error", msg)
-                    Clock.schedule_once(_err, 0)
-                else:
-                    def _err2(dt):
-                        self.mostrar_mensaje("Error", f"Error del servidor ({resp.status_code}).")
-                    Clock.schedule_once(_err2, 0)
-                    
-            except requests.exceptions.ConnectionError:
+                # NUEVO: También guardar en SessionManager
+                from session_manager import session
+                session.set_session(
+                    admin_id=admin.get('idAdministrador'),
+                    admin_data=admin,
+                    access_token=access_token
+                )
+                return admin
+                
+            elif resp.status_code in (400, 401):
+                try:
+                    msg = resp.json().get("message", "Credenciales inválidas")
+                except Exception:
+                    msg = "Credenciales inválidas"
+                raise RuntimeError(msg)
+            else:
+                raise RuntimeError(f"Error del servidor ({resp.status_code}).")
+        
+        def _ok(admin):
+            self.manager.current = 'ini'
+            self.mostrar_mensaje("Éxito", f"Bienvenido {admin.get('usuarioAdministrador')}")
+        
+        def _err(e):
+            if isinstance(e, RuntimeError):
+                msg = str(e)
+            elif isinstance(e, requests.exceptions.ConnectionError):
                 msg = "No se pudo conectar con el servidor."
-                Clock.schedule_once(lambda dt, m=msg: self.mostrar_mensaje("Error", m), 0)
-            except requests.exceptions.Timeout:
+            elif isinstance(e, requests.exceptions.Timeout):
                 msg = "Tiempo de espera agotado."
-                Clock.schedule_once(lambda dt, m=msg: self.mostrar_mensaje("Error", m), 0)
-            except Exception as e:
+            else:
                 msg = f"Ocurrió un error: {e}"
-                Clock.schedule_once(lambda dt, m=msg: self.mostrar_mensaje("Error", m), 0)
+            self.mostrar_mensaje("Error", msg)
     
         if hasattr(self, "show_loading"): 
             self.show_loading("Verificando...")
         
-        Thread(target=_task, daemon=True).start()
+        tasks.submit(_task, owner=self, priority=PRIORITY_HIGH, name="admin.login",
+                     on_success=_ok, on_error=_err)
 
     def mostrar_mensaje(self, titulo, mensaje):
         content = BoxLayout(
@@ -14,11 +14,10 @@ Config.set('kivy', 'exit_on_escape', '1')
 
 
 from kivy.app import App
-from kivy.uix.screenmanager import ScreenManager, Screen
+from kivy.uix.screenmanager import Screen
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.button import Button
 from kivy.uix.label import Label
-from kivy.uix.image import Image
 from kivy.uix.widget import Widget
 from kivy.graphics import Color, Rectangle, RoundedRectangle
 from kivy.uix.scrollview import ScrollView
@@ -30,21 +29,11 @@ from kivy.clock import Clock
 import webbrowser
 import os
 
-# Importaciones de tus pantallas
-from registro import RegistroScreen
-from torneos_anteriores import TorneosAnterioresScreen
-from crear_torneo import CrearTorneoScreen
-from crear_combate import CrearCombateScreen
-from tablero import MainScreentab
-from tablero_central import MainScreentabc
-from combates_anteriore import CombatesScreen
-from inicio import InicioSesionScreen
-from ini import MainInAuthScreen
-from ini_juez import InicioSesionJuezScreen
-from cuenta import VerInfoScreen
-from actualizar_torneos import ActualizarTorneoScreen
-from actualizar import ActualizarDatosScreen
-from api_client import api
+# Las pantallas de otros módulos se importan al construirlas (screen_registry)
+from screen_registry import LazyScreenManager
+from responsive import responsive
+from assets import assets
+from stall_detector import stall_detector
 
 # ------------------ UTILIDADES MULTIPLATAFORMA ------------------
 class ResponsiveHelper:
@@ -207,16 +196,12 @@ class HoverButton(Button):
         self.bind(size=self.update_rect, pos=self.update_rect)
         
         # Actualizar tamaño de fuente cuando cambie la ventana
-        Window.bind(on_resize=self.on_window_resize)
+        responsive.track(self, font_size=lambda: ResponsiveHelper.get_font_size(16))
 
     def update_rect(self, *args):
         self.rect.pos = self.pos
         self.rect.size = self.size
         self.rect.radius = [self.border_radius]
-    
-    def on_window_resize(self, instance, width, height):
-        self.font_size = ResponsiveHelper.get_font_size(16)
-        self.height = dp(50)
 
 
 # ------------------ NAVBAR RESPONSIVE ------------------
@@ -239,8 +224,8 @@ class Navbar(BoxLayout):
         scroll_content.bind(minimum_height=scroll_content.setter('height'))
 
         # Logo responsive
-        self.logo = Image(
-            source="Imagen5-Photoroom.png", 
+        self.logo = assets.image(
+            "Imagen5-Photoroom.png",
             size_hint=(1, None), 
             height=dp(120),
             allow_stretch=True,
@@ -267,17 +252,14 @@ class Navbar(BoxLayout):
         self.add_widget(scroll)
         
         # Actualizar cuando cambie el tamaño de ventana
-        Window.bind(on_resize=self.on_window_resize)
+        responsive.track(self,
+                         size_hint=lambda: (ResponsiveHelper.get_navbar_width(), 1),
+                         spacing=ResponsiveHelper.get_spacing,
+                         padding=ResponsiveHelper.get_padding)
 
     def update_rect(self, *args):
         self.rect.size = self.size
         self.rect.pos = self.pos
-    
-    def on_window_resize(self, instance, width, height):
-        self.size_hint = (ResponsiveHelper.get_navbar_width(), 1)
-        self.logo.height = dp(120)
-        self.spacing = ResponsiveHelper.get_spacing()
-        self.padding = ResponsiveHelper.get_padding()
 
     def descargar_manual(self, instance):
         # Manejo multiplataforma de rutas
@@ -328,7 +310,6 @@ class ConocenosScreen(Screen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.build_ui()
-        Window.bind(on_resize=self.on_window_resize)
 
     def build_ui(self):
         self.clear_widgets()
@@ -345,6 +326,7 @@ class ConocenosScreen(Screen):
             spacing=0, 
             size_hint=(1 - ResponsiveHelper.get_navbar_width(), 1)
         )
+        responsive.track(content_layout, size_hint=lambda: (1 - ResponsiveHelper.get_navbar_width(), 1))
         with content_layout.canvas.before:
             Color(0.98, 0.98, 0.98, 1)
             self.background_rect = Rectangle(size=content_layout.size, pos=content_layout.pos)
@@ -383,6 +365,7 @@ class ConocenosScreen(Screen):
             size_hint_y=None,
             height=dp(80)
         )
+        responsive.track(titulo, font_size=lambda: ResponsiveHelper.get_font_size(36))
         main_content.add_widget(titulo)
 
         # -------- Función para secciones --------
@@ -421,6 +404,7 @@ class ConocenosScreen(Screen):
                 color=(0.1, 0.4, 0.7, 1),
                 halign='center'
             )
+            responsive.track(lbl_titulo, font_size=lambda: ResponsiveHelper.get_font_size(22))
             
             lbl_contenido = ResponsiveLabel(
                 text=contenido,
@@ -429,6 +413,7 @@ class ConocenosScreen(Screen):
                 halign='center',
                 valign='top'
             )
+            responsive.track(lbl_contenido, font_size=lambda: ResponsiveHelper.get_font_size(16))
             
             box.add_widget(lbl_titulo)
             box.add_widget(lbl_contenido)
@@ -442,6 +427,8 @@ class ConocenosScreen(Screen):
             padding=[dp(10), 0]
         )
         mision_vision_container.bind(minimum_height=mision_vision_container.setter('height'))
+        responsive.track(mision_vision_container,
+                         orientation=lambda: 'horizontal' if Window.width > 800 else 'vertical')
         
         seccion_mision = crear_seccion(
             "MISIÓN",
@@ -468,6 +455,7 @@ class ConocenosScreen(Screen):
             size_hint_y=None,
             height=dp(60)
         )
+        responsive.track(gallery_title, font_size=lambda: ResponsiveHelper.get_font_size(22))
         main_content.add_widget(gallery_title)
 
         # Contenedor centrado para las tarjetas
@@ -485,6 +473,7 @@ class ConocenosScreen(Screen):
             do_scroll_y=False,
             bar_width=dp(10)
         )
+        responsive.track(gallery_scroll, size=lambda: (min(Window.width * 0.9, dp(600)), dp(280)))
         
         img_grid = BoxLayout(
             orientation='horizontal', 
@@ -512,27 +501,25 @@ class ConocenosScreen(Screen):
                     pos=lambda c, v: setattr(c.rect, 'pos', v)
                 )
                 
-                img = Image(
-                    source=image_path, 
+                img = assets.image(
+                    image_path,
                     size_hint_y=0.65, 
                     allow_stretch=True,
                     keep_ratio=True
                 )
                 self.add_widget(img)
                 
-                self.add_widget(Label(
+                self.add_widget(responsive.track(Label(
                     text=f"[b]{name}[/b]", 
                     markup=True, 
                     color=(0.1, 0.4, 0.7, 1),
-                    font_size=ResponsiveHelper.get_font_size(16),
                     size_hint_y=0.2
-                ))
-                self.add_widget(Label(
+                ), font_size=lambda: ResponsiveHelper.get_font_size(16)))
+                self.add_widget(responsive.track(Label(
                     text=role, 
                     color=(0.4, 0.4, 0.4, 1),
-                    font_size=ResponsiveHelper.get_font_size(14),
                     size_hint_y=0.15
-                ))
+                ), font_size=lambda: ResponsiveHelper.get_font_size(14)))
 
         img_grid.add_widget(TeamCard("p1-Photoroom.png", "Karla", "Desarrolladora Backend" ))
         img_grid.add_widget(TeamCard("p2-Photoroom.png", "Enrique", "Desarrollador Frontend"))
@@ -575,10 +562,6 @@ class ConocenosScreen(Screen):
         """Actualiza el fondo del contenido del scroll"""
         self.main_content_rect.size = instance.size
         self.main_content_rect.pos = instance.pos
-    
-    def on_window_resize(self, instance, width, height):
-        # Reconstruir UI al cambiar tamaño
-        Clock.schedule_once(lambda dt: self.build_ui(), 0.1)
 
 
 # ------------------ PANTALLA PRINCIPAL RESPONSIVE ------------------
@@ -586,7 +569,6 @@ class MainInScreen(Screen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.build_ui()
-        Window.bind(on_resize=self.on_window_resize)
 
     def build_ui(self):
         self.clear_widgets()
@@ -606,6 +588,7 @@ class MainInScreen(Screen):
             bar_color=(0.5, 0.5, 0.5, 1),
             bar_inactive_color=(0.7, 0.7, 0.7, 0.5)
         )
+        responsive.track(scroll_view, size_hint=lambda: (1 - ResponsiveHelper.get_navbar_width(), 1))
 
         content_layout = BoxLayout(
             orientation='vertical', 
@@ -614,6 +597,7 @@ class MainInScreen(Screen):
             size_hint_y=None
         )
         content_layout.bind(minimum_height=content_layout.setter('height'))
+        responsive.track(content_layout, padding=lambda: ResponsiveHelper.get_padding() * 2)
         
         with content_layout.canvas.before:
             Color(0.95, 0.95, 0.95, 1)
@@ -641,6 +625,8 @@ class MainInScreen(Screen):
             size_hint_y=None,
             height=dp(60)
         )
+        responsive.track(titulo, font_size=lambda: ResponsiveHelper.get_font_size(60))
+        responsive.track(eslogan, font_size=lambda: ResponsiveHelper.get_font_size(20))
 
         botones = BoxLayout(
             spacing=dp(15), 
@@ -660,6 +646,7 @@ class MainInScreen(Screen):
             size_hint=(None, None), 
             size=(min(dp(400), Window.width * 0.5), dp(45))
         )
+        responsive.track(btn_juez, size=lambda: (min(dp(400), Window.width * 0.5), dp(45)))
         btn_juez.bind(on_press=lambda x: setattr(App.get_running_app().root, 'current', 'ini_juez'))
         
         btn_juez_container = AnchorLayout(
@@ -675,6 +662,7 @@ class MainInScreen(Screen):
             color=(0.1, 0.1, 0.1, 1),
             halign="center"
         )
+        responsive.track(quienes, font_size=lambda: ResponsiveHelper.get_font_size(16))
 
         imagenes = BoxLayout(
             orientation="horizontal", 
@@ -683,13 +671,13 @@ class MainInScreen(Screen):
             height=dp(250),
             padding=[dp(20), 0]
         )
-        imagenes.add_widget(Image(
-            source="p1-Photoroom.png",
+        imagenes.add_widget(assets.image(
+            "p1-Photoroom.png",
             allow_stretch=True,
             keep_ratio=True
         ))
-        imagenes.add_widget(Image(
-            source="p2-Photoroom.png",
+        imagenes.add_widget(assets.image(
+            "p2-Photoroom.png",
             allow_stretch=True,
             keep_ratio=True
         ))
@@ -701,6 +689,7 @@ class MainInScreen(Screen):
             size_hint_y=None,
             height=dp(40)
         )
+        responsive.track(footer, font_size=lambda: ResponsiveHelper.get_font_size(14))
 
         content_layout.add_widget(titulo)
         content_layout.add_widget(eslogan)
@@ -731,12 +720,27 @@ class MainInScreen(Screen):
         """Actualiza el fondo del ScrollView para evitar negro"""
         self.scroll_background.size = instance.size
         self.scroll_background.pos = instance.pos
-    
-    def on_window_resize(self, instance, width, height):
-        Clock.schedule_once(lambda dt: self.build_ui(), 0.1)
 
 
 # ------------------ APLICACIÓN ------------------
+# nombre -> fábrica; se construyen al navegar a ellas (o al precalentar)
+SCREENS = {
+    'conocenos': lambda name: ConocenosScreen(name=name),
+    'inicio_sesion': 'inicio:InicioSesionScreen',
+    'registro': 'registro:RegistroScreen',
+    'torneos_anteriores': 'torneos_anteriores:TorneosAnterioresScreen',
+    'crear_torneo': 'crear_torneo:CrearTorneoScreen',
+    'crear_combate': 'crear_combate:CrearCombateScreen',
+    'visualizar_combate': 'tablero:MainScreentab',
+    'visualizar_tablero_central': 'tablero_central:MainScreentabc',
+    'ini': 'ini:MainInAuthScreen',
+    'ini_juez': 'ini_juez:InicioSesionJuezScreen',
+    'cuenta': 'cuenta:VerInfoScreen',
+    'actualizar': 'actualizar:ActualizarDatosScreen',
+    'combates_anteriores': 'combates_anteriore:CombatesScreen',
+}
+
+
 class MyApp(App):
 
     LOGIN_SCREEN_NAME = 'main'
@@ -749,23 +753,25 @@ class MyApp(App):
             Window.minimum_width = 800
             Window.minimum_height = 600
         
-        sm = ScreenManager()
+        sm = LazyScreenManager()
+        # Solo la pantalla inicial se construye antes del primer frame
         sm.add_widget(MainInScreen(name='main'))
-        sm.add_widget(ConocenosScreen(name='conocenos'))
-        sm.add_widget(InicioSesionScreen(name='inicio_sesion'))
-        sm.add_widget(RegistroScreen(name='registro'))
-        sm.add_widget(TorneosAnterioresScreen(name='torneos_anteriores'))
-        sm.add_widget(CrearTorneoScreen(name='crear_torneo'))
-        sm.add_widget(CrearCombateScreen(name='crear_combate'))
-        sm.add_widget(MainScreentab(name='visualizar_combate'))
-        sm.add_widget(MainScreentabc(name='visualizar_tablero_central'))
-        sm.add_widget(MainInAuthScreen(name='ini'))
-        sm.add_widget(InicioSesionJuezScreen(name='ini_juez'))
-        sm.add_widget(VerInfoScreen(name='cuenta'))
-        sm.add_widget(ActualizarDatosScreen(name='actualizar'))
-        sm.add_widget(CombatesScreen(name='combates_anteriores'))
+        for name, factory in SCREENS.items():
+            sm.register(name, factory)
         # ActualizarTorneoScreen se agregará dinámicamente cuando se necesite
+        # Las pantallas inactivas reciben el último resize al volver a mostrarse
+        responsive.watch_manager(sm)
+        assets.watch_manager(sm)
         return sm
+
+    def on_start(self):
+        # Con la pantalla inicial ya dibujada, adelantar las que se abren desde ella
+        self.root.prewarm()
+        stall_detector.watch_manager(self.root)
+        stall_detector.start()
+
+    def on_stop(self):
+        stall_detector.stop()
     
     def agregar_pantalla_actualizar_torneo(self, torneo_data, on_save_callback):
         """
@@ -778,6 +784,7 @@ class MyApp(App):
             sm.remove_widget(sm.get_screen('actualizar_torneos'))
         
         # Crear y agregar nueva pantalla con los datos
+        from actualizar_torneos import ActualizarTorneoScreen
         screen = ActualizarTorneoScreen(
             name='actualizar_torneos',
             torneo_data=torneo_data,
@@ -793,6 +800,7 @@ class MyApp(App):
         - Limpia token local y estado de auth.
         - Navega a LOGIN_SCREEN_NAME.
         """
+        from api_client import api
         try:
             if call_backend:
                 try:
@@ -0,0 +1,134 @@
+import threading
+import time
+from collections import deque
+
+from config import FRAME_BUDGET_MS
+
+
+class LatencyStats:
+    """
+    Acumula latencias (en ms) de una operación.
+    Guarda conteo, errores, min/max/promedio y una ventana de muestras
+    recientes para calcular percentiles.
+    """
+
+    def __init__(self, window=500):
+        self._lock = threading.Lock()
+        self._recent = deque(maxlen=window)
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.min_ms = None
+        self.max_ms = 0.0
+        self.last_ms = None
+
+    def record(self, elapsed_ms: float, ok: bool = True):
+        with self._lock:
+            self.count += 1
+            if not ok:
+                self.errors += 1
+            self.total_ms += elapsed_ms
+            self.last_ms = elapsed_ms
+            self.max_ms = max(self.max_ms, elapsed_ms)
+            self.min_ms = elapsed_ms if self.min_ms is None else min(self.min_ms, elapsed_ms)
+            self._recent.append(elapsed_ms)
+
+    def percentile(self, p: float) -> float:
+        with self._lock:
+            samples = sorted(self._recent)
+        if not samples:
+            return 0.0
+        idx = min(len(samples) - 1, int(round(p / 100.0 * (len(samples) - 1))))
+        return samples[idx]
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            count = self.count
+            data = {
+                "count": count,
+                "errors": self.errors,
+                "avg_ms": round(self.total_ms / count, 2) if count else 0.0,
+                "min_ms": round(self.min_ms or 0.0, 2),
+                "max_ms": round(self.max_ms, 2),
+                "last_ms": round(self.last_ms or 0.0, 2),
+            }
+        data["p50_ms"] = round(self.percentile(50), 2)
+        data["p95_ms"] = round(self.percentile(95), 2)
+        data["p99_ms"] = round(self.percentile(99), 2)
+        return data
+
+
+class LatencyRegistry:
+    """Conjunto de LatencyStats indexados por nombre de operación."""
+
+    def __init__(self, window=500):
+        self._window = window
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def get(self, name: str) -> LatencyStats:
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = LatencyStats(self._window)
+            return stats
+
+    def measure(self, name: str, fn, *args, **kwargs):
+        """Ejecuta fn midiendo su latencia bajo `name` (los errores también se registran)."""
+        start = time.perf_counter()
+        ok = False
+        try:
+            result = fn(*args, **kwargs)
+            ok = True
+            return result
+        finally:
+            self.get(name).record((time.perf_counter() - start) * 1000.0, ok)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            items = list(self._stats.items())
+        return {name: stats.snapshot() for name, stats in items}
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+class FrameTimeCounter:
+    """
+    Mide el tiempo entre frames del hilo principal.
+
+    `tick()` se engancha a un callback que corra una vez por frame
+    (p.ej. Clock.schedule_interval(counter.tick, 0)); cada intervalo se
+    registra en ms y los que superan `budget_ms` cuentan como frames lentos.
+    """
+
+    def __init__(self, budget_ms=FRAME_BUDGET_MS, window=600):
+        self.budget_ms = budget_ms
+        self.frames = LatencyStats(window)
+        self.slow_frames = 0
+        self._last = None
+
+    def tick(self, *args):
+        now = time.perf_counter()
+        if self._last is not None:
+            elapsed_ms = (now - self._last) * 1000.0
+            self.frames.record(elapsed_ms)
+            if elapsed_ms > self.budget_ms:
+                self.slow_frames += 1
+        self._last = now
+
+    def pause(self):
+        """El siguiente tick no se compara con el último (evita medir la pantalla oculta)."""
+        self._last = None
+
+    def reset(self):
+        self.frames = LatencyStats(self.frames._recent.maxlen)
+        self.slow_frames = 0
+        self._last = None
+
+    def snapshot(self) -> dict:
+        data = self.frames.snapshot()
+        data["slow_frames"] = self.slow_frames
+        data["fps"] = round(1000.0 / data["avg_ms"], 1) if data["avg_ms"] else 0.0
+        return data
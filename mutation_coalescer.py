@@ -0,0 +1,166 @@
+import threading
+import time
+
+from config import COALESCE_WINDOW_MS
+from offline_queue import offline_queue
+
+
+class _Batch:
+    """Puntos acumulados para una clave (combateId, alumnoId) aún sin enviar."""
+
+    def __init__(self, deadline, on_success, on_error):
+        self.deadline = deadline
+        self.valor = 0
+        self.tokens = []
+        self.clicks = 0
+        self.on_success = on_success
+        self.on_error = on_error
+
+
+class MutationCoalescer:
+    """
+    Agrupa ráfagas de puntos por (combateId, alumnoId).
+
+    Los +1 que llegan dentro de la ventana (`window_ms`) se envían como un
+    único POST /apiPuntajes/puntaje/simple con valorPuntaje sumado. Los
+    lotes se entregan a la cola durable (OfflineQueue), que ejecuta cada
+    clave en un carril serie, de modo que una resta nunca adelanta a los
+    puntos que se marcaron antes que ella:
+
+    - Si hay puntos sin enviar, la resta cancela uno de ellos en local
+      (ninguna petición).
+    - Si no, se envía el lote pendiente y el DELETE .../last queda detrás.
+
+    Los callbacks `on_success(data, tokens)` y `on_error(exc, tokens)` se
+    llaman una vez por petición con los tokens de todas las pulsaciones que
+    cubre; dentro de un lote se conservan los callbacks de la primera. Un
+    lote que se anuló por completo se confirma con `data=None`.
+    """
+
+    def __init__(self, queue=None, window_ms=COALESCE_WINDOW_MS):
+        self.queue = queue or offline_queue
+        self.window = window_ms / 1000.0
+        self._cond = threading.Condition()
+        self._batches = {}
+        self._flusher = None
+        self._round = self._new_round_counters()
+        self.rounds = []
+
+    # ============ API PÚBLICA ============
+
+    def add_puntaje(self, combate_id, alumno_id, valor=1, token=None, on_success=None, on_error=None):
+        key = (combate_id, alumno_id)
+        with self._cond:
+            self._round["mutations"] += 1
+            batch = self._batches.get(key)
+            if batch is None:
+                batch = _Batch(time.monotonic() + self.window, on_success, on_error)
+                self._batches[key] = batch
+            batch.valor += valor
+            batch.clicks += 1
+            batch.tokens.append(token)
+            if self.window <= 0:
+                self._flush_locked(key)
+            else:
+                self._ensure_flusher()
+                self._cond.notify()
+
+    def subtract_puntaje(self, combate_id, alumno_id, token=None, on_success=None, on_error=None):
+        key = (combate_id, alumno_id)
+        with self._cond:
+            self._round["mutations"] += 1
+            batch = self._batches.get(key)
+            if batch is not None and batch.valor > 0:
+                # Cancela un punto que todavía no salió
+                batch.valor -= 1
+                batch.clicks += 1
+                batch.tokens.append(token)
+                self._round["cancelled"] += 1
+                return
+            self._flush_locked(key)
+            self._enqueue_locked(key, "puntaje.delete", {"alumnoId": alumno_id},
+                                 [token], on_success, on_error)
+
+    def flush(self, combate_id=None, alumno_id=None):
+        """Envía ya los lotes pendientes (todos o los de una clave)."""
+        with self._cond:
+            keys = [(combate_id, alumno_id)] if combate_id is not None else list(self._batches)
+            for key in keys:
+                self._flush_locked(key)
+
+    def close_round(self, label):
+        """Cierra los contadores del round actual y los guarda en `rounds`."""
+        with self._cond:
+            counters = dict(self._round)
+            counters["round"] = label
+            counters["saved"] = counters["mutations"] - counters["requests"]
+            self.rounds.append(counters)
+            self._round = self._new_round_counters()
+            return counters
+
+    def stats(self) -> dict:
+        with self._cond:
+            current = dict(self._round)
+            current["saved"] = current["mutations"] - current["requests"]
+            return {
+                "window_ms": int(self.window * 1000),
+                "current_round": current,
+                "rounds": list(self.rounds),
+                "pending_keys": len(self._batches),
+            }
+
+    # ============ INTERNOS ============
+
+    @staticmethod
+    def _new_round_counters():
+        return {"mutations": 0, "requests": 0, "cancelled": 0}
+
+    def _ensure_flusher(self):
+        if self._flusher is None:
+            self._flusher = threading.Thread(target=self._flush_loop, name="coalescer", daemon=True)
+            self._flusher.start()
+
+    def _flush_loop(self):
+        with self._cond:
+            while True:
+                if not self._batches:
+                    self._cond.wait()
+                    continue
+                now = time.monotonic()
+                due = [k for k, b in self._batches.items() if b.deadline <= now]
+                for key in due:
+                    self._flush_locked(key)
+                if self._batches:
+                    wait = min(b.deadline for b in self._batches.values()) - now
+                    self._cond.wait(max(wait, 0.001))
+
+    def _flush_locked(self, key):
+        batch = self._batches.pop(key, None)
+        if batch is None:
+            return
+        combate_id, alumno_id = key
+        if batch.valor <= 0:
+            # Todo el lote se anuló en local: se confirma sin tocar la red
+            if batch.on_success:
+                self.queue.transport.submit(
+                    "coalescer.local", lambda: None,
+                    on_success=lambda data: batch.on_success(data, batch.tokens)
+                )
+            return
+        self._enqueue_locked(
+            key, "puntaje.add",
+            {"combateId": combate_id, "alumnoId": alumno_id, "valorPuntaje": batch.valor},
+            batch.tokens, batch.on_success, batch.on_error
+        )
+
+    def _enqueue_locked(self, key, kind, args, tokens, on_success, on_error):
+        self._round["requests"] += 1
+        combate_id, alumno_id = key
+        self.queue.enqueue(
+            f"{combate_id}:{alumno_id}:puntaje", kind, args,
+            tokens=tokens, on_success=on_success, on_error=on_error
+        )
+
+
+# Instancia global del agrupador
+coalescer = MutationCoalescer()
@@ -0,0 +1,465 @@
+import json
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+
+from config import APP_DATA_DIR, WAL_FSYNC, OFFLINE_RETRY_BASE, OFFLINE_RETRY_MAX
+from scoring_transport import scoring
+from app_logging import get_logger
+
+log = get_logger("offline_queue")
+
+
+# tipo de operación -> (método de ScoringTransport, argumentos en orden)
+_KINDS = {
+    "puntaje.add": ("add_puntaje", ("combateId", "alumnoId", "valorPuntaje")),
+    "puntaje.delete": ("delete_ultimo_puntaje", ("alumnoId",)),
+    "falta.add": ("add_falta", ("combateId", "alumnoId")),
+    "falta.delete": ("delete_ultima_falta", ("alumnoId", "combateId")),
+}
+
+
+# Respuestas de una caída temporal del backend: se reintentan como un error de red
+_RETRY_STATUS = (408, 429)
+
+
+def _transient(exc):
+    """El error puede desaparecer reintentando la misma operación."""
+    if isinstance(exc, ValueError):
+        # JSON inválido en una respuesta 2xx: reintentar no lo arregla
+        return False
+    response = getattr(exc, "response", None)
+    if response is None:
+        return True
+    return response.status_code >= 500 or response.status_code in _RETRY_STATUS
+
+
+# ruta -> WAL cuyo hilo escritor sigue vivo (uno por archivo)
+_writers = {}
+_writers_lock = threading.Lock()
+
+
+class WriteAheadLog:
+    """
+    Registro append-only en disco, un objeto JSON por línea:
+
+        {"op": "put", "key": ..., "lane": ..., "kind": ..., "args": {...}}
+        {"op": "ack", "key": ...}
+        {"op": "local", "kind": "round_end", "args": {...}}
+
+    Una operación está pendiente mientras no tenga su "ack". Una última
+    línea truncada (corte de luz a mitad de escritura) se ignora.
+
+    Quien registra (el hilo de Kivy o los hilos de la cola) solo agrega la
+    línea a un búfer; un hilo escritor por WAL la escribe. Las líneas que
+    llegan mientras se hace un fsync van juntas en la siguiente escritura
+    con un solo fsync (group commit): un clic nunca espera al disco.
+    `flush()` espera a que todo lo registrado esté en disco.
+    """
+
+    def __init__(self, path, fsync=WAL_FSYNC):
+        self.path = path
+        self.fsync = fsync
+        self._cond = threading.Condition()
+        self._fh = None
+        self._buffer = []
+        self._thread = None
+        self._closing = False
+        self._remove = False
+        self._queued = 0
+        self._synced = 0
+        # Métricas
+        self.batches = 0
+
+    def load(self):
+        """Devuelve (operaciones_pendientes, eventos_locales) en orden de escritura."""
+        pending = OrderedDict()
+        local = []
+        if not os.path.exists(self.path):
+            return [], []
+        with open(self.path, "r", encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                op = record.get("op")
+                if op == "put":
+                    pending[record["key"]] = record
+                elif op == "ack":
+                    pending.pop(record.get("key"), None)
+                elif op == "local":
+                    local.append(record)
+        return list(pending.values()), local
+
+    def open(self):
+        """Carga el registro, lo compacta (solo pendientes y locales) y lo deja listo para escribir."""
+        with _writers_lock:
+            previous = _writers.get(self.path)
+        if previous is not None and previous is not self:
+            # Un WAL anterior del mismo archivo aún escribe (o borra) al cerrarse
+            previous.wait_closed()
+        pending, local = self.load()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            for record in local + pending:
+                fh.write(json.dumps(record, separators=(",", ":")) + "\n")
+        os.replace(tmp_path, self.path)
+        self._fh = open(self.path, "a", encoding="utf-8")
+        self._thread = threading.Thread(target=self._writer, name="wal-writer", daemon=True)
+        with _writers_lock:
+            _writers[self.path] = self
+        self._thread.start()
+        return pending, local
+
+    def append(self, record):
+        self._write(dict(record, op="put"))
+
+    def ack(self, key):
+        self._write({"op": "ack", "key": key})
+
+    def record_local(self, kind, args):
+        self._write({"op": "local", "kind": kind, "args": args, "ts": time.time()})
+
+    def flush(self, timeout=None) -> bool:
+        """Espera a que lo registrado hasta ahora esté en disco; False si se agotó `timeout`."""
+        with self._cond:
+            target = self._queued
+            return self._cond.wait_for(lambda: self._synced >= target or self._thread is None, timeout)
+
+    def wait_closed(self, timeout=None) -> bool:
+        with self._cond:
+            return self._cond.wait_for(lambda: self._thread is None, timeout)
+
+    def close(self, remove=False):
+        """Escribe lo pendiente y cierra (el hilo escritor lo hace; no se espera al disco)."""
+        with self._cond:
+            if self._thread is None:
+                if remove and os.path.exists(self.path):
+                    os.remove(self.path)
+                return
+            self._closing = True
+            self._remove = self._remove or remove
+            self._cond.notify_all()
+
+    # ============ INTERNOS ============
+
+    def _write(self, record):
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self._cond:
+            if self._thread is None or self._closing:
+                return
+            self._buffer.append(line)
+            self._queued += 1
+            self._cond.notify_all()
+
+    def _writer(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._buffer or self._closing)
+                lines, self._buffer = self._buffer, []
+                closing = self._closing and not lines
+            if closing:
+                break
+            try:
+                self._fh.write("".join(lines))
+                self._fh.flush()
+                if self.fsync:
+                    os.fsync(self._fh.fileno())
+            except OSError as e:
+                log.error("wal.escritura_fallida", archivo=self.path, lineas=len(lines), error=e)
+            with self._cond:
+                self._synced += len(lines)
+                self.batches += 1
+                self._cond.notify_all()
+        self._fh.close()
+        self._fh = None
+        if self._remove and os.path.exists(self.path):
+            os.remove(self.path)
+        with _writers_lock:
+            if _writers.get(self.path) is self:
+                del _writers[self.path]
+        with self._cond:
+            self._thread = None
+            self._cond.notify_all()
+
+
+class _Op:
+    __slots__ = ("key", "lane", "kind", "args", "tokens", "on_success", "on_error",
+                 "attempts", "replay", "wal")
+
+    def __init__(self, key, lane, kind, args, tokens=None, on_success=None, on_error=None,
+                 replay=False, wal=None):
+        self.key = key
+        self.lane = lane
+        self.kind = kind
+        self.args = args
+        self.tokens = tokens or []
+        self.on_success = on_success
+        self.on_error = on_error
+        self.attempts = 0
+        self.replay = replay
+        self.wal = wal
+
+
+class OfflineQueue:
+    """
+    Cola durable de mutaciones del tablero central.
+
+    Cada operación se escribe en el WAL del combate antes de enviarse, con
+    una clave de idempotencia (cabecera Idempotency-Key) que se reutiliza en
+    los reintentos. Las operaciones se agrupan en carriles (uno por
+    alumno y tipo) que se ejecutan en serie y en orden:
+
+    - Error de conexión, timeout o respuesta de caída temporal (5xx, 408,
+      429): la operación se queda al frente de su carril y se reintenta con
+      backoff; cuando una petición vuelve a salir bien se desbloquean todos
+      los carriles. La clave de idempotencia hace seguro el reintento.
+    - Cualquier otro error (4xx, respuesta 2xx con JSON inválido): la
+      operación se descarta y se llama a `on_error(exc, tokens)`.
+
+    Los callbacks solo viven en memoria: lo que se recupera del WAL tras un
+    cierre inesperado se reenvía sin ellos y, cuando la cola termina de
+    vaciarse, se invoca `on_drained()` para que la pantalla se resincronice.
+    `last_replay_ms` mide desde `open()` hasta ese momento (un combate
+    completo de 3 rounds debe tardar menos de 1 s: benchmarks/wal_replay.py).
+    """
+
+    def __init__(self, transport=None, data_dir=APP_DATA_DIR):
+        self.transport = transport or scoring
+        self.data_dir = data_dir
+        self.on_drained = None
+        self.online = True
+        self._cond = threading.Condition()
+        self._lanes = {}
+        self._busy = {}            # carril -> operación en vuelo
+        self._blocked = {}
+        self._wal = None
+        self._combate_id = None
+        self._remove_when_drained = set()
+        self._close_when_drained = set()
+        self._retry_thread = None
+        self._needs_resync = False
+        self._completions = deque(maxlen=500)
+        self.sent = 0
+        self.failed = 0
+        self.replayed = 0
+        self.last_recovery_ms = 0.0
+        self.last_replay_ms = 0.0
+        self._replay_start = None
+
+    # ============ WAL ============
+
+    def wal_path(self, combate_id):
+        return os.path.join(self.data_dir, "wal", f"combate_{combate_id}.log")
+
+    def open(self, combate_id):
+        """
+        Abre (o recupera) el WAL del combate y reencola lo pendiente.
+        Retorna los eventos locales registrados (p.ej. cierres de round).
+        """
+        start = time.perf_counter()
+        with self._cond:
+            if self._combate_id == combate_id and self._wal is not None:
+                self._wal.flush()
+                return self._wal.load()[1]
+            previous = self._wal
+            closing = next((w for w in self._close_when_drained if w.path == self.wal_path(combate_id)), None)
+            if closing is not None:
+                # Se volvió a un combate cuyas operaciones siguen en memoria: mismo WAL
+                self._close_when_drained.discard(closing)
+                if previous is not None:
+                    self._close_when_drained.add(previous)
+                    self._maybe_cleanup_locked()
+                self._wal = closing
+                self._combate_id = combate_id
+                closing.flush()
+                return closing.load()[1]
+            wal = WriteAheadLog(self.wal_path(combate_id))
+            pending, local = wal.open()
+            self._wal = wal
+            self._combate_id = combate_id
+            if previous is not None:
+                # Sus operaciones en cola o en vuelo aún deben escribir el "ack"
+                self._close_when_drained.add(previous)
+                self._maybe_cleanup_locked()
+            for record in pending:
+                op = _Op(record["key"], record["lane"], record["kind"], record["args"],
+                         replay=True, wal=wal)
+                self._enqueue_locked(op)
+        self.last_recovery_ms = (time.perf_counter() - start) * 1000.0
+        if pending:
+            # El reenvío termina cuando la cola se vacía (on_drained)
+            self._replay_start = start
+            log.info("wal.recuperado", combate_id=combate_id, pendientes=len(pending),
+                     ms=round(self.last_recovery_ms, 1))
+        return local
+
+    def finish(self, combate_id):
+        """El combate terminó: borra su WAL en cuanto no queden operaciones pendientes."""
+        with self._cond:
+            if self._combate_id != combate_id or self._wal is None:
+                return
+            self._remove_when_drained.add(self._wal)
+            self._maybe_cleanup_locked()
+
+    def record_local(self, kind, args):
+        """Registra un evento local (sin red) para reconstruir el estado tras un cierre."""
+        with self._cond:
+            if self._wal is not None:
+                self._wal.record_local(kind, args)
+
+    # ============ ENCOLADO ============
+
+    def enqueue(self, lane, kind, args, tokens=None, on_success=None, on_error=None):
+        if kind not in _KINDS:
+            raise ValueError(f"Tipo de operación desconocido: {kind}")
+        with self._cond:
+            op = _Op(uuid.uuid4().hex, lane, kind, args, tokens, on_success, on_error, wal=self._wal)
+            if op.wal is not None:
+                op.wal.append({"key": op.key, "lane": lane, "kind": kind, "args": args,
+                               "ts": time.time()})
+            self._enqueue_locked(op)
+            return op.key
+
+    def depth(self):
+        with self._cond:
+            return sum(len(lane) for lane in self._lanes.values()) + len(self._busy)
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        with self._cond:
+            recent = [t for t in self._completions if now - t <= 5.0]
+            return {
+                "depth": sum(len(lane) for lane in self._lanes.values()) + len(self._busy),
+                "online": self.online,
+                "blocked_lanes": len(self._blocked),
+                "sent": self.sent,
+                "failed": self.failed,
+                "replayed": self.replayed,
+                "throughput_ops_s": round(len(recent) / 5.0, 1),
+                "last_recovery_ms": round(self.last_recovery_ms, 2),
+                "last_replay_ms": round(self.last_replay_ms, 2),
+                "wal_batches": self._wal.batches if self._wal is not None else 0,
+            }
+
+    # ============ INTERNOS ============
+
+    def _ops_for(self, wal):
+        """Hay operaciones de `wal` en cola o en vuelo."""
+        return (any(op.wal is wal for op in self._busy.values())
+                or any(op.wal is wal for lane in self._lanes.values() for op in lane))
+
+    def _enqueue_locked(self, op):
+        self._lanes.setdefault(op.lane, deque()).append(op)
+        if op.lane not in self._busy and op.lane not in self._blocked:
+            self._start_next_locked(op.lane)
+
+    def _start_next_locked(self, lane):
+        queue = self._lanes.get(lane)
+        if not queue:
+            self._busy.pop(lane, None)
+            self._lanes.pop(lane, None)
+            self._maybe_cleanup_locked()
+            return
+        op = queue.popleft()
+        self._busy[lane] = op
+        op.attempts += 1
+        method, names = _KINDS[op.kind]
+        args = [op.args[name] for name in names]
+        getattr(self.transport, method)(
+            *args,
+            idempotency_key=op.key,
+            on_success=lambda data: self._on_done(op, data, None),
+            on_error=lambda exc: self._on_done(op, None, exc)
+        )
+
+    def _on_done(self, op, data, exc):
+        transient = exc is not None and _transient(exc)
+        with self._cond:
+            self._busy.pop(op.lane, None)
+            if transient:
+                # Sin conexión o backend caído: la operación vuelve al frente de su carril
+                self.online = False
+                op.replay = True
+                self._lanes.setdefault(op.lane, deque()).appendleft(op)
+                delay = min(OFFLINE_RETRY_MAX, OFFLINE_RETRY_BASE * (2 ** min(op.attempts - 1, 6)))
+                self._blocked[op.lane] = time.monotonic() + delay
+                self._ensure_retry_thread()
+                self._cond.notify_all()
+                return
+            if op.wal is not None:
+                op.wal.ack(op.key)
+                self._maybe_cleanup_locked()
+            self._completions.append(time.monotonic())
+            if exc is None:
+                self.sent += 1
+                if op.replay:
+                    self.replayed += 1
+                if not self.online:
+                    # Volvió la conexión: reintentar ya los demás carriles
+                    self.online = True
+                    for lane in list(self._blocked):
+                        self._blocked[lane] = 0
+                    self._cond.notify_all()
+            else:
+                self.failed += 1
+            if op.replay and op.on_success is None and op.on_error is None:
+                self._needs_resync = True
+            self._start_next_locked(op.lane)
+            drained = self._needs_resync and not self._lanes and not self._busy
+            if drained:
+                self._needs_resync = False
+                if self._replay_start is not None:
+                    self.last_replay_ms = (time.perf_counter() - self._replay_start) * 1000.0
+                    self._replay_start = None
+                    log.info("wal.reenviado", ms=round(self.last_replay_ms, 1), enviadas=self.replayed)
+        try:
+            if exc is None and op.on_success:
+                op.on_success(data, op.tokens)
+            elif exc is not None and op.on_error:
+                op.on_error(exc, op.tokens)
+        finally:
+            if drained and self.on_drained:
+                self.on_drained()
+
+    def _maybe_cleanup_locked(self):
+        """Cierra los WAL (y borra los de combates terminados) que ya no tienen operaciones."""
+        for wal in list(self._remove_when_drained | self._close_when_drained):
+            if self._ops_for(wal):
+                continue
+            remove = wal in self._remove_when_drained
+            wal.close(remove=remove)
+            self._remove_when_drained.discard(wal)
+            self._close_when_drained.discard(wal)
+            if wal is self._wal:
+                self._wal = None
+                self._combate_id = None
+
+    def _ensure_retry_thread(self):
+        if self._retry_thread is None:
+            self._retry_thread = threading.Thread(target=self._retry_loop, name="offline-retry", daemon=True)
+            self._retry_thread.start()
+
+    def _retry_loop(self):
+        with self._cond:
+            while True:
+                if not self._blocked:
+                    self._cond.wait()
+                    continue
+                now = time.monotonic()
+                for lane, deadline in list(self._blocked.items()):
+                    if deadline <= now:
+                        del self._blocked[lane]
+                        if lane not in self._busy:
+                            self._start_next_locked(lane)
+                if self._blocked:
+                    wait = min(self._blocked.values()) - now
+                    self._cond.wait(max(wait, 0.01))
+
+
+# Instancia global de la cola durable
+offline_queue = OfflineQueue()
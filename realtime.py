@@ -0,0 +1,262 @@
+import json
+import random
+import threading
+import time
+
+from config import (WEBSOCKET_BASE_URL, REALTIME_BACKOFF_BASE, REALTIME_BACKOFF_MAX,
+                    REALTIME_PING_INTERVAL, REALTIME_PING_TIMEOUT)
+from metrics import LatencyStats
+from app_logging import get_logger
+
+log = get_logger("realtime")
+
+try:
+    import websocket
+    WEBSOCKET_AVAILABLE = True
+except ImportError:
+    websocket = None
+    WEBSOCKET_AVAILABLE = False
+    log.warning("websocket-client no instalado: sin actualizaciones en tiempo real",
+                solucion="pip install websocket-client")
+
+
+class RealtimeConnection:
+    """
+    Conexión WebSocket de larga duración compartida por los tableros.
+
+    Un único hilo por conexión se encarga de conectar, leer y reconectar:
+
+    - Reconexión con backoff exponencial y jitter completo
+      (REALTIME_BACKOFF_BASE..REALTIME_BACKOFF_MAX).
+    - Ping/pong del protocolo cada REALTIME_PING_INTERVAL; si el pong no
+      llega en REALTIME_PING_TIMEOUT la conexión se da por muerta.
+    - Reanudación: cada evento trae `seq`; al reconectar se envía
+      `?lastSeq=N` y, si el servidor confirma `{"status": "connected",
+      "resumed": true}`, no hace falta rehidratar por REST. En cualquier
+      otro caso (primera conexión, servidor sin soporte, hueco en la
+      secuencia) se llama a `on_resync()`.
+
+    Callbacks (se ejecutan en el hilo de la conexión):
+        on_event(data)   evento del stream (ya sin duplicados)
+        on_resync()      hay que recargar el estado completo
+        on_state(state)  "connecting" | "connected" | "disconnected" | "stopped"
+    """
+
+    def __init__(self, name, on_event=None, on_resync=None, on_state=None,
+                 base_url=WEBSOCKET_BASE_URL):
+        self.name = name
+        self.base_url = base_url.rstrip("/")
+        self.on_event = on_event
+        self.on_resync = on_resync
+        self.on_state = on_state
+        self.state = "stopped"
+        self._cond = threading.Condition()
+        self._path = None
+        self._generation = 0
+        self._app = None
+        self._worker = None
+        self._attempt = 0
+        # Métricas
+        self.last_seq = None
+        self.reconnects = 0
+        self.messages = 0
+        self.duplicates = 0
+        self.gaps = 0
+        self.dead_peers = 0
+        self.lag = LatencyStats()
+        self.last_pong = None
+        self._connected_at = None
+        self._uptime = 0.0
+        self._opened_for_path = False
+
+    # ============ API PÚBLICA ============
+
+    def start(self, path):
+        """Conecta (o cambia) al stream `path`, p.ej. /ws/tablero/12."""
+        if not WEBSOCKET_AVAILABLE:
+            return False
+        with self._cond:
+            if path != self._path:
+                self.last_seq = None
+                self._opened_for_path = False
+            self._path = path
+            self._generation += 1
+            self._attempt = 0
+            app = self._app
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name=f"realtime-{self.name}", daemon=True)
+                self._worker.start()
+            self._cond.notify_all()
+        if app is not None:
+            app.close()
+        return True
+
+    def stop(self):
+        """Cierra la conexión; el hilo queda en espera para un próximo start()."""
+        with self._cond:
+            self._path = None
+            self._generation += 1
+            app = self._app
+            self._cond.notify_all()
+        if app is not None:
+            app.close()
+
+    def send(self, data) -> bool:
+        """Envía un mensaje JSON por la conexión abierta; False si no hay conexión."""
+        with self._cond:
+            app = self._app if self.state == "connected" else None
+        if app is None:
+            return False
+        try:
+            app.send(json.dumps(data))
+            return True
+        except Exception as e:
+            log.warning("envio_fallido", conexion=self.name, error=e)
+            return False
+
+    @property
+    def connected(self):
+        return self.state == "connected"
+
+    def stats(self) -> dict:
+        with self._cond:
+            now = time.monotonic()
+            session = now - self._connected_at if self._connected_at is not None else 0.0
+            return {
+                "state": self.state,
+                "uptime_s": round(session, 1),
+                "total_uptime_s": round(self._uptime + session, 1),
+                "reconnects": self.reconnects,
+                "messages": self.messages,
+                "duplicates": self.duplicates,
+                "gaps": self.gaps,
+                "dead_peers": self.dead_peers,
+                "last_seq": self.last_seq,
+                "last_pong_age_s": round(now - self.last_pong, 1) if self.last_pong else None,
+                "lag": self.lag.snapshot(),
+            }
+
+    # ============ INTERNOS ============
+
+    def _url(self, path):
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        if self.last_seq is not None:
+            url += f"?lastSeq={self.last_seq}"
+        return url
+
+    def _set_state(self, state):
+        if state == self.state:
+            return
+        self.state = state
+        log.info("estado", conexion=self.name, estado=state)
+        if self.on_state:
+            self.on_state(state)
+
+    def _backoff(self):
+        # Jitter completo: evita que 20 tableros reconecten en el mismo instante
+        ceiling = min(REALTIME_BACKOFF_MAX, REALTIME_BACKOFF_BASE * (2 ** min(self._attempt, 10)))
+        self._attempt += 1
+        return random.uniform(0, ceiling)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._path is None:
+                    self._cond.wait()
+                generation = self._generation
+                app = websocket.WebSocketApp(
+                    self._url(self._path),
+                    on_open=self._on_open,
+                    on_message=self._on_message,
+                    on_error=self._on_error,
+                    on_pong=self._on_pong,
+                )
+                self._app = app
+            self._set_state("connecting")
+            try:
+                app.run_forever(ping_interval=REALTIME_PING_INTERVAL, ping_timeout=REALTIME_PING_TIMEOUT)
+            except Exception as e:
+                log.error("error", conexion=self.name, error=e)
+            with self._cond:
+                self._app = None
+                if self._connected_at is not None:
+                    self._uptime += time.monotonic() - self._connected_at
+                    self._connected_at = None
+                if generation != self._generation:
+                    # start() con otro stream o stop(): sin espera
+                    if self._path is None:
+                        state = "stopped"
+                    else:
+                        continue
+                else:
+                    state = "disconnected"
+            self._set_state(state)
+            if state == "stopped":
+                continue
+            with self._cond:
+                delay = self._backoff()
+                deadline = time.monotonic() + delay
+                log.info("reintento", conexion=self.name, delay_s=round(delay, 1))
+                while generation == self._generation:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+    def _on_open(self, ws):
+        with self._cond:
+            if ws is not self._app:
+                return
+            self._attempt = 0
+            self._connected_at = time.monotonic()
+            self.last_pong = time.monotonic()
+            if self._opened_for_path:
+                self.reconnects += 1
+            self._opened_for_path = True
+        self._set_state("connected")
+
+    def _on_pong(self, ws, data):
+        self.last_pong = time.monotonic()
+
+    def _on_error(self, ws, error):
+        if websocket is not None and isinstance(error, websocket.WebSocketTimeoutException):
+            self.dead_peers += 1
+            log.warning("sin_pong", conexion=self.name)
+        else:
+            log.error("error", conexion=self.name, error=error)
+
+    def _on_message(self, ws, message):
+        try:
+            data = json.loads(message)
+        except ValueError:
+            return
+        if not isinstance(data, dict):
+            return
+
+        if data.get("status") == "connected":
+            with self._cond:
+                resumed = bool(data.get("resumed")) and self.last_seq is not None
+            if not resumed and self.on_resync:
+                self.on_resync()
+            return
+
+        resync = False
+        seq = data.get("seq")
+        with self._cond:
+            self.messages += 1
+            if isinstance(seq, int):
+                if self.last_seq is not None and seq <= self.last_seq:
+                    self.duplicates += 1
+                    return
+                if self.last_seq is not None and seq > self.last_seq + 1:
+                    self.gaps += 1
+                    resync = True
+                self.last_seq = seq
+        ts = data.get("ts")
+        if isinstance(ts, (int, float)):
+            # ts del servidor en milisegundos epoch
+            self.lag.record(max(0.0, time.time() * 1000.0 - ts))
+        if self.on_event:
+            self.on_event(data)
+        if resync and self.on_resync:
+            self.on_resync()
@@ -0,0 +1,92 @@
+import threading
+import time
+from collections import OrderedDict
+
+from kivy.clock import Clock
+
+from metrics import LatencyStats
+from app_logging import get_logger
+
+log = get_logger("realtime_dispatcher")
+
+
+def _por_atleta(data):
+    return data.get("event"), data.get("alumnoId")
+
+
+class FrameDispatcher:
+    """
+    Entrega eventos de tiempo real al hilo principal una vez por frame.
+
+    `push(data)` se llama desde el hilo del socket: el evento se guarda bajo
+    su clave (por defecto (event, alumnoId)) y, si ya había uno pendiente
+    con la misma clave, lo reemplaza, porque solo importa el último estado
+    de cada atleta. Un único callback por frame (Clock.create_trigger)
+    aplica el lote con `apply(data)`.
+
+    Métricas: eventos recibidos, colapsados, aplicados, frames con lote y
+    retraso desde la recepción hasta aplicarse.
+    """
+
+    def __init__(self, name, apply, key=_por_atleta):
+        self.name = name
+        self.apply = apply
+        self.key = key
+        self._lock = threading.Lock()
+        self._pending = OrderedDict()
+        self._trigger = Clock.create_trigger(self._flush, 0)
+        self.received = 0
+        self.collapsed = 0
+        self.applied = 0
+        self.frames = 0
+        self.max_batch = 0
+        self.delay = LatencyStats()
+
+    def push(self, data):
+        key = self.key(data)
+        with self._lock:
+            self.received += 1
+            previous = self._pending.pop(key, None)
+            if previous is not None:
+                # Se conserva la hora del primero para medir el retraso real
+                self.collapsed += 1
+                received_at = previous[1]
+            else:
+                received_at = time.perf_counter()
+            self._pending[key] = (data, received_at)
+        self._trigger()
+
+    def clear(self):
+        """Descarta lo pendiente (p.ej. al cambiar de combate)."""
+        with self._lock:
+            self._pending.clear()
+
+    def _flush(self, *args):
+        with self._lock:
+            batch = list(self._pending.values())
+            self._pending.clear()
+        if not batch:
+            return
+        self.frames += 1
+        self.max_batch = max(self.max_batch, len(batch))
+        now = time.perf_counter()
+        for data, received_at in batch:
+            try:
+                self.apply(data)
+                self.applied += 1
+            except Exception as e:
+                log.error("evento.error", dispatcher=self.name, error=e)
+            self.delay.record((now - received_at) * 1000.0)
+
+    def stats(self) -> dict:
+        with self._lock:
+            pending = len(self._pending)
+        return {
+            "received": self.received,
+            "collapsed": self.collapsed,
+            "applied": self.applied,
+            "frames": self.frames,
+            "max_batch": self.max_batch,
+            "pending": pending,
+            "delay": self.delay.snapshot(),
+        }
@@ -3,7 +3,6 @@ from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.uix.textinput import TextInput
 from kivy.uix.button import Button
-from kivy.uix.image import Image
 from kivy.graphics import Color, RoundedRectangle, Rectangle
 from kivy.core.window import Window
 from kivy.clock import Clock
@@ -14,14 +13,18 @@ from kivy.uix.widget import Widget
 from kivy.uix.scrollview import ScrollView
 from kivy.utils import platform
 import requests, json
-from threading import Thread
-
-API_BASE_URL = "http://localhost:8080"
+from task_executor import tasks, PRIORITY_HIGH
+from stall_detector import GuardedAdapter
+from responsive import responsive
+from assets import assets
+from config import API_BASE_URL
 
 class ApiClient:
     def __init__(self, base_url):
         self.base_url = base_url.strip("/")
         self.session = requests.Session()
+        self.session.mount("http://", GuardedAdapter())
+        self.session.mount("https://", GuardedAdapter())
 
     def post_json(self, path, payload):
         url = f"{self.base_url}{path}"
@@ -131,17 +134,13 @@ class RoundedTextInput(TextInput):
             )
 
         self.bind(pos=self._update_rects, size=self._update_rects)
-        Window.bind(on_resize=self.on_window_resize)
+        responsive.track(self, font_size=lambda: ResponsiveHelper.get_font_size(18))
 
     def _update_rects(self, *args):
         self.bg_rect.pos = self.pos
         self.bg_rect.size = self.size
         self.border_rect.pos = (self.pos[0]+dp(2), self.pos[1]+dp(2))
         self.border_rect.size = (self.size[0]-dp(4), self.size[1]-dp(4))
-    
-    def on_window_resize(self, instance, width, height):
-        self.font_size = ResponsiveHelper.get_font_size(18)
-        self.height = dp(55)
 
     def on_focus(self, instance, value):
         if value:
@@ -207,15 +206,11 @@ class HoverButton(Button):
             )
         
         self.bind(pos=self.update_rect, size=self.update_rect)
-        Window.bind(on_resize=self.on_window_resize)
+        responsive.track(self, font_size=lambda: ResponsiveHelper.get_font_size(18))
 
     def update_rect(self, *args):
         self.rect.pos = self.pos
         self.rect.size = self.size
-    
-    def on_window_resize(self, instance, width, height):
-        self.font_size = ResponsiveHelper.get_font_size(18)
-        self.height = dp(50)
 
 
 # ------------------ PANTALLA REGISTRO RESPONSIVE ------------------
@@ -224,7 +219,6 @@ class RegistroScreen(Screen):
         super().__init__(**kwargs)
         self.loading_popup = None
         self.build_ui()
-        Window.bind(on_resize=self.on_window_resize)
 
     def build_ui(self):
         self.clear_widgets()
@@ -245,14 +239,20 @@ class RegistroScreen(Screen):
         # Logo responsive centrado
         logo_height = ResponsiveHelper.get_logo_height()
         logo_container = BoxLayout(size_hint=(1, None), height=logo_height)
-        logo = Image(
-            source="Imagen5-Photoroom.png",
+        logo = assets.image(
+            "Imagen5-Photoroom.png",
             size_hint=(None, None),
             width=logo_height * 1.2,
             height=logo_height,
             pos_hint={'center_x': 0.5},
             fit_mode="contain"
         )
+        responsive.track(logo_container, height=ResponsiveHelper.get_logo_height)
+        responsive.track(
+            logo,
+            width=lambda: ResponsiveHelper.get_logo_height() * 1.2,
+            height=ResponsiveHelper.get_logo_height
+        )
         logo_container.add_widget(Widget())
         logo_container.add_widget(logo)
         logo_container.add_widget(Widget())
@@ -282,6 +282,7 @@ class RegistroScreen(Screen):
             pos_hint={'center_x': 0.5}
         )
         form_container.bind(minimum_height=form_container.setter('height'))
+        responsive.track(form_container, size_hint_x=ResponsiveHelper.get_form_width)
 
         # Título centrado
         titulo = Label(
@@ -294,6 +295,7 @@ class RegistroScreen(Screen):
             halign='center',
             valign='middle'
         )
+        responsive.track(titulo, font_size=lambda: ResponsiveHelper.get_font_size(32))
         form_container.add_widget(titulo)
 
         # Espaciador
@@ -319,6 +321,7 @@ class RegistroScreen(Screen):
                 halign='center',
                 valign='middle'
             )
+            responsive.track(label, font_size=lambda: ResponsiveHelper.get_font_size(18))
             campo_layout.add_widget(label)
 
             input_field = RoundedTextInput(
@@ -361,6 +364,11 @@ class RegistroScreen(Screen):
             size_hint_x=1,
             height=ResponsiveHelper.get_button_layout_height()
         )
+        responsive.track(
+            botones_layout,
+            orientation=ResponsiveHelper.get_button_layout_orientation,
+            height=ResponsiveHelper.get_button_layout_height
+        )
 
         # Botón Registrar
         btn_registrar = HoverButton(
@@ -403,9 +411,6 @@ class RegistroScreen(Screen):
         self.background_rect.size = instance.size
         self.background_rect.pos = instance.pos
 
-    def on_window_resize(self, instance, width, height):
-        Clock.schedule_once(lambda dt: self.build_ui(), 0.1)
-
     def on_enter(self, *args):
         Clock.schedule_once(self.establecer_foco, 0.1)
 
@@ -643,56 +648,51 @@ class RegistroScreen(Screen):
         }
 
         def _task():
-            try:
-                resp = api.post_json("/apiAdministradores/administrador", payload)
-                if resp.status_code in (200, 201):
-                    # Éxito
-                    def _ok(dt):
-                        self.hide_loading()
-                        self.manager.current = 'main'
-                        self.mostrar_mensaje(
-                            "¡Registro exitoso!",
-                            f"Bienvenido {self.nombre_input.text} {self.apellidos_input.text}"
-                        )
-                        # Limpiar campos
-                        for campo in [self.nombre_input, self.apellidos_input, self.usuario_input,
-                                    self.correo_input, self.contraseña_input, self.confirmar_contraseña_input]:
-                            campo.text = ""
-                        # (Opcional) Navegar a login si lo deseas
-                        # self.manager.current = 'login'
-                    Clock.schedule_once(_ok, 0)
-                else:
-                    try:
-                        msg = resp.json().get("message", f"Error {resp.status_code}")
-                    except Exception:
-                        msg = f"Error {resp.status_code}"
-                    def _err(dt):
-                        self.hide_loading()
-                        self.mostrar_mensaje("Error", msg)
-                    Clock.schedule_once(_err, 0)
-
-            except requests.exceptions.ConnectionError:
-                def _net(dt):
-                    self.hide_loading()
-                    self.mostrar_mensaje("Error", "No se pudo conectar con el servidor.")
-                Clock.schedule_once(_net, 0)
-            except requests.exceptions.Timeout:
-                def _to(dt):
-                    self.hide_loading()
-                    self.mostrar_mensaje("Error", "Tiempo de espera agotado.")
-                Clock.schedule_once(_to, 0)
-            except Exception as e:
-                def _ex(dt):
-                    self.hide_loading()
-                    self.mostrar_mensaje("Error", f"Ocurrió un error: {str(e)}")
-                Clock.schedule_once(_ex, 0)
+            resp = api.post_json("/apiAdministradores/administrador", payload)
+            if resp.status_code not in (200, 201):
+                try:
+                    msg = resp.json().get("message", f"Error {resp.status_code}")
+                except Exception:
+                    msg = f"Error {resp.status_code}"
+                raise RuntimeError(msg)
+
+        def _ok(result):
+            # Éxito
+            self.hide_loading()
+            self.manager.current = 'main'
+            self.mostrar_mensaje(
+                "¡Registro exitoso!",
+                f"Bienvenido {self.nombre_input.text} {self.apellidos_input.text}"
+            )
+            # Limpiar campos
+            for campo in [self.nombre_input, self.apellidos_input, self.usuario_input,
+                        self.correo_input, self.contraseña_input, self.confirmar_contraseña_input]:
+                campo.text = ""
+            # (Opcional) Navegar a login si lo deseas
+            # self.manager.current = 'login'
+
+        def _err(e):
+            self.hide_loading()
+            if isinstance(e, RuntimeError):
+                self.mostrar_mensaje("Error", str(e))
+            elif isinstance(e, requests.exceptions.ConnectionError):
+                self.mostrar_mensaje("Error", "No se pudo conectar con el servidor.")
+            elif isinstance(e, requests.exceptions.Timeout):
+                self.mostrar_mensaje("Error", "Tiempo de espera agotado.")
+            else:
+                self.mostrar_mensaje("Error", f"Ocurrió un error: {str(e)}")
 
         self.show_loading("Creando cuenta...")
-        Thread(target=_task, daemon=True).start()
+        tasks.submit(_task, owner=self, priority=PRIORITY_HIGH, essential=True, name="admin.create",
+                     on_success=_ok, on_error=_err)
 
     def volver(self, instance):
         self.manager.current = 'main'
 
+    def on_pre_leave(self, *args):
+        tasks.cancel_owner(self)
+        self.hide_loading()
+
 
 # ------------------ APP DE PRUEBA ------------------
 class RegistroApp(App):
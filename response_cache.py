@@ -0,0 +1,164 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from config import RESPONSE_CACHE_MAX_ENTRIES, RESPONSE_CACHE_TTLS, RESPONSE_CACHE_DEFAULT_TTL
+
+
+class CacheEntry:
+    """
+    Respuesta guardada de un GET: cuerpo crudo y validadores HTTP.
+
+    Se guarda el cuerpo y no el JSON ya parseado para que cada llamador
+    reciba su propia copia (las pantallas modifican los dicts que reciben).
+    """
+
+    __slots__ = ("body", "etag", "last_modified", "stored_at", "ttl")
+
+    def __init__(self, body, etag, last_modified, ttl, now):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.ttl = ttl
+        self.stored_at = now
+
+    def fresh(self, now):
+        return now - self.stored_at < self.ttl
+
+    def decode(self, empty):
+        return json.loads(self.body) if self.body else empty
+
+    def validators(self) -> dict:
+        """Cabeceras para una petición condicional (304 si no cambió)."""
+        h = {}
+        if self.etag:
+            h["If-None-Match"] = self.etag
+        if self.last_modified:
+            h["If-Modified-Since"] = self.last_modified
+        return h
+
+
+class ResponseCache:
+    """
+    Caché LRU de respuestas GET del ApiClient, indexada por ruta.
+
+    - Cada ruta tiene una frescura (TTL) según su prefijo en
+      RESPONSE_CACHE_TTLS; mientras está fresca se sirve sin red.
+    - Al vencer se conserva: sirve como dato "stale" para pintar al
+      instante y aporta ETag/Last-Modified para revalidar con una
+      petición condicional.
+    - `invalidate(prefijo)` borra las entradas afectadas por una escritura
+      y avanza `generation`, de modo que una respuesta que salió antes de
+      la escritura no vuelva a guardar el dato viejo (`put(..., since=)`).
+    - Como máximo `max_entries` entradas; se descarta la menos usada.
+    """
+
+    def __init__(self, max_entries=RESPONSE_CACHE_MAX_ENTRIES, ttls=RESPONSE_CACHE_TTLS,
+                 default_ttl=RESPONSE_CACHE_DEFAULT_TTL, time_source=time.monotonic):
+        self.max_entries = max_entries
+        # Prefijo más largo primero para que gane la regla más específica
+        self.ttls = sorted(ttls.items(), key=lambda item: len(item[0]), reverse=True)
+        self.default_ttl = default_ttl
+        self._now = time_source
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self.generation = 0
+        # Métricas
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.revalidations = 0
+        self.updates = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    def ttl_for(self, key) -> float:
+        for prefix, ttl in self.ttls:
+            if key.startswith(prefix):
+                return ttl
+        return self.default_ttl
+
+    def lookup(self, key):
+        """(entrada, fresca) o (None, False); cuenta acierto, acierto stale o fallo."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, False
+            self._entries.move_to_end(key)
+            fresh = entry.fresh(self._now())
+            if fresh:
+                self.hits += 1
+            else:
+                self.stale_hits += 1
+            return entry, fresh
+
+    def put(self, key, body, etag=None, last_modified=None, since=None):
+        """Guarda una respuesta 200. Se ignora si hubo una invalidación desde `since`."""
+        ttl = self.ttl_for(key)
+        with self._lock:
+            if ttl <= 0 or (since is not None and since != self.generation):
+                return False
+            previous = self._entries.get(key)
+            if previous is not None and previous.body != body:
+                self.updates += 1
+            self._entries[key] = CacheEntry(body, etag, last_modified, ttl, self._now())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            return True
+
+    def refresh(self, key, since=None):
+        """El servidor respondió 304: la entrada vuelve a estar fresca."""
+        with self._lock:
+            self.not_modified += 1
+            entry = self._entries.get(key)
+            if entry is None or (since is not None and since != self.generation):
+                return None
+            entry.stored_at = self._now()
+            return entry
+
+    def discard(self, key):
+        """Quita una entrada cuyo recurso ya no existe (404)."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def revalidating(self):
+        with self._lock:
+            self.revalidations += 1
+
+    def invalidate(self, *prefixes) -> int:
+        """Borra las entradas cuya ruta empieza con alguno de los prefijos."""
+        with self._lock:
+            self.generation += 1
+            keys = [k for k in self._entries if k.startswith(prefixes)]
+            for key in keys:
+                del self._entries[key]
+            self.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.stale_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "hit_ratio": round((self.hits + self.stale_hits) / lookups, 3) if lookups else 0.0,
+                "not_modified": self.not_modified,
+                "revalidations": self.revalidations,
+                "updates": self.updates,
+                "invalidations": self.invalidations,
+                "evictions": self.evictions,
+                "generation": self.generation,
+            }
@@ -0,0 +1,183 @@
+import time
+import weakref
+
+from kivy.clock import Clock
+from kivy.core.window import Window
+from kivy.event import EventDispatcher
+from kivy.properties import NumericProperty, OptionProperty
+
+from config import RESIZE_DEBOUNCE, BREAKPOINTS
+from window_events import resize_events
+from app_logging import get_logger
+
+log = get_logger("responsive")
+
+
+def _same(current, value):
+    # Las propiedades lista de Kivy (padding, size_hint...) no son iguales a una tupla
+    if isinstance(value, tuple) and isinstance(current, list):
+        return list(value) == current
+    return current == value
+
+
+class ResponsiveLayout(EventDispatcher):
+    """
+    Reacomodo de la interfaz al cambiar el tamaño de la ventana.
+
+    Antes cada pantalla respondía a un resize llamando `build_ui()`: se
+    destruía y recreaba todo el árbol de widgets (perdiendo lo escrito en
+    los formularios) y algunas volvían a pedir sus datos al servidor.
+    Ahora las pantallas construyen su interfaz una sola vez y registran
+    reglas por propiedad:
+
+        responsive.track(titulo, font_size=lambda: ResponsiveHelper.get_font_size(32))
+
+    Los resizes seguidos se agrupan (RESIZE_DEBOUNCE); una vez terminado,
+    se calcula el breakpoint y se vuelven a evaluar las reglas, asignando
+    solo las propiedades cuyo valor cambió. Para ajustes que no son una
+    propiedad, `subscribe(widget)` llama `widget.reflow()` tras las reglas;
+    si el widget no está en la ventana (pantalla inactiva) la llamada queda
+    pendiente hasta que su pantalla se muestre (`watch_manager`).
+
+    Los resizes llegan interceptados de window_events.resize_events, que
+    también guarda los widgets suscritos y sus llamadas pendientes; las
+    reglas se guardan aquí, con referencias débiles.
+    """
+
+    width = NumericProperty(0)
+    height = NumericProperty(0)
+    breakpoint = OptionProperty("desktop", options=[name for name, _ in BREAKPOINTS])
+
+    __events__ = ("on_reflow",)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._entries = {}
+        self._bound = False
+        self._trigger = Clock.create_trigger(self.reflow, RESIZE_DEBOUNCE)
+        # Métricas
+        self.resizes = 0
+        self.reflows = 0
+        self.updates = 0
+        self.collected = 0
+        self.last_ms = 0.0
+        self.max_ms = 0.0
+
+    # ============ API PÚBLICA ============
+
+    def track(self, widget, **rules):
+        """
+        Registra reglas `propiedad=callable` para `widget` y las aplica ya.
+        Devuelve el widget; llamarlo de nuevo suma o reemplaza reglas.
+        """
+        self._ensure_bound()
+        entry = self._entry(widget)
+        entry[1].update(rules)
+        self._apply(widget, rules)
+        return widget
+
+    def subscribe(self, widget, method="reflow"):
+        """Llama `widget.<method>()` en cada reacomodo, después de las reglas."""
+        self._ensure_bound()
+        self._entry(widget)
+        resize_events.bind(widget, method)
+        return widget
+
+    def untrack(self, widget):
+        self._entries.pop(id(widget), None)
+        resize_events.unbind(widget)
+
+    def watch_manager(self, manager):
+        """Al cambiar de pantalla, ejecuta los `reflow()` pendientes de la que se muestra."""
+        resize_events.watch_manager(manager)
+
+    def flush_pending(self, *args):
+        resize_events.flush_pending()
+
+    def reflow(self, *args):
+        """Aplica todas las reglas con el tamaño actual (lo llama el debounce)."""
+        start = time.perf_counter()
+        self.width, self.height = Window.width, Window.height
+        self.breakpoint = self.breakpoint_for(self.width)
+        for key in list(self._entries):
+            entry = self._entries.get(key)
+            widget = entry[0]() if entry is not None else None
+            if widget is not None:
+                self._apply(widget, entry[1])
+        # reflow() de los suscritos; los de pantallas inactivas quedan pendientes
+        resize_events.dispatch()
+        self.reflows += 1
+        self.dispatch("on_reflow")
+        self.last_ms = (time.perf_counter() - start) * 1000.0
+        self.max_ms = max(self.max_ms, self.last_ms)
+
+    def on_reflow(self, *args):
+        pass
+
+    @staticmethod
+    def breakpoint_for(width) -> str:
+        for name, max_width in BREAKPOINTS:
+            if max_width is None or width < max_width:
+                return name
+        return BREAKPOINTS[-1][0]
+
+    def tracked(self) -> int:
+        """Widgets vivos con reglas o suscripción."""
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        events = resize_events.stats()
+        return {
+            "tracked": len(self._entries),
+            "breakpoint": self.breakpoint,
+            "resizes": self.resizes,
+            "reflows": self.reflows,
+            "updates": self.updates,
+            "callbacks": events["delivered"],
+            "pending": events["pending"],
+            "deferred": events["deferred"],
+            "collected": self.collected,
+            "last_ms": round(self.last_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+    # ============ INTERNOS ============
+
+    def _ensure_bound(self):
+        if not self._bound:
+            resize_events.intercept(self._on_resize)
+            self.width, self.height = Window.width, Window.height
+            self.breakpoint = self.breakpoint_for(self.width)
+            self._bound = True
+
+    def _entry(self, widget):
+        key = id(widget)
+        entry = self._entries.get(key)
+        if entry is None or entry[0]() is not widget:
+            ref = weakref.ref(widget, lambda r, key=key: self._forget(key, r))
+            entry = self._entries[key] = [ref, {}]
+        return entry
+
+    def _forget(self, key, ref):
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is ref:
+            del self._entries[key]
+            self.collected += 1
+
+    def _apply(self, widget, rules):
+        for name, rule in rules.items():
+            try:
+                value = rule()
+                if not _same(getattr(widget, name), value):
+                    setattr(widget, name, value)
+                    self.updates += 1
+            except Exception as e:
+                log.error("regla.error", widget=type(widget).__name__, propiedad=name, error=e)
+
+    def _on_resize(self, window, width, height):
+        self.resizes += 1
+        self._trigger()
+
+
+# Instancia global del reacomodo responsive
+responsive = ResponsiveLayout()
@@ -0,0 +1,179 @@
+import threading
+from collections import OrderedDict
+
+
+def _as_ids(op_ids):
+    if isinstance(op_ids, (list, tuple, set)):
+        return op_ids
+    return (op_ids,)
+
+
+class VersionGate:
+    """
+    Orden monotónico para valores que llegan por caminos distintos
+    (GET de refresco, respuestas de POST/DELETE, eventos WebSocket).
+
+    Cada valor lleva una versión: `ticket()` entrega números crecientes y
+    se toma cuando el dato refleja al servidor (al *emitir* un GET, al
+    *recibir* una respuesta o un push). `admit(version)` solo acepta
+    versiones más nuevas que la última aplicada; las viejas se cuentan en
+    `stale` y se descartan.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._next = 0
+        self.applied = 0
+        self.stale = 0
+
+    def ticket(self):
+        with self._lock:
+            self._next += 1
+            return self._next
+
+    def admit(self, version=None):
+        """True si `version` (por defecto, un ticket nuevo) es más nueva que la aplicada."""
+        with self._lock:
+            if version is None:
+                self._next += 1
+                version = self._next
+            if version <= self.applied:
+                self.stale += 1
+                return False
+            self.applied = version
+            return True
+
+
+class PendingOpsJournal:
+    """
+    Diario de operaciones pendientes para actualizaciones optimistas.
+
+    El tablero muestra `confirmado + suma(deltas pendientes)` en cuanto el
+    operador hace clic. Cada operación se reconcilia después con el valor
+    autoritativo del servidor (respuesta REST o evento WebSocket):
+
+    - acknowledge(op_id, valor): el servidor aplicó la operación; `valor`
+      pasa a ser el confirmado.
+    - reject(op_id): la operación falló; se descarta (rollback).
+    - observe(valor): llegó un valor por push. Si hay operaciones en vuelo
+      se guarda y se aplica cuando el diario queda vacío, para no contar
+      dos veces una operación que el servidor ya incluyó.
+
+    Los valores autoritativos llevan una versión (ver VersionGate): uno más
+    viejo que el último aplicado se descarta y se cuenta en `stale`, así un
+    GET lento no pisa un conteo más nuevo.
+
+    Cada reconciliación devuelve (valor_a_mostrar, divergio). `divergio` es
+    True cuando el valor corregido no coincide con lo que se estaba
+    mostrando; esos casos se cuentan en `divergences` y los fallos en
+    `rollbacks`. Los cambios por push sin operaciones propias en vuelo no
+    cuentan como divergencia.
+    """
+
+    def __init__(self, confirmed=0):
+        self._lock = threading.Lock()
+        self._pending = OrderedDict()
+        self._next_id = 1
+        self._deferred = None
+        self.confirmed = confirmed
+        self.displayed = confirmed
+        self.divergences = 0
+        self.rollbacks = 0
+        self.acknowledged = 0
+        self.versions = VersionGate()
+
+    def _expected(self):
+        return max(0, self.confirmed + sum(self._pending.values()))
+
+    def _settle(self, value, count=True):
+        diverged = value != self.displayed
+        if diverged and count:
+            self.divergences += 1
+        self.displayed = value
+        return value, diverged
+
+    def record(self, delta):
+        """Registra una operación optimista. Retorna (op_id, valor_a_mostrar)."""
+        with self._lock:
+            op_id = self._next_id
+            self._next_id += 1
+            self._pending[op_id] = delta
+            self.displayed = self._expected()
+            return op_id, self.displayed
+
+    def ticket(self):
+        """Versión para un dato que se pide ahora (p.ej. al emitir un GET)."""
+        return self.versions.ticket()
+
+    def acknowledge(self, op_ids, authoritative=None, version=None):
+        """
+        Confirma una operación o una lista de ellas (p.ej. un lote agrupado
+        que el servidor aplicó en una sola petición). Si el servidor no
+        devolvió conteo (p.ej. 204) o el conteo es más viejo que uno ya
+        aplicado, se da por aplicado el delta sobre el último confirmado.
+        """
+        with self._lock:
+            delta = 0
+            for op_id in _as_ids(op_ids):
+                delta += self._pending.pop(op_id, 0)
+                self.acknowledged += 1
+            if authoritative is not None and not self.versions.admit(version):
+                authoritative = None
+            if authoritative is None:
+                self.confirmed = max(0, self.confirmed + delta)
+            else:
+                self.confirmed = authoritative
+                self._deferred = None
+            if not self._pending and self._deferred is not None:
+                self.confirmed = self._deferred
+                self._deferred = None
+            return self._settle(self._expected())
+
+    def reject(self, op_ids):
+        """Descarta una o varias operaciones tras un error y devuelve el valor corregido."""
+        with self._lock:
+            for op_id in _as_ids(op_ids):
+                if self._pending.pop(op_id, None) is not None:
+                    self.rollbacks += 1
+            if not self._pending and self._deferred is not None:
+                self.confirmed = self._deferred
+                self._deferred = None
+            return self._settle(self._expected())
+
+    def observe(self, authoritative, version=None):
+        """
+        Valor autoritativo recibido fuera de una respuesta propia.
+        Retorna (valor, divergio), o None si es viejo o se difiere por
+        haber pendientes.
+        """
+        with self._lock:
+            if not self.versions.admit(version):
+                return None
+            if self._pending:
+                self._deferred = authoritative
+                return None
+            self.confirmed = authoritative
+            return self._settle(self._expected(), count=False)
+
+    def has_pending(self):
+        with self._lock:
+            return bool(self._pending)
+
+    def reset(self, confirmed=0):
+        with self._lock:
+            self._pending.clear()
+            self._deferred = None
+            self.confirmed = confirmed
+            self.displayed = confirmed
+            # Lo que estaba en vuelo antes del reinicio queda viejo
+            self.versions.admit()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "pending": len(self._pending),
+                "acknowledged": self.acknowledged,
+                "divergences": self.divergences,
+                "rollbacks": self.rollbacks,
+                "stale": self.versions.stale,
+            }
@@ -0,0 +1,117 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from api_client import api
+from config import SHORT_TIMEOUT, SCORING_WORKERS, SCORING_REFRESH_TIMEOUT
+from metrics import LatencyRegistry
+
+
+class ScoringTransport:
+    """
+    Transporte compartido para las peticiones de puntajes y faltas del tablero.
+
+    Reutiliza la sesión keep-alive de ApiClient y ejecuta cada petición en un
+    pool de hilos acotado (en lugar de crear un Thread por clic). Cada método
+    tipado recibe callbacks opcionales `on_success(resultado)` y
+    `on_error(excepcion)`, que se ejecutan en el hilo del pool.
+    """
+
+    def __init__(self, client=None, max_workers=SCORING_WORKERS):
+        self.client = client or api
+        self.latency = LatencyRegistry()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="scoring"
+        )
+
+    def submit(self, name, fn, *args, on_success=None, on_error=None, **kwargs):
+        """Encola fn en el pool midiendo su latencia bajo `name`."""
+        def work():
+            try:
+                result = self.latency.measure(name, fn, *args, **kwargs)
+            except Exception as e:
+                if on_error:
+                    on_error(e)
+                return None
+            if on_success:
+                on_success(result)
+            return result
+        return self._executor.submit(work)
+
+    # ============ PUNTAJES ============
+
+    def add_puntaje(self, combate_id, alumno_id, valor_puntaje=1, idempotency_key=None,
+                    on_success=None, on_error=None):
+        """POST /apiPuntajes/puntaje/simple"""
+        return self.submit(
+            "puntaje.simple", self.client.add_puntaje_simple,
+            combate_id, alumno_id, valor_puntaje,
+            idempotency_key=idempotency_key, timeout=SHORT_TIMEOUT,
+            on_success=on_success, on_error=on_error
+        )
+
+    def delete_ultimo_puntaje(self, alumno_id, idempotency_key=None, on_success=None, on_error=None):
+        """DELETE /apiPuntajes/puntaje/alumno/{id}/last"""
+        return self.submit(
+            "puntaje.last", self.client.delete_ultimo_puntaje,
+            alumno_id, idempotency_key=idempotency_key, timeout=SHORT_TIMEOUT,
+            on_success=on_success, on_error=on_error
+        )
+
+    def get_puntaje_count(self, alumno_id, on_success=None, on_error=None):
+        """GET /apiPuntajes/puntaje/alumno/{id}/count"""
+        return self.submit(
+            "puntaje.count", self.client.get_puntaje_count_strict,
+            alumno_id, timeout=SCORING_REFRESH_TIMEOUT,
+            on_success=on_success, on_error=on_error
+        )
+
+    # ============ GAM-JEOM ============
+
+    def add_falta(self, combate_id, alumno_id, idempotency_key=None, on_success=None, on_error=None):
+        """POST /apiGamJeom/falta/simple"""
+        return self.submit(
+            "falta.simple", self.client.add_falta_simple,
+            combate_id, alumno_id, idempotency_key=idempotency_key, timeout=SHORT_TIMEOUT,
+            on_success=on_success, on_error=on_error
+        )
+
+    def delete_ultima_falta(self, alumno_id, combate_id, idempotency_key=None,
+                            on_success=None, on_error=None):
+        """DELETE /apiGamJeom/falta/alumno/{id}/combate/{id}/last"""
+        return self.submit(
+            "falta.last", self.client.delete_ultima_falta,
+            alumno_id, combate_id, idempotency_key=idempotency_key, timeout=SHORT_TIMEOUT,
+            on_success=on_success, on_error=on_error
+        )
+
+    def get_falta_count(self, alumno_id, combate_id, on_success=None, on_error=None):
+        """GET /apiGamJeom/falta/alumno/{id}/combate/{id}/count"""
+        return self.submit(
+            "falta.count", self.client.get_falta_count,
+            alumno_id, combate_id, timeout=SCORING_REFRESH_TIMEOUT,
+            on_success=on_success, on_error=on_error
+        )
+
+    # ============ SNAPSHOT ============
+
+    def get_combate_snapshot(self, combate_id, id_alumno_rojo=None, id_alumno_azul=None,
+                             on_success=None, on_error=None):
+        """Puntajes, faltas, round y estado del combate en una sola llamada."""
+        return self.submit(
+            "combate.snapshot", self.client.get_combate_snapshot,
+            combate_id, id_alumno_rojo, id_alumno_azul, timeout=SCORING_REFRESH_TIMEOUT,
+            on_success=on_success, on_error=on_error
+        )
+
+    # ============ MÉTRICAS ============
+
+    def get_latency_stats(self) -> dict:
+        """Devuelve {operación: {count, errors, avg_ms, p50_ms, p95_ms, ...}}"""
+        return self.latency.snapshot()
+
+    def shutdown(self, wait=False):
+        self._executor.shutdown(wait=wait)
+
+
+# Instancia global del transporte
+scoring = ScoringTransport()
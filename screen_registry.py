@@ -0,0 +1,120 @@
+import importlib
+import time
+
+from kivy.clock import Clock
+from kivy.uix.screenmanager import ScreenManager, ScreenManagerException
+
+from config import SCREEN_PREWARM, SCREEN_PREWARM_DELAY
+from app_logging import get_logger
+
+log = get_logger("screen_registry")
+
+
+class LazyScreenManager(ScreenManager):
+    """
+    ScreenManager que construye cada pantalla la primera vez que se usa.
+
+    Antes `MyApp.build` importaba los 14 módulos de pantallas y creaba
+    todas (ambos tableros, el formulario de CrearCombate...) antes del
+    primer frame. Aquí las pantallas se declaran por nombre:
+
+        sm.register('crear_combate', 'crear_combate:CrearCombateScreen')
+
+    La fábrica es un callable `factory(name)` o una ruta "modulo:Clase";
+    con la ruta, el módulo no se importa hasta construir la pantalla.
+    `has_screen` cuenta las registradas y `get_screen` (y por lo tanto
+    `current = nombre`) las construye al vuelo, así el código que navega
+    no cambia.
+
+    `prewarm(names)` construye pantallas en frames ociosos, una por frame,
+    después de que la pantalla inicial ya se mostró.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._factories = {}
+        self._prewarm_queue = []
+        self._prewarm_event = None
+        # Métricas: ms de construcción por pantalla y cómo se construyó
+        self.build_ms = {}
+        self.built_by = {}
+
+    # ============ API PÚBLICA ============
+
+    def register(self, name, factory):
+        """Declara la pantalla `name`; se construye al navegar a ella."""
+        self._factories[name] = factory
+
+    def is_built(self, name) -> bool:
+        return any(screen.name == name for screen in self.screens)
+
+    def has_screen(self, name):
+        return name in self._factories or super().has_screen(name)
+
+    def get_screen(self, name):
+        try:
+            return super().get_screen(name)
+        except ScreenManagerException:
+            if name not in self._factories:
+                raise
+            return self.build_screen(name, reason="navigation")
+
+    def remove_widget(self, *args, **kwargs):
+        # Una pantalla quitada explícitamente no se vuelve a crear sola
+        if args and getattr(args[0], 'name', None) in self._factories:
+            self._factories.pop(args[0].name)
+        return super().remove_widget(*args, **kwargs)
+
+    def build_screen(self, name, reason="navigation"):
+        """Construye y agrega la pantalla registrada `name` (si aún no existe)."""
+        for screen in self.screens:
+            if screen.name == name:
+                return screen
+        factory = self._factories[name]
+        start = time.perf_counter()
+        if isinstance(factory, str):
+            module_name, class_name = factory.split(':')
+            cls = getattr(importlib.import_module(module_name), class_name)
+            screen = cls(name=name)
+        else:
+            screen = factory(name)
+        self.add_widget(screen)
+        self.build_ms[name] = round((time.perf_counter() - start) * 1000.0, 2)
+        self.built_by[name] = reason
+        log.info("pantalla.construida", pantalla=name, ms=self.build_ms[name], motivo=reason)
+        return screen
+
+    def prewarm(self, names=SCREEN_PREWARM, delay=SCREEN_PREWARM_DELAY):
+        """Construye `names` en segundo plano del Clock, una pantalla por frame."""
+        self._prewarm_queue.extend(n for n in names if n in self._factories and n not in self._prewarm_queue)
+        if self._prewarm_event is None and self._prewarm_queue:
+            self._prewarm_event = Clock.schedule_once(self._prewarm_next, delay)
+
+    def build_all(self):
+        """Construye todo lo registrado ahora mismo (modo ansioso, para comparar)."""
+        for name in list(self._factories):
+            self.build_screen(name, reason="eager")
+
+    def stats(self) -> dict:
+        return {
+            "registered": len(self._factories),
+            "built": sum(1 for name in self._factories if self.is_built(name)),
+            "pending_prewarm": len(self._prewarm_queue),
+            "build_ms": dict(self.build_ms),
+            "built_by": dict(self.built_by),
+        }
+
+    # ============ INTERNOS ============
+
+    def _prewarm_next(self, dt):
+        self._prewarm_event = None
+        while self._prewarm_queue:
+            name = self._prewarm_queue.pop(0)
+            if name in self._factories and not self.is_built(name):
+                try:
+                    self.build_screen(name, reason="prewarm")
+                except Exception as e:
+                    log.exception("prewarm.error", pantalla=name)
+                break
+        if self._prewarm_queue:
+            self._prewarm_event = Clock.schedule_once(self._prewarm_next, 0)
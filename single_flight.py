@@ -0,0 +1,75 @@
+import threading
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Colapsa llamadas idénticas concurrentes en una sola ejecución.
+
+    El primer hilo que llama `do(key, fn)` ejecuta fn(); los que llegan con
+    la misma clave mientras está en curso esperan y reciben el mismo
+    resultado (o la misma excepción). Al terminar, la clave se libera: una
+    llamada posterior vuelve a ejecutar fn(). No es una caché.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+        self.calls = 0
+        self.executed = 0
+        self.collapsed = 0
+        self.max_waiters = 0
+
+    def do(self, key, fn):
+        with self._lock:
+            self.calls += 1
+            flight = self._flights.get(key)
+            if flight is not None:
+                self.collapsed += 1
+                flight.waiters += 1
+                self.max_waiters = max(self.max_waiters, flight.waiters)
+                leader = False
+            else:
+                flight = self._flights[key] = _Flight()
+                self.executed += 1
+                leader = True
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fn()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._flights)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "executed": self.executed,
+                "collapsed": self.collapsed,
+                "max_waiters": self.max_waiters,
+                "in_flight": len(self._flights),
+            }
@@ -0,0 +1,297 @@
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, deque
+from logging.handlers import RotatingFileHandler
+
+from requests.adapters import HTTPAdapter
+
+from config import (UI_NETWORK_GUARD, WATCHDOG_BUDGET_MS, WATCHDOG_POLL_MS, WATCHDOG_MAX_SAMPLES,
+                    WATCHDOG_STACK_DEPTH, WATCHDOG_LOG_FILE, WATCHDOG_LOG_MAX_BYTES, WATCHDOG_LOG_BACKUPS)
+from metrics import LatencyStats
+from app_logging import get_logger
+
+log = get_logger("stall_detector")
+
+_APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Módulos de infraestructura: el sitio reportado es quien los llamó
+_INFRA_FILES = {"stall_detector.py", "api_client.py", "single_flight.py", "response_cache.py"}
+
+
+def _app_site(stack) -> str:
+    """Frame más interno de la aplicación (fuera de Kivy, requests y la biblioteca estándar)."""
+    for frame in reversed(stack):
+        path = os.path.abspath(frame.filename)
+        if not path.startswith(_APP_DIR) or os.path.basename(path) in _INFRA_FILES:
+            continue
+        return f"{os.path.relpath(path, _APP_DIR)}:{frame.lineno} en {frame.name}"
+    return "desconocido"
+
+
+class StallDetector:
+    """
+    Detecta trabajo bloqueante en el hilo de Kivy.
+
+    Peticiones de red: una petición HTTP hecha desde el hilo principal
+    congela toda la ventana hasta DEFAULT_TIMEOUT (15 s) si el backend
+    tarda. Todas las sesiones HTTP montan `GuardedAdapter`, que antes de
+    enviar pregunta `network_call()`: si corre en el hilo de la interfaz
+    se cuenta, se guarda el sitio que la hizo (archivo:línea) y se mide
+    cuánto tiempo quedó bloqueada la ventana. Según UI_NETWORK_GUARD:
+
+    - "warn": avisa una vez por sitio y deja pasar la petición.
+    - "raise": lanza RuntimeError (para encontrarlas en desarrollo).
+    - "off": no revisa.
+
+    Congelamientos: `start()` programa un latido en cada frame del Clock
+    y arranca un hilo vigilante. Si el último latido tiene más de
+    WATCHDOG_BUDGET_MS, el vigilante copia la pila del hilo principal
+    (de nuevo cada presupuesto mientras siga congelado, hasta
+    WATCHDOG_MAX_SAMPLES). Al volver el latido se conoce la duración; el
+    registro (pantalla activa, ms, sitio más repetido en las muestras y la
+    pila) se escribe como una línea JSON en WATCHDOG_LOG_FILE, que rota
+    por tamaño. El vigilante escribe el archivo: el hilo principal nunca
+    toca el disco. `summary()` agrupa los congelamientos por sitio.
+    """
+
+    def __init__(self, mode=UI_NETWORK_GUARD, budget_ms=WATCHDOG_BUDGET_MS, poll_ms=WATCHDOG_POLL_MS,
+                 log_file=WATCHDOG_LOG_FILE):
+        self.mode = mode
+        self.budget_ms = budget_ms
+        self.poll_ms = poll_ms
+        self.log_file = log_file
+        self.ui_thread = threading.main_thread()
+        self.screen = None
+        self._lock = threading.Lock()
+        self._sites = {}
+        self._stall_sites = {}     # sitio -> [congelamientos, ms totales, ms máx, pantallas]
+        self._last_beat = time.perf_counter()
+        self._seq = 0
+        self._open = None          # congelamiento en curso (lo llena el vigilante)
+        self._finished = deque()   # registros por escribir
+        self._thread = None
+        self._stop = threading.Event()
+        self._beat_event = None
+        self._logger = None
+        # Métricas
+        self.network_calls = 0
+        self.blocked = LatencyStats()
+        self.stalls = LatencyStats()
+
+    # ============ API PÚBLICA ============
+
+    def on_ui_thread(self) -> bool:
+        return threading.current_thread() is self.ui_thread
+
+    def network_call(self, method, url) -> bool:
+        """Registra una petición; True si corre en el hilo de la interfaz (y hay que medirla)."""
+        if self.mode == "off" or not self.on_ui_thread():
+            return False
+        site = _app_site(traceback.extract_stack())
+        with self._lock:
+            self.network_calls += 1
+            first = site not in self._sites
+            self._sites[site] = self._sites.get(site, 0) + 1
+        if self.mode == "raise":
+            raise RuntimeError(f"Petición de red en el hilo de la interfaz: {method} {url} ({site})")
+        if first:
+            log.warning("red_en_hilo_ui", metodo=method, url=url, sitio=site)
+        return True
+
+    def record_blocked(self, elapsed_ms: float, ok: bool = True):
+        self.blocked.record(elapsed_ms, ok)
+
+    def sites(self) -> dict:
+        """Sitios que hicieron peticiones desde el hilo de la interfaz -> cuántas veces."""
+        with self._lock:
+            return dict(self._sites)
+
+    def start(self):
+        """Arranca el latido (hilo principal) y el hilo vigilante. Llamar desde el hilo de Kivy."""
+        if self._thread is not None:
+            return
+        # Importación diferida: el cliente HTTP también usa este módulo y no depende de Kivy
+        from kivy.clock import Clock
+
+        self._logger = self._open_log()
+        self._last_beat = time.perf_counter()
+        self._beat_event = Clock.schedule_interval(self._beat, 0)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name="stall-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout=1.0)
+        self._thread = None
+        if self._beat_event is not None:
+            self._beat_event.cancel()
+            self._beat_event = None
+        self._write_finished()
+
+    def watch_manager(self, manager):
+        """Guarda el nombre de la pantalla activa para los registros (el vigilante no lee Kivy)."""
+        self.screen = manager.current
+        manager.bind(current=lambda instance, value: setattr(self, 'screen', value))
+
+    def summary(self, limit=10) -> list:
+        """Sitios con más congelamientos: [{site, stalls, total_ms, max_ms, screens}]."""
+        with self._lock:
+            items = [(site, list(data)) for site, data in self._stall_sites.items()]
+        return _rank(items, limit)
+
+    def stats(self) -> dict:
+        return {
+            "mode": self.mode,
+            "network_calls": self.network_calls,
+            "sites": self.sites(),
+            "blocked": self.blocked.snapshot(),
+            "budget_ms": self.budget_ms,
+            "stalls": self.stalls.snapshot(),
+            "top_stalls": self.summary(5),
+            "log_file": self.log_file,
+        }
+
+    # ============ INTERNOS ============
+
+    def _beat(self, dt):
+        now = time.perf_counter()
+        with self._lock:
+            gap_ms = (now - self._last_beat) * 1000.0
+            self._last_beat = now
+            self._seq += 1
+            record, self._open = self._open, None
+        if gap_ms <= self.budget_ms:
+            return
+        if record is None:
+            # Más corto que el sondeo del vigilante: sin pila
+            record = {"ts": time.time(), "screen": self.screen, "samples": [], "stack": []}
+        samples = record.pop("samples")
+        site = Counter(samples).most_common(1)[0][0] if samples else "desconocido"
+        record.pop("seq", None)
+        record.update(ms=round(gap_ms, 1), site=site, samples=len(samples))
+        self.stalls.record(gap_ms)
+        with self._lock:
+            data = self._stall_sites.setdefault(site, [0, 0.0, 0.0, set()])
+            data[0] += 1
+            data[1] += gap_ms
+            data[2] = max(data[2], gap_ms)
+            data[3].add(record["screen"])
+        self._finished.append(record)
+
+    def _watch(self):
+        while not self._stop.wait(self.poll_ms / 1000.0):
+            self._write_finished()
+            with self._lock:
+                last, seq, record = self._last_beat, self._seq, self._open
+            stalled_ms = (time.perf_counter() - last) * 1000.0
+            if stalled_ms < self.budget_ms:
+                continue
+            if record is not None and record["seq"] == seq:
+                samples = record["samples"]
+                if len(samples) >= WATCHDOG_MAX_SAMPLES or stalled_ms < self.budget_ms * (len(samples) + 1):
+                    continue
+                stack = self._main_stack()
+                with self._lock:
+                    if self._open is record:
+                        samples.append(_app_site(stack))
+                continue
+            stack = self._main_stack()
+            record = {"seq": seq, "ts": time.time(), "screen": self.screen,
+                      "samples": [_app_site(stack)], "stack": traceback.format_list(stack)}
+            with self._lock:
+                # Si el latido volvió mientras se copiaba la pila, el congelamiento ya terminó
+                if self._seq == seq:
+                    self._open = record
+
+    def _main_stack(self):
+        frame = sys._current_frames().get(self.ui_thread.ident)
+        if frame is None:
+            return []
+        return traceback.extract_stack(frame)[-WATCHDOG_STACK_DEPTH:]
+
+    def _write_finished(self):
+        while self._finished:
+            record = self._finished.popleft()
+            if self._logger is not None:
+                self._logger.warning(json.dumps(record, ensure_ascii=False))
+            log.warning("congelamiento", ms=record['ms'], pantalla=record['screen'], sitio=record['site'])
+
+    def _open_log(self):
+        logger = logging.getLogger("stall_detector.stalls")
+        logger.propagate = False
+        logger.setLevel(logging.WARNING)
+        if not logger.handlers:
+            try:
+                os.makedirs(os.path.dirname(self.log_file), exist_ok=True)
+                handler = RotatingFileHandler(self.log_file, maxBytes=WATCHDOG_LOG_MAX_BYTES,
+                                              backupCount=WATCHDOG_LOG_BACKUPS, encoding="utf-8")
+            except OSError as e:
+                log.error("log.no_abierto", archivo=self.log_file, error=e)
+                return None
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            logger.addHandler(handler)
+        return logger
+
+
+def _rank(items, limit):
+    items.sort(key=lambda item: item[1][1], reverse=True)
+    return [{"site": site, "stalls": data[0], "total_ms": round(data[1], 1), "max_ms": round(data[2], 1),
+             "screens": sorted(s for s in data[3] if s)} for site, data in items[:limit]]
+
+
+def summarize_log(log_file=WATCHDOG_LOG_FILE, limit=10) -> list:
+    """Como `summary()`, pero leyendo el archivo rotado (incluye sesiones anteriores)."""
+    sites = {}
+    paths = [log_file] + [f"{log_file}.{i}" for i in range(1, WATCHDOG_LOG_BACKUPS + 1)]
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                data = sites.setdefault(record.get("site", "desconocido"), [0, 0.0, 0.0, set()])
+                data[0] += 1
+                data[1] += record.get("ms", 0.0)
+                data[2] = max(data[2], record.get("ms", 0.0))
+                data[3].add(record.get("screen"))
+    return _rank(list(sites.items()), limit)
+
+
+class GuardedAdapter(HTTPAdapter):
+    """HTTPAdapter que avisa al StallDetector antes de cada envío."""
+
+    def send(self, request, **kwargs):
+        if not stall_detector.network_call(request.method, request.url):
+            return super().send(request, **kwargs)
+        start = time.perf_counter()
+        ok = False
+        try:
+            response = super().send(request, **kwargs)
+            ok = True
+            return response
+        finally:
+            stall_detector.record_blocked((time.perf_counter() - start) * 1000.0, ok)
+
+
+# Instancia global del detector
+stall_detector = StallDetector()
+
+
+if __name__ == '__main__':
+    # Reporte de los sitios que más congelan: python stall_detector.py [archivo]
+    path = sys.argv[1] if len(sys.argv) > 1 else WATCHDOG_LOG_FILE
+    print(f"{'ms totales':>10} {'veces':>6} {'ms máx':>8}  sitio (pantallas)")
+    for row in summarize_log(path, limit=20):
+        print(f"{row['total_ms']:>10.1f} {row['stalls']:>6} {row['max_ms']:>8.1f}  "
+              f"{row['site']} ({', '.join(row['screens'])})")
@@ -9,9 +9,19 @@ from kivy.core.window import Window
 from kivy.metrics import dp, sp
 from kivy.utils import platform
 from kivy.clock import Clock
-from threading import Thread
-from threading import Thread
+from task_executor import tasks, PRIORITY_LOW
 from kivy.clock import Clock
+import time
+
+from config import VIEWER_POLL_BASE, VIEWER_POLL_MAX, CLOCK_DISPLAY_INTERVAL, CLOCK_MAX_LAG_COMPENSATION
+from realtime import RealtimeConnection
+from combat_clock import CountdownClock
+from score_journal import VersionGate
+from realtime_dispatcher import FrameDispatcher
+from responsive import responsive
+from app_logging import get_logger
+
+log = get_logger("tablero")
 
 # Importar cliente API si está disponible
 try:
@@ -20,7 +30,7 @@ try:
 except ImportError:
     api = None
     API_AVAILABLE = False
-    print("[Tablero] Warning: api_client not found, using local scores only")
+    log.warning("api_client no encontrado: solo puntajes locales")
 
 
 # ------------------ UTILIDADES RESPONSIVE ------------------
@@ -97,9 +107,12 @@ class CompetitorPanel(BoxLayout):
         self.is_red = is_red
         self.alumno_id = alumno_id
         self.score_refresh_event = None
+        # Versiones de puntaje/faltas: un GET lento no pisa un push más nuevo
+        self.score_versions = VersionGate()
+        self.gamjeom_versions = VersionGate()
         
         self.update_layout()
-        Window.bind(on_resize=self.on_window_resize)
+        responsive.track(self, spacing=ResponsiveHelper.get_spacing, padding=lambda: [ResponsiveHelper.get_padding()] * 4)
         
         self.bind(score=self.update_score_label)
         self.bind(penalty_score=self.update_penalty_label)
@@ -130,6 +143,7 @@ class CompetitorPanel(BoxLayout):
             size_hint_y=None,
             height=dp(25)
         )
+        responsive.track(color_indicator, font_size=lambda: ResponsiveHelper.get_font_size(16))
         self.add_widget(color_indicator)
 
         # Nacionalidad
@@ -141,6 +155,7 @@ class CompetitorPanel(BoxLayout):
             size_hint_y=None,
             height=dp(35)
         )
+        responsive.track(self.nationality_label, font_size=lambda: ResponsiveHelper.get_font_size(22))
         self.add_widget(self.nationality_label)
 
         # Nombre del competidor
@@ -157,6 +172,11 @@ class CompetitorPanel(BoxLayout):
             shorten=True,
             shorten_from='right'
         )
+        responsive.track(
+            self.name_label,
+            font_size=lambda: ResponsiveHelper.get_font_size(28),
+            text_size=lambda: (Window.width * 0.3, None)
+        )
         self.add_widget(self.name_label)
 
         # Espaciador
@@ -170,6 +190,7 @@ class CompetitorPanel(BoxLayout):
             size_hint_y=None,
             height=dp(30)
         )
+        responsive.track(puntaje_label, font_size=lambda: ResponsiveHelper.get_font_size(18))
         self.add_widget(puntaje_label)
 
         # Contenedor del puntaje con fondo
@@ -202,6 +223,7 @@ class CompetitorPanel(BoxLayout):
             color=(1, 1, 1, 1),
             size_hint_y=1
         )
+        responsive.track(self.score_label, font_size=lambda: ResponsiveHelper.get_font_size(70))
         score_container.add_widget(self.score_label)
 
         self.add_widget(score_container)
@@ -217,6 +239,7 @@ class CompetitorPanel(BoxLayout):
             size_hint_y=None,
             height=dp(25)
         )
+        responsive.track(penalty_label, font_size=lambda: ResponsiveHelper.get_font_size(16))
         self.add_widget(penalty_label)
 
         # Número de penalizaciones (simple)
@@ -228,6 +251,7 @@ class CompetitorPanel(BoxLayout):
             size_hint_y=None,
             height=dp(50)
         )
+        responsive.track(self.penalty_count_label, font_size=lambda: ResponsiveHelper.get_font_size(40))
         self.add_widget(self.penalty_count_label)
 
         # Espaciador inferior
@@ -253,9 +277,6 @@ class CompetitorPanel(BoxLayout):
         self.rect.pos = self.pos
         self.rect.size = self.size
     
-    def on_window_resize(self, instance, width, height):
-        Clock.schedule_once(lambda dt: self.update_layout(), 0.1)
-
     def add_score(self, points=1):
         """Añade puntos al marcador"""
         self.score += points
@@ -281,46 +302,35 @@ class CompetitorPanel(BoxLayout):
         if not API_AVAILABLE or not api or self.alumno_id <= 0:
             return
         
-        def _fetch_score():
-            try:
-                count = api.get_puntaje_count(self.alumno_id)
-                Clock.schedule_once(lambda dt: self._update_score_from_api(count))
-            except Exception as e:
-                print(f"[CompetitorPanel] Error al obtener puntaje: {e}")
-        
-        thread = Thread(target=_fetch_score)
-        thread.daemon = True
-        thread.start()
+        version = self.score_versions.ticket()
+        tasks.submit(
+            api.get_puntaje_count, self.alumno_id,
+            owner=self, priority=PRIORITY_LOW, name="tablero.puntaje",
+            on_success=lambda count: self._update_score_from_api(count, version),
+            on_error=lambda e: log.warning("puntaje.error", alumno_id=self.alumno_id, error=e)
+        )
 
     def load_gamjeom_from_api(self, combate_id):
         """Carga las faltas GAM-JEOM desde la API"""
         if not API_AVAILABLE or not api or self.alumno_id <= 0 or not combate_id:
             return
         
-        def _fetch_gamjeom():
-            try:
-                import requests
-                url = f"http://localhost:8080/apiGamJeom/falta/alumno/{self.alumno_id}/combate/{combate_id}/count"
-                response = requests.get(url, timeout=2)
-                if response.status_code == 200:
-                    data = response.json()
-                    count = data.get('count', 0)
-                    Clock.schedule_once(lambda dt: self._update_gamjeom_from_api(count))
-            except Exception as e:
-                print(f"[CompetitorPanel] Error al obtener GAM-JEOM: {e}")
-    
-        thread = Thread(target=_fetch_gamjeom)
-        thread.daemon = True
-        thread.start()
+        version = self.gamjeom_versions.ticket()
+        tasks.submit(
+            api.get_falta_count, self.alumno_id, combate_id, timeout=2,
+            owner=self, priority=PRIORITY_LOW, name="tablero.gamjeom",
+            on_success=lambda count: self._update_gamjeom_from_api(count, version),
+            on_error=lambda e: log.warning("gamjeom.error", alumno_id=self.alumno_id, error=e)
+        )
 
-    def _update_gamjeom_from_api(self, count):
-        """Actualiza las faltas GAM-JEOM en el hilo principal"""
-        if count is not None:
+    def _update_gamjeom_from_api(self, count, version=None):
+        """Actualiza las faltas GAM-JEOM en el hilo principal (si el dato es más nuevo)"""
+        if count is not None and self.gamjeom_versions.admit(version):
             self.penalty_score = count
 
-    def _update_score_from_api(self, count):
-        """Actualiza el puntaje en el hilo principal"""
-        if count is not None:
+    def _update_score_from_api(self, count, version=None):
+        """Actualiza el puntaje en el hilo principal (si el dato es más nuevo)"""
+        if count is not None and self.score_versions.admit(version):
             self.score = count
 
     def start_score_refresh(self, combate_id=None, interval=2.0):
@@ -364,8 +374,8 @@ class CenterPanel(BoxLayout):
         super().__init__(**kwargs)
         self.orientation = 'vertical'
         
-        # Timer variables
-        self.time_seconds = 0
+        # Timer variables (reloj monotónico; el tablero central publica el tiempo autoritativo)
+        self.clock = CountdownClock(0)
         self.round_duration = 120  # 2 minutos por defecto
         self.rest_duration = 60    # 1 minuto de descanso
         self.is_running = False
@@ -373,7 +383,7 @@ class CenterPanel(BoxLayout):
         self.timer_event = None
         
         self.update_layout()
-        Window.bind(on_resize=self.on_window_resize)
+        responsive.track(self, spacing=ResponsiveHelper.get_spacing, padding=lambda: [ResponsiveHelper.get_padding()] * 4)
 
     def update_layout(self):
         self.clear_widgets()
@@ -399,6 +409,7 @@ class CenterPanel(BoxLayout):
                 size_hint_y=None,
                 height=dp(25)
             )
+            responsive.track(info_label, font_size=lambda: ResponsiveHelper.get_font_size(16))
             self.add_widget(info_label)
 
         # Estado del combate
@@ -410,6 +421,7 @@ class CenterPanel(BoxLayout):
             size_hint_y=None,
             height=dp(30)
         )
+        responsive.track(self.status_label, font_size=lambda: ResponsiveHelper.get_font_size(18))
         self.add_widget(self.status_label)
 
         # Espaciador
@@ -423,6 +435,7 @@ class CenterPanel(BoxLayout):
             size_hint_y=None,
             height=dp(25)
         )
+        responsive.track(ronda_label, font_size=lambda: ResponsiveHelper.get_font_size(18))
         self.add_widget(ronda_label)
 
         # Número de ronda con total
@@ -434,6 +447,7 @@ class CenterPanel(BoxLayout):
             size_hint_y=None,
             height=dp(60)
         )
+        responsive.track(self.round_label, font_size=lambda: ResponsiveHelper.get_font_size(45))
         self.add_widget(self.round_label)
 
         # Espaciador
@@ -468,6 +482,7 @@ class CenterPanel(BoxLayout):
             color=(0.3, 0.3, 0.3, 1),
             size_hint_y=0.25
         )
+        responsive.track(tiempo_label, font_size=lambda: ResponsiveHelper.get_font_size(16))
         time_container.add_widget(tiempo_label)
 
         # Tiempo
@@ -478,6 +493,7 @@ class CenterPanel(BoxLayout):
             bold=True,
             size_hint_y=0.75
         )
+        responsive.track(self.time_label, font_size=lambda: ResponsiveHelper.get_font_size(55))
         time_container.add_widget(self.time_label)
 
         self.add_widget(time_container)
@@ -501,6 +517,7 @@ class CenterPanel(BoxLayout):
             bold=True,
             font_size=ResponsiveHelper.get_font_size(16)
         )
+        responsive.track(self.back_button, font_size=lambda: ResponsiveHelper.get_font_size(16))
         
         with self.back_button.canvas.before:
             Color(0.5, 0.5, 0.5, 1)
@@ -542,7 +559,8 @@ class CenterPanel(BoxLayout):
         if self.timer_event:
             self.timer_event.cancel()
         
-        self.timer_event = Clock.schedule_interval(self.update_timer, 1)
+        self.clock.start()
+        self.timer_event = Clock.schedule_interval(self.update_timer, CLOCK_DISPLAY_INTERVAL)
         self.update_status_label()
 
     def pause_timer(self):
@@ -550,23 +568,24 @@ class CenterPanel(BoxLayout):
         self.is_running = False
         self.match_status = "PAUSADO"
         
+        self.clock.pause()
         if self.timer_event:
             self.timer_event.cancel()
+            self.timer_event = None
         
         self.update_status_label()
 
     def reset_timer(self, instance=None):
         """Reinicia el timer del round actual"""
-        self.time_seconds = self.round_duration if not self.is_rest else self.rest_duration
+        self.clock.reset(self.round_duration if not self.is_rest else self.rest_duration)
         self.update_time_display()
         
         if self.is_running:
             self.pause_timer()
 
     def update_timer(self, dt):
-        """Actualiza el timer cada segundo"""
-        if self.time_seconds > 0:
-            self.time_seconds -= 1
+        """Repinta el tiempo leyendo el reloj; las transiciones ocurren al llegar a cero"""
+        if not self.clock.expired:
             self.update_time_display()
         else:
             # Tiempo agotado
@@ -577,13 +596,15 @@ class CenterPanel(BoxLayout):
                 if self.round_num > self.total_rounds:
                     self.end_match()
                 else:
-                    self.time_seconds = self.round_duration
+                    self.clock.reset(self.round_duration)
+                    self.clock.start()
                     self.update_layout()
             else:
                 # Fin del round
                 if self.round_num < self.total_rounds:
                     self.is_rest = True
-                    self.time_seconds = self.rest_duration
+                    self.clock.reset(self.rest_duration)
+                    self.clock.start()
                     self.update_layout()
                 else:
                     self.end_match()
@@ -596,12 +617,51 @@ class CenterPanel(BoxLayout):
 
     def update_time_display(self):
         """Actualiza la visualización del tiempo"""
-        minutes = self.time_seconds // 60
-        seconds = self.time_seconds % 60
-        self.time_str = f"{minutes:02d}:{seconds:02d}"
-        if hasattr(self, 'time_label'):
+        self.time_str = self.clock.display()
+        if hasattr(self, 'time_label') and self.time_label.text != self.time_str:
             self.time_label.text = self.time_str
 
+    def apply_clock(self, data):
+        """Aplica el tiempo autoritativo publicado por el tablero central (evento 'clock')"""
+        remaining = (data.get('remaining_ms') or 0) / 1000.0
+        running = bool(data.get('running'))
+        sent_at = data.get('sent_at')
+        if running and isinstance(sent_at, (int, float)):
+            # Compensa el tránsito del mensaje, acotado por si los relojes de pared difieren
+            lag = time.time() - sent_at / 1000.0
+            remaining -= min(CLOCK_MAX_LAG_COMPENSATION, max(0.0, lag))
+        phase = data.get('phase')
+
+        layout_changed = False
+        round_num = data.get('round')
+        if isinstance(round_num, int) and round_num != self.round_num:
+            self.round_num = round_num
+            layout_changed = True
+        is_rest = phase == 'rest'
+        if is_rest != self.is_rest:
+            self.is_rest = is_rest
+            layout_changed = True
+
+        self.clock.sync(remaining, running)
+        self.is_running = running
+        if running and not self.timer_event:
+            self.timer_event = Clock.schedule_interval(self.update_timer, CLOCK_DISPLAY_INTERVAL)
+        elif not running and self.timer_event:
+            self.timer_event.cancel()
+            self.timer_event = None
+        self.match_status = {
+            'finished': "FINALIZADO",
+            'rest': "DESCANSO",
+            'medical': "TIEMPO MÉDICO",
+            'paused': "PAUSADO",
+        }.get(phase, "EN CURSO" if running else "LISTO")
+
+        if layout_changed:
+            self.update_layout()
+        else:
+            self.update_time_display()
+            self.update_status_label()
+
     def update_status_label(self):
         """Actualiza el label de estado"""
         if hasattr(self, 'status_label'):
@@ -627,15 +687,12 @@ class CenterPanel(BoxLayout):
         else:
             app.root.current = 'ini'
     
-    def on_window_resize(self, instance, width, height):
-        Clock.schedule_once(lambda dt: self.update_layout(), 0.1)
-
     def set_round_config(self, num_rounds, round_duration, rest_duration):
         """Configura los parámetros de rounds"""
         self.total_rounds = num_rounds
         self.round_duration = round_duration
         self.rest_duration = rest_duration
-        self.time_seconds = round_duration
+        self.clock.reset(round_duration)
         self.update_time_display()
         self.update_layout()
 
@@ -647,8 +704,20 @@ class MainScreentab(Screen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.combate_data = None
+        self.combate_id = None
+        self.ws_connected = False
+        self._ws_combate_id = None
+        # Eventos del stream: último estado por atleta (y del reloj), una vez por frame
+        self.realtime_events = FrameDispatcher("tablero", self.apply_event)
+        self.realtime = RealtimeConnection(
+            "tablero",
+            on_event=self.realtime_events.push,
+            on_resync=lambda: Clock.schedule_once(lambda dt: self._resync()),
+            on_state=lambda state: Clock.schedule_once(lambda dt: self._on_ws_state(state))
+        )
+        self._poll_event = None
+        self._poll_interval = VIEWER_POLL_BASE
         self.build_ui()
-        Window.bind(on_resize=self.on_window_resize)
 
     def build_ui(self):
         self.clear_widgets()
@@ -659,6 +728,7 @@ class MainScreentab(Screen):
             orientation=orientation,
             spacing=0
         )
+        responsive.track(main_layout, orientation=ResponsiveHelper.get_layout_orientation)
 
         # Panel Competidor 1 (AZUL - izquierda)
         self.com1_panel = CompetitorPanel(
@@ -693,7 +763,7 @@ class MainScreentab(Screen):
         if not data:
             return
         
-        print(f"[Tablero] Cargando datos del combate: {data}")
+        log.debug("combate.datos", data=dict(data))
         
         # Detener actualizaciones previas
         self.com1_panel.stop_score_refresh()
@@ -736,28 +806,134 @@ class MainScreentab(Screen):
         # Obtener ID del combate
         combate_id = data.get('idCombate') or data.get('id') or data.get('combate_id')
 
-        # Cargar puntajes y GAM-JEOM UNA SOLA VEZ
-        self.com1_panel.load_score_from_api()
-        self.com2_panel.load_score_from_api()
-
+        # Cargar puntajes y GAM-JEOM UNA SOLA VEZ (snapshot del combate)
         if combate_id:
-            self.com1_panel.load_gamjeom_from_api(combate_id)
-            self.com2_panel.load_gamjeom_from_api(combate_id)
+            self.load_snapshot_from_api(combate_id)
         else:
-            print("[Tablero] ⚠️ No se proporcionó ID de combate, no se cargarán GAM-JEOM")
+            self.com1_panel.load_score_from_api()
+            self.com2_panel.load_score_from_api()
+            log.warning("combate.sin_id", detalle="no se cargarán GAM-JEOM")
+
+        # Sin polling: los cambios llegan por WebSocket
+        self.combate_id = combate_id
+        if combate_id and combate_id != self._ws_combate_id:
+            self.connect_websocket()
+
+    def load_snapshot_from_api(self, combate_id):
+        """Hidrata ambos paneles con una sola llamada a get_combate_snapshot"""
+        if not API_AVAILABLE or not api:
+            return
+        id_azul = self.com1_panel.alumno_id
+        id_rojo = self.com2_panel.alumno_id
+        start = time.perf_counter()
+        versions = {
+            panel: (panel.score_versions.ticket(), panel.gamjeom_versions.ticket())
+            for panel in (self.com1_panel, self.com2_panel)
+        }
+
+        tasks.submit(
+            api.get_combate_snapshot, combate_id, id_rojo or None, id_azul or None,
+            owner=self, name="tablero.snapshot",
+            on_success=lambda snapshot: self._apply_snapshot(snapshot, start, versions),
+            on_error=lambda e: log.error("snapshot.error", combate_id=self.combate_id, error=e)
+        )
+
+    def _apply_snapshot(self, snapshot, start, versions=None):
+        """Aplica el snapshot en el hilo principal"""
+        versions = versions or {}
+        for panel, lado in ((self.com1_panel, 'azul'), (self.com2_panel, 'rojo')):
+            datos = snapshot.get(lado) or {}
+            score_version, gamjeom_version = versions.get(panel, (None, None))
+            panel._update_score_from_api(datos.get('puntaje'), score_version)
+            panel._update_gamjeom_from_api(datos.get('faltas'), gamjeom_version)
+        total_ms = (time.perf_counter() - start) * 1000.0
+        log.info("hidratado", total_ms=round(total_ms, 1), red_ms=snapshot.get('elapsed_ms'),
+                 fuente=snapshot.get('source'))
+
+    # ============ TIEMPO REAL ============
+
+    def connect_websocket(self):
+        """Se suscribe al mismo stream que el tablero central"""
+        if not self.combate_id:
+            return
+        self._ws_combate_id = self.combate_id
+        if not self.realtime.start(f"/ws/tablero/{self.combate_id}"):
+            self.start_fallback_polling()
+
+    def apply_event(self, data):
+        """Aplica un evento del stream al panel correspondiente"""
+        event = data.get('event')
+        if event == 'score_update':
+            panel = self._panel_for(data.get('alumnoId'))
+            if panel:
+                panel._update_score_from_api(data.get('count'))
+        elif event in ('gamjeom_update', 'falta_update'):
+            panel = self._panel_for(data.get('alumnoId'))
+            if panel:
+                panel._update_gamjeom_from_api(data.get('count', data.get('totalFaltas')))
+        elif event == 'clock':
+            self.center_panel.apply_clock(data)
+
+    def _panel_for(self, alumno_id):
+        if not alumno_id:
+            return None
+        if alumno_id == self.com1_panel.alumno_id:
+            return self.com1_panel
+        if alumno_id == self.com2_panel.alumno_id:
+            return self.com2_panel
+        return None
+
+    def _resync(self):
+        """Primera conexión o reconexión sin reanudar: rehidrata una vez"""
+        if self.combate_id:
+            self.load_snapshot_from_api(self.combate_id)
+
+    def _on_ws_state(self, state):
+        self.ws_connected = state == "connected"
+        if self.ws_connected:
+            self.stop_fallback_polling()
+        elif state == "disconnected":
+            self.start_fallback_polling()
+
+    def disconnect_websocket(self):
+        self._ws_combate_id = None
+        self.realtime.stop()
+        self.realtime_events.clear()
+
+    def start_fallback_polling(self):
+        """Polling con backoff, solo mientras no hay WebSocket"""
+        if self._poll_event:
+            return
+        self._poll_interval = VIEWER_POLL_BASE
+        self._poll_event = Clock.schedule_once(self._poll_once, self._poll_interval)
+
+    def _poll_once(self, dt):
+        self._poll_event = None
+        if self.ws_connected or not self.combate_id:
+            return
+        self.load_snapshot_from_api(self.combate_id)
+        self._poll_interval = min(VIEWER_POLL_MAX, self._poll_interval * 2)
+        self._poll_event = Clock.schedule_once(self._poll_once, self._poll_interval)
+
+    def stop_fallback_polling(self):
+        if self._poll_event:
+            self._poll_event.cancel()
+            self._poll_event = None
+        self._poll_interval = VIEWER_POLL_BASE
 
-        # NO llamar a start_score_refresh() - así no hay polling
+    def on_pre_leave(self, *args):
+        for owner in (self, getattr(self, 'com1_panel', None), getattr(self, 'com2_panel', None)):
+            if owner is not None:
+                tasks.cancel_owner(owner)
+
+    def on_leave(self, *args):
+        self.disconnect_websocket()
+        self.stop_fallback_polling()
 
     def set_combate_data(self, data):
         """Establece los datos del combate"""
         self.combate_data = data
         self.load_combate_data(data)
-    
-    def on_window_resize(self, instance, width, height):
-        Clock.schedule_once(lambda dt: self.build_ui(), 0.1)
-        # Recargar datos después de reconstruir UI
-        if self.combate_data:
-            Clock.schedule_once(lambda dt: self.load_combate_data(self.combate_data), 0.2)
 
 
 # ------------------ APLICACIÓN STANDALONE ------------------
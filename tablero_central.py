@@ -12,21 +12,31 @@ from kivy.uix.screenmanager import Screen, ScreenManager
 from kivy.uix.popup import Popup
 from kivy.metrics import dp, sp
 from kivy.core.window import Window
-from threading import Thread
 from kivy.clock import mainthread
-import requests
-import json
+import math
+import time
 
-try:
-    import websocket
-    WEBSOCKET_AVAILABLE = True
-except ImportError:
-    WEBSOCKET_AVAILABLE = False
-    print("=" * 60)
-    print("  ADVERTENCIA: websocket-client no instalado")
-    print("  Ejecuta: pip install websocket-client")
-    print("  Las actualizaciones en tiempo real NO funcionarán")
-    print("=" * 60)
+from config import OPTIMISTIC_SCORING, CLOCK_DISPLAY_INTERVAL, CLOCK_PUBLISH_INTERVAL
+from scoring_transport import scoring
+from mutation_coalescer import coalescer
+from offline_queue import offline_queue
+from score_journal import PendingOpsJournal
+from realtime import RealtimeConnection, WEBSOCKET_AVAILABLE
+from combat_state import CombatStateMachine, RUNNING, PAUSED, READY, REST, MEDICAL
+from combat_clock import CountdownClock
+from metrics import FrameTimeCounter
+from realtime_dispatcher import FrameDispatcher
+from app_logging import get_logger
+
+log = get_logger("tablero_central")
+
+
+def _error_text(exc):
+    """Texto de estado para un error del transporte de puntajes."""
+    response = getattr(exc, 'response', None)
+    if response is not None:
+        return f"✗ Error {response.status_code}"
+    return "✗ Error conexión"
 
 
 # ------------------ UTILIDADES RESPONSIVE ------------------
@@ -77,12 +87,14 @@ class ResponsiveHelper:
 class RestPopup(Popup):
     """Popup que aparece automáticamente durante el descanso con su propio cronómetro"""
     
-    def __init__(self, round_number, duracion_descanso, on_rest_end_callback, round_scores, **kwargs):
+    def __init__(self, round_number, duracion_descanso, on_rest_end_callback, round_scores,
+                 clock=None, on_tick=None, **kwargs):
         self.round_number = round_number
         self.duracion_descanso = duracion_descanso
         self.on_rest_end_callback = on_rest_end_callback
         self.round_scores = round_scores  # dict: {'rojo': [...], 'azul': [...]}
-        self.remaining = duracion_descanso
+        self.clock = clock or CountdownClock(duracion_descanso)
+        self.on_tick = on_tick
         self._clock_event = None
         
         content = self._build_content()
@@ -101,7 +113,8 @@ class RestPopup(Popup):
             Color(0.05, 0.05, 0.15, 0.97)
             self.bg_rect = RoundedRectangle(pos=self.pos, size=self.size, radius=[dp(20)])
         self.bind(pos=self._update_bg, size=self._update_bg)
-        self._clock_event = Clock.schedule_interval(self._tick, 1)
+        self.clock.start()
+        self._clock_event = Clock.schedule_interval(self._tick, CLOCK_DISPLAY_INTERVAL)
 
     def _update_bg(self, *args):
         self.bg_rect.pos = self.pos
@@ -133,8 +146,6 @@ class RestPopup(Popup):
         root.add_widget(next_lbl)
 
         # Cronómetro grande
-        mins = self.remaining // 60
-        secs = self.remaining % 60
         timer_container = BoxLayout(size_hint_y=None, height=dp(160))
         with timer_container.canvas.before:
             Color(0.02, 0.02, 0.12, 1)
@@ -144,7 +155,7 @@ class RestPopup(Popup):
             size=lambda i, v: setattr(i._bg, 'size', v)
         )
         self.timer_lbl = Label(
-            text=f"{mins:02}:{secs:02}",
+            text=self.clock.display(),
             font_size=sp(120),
             bold=True,
             color=(1, 0.85, 0.1, 1),
@@ -234,13 +245,14 @@ class RestPopup(Popup):
         grid.add_widget(lbl)
 
     def _tick(self, dt):
-        if self.remaining > 0:
-            self.remaining -= 1
-            mins = self.remaining // 60
-            secs = self.remaining % 60
-            self.timer_lbl.text = f"{mins:02}:{secs:02}"
-        else:
+        if self.clock.expired:
             self._end_rest()
+            return
+        text = self.clock.display()
+        if text != self.timer_lbl.text:
+            self.timer_lbl.text = text
+        if self.on_tick:
+            self.on_tick()
 
     def _skip(self, *args):
         self._end_rest()
@@ -249,6 +261,7 @@ class RestPopup(Popup):
         if self._clock_event:
             self._clock_event.cancel()
             self._clock_event = None
+        self.clock.pause()
         self.dismiss()
         if self.on_rest_end_callback:
             Clock.schedule_once(lambda dt: self.on_rest_end_callback(), 0.2)
@@ -260,7 +273,8 @@ class CompetitorPanel(BoxLayout):
     penalty_score = NumericProperty(0)
     api_score = NumericProperty(0)
 
-    def __init__(self, name, color, nationality="", alumno_id=None, combate_id=None, **kwargs):
+    def __init__(self, name, color, nationality="", alumno_id=None, combate_id=None,
+                 lado="rojo", combat=None, **kwargs):
         super().__init__(**kwargs)
         self.orientation = 'vertical'
         self.name = name
@@ -268,10 +282,19 @@ class CompetitorPanel(BoxLayout):
         self.nationality = nationality
         self.alumno_id = alumno_id
         self.combate_id = combate_id
+        self.lado = lado
+        # Estado del combate: el panel solo envía eventos y pinta instantáneas
+        self.combat = combat or CombatStateMachine()
+        self._rendered_rounds = ()
+        # Contadores de la tabla de rounds (celdas reutilizadas)
+        self.table_cell_writes = 0
+        self.table_columns_added = 0
         self.parent_screen = None
         self.max_gamjeom = 3
-        self.round_scores = []   # puntajes por round
-        self.current_round_score = 0
+        self.disqualified = False
+        # Operaciones optimistas pendientes de confirmar por el servidor
+        self.score_journal = PendingOpsJournal()
+        self.gamjeom_journal = PendingOpsJournal()
 
         self.build_ui()
 
@@ -451,7 +474,8 @@ class CompetitorPanel(BoxLayout):
             height=dp(80),
             spacing=dp(3)
         )
-        self._rebuild_round_table()
+        self._build_round_table()
+        self._update_round_table()
         self.add_widget(self.round_table_layout)
 
         # ── INDICADORES LED JUECES ──
@@ -532,47 +556,126 @@ class CompetitorPanel(BoxLayout):
         self.add_widget(judges_row)
         self.add_widget(BoxLayout(size_hint_y=0.05))
 
-    def _rebuild_round_table(self):
-        self.round_table_layout.clear_widgets()
-
-        if not self.round_scores and not self.current_round_score:
-            empty = Label(
-                text="—",
-                font_size=sp(16),
-                color=(1, 1, 1, 0.4),
-                size_hint_y=None,
-                height=dp(30)
-            )
-            self.round_table_layout.add_widget(empty)
+    # Estilos de celda: (fondo, texto, tamaño, negrita)
+    _CELL_TITLE = ((0, 0, 0, 0.3), (0.7, 0.7, 0.7, 1), 14, False)
+    _CELL_SCORE_TITLE = ((0, 0, 0, 0.3), (0.7, 0.7, 0.7, 1), 14, True)
+    _CELL_HEADER = ((0, 0, 0, 0.25), (0.85, 0.85, 0.85, 1), 14, True)
+    _CELL_HEADER_CURRENT = ((0, 0, 0, 0.3), (1, 0.9, 0.3, 1), 14, True)
+    _CELL_SCORE = ((0, 0, 0, 0.2), (1, 1, 1, 1), 16, False)
+    _CELL_SCORE_CURRENT = ((0, 0, 0, 0.2), (1, 1, 0.4, 1), 16, True)
+
+    def _build_round_table(self):
+        """
+        Crea una sola vez las filas y un grupo de celdas para todos los rounds
+        del combate; después solo se cambia su texto. Una columna nueva se
+        agrega a la fila únicamente cuando se guarda un round.
+        """
+        self._table_empty = Label(
+            text="—",
+            font_size=sp(16),
+            color=(1, 1, 1, 0.4),
+            size_hint_y=None,
+            height=dp(30)
+        )
+        self._table_header_row = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(30), spacing=dp(2))
+        self._table_score_row = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(34), spacing=dp(2))
+        self._table_header_row.add_widget(self._make_table_cell("", self._CELL_TITLE))
+        self._table_score_row.add_widget(self._make_table_cell("PTS", self._CELL_SCORE_TITLE))
+        self._table_columns = []     # [(celda_encabezado, celda_puntaje, estilo_actual)]
+        self._table_visible = 0
+        self._table_showing = None   # "empty" | "table"
+        for _ in range(self.combat.snapshot.numero_rounds + 1):
+            self._table_columns.append(self._new_table_column())
+
+    def _new_table_column(self):
+        return [self._make_table_cell("", self._CELL_HEADER_CURRENT),
+                self._make_table_cell("", self._CELL_SCORE_CURRENT),
+                True]
+
+    def _update_round_table(self):
+        """Actualiza la tabla de rounds reutilizando las celdas existentes."""
+        layout = self.round_table_layout
+        rounds = self._rendered_rounds
+
+        if not rounds:
+            if self._table_showing != "empty":
+                layout.clear_widgets()
+                layout.cols = 1
+                layout.add_widget(self._table_empty)
+                self._table_showing = "empty"
             return
 
-        num_rounds = len(self.round_scores) + 1
-        self.round_table_layout.cols = num_rounds + 1
-        self.round_table_layout.size_hint_y = None
-        self.round_table_layout.height = dp(76)
-
-        header_row = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(30), spacing=dp(2))
-        self._add_table_cell(header_row, "", (0, 0, 0, 0.3), (0.7, 0.7, 0.7, 1), sp(14))
-        for i in range(len(self.round_scores)):
-            self._add_table_cell(header_row, f"R{i+1}", (0, 0, 0, 0.25), (0.85, 0.85, 0.85, 1), sp(14), bold=True)
-        self._add_table_cell(header_row, f"R{len(self.round_scores)+1}*", (0, 0, 0, 0.3), (1, 0.9, 0.3, 1), sp(14), bold=True)
-        self.round_table_layout.add_widget(header_row)
-
-        score_row = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(34), spacing=dp(2))
-        self._add_table_cell(score_row, "PTS", (0, 0, 0, 0.3), (0.7, 0.7, 0.7, 1), sp(14), bold=True)
-        for s in self.round_scores:
-            self._add_table_cell(score_row, str(s), (0, 0, 0, 0.2), (1, 1, 1, 1), sp(16))
-        self._add_table_cell(score_row, str(self.api_score), (0, 0, 0, 0.2), (1, 1, 0.4, 1), sp(16), bold=True)
-        self.round_table_layout.add_widget(score_row)
-
-    def _add_table_cell(self, parent, text, bg, fg, font_size, bold=False):
-        lbl = Label(text=text, font_size=font_size, bold=bold, color=fg)
+        columns = len(rounds) + 1
+        if self._table_showing != "table":
+            layout.clear_widgets()
+            layout.cols = self._table_visible + 1
+            layout.size_hint_y = None
+            layout.height = dp(76)
+            layout.add_widget(self._table_header_row)
+            layout.add_widget(self._table_score_row)
+            self._table_showing = "table"
+
+        if columns != self._table_visible:
+            self._resize_table(columns)
+
+        for i, value in enumerate(rounds):
+            header, cell, _ = self._table_columns[i]
+            self._set_cell_text(header, f"R{i+1}")
+            self._set_cell_text(cell, str(value))
+        header, cell, _ = self._table_columns[len(rounds)]
+        self._set_cell_text(header, f"R{len(rounds)+1}*")
+        self._set_cell_text(cell, str(self.api_score))
+
+    def _resize_table(self, columns):
+        """Agrega o quita columnas (solo cuando cambia la cantidad de rounds guardados)."""
+        while len(self._table_columns) < columns:
+            self._table_columns.append(self._new_table_column())
+        while self._table_visible < columns:
+            header, cell, _ = self._table_columns[self._table_visible]
+            self._table_header_row.add_widget(header)
+            self._table_score_row.add_widget(cell)
+            self._table_visible += 1
+            self.table_columns_added += 1
+        while self._table_visible > columns:
+            self._table_visible -= 1
+            header, cell, _ = self._table_columns[self._table_visible]
+            self._table_header_row.remove_widget(header)
+            self._table_score_row.remove_widget(cell)
+        self.round_table_layout.cols = columns + 1
+        for i in range(columns):
+            column = self._table_columns[i]
+            current = i == columns - 1
+            if column[2] != current:
+                self._style_table_cell(column[0], self._CELL_HEADER_CURRENT if current else self._CELL_HEADER)
+                self._style_table_cell(column[1], self._CELL_SCORE_CURRENT if current else self._CELL_SCORE)
+                column[2] = current
+
+    def _set_cell_text(self, cell, text):
+        if cell.text != text:
+            cell.text = text
+            self.table_cell_writes += 1
+
+    def _make_table_cell(self, text, style):
+        lbl = Label(text=text)
         with lbl.canvas.before:
-            Color(*bg)
+            lbl._bg = Color()
             lbl._r = Rectangle(pos=lbl.pos, size=lbl.size)
-        lbl.bind(pos=lambda i, v: setattr(i._r, 'pos', v),
-                 size=lambda i, v: setattr(i._r, 'size', v))
-        parent.add_widget(lbl)
+        lbl.bind(pos=self._sync_cell_rect, size=self._sync_cell_rect)
+        self._style_table_cell(lbl, style)
+        return lbl
+
+    @staticmethod
+    def _sync_cell_rect(cell, *args):
+        cell._r.pos = cell.pos
+        cell._r.size = cell.size
+
+    @staticmethod
+    def _style_table_cell(cell, style):
+        bg, fg, size, bold = style
+        cell._bg.rgba = bg
+        cell.color = fg
+        cell.font_size = sp(size)
+        cell.bold = bold
 
     @mainthread
     def set_judge_active(self, judge_name, active, auto_reset_seconds=3):
@@ -595,41 +698,60 @@ class CompetitorPanel(BoxLayout):
         self.rect.pos = self.pos
         self.rect.size = self.size
 
-    def save_round_score(self):
-        self.round_scores.append(self.api_score)
-        self._rebuild_round_table()
-        print(f"[CompetitorPanel] Round guardado para {self.name}: {self.api_score} → historial: {self.round_scores}")
+    @property
+    def round_scores(self):
+        """Puntajes por round (de la última instantánea del combate)"""
+        return list(self.combat.snapshot.athlete(self.lado).round_scores)
 
     def get_total_score(self):
         """Retorna la suma total de todos los rounds incluyendo el actual"""
-        return sum(self.round_scores) + self.api_score
+        return self.combat.snapshot.total(self.lado)
+
+    def render(self, snapshot):
+        """Pinta el puntaje, las faltas y la tabla de rounds de la instantánea"""
+        athlete = snapshot.athlete(self.lado)
+        if athlete.score != self.api_score or athlete.round_scores != self._rendered_rounds:
+            self.api_score = athlete.score
+            self._rendered_rounds = athlete.round_scores
+            self.score_label.text = str(self.api_score)
+            self._update_round_table()
+        if athlete.fouls != self.penalty_score:
+            self._paint_gamjeom(athlete.fouls)
 
     # ==================== MÉTODOS DE PUNTAJE ====================
 
     def add_score_api(self):
         if not self.alumno_id or not self.combate_id:
-            print("[CompetitorPanel] No hay alumno_id o combate_id")
+            log.warning("puntaje.sin_ids", lado=self.lado, alumno_id=self.alumno_id, combate_id=self.combate_id)
             return
         if self.parent_screen and not self.parent_screen.is_timer_active():
             self.show_status("Inicia el timer primero")
             return
+
+        if OPTIMISTIC_SCORING:
+            op_id, value = self.score_journal.record(+1)
+            self._publish_score(value, "point")
+            self.show_status("+1")
+            coalescer.add_puntaje(
+                self.combate_id, self.alumno_id, 1, token=op_id,
+                on_success=self._on_score_result,
+                on_error=self._rollback_score
+            )
+            return
+
         self.show_status("Guardando...")
 
-        def work():
-            try:
-                url = f"http://localhost:8080/apiPuntajes/puntaje/simple?combateId={self.combate_id}&alumnoId={self.alumno_id}&valorPuntaje=1"
-                response = requests.post(url, timeout=5)
-                if response.status_code in [200, 201]:
-                    data = response.json()
-                    new_count = data.get('newCount', 0)
-                    self.update_api_score(new_count)
-                    self.show_status("+1")
-                    Clock.schedule_once(lambda dt: self.clear_status(), 1)
-                else:
-                    self.show_status(f"✗ Error {response.status_code}")
-            except Exception as e:
-                self.show_status("✗ Error conexión")
-        Thread(target=work, daemon=True).start()
+        def on_success(data):
+            self.update_api_score(data.get('newCount', 0))
+            self.show_status("+1")
+            Clock.schedule_once(lambda dt: self.clear_status(), 1)
+
+        offline_queue.enqueue(
+            self._lane('puntaje'), "puntaje.add",
+            {"combateId": self.combate_id, "alumnoId": self.alumno_id, "valorPuntaje": 1},
+            on_success=lambda data, _: on_success(data),
+            on_error=lambda e, _: self.show_status(_error_text(e))
+        )
 
     def subtract_score_api(self):
         if not self.alumno_id:
@@ -637,51 +759,106 @@ class CompetitorPanel(BoxLayout):
         if self.parent_screen and not self.parent_screen.is_timer_active():
             self.show_status("Inicia el timer primero")
             return
-        if self.api_score <= 0:
+        if self.combat.snapshot.athlete(self.lado).score <= 0:
             self.show_status("Ya está en 0")
             return
+
+        if OPTIMISTIC_SCORING:
+            op_id, value = self.score_journal.record(-1)
+            self._publish_score(value, "undo")
+            self.show_status("-1")
+            coalescer.subtract_puntaje(
+                self.combate_id, self.alumno_id, token=op_id,
+                on_success=self._on_score_result,
+                on_error=self._rollback_score
+            )
+            return
+
         self.show_status("Eliminando...")
 
-        def work():
-            try:
-                url = f"http://localhost:8080/apiPuntajes/puntaje/alumno/{self.alumno_id}/last"
-                response = requests.delete(url, timeout=5)
-                if response.status_code == 200:
-                    data = response.json()
-                    new_count = data.get('newCount', 0)
-                    self.update_api_score(new_count)
-                    self.show_status("-1")
-                    Clock.schedule_once(lambda dt: self.clear_status(), 1)
-                elif response.status_code == 204:
-                    self.refresh_score()
-                    self.show_status("✓ -1")
-                    Clock.schedule_once(lambda dt: self.clear_status(), 1)
-                else:
-                    self.show_status(f"✗ Error {response.status_code}")
-            except Exception as e:
-                self.show_status("✗ Error conexión")
-        Thread(target=work, daemon=True).start()
+        def on_success(data):
+            if 'newCount' in data:
+                self.update_api_score(data.get('newCount', 0))
+                self.show_status("-1")
+            else:
+                # 204 sin cuerpo: consultar el conteo actualizado
+                self.refresh_score()
+                self.show_status("✓ -1")
+            Clock.schedule_once(lambda dt: self.clear_status(), 1)
+
+        offline_queue.enqueue(
+            self._lane('puntaje'), "puntaje.delete", {"alumnoId": self.alumno_id},
+            on_success=lambda data, _: on_success(data),
+            on_error=lambda e, _: self.show_status(_error_text(e))
+        )
 
     def refresh_score(self):
         if not self.alumno_id:
             return
-        def work():
-            try:
-                url = f"http://localhost:8080/apiPuntajes/puntaje/alumno/{self.alumno_id}/count"
-                response = requests.get(url, timeout=2)
-                if response.status_code == 200:
-                    new_count = response.json().get('count', 0)
-                    self.update_api_score(new_count)
-            except:
-                pass
-        Thread(target=work, daemon=True).start()
+        # La versión se toma al pedir: la respuesta no puede pisar nada que llegue después
+        version = self.score_journal.ticket()
+        scoring.get_puntaje_count(self.alumno_id, on_success=lambda count: self.update_api_score(count, version))
+
+    def _lane(self, tipo):
+        """Carril serie de la cola offline para este alumno."""
+        return f"{self.combate_id}:{self.alumno_id}:{tipo}"
+
+    def _on_score_result(self, data, op_ids):
+        if data is None:
+            # Lote anulado en local (+1 y -1 antes de enviarse)
+            self._reconcile_score(op_ids, None)
+            return
+        self._reconcile_score(op_ids, data.get('newCount'), self.score_journal.ticket())
+        if 'newCount' not in data:
+            # 204 sin cuerpo: se da por aplicado y se confirma con un refresh
+            self.refresh_score()
+
+    @mainthread
+    def _reconcile_score(self, op_ids, new_count, version=None):
+        value, diverged = self.score_journal.acknowledge(op_ids, new_count, version)
+        self._publish_score(value)
+        if diverged:
+            self._show_divergence(self.show_status, value)
+        elif not self.score_journal.has_pending():
+            Clock.schedule_once(lambda dt: self.clear_status(), 1)
 
     @mainthread
-    def update_api_score(self, new_score):
-        self.api_score = new_score
-        self.score_label.text = str(self.api_score)
-        self._rebuild_round_table()
-        print(f"[CompetitorPanel] Score actualizado: {self.name} = {self.api_score}")
+    def _rollback_score(self, exc, op_ids):
+        value, _ = self.score_journal.reject(op_ids)
+        self._publish_score(value)
+        self.show_status(f"{_error_text(exc)} ↺")
+
+    def update_api_score(self, new_score, version=None):
+        """
+        Valor autoritativo (WebSocket o refresh); se difiere si hay clics en
+        vuelo y se descarta si es más viejo que el último aplicado. Sin
+        `version`, cuenta desde que se recibe (antes de pasar al hilo principal).
+        """
+        if version is None:
+            version = self.score_journal.ticket()
+        mainthread(self.apply_api_score)(new_score, version)
+
+    def apply_api_score(self, new_score, version):
+        """Igual que update_api_score, ya en el hilo principal y con versión."""
+        result = self.score_journal.observe(new_score, version)
+        if result is None:
+            return
+        self._publish_score(result[0])
+
+    def _publish_score(self, value, kind="score_sync"):
+        """Envía el valor a mostrar a la máquina de estados; se pinta en render()."""
+        self.combat.apply(kind, lado=self.lado, value=value)
+
+    def _show_divergence(self, show, value):
+        """Marca visualmente que el servidor corrigió el valor optimista."""
+        show(f"↺ corregido a {value}")
+        Clock.schedule_once(lambda dt: show(""), 2)
+
+    def get_reconciliation_stats(self):
+        return {
+            "puntaje": self.score_journal.stats(),
+            "gamjeom": self.gamjeom_journal.stats(),
+        }
 
     @mainthread
     def show_status(self, text):
@@ -699,29 +876,42 @@ class CompetitorPanel(BoxLayout):
         if self.parent_screen and not self.parent_screen.is_timer_active():
             self.show_gamjeom_status("Inicia el timer primero")
             return
+
+        if OPTIMISTIC_SCORING:
+            op_id, value = self.gamjeom_journal.record(+1)
+            self._publish_gamjeom(value, "foul")
+            if value >= self.max_gamjeom:
+                # La descalificación es irreversible: se espera al servidor
+                self.show_gamjeom_status(f"Falta {value}/3 — confirmando...")
+            else:
+                self.show_gamjeom_status(f"Falta {value}/3")
+            offline_queue.enqueue(
+                self._lane('falta'), "falta.add",
+                {"combateId": self.combate_id, "alumnoId": self.alumno_id},
+                tokens=[op_id],
+                on_success=self._on_gamjeom_result,
+                on_error=self._rollback_gamjeom
+            )
+            return
+
         self.show_gamjeom_status("Registrando falta...")
 
-        def work():
-            try:
-                url = f"http://localhost:8080/apiGamJeom/falta/simple?combateId={self.combate_id}&alumnoId={self.alumno_id}"
-                response = requests.post(url, timeout=5)
-                if response.status_code in [200, 201]:
-                    data = response.json()
-                    total_faltas = data.get('totalFaltas', 0)
-                    descalificado = data.get('descalificado', False)
-                    self.update_gamjeom_count(total_faltas)
-                    if descalificado:
-                        self.show_gamjeom_status("DESCALIFICADO")
-                        if self.parent_screen:
-                            self.parent_screen.on_player_disqualified(self.alumno_id, self.name)
-                    else:
-                        self.show_gamjeom_status(f"Falta {total_faltas}/3")
-                        Clock.schedule_once(lambda dt: self.clear_gamjeom_status(), 2)
-                else:
-                    self.show_gamjeom_status(f"✗ Error {response.status_code}")
-            except:
-                self.show_gamjeom_status("✗ Error conexión")
-        Thread(target=work, daemon=True).start()
+        def on_success(data):
+            total_faltas = data.get('totalFaltas', 0)
+            descalificado = data.get('descalificado', False)
+            self.update_gamjeom_count(total_faltas)
+            if descalificado:
+                self._on_disqualified()
+            else:
+                self.show_gamjeom_status(f"Falta {total_faltas}/3")
+                Clock.schedule_once(lambda dt: self.clear_gamjeom_status(), 2)
+
+        offline_queue.enqueue(
+            self._lane('falta'), "falta.add",
+            {"combateId": self.combate_id, "alumnoId": self.alumno_id},
+            on_success=lambda data, _: on_success(data),
+            on_error=lambda e, _: self.show_gamjeom_status(_error_text(e))
+        )
 
     def subtract_gamjeom_api(self):
         if not self.alumno_id or not self.combate_id:
@@ -729,43 +919,91 @@ class CompetitorPanel(BoxLayout):
         if self.parent_screen and not self.parent_screen.is_timer_active():
             self.show_gamjeom_status("Inicia el timer primero")
             return
-        if self.penalty_score <= 0:
+        if self.combat.snapshot.athlete(self.lado).fouls <= 0:
             self.show_gamjeom_status("Ya está en 0")
             return
+
+        if OPTIMISTIC_SCORING:
+            op_id, value = self.gamjeom_journal.record(-1)
+            self._publish_gamjeom(value, "foul_undo")
+            self.show_gamjeom_status("Falta eliminada")
+            offline_queue.enqueue(
+                self._lane('falta'), "falta.delete",
+                {"alumnoId": self.alumno_id, "combateId": self.combate_id},
+                tokens=[op_id],
+                on_success=self._on_gamjeom_result,
+                on_error=self._rollback_gamjeom
+            )
+            return
+
         self.show_gamjeom_status("Eliminando falta...")
 
-        def work():
-            try:
-                url = f"http://localhost:8080/apiGamJeom/falta/alumno/{self.alumno_id}/combate/{self.combate_id}/last"
-                response = requests.delete(url, timeout=5)
-                if response.status_code == 200:
-                    data = response.json()
-                    new_count = data.get('newCount', 0)
-                    self.update_gamjeom_count(new_count)
-                    self.show_gamjeom_status("Falta eliminada")
-                    Clock.schedule_once(lambda dt: self.clear_gamjeom_status(), 1)
-                else:
-                    self.show_gamjeom_status(f"✗ Error {response.status_code}")
-            except:
-                self.show_gamjeom_status("✗ Error conexión")
-        Thread(target=work, daemon=True).start()
+        def on_success(data):
+            self.update_gamjeom_count(data.get('newCount', 0))
+            self.show_gamjeom_status("Falta eliminada")
+            Clock.schedule_once(lambda dt: self.clear_gamjeom_status(), 1)
+
+        offline_queue.enqueue(
+            self._lane('falta'), "falta.delete",
+            {"alumnoId": self.alumno_id, "combateId": self.combate_id},
+            on_success=lambda data, _: on_success(data),
+            on_error=lambda e, _: self.show_gamjeom_status(_error_text(e))
+        )
 
     def refresh_gamjeom(self):
         if not self.alumno_id or not self.combate_id:
             return
-        def work():
-            try:
-                url = f"http://localhost:8080/apiGamJeom/falta/alumno/{self.alumno_id}/combate/{self.combate_id}/count"
-                response = requests.get(url, timeout=2)
-                if response.status_code == 200:
-                    new_count = response.json().get('count', 0)
-                    self.update_gamjeom_count(new_count)
-            except:
-                pass
-        Thread(target=work, daemon=True).start()
+        version = self.gamjeom_journal.ticket()
+        scoring.get_falta_count(self.alumno_id, self.combate_id,
+                                on_success=lambda count: self.update_gamjeom_count(count, version))
+
+    def _on_gamjeom_result(self, data, op_ids):
+        self._reconcile_gamjeom(data, op_ids, self.gamjeom_journal.ticket())
 
     @mainthread
-    def update_gamjeom_count(self, count):
+    def _reconcile_gamjeom(self, data, op_ids, version=None):
+        # POST devuelve totalFaltas; DELETE devuelve newCount
+        count = data.get('totalFaltas', data.get('newCount'))
+        value, diverged = self.gamjeom_journal.acknowledge(op_ids, count, version)
+        self._publish_gamjeom(value)
+        if data.get('descalificado', False):
+            self._on_disqualified()
+        elif diverged:
+            self._show_divergence(self.show_gamjeom_status, value)
+        elif not self.gamjeom_journal.has_pending():
+            Clock.schedule_once(lambda dt: self.clear_gamjeom_status(), 2)
+
+    @mainthread
+    def _rollback_gamjeom(self, exc, op_ids):
+        value, _ = self.gamjeom_journal.reject(op_ids)
+        self._publish_gamjeom(value)
+        self.show_gamjeom_status(f"{_error_text(exc)} ↺")
+
+    def _on_disqualified(self):
+        if self.disqualified:
+            return
+        self.disqualified = True
+        self.show_gamjeom_status("DESCALIFICADO")
+        if self.parent_screen:
+            self.parent_screen.on_player_disqualified(self.alumno_id, self.name)
+
+    def update_gamjeom_count(self, count, version=None):
+        """Valor autoritativo de faltas; se difiere si hay faltas en vuelo y se descarta si es viejo."""
+        if version is None:
+            version = self.gamjeom_journal.ticket()
+        self._apply_gamjeom_count(count, version)
+
+    @mainthread
+    def _apply_gamjeom_count(self, count, version):
+        result = self.gamjeom_journal.observe(count, version)
+        if result is None:
+            return
+        self._publish_gamjeom(result[0])
+
+    def _publish_gamjeom(self, value, kind="foul_sync"):
+        self.combat.apply(kind, lado=self.lado, value=value)
+
+    def _paint_gamjeom(self, count):
         self.penalty_score = count
         self.penalty_label.text = str(count)
         if count >= 2:
@@ -786,7 +1024,7 @@ class CompetitorPanel(BoxLayout):
     def reset_scores(self):
         self.clear_status()
         self.clear_gamjeom_status()
-        self._rebuild_round_table()
+        self._update_round_table()
 
 
 # ------------------ POPUP TIEMPO MÉDICO ------------------
@@ -795,7 +1033,7 @@ class MedicalTimePopup(Popup):
         self.athlete_name = athlete_name
         self.athlete_color = athlete_color
         self.on_result_callback = on_result_callback
-        self.remaining = 60
+        self.clock = CountdownClock(60)
         self._clock_event = None
 
         content = self._build_content()
@@ -825,7 +1063,8 @@ class MedicalTimePopup(Popup):
 
     def _start_clock(self, *args):
         if self._clock_event is None:
-            self._clock_event = Clock.schedule_interval(self._tick, 1)
+            self.clock.start()
+            self._clock_event = Clock.schedule_interval(self._tick, CLOCK_DISPLAY_INTERVAL)
 
     def _build_content(self):
         root = BoxLayout(orientation='vertical', spacing=dp(8), padding=[dp(20), dp(14)])
@@ -928,20 +1167,21 @@ class MedicalTimePopup(Popup):
         return root
 
     def _tick(self, dt):
-        if self.remaining > 0:
-            self.remaining -= 1
-        mins = self.remaining // 60
-        secs = self.remaining % 60
-        self.timer_lbl.text = f"{mins:02}:{secs:02}"
-        if self.remaining <= 10:
+        remaining = self.clock.remaining()
+        text = self.clock.display()
+        if text == self.timer_lbl.text:
+            return
+        self.timer_lbl.text = text
+        if remaining <= 10:
             self.timer_lbl.color = (1, 0.3, 0.3, 1)
-        elif self.remaining <= 20:
+        elif remaining <= 20:
             self.timer_lbl.color = (1, 0.75, 0.2, 1)
 
     def _stop_clock(self):
         if self._clock_event:
             self._clock_event.cancel()
             self._clock_event = None
+        self.clock.pause()
 
     def _result(self, result):
         self._stop_clock()
@@ -1157,22 +1397,105 @@ class FinalResultPopup(Popup):
 class CenterPanel(BoxLayout):
     time_str = StringProperty("03:00")
     round_str = StringProperty("Round 1")
-    combat_started = BooleanProperty(False)
 
-    def __init__(self, duracion_round=180, duracion_descanso=60, numero_rounds=3, **kwargs):
+    def __init__(self, duracion_round=180, duracion_descanso=60, numero_rounds=3, combat=None, **kwargs):
         super().__init__(**kwargs)
-        self.timer_running = False
-        self.round_number = 1
-        self.numero_rounds = numero_rounds
-        self.duracion_round = duracion_round
-        self.duracion_descanso = duracion_descanso
-        self.remaining_time = duracion_round
-        self.is_rest_time = False
+        # Estado del combate: el panel solo envía eventos y pinta instantáneas
+        self.combat = combat or CombatStateMachine(numero_rounds, duracion_round, duracion_descanso)
+        # Reloj monotónico del round y del descanso; Clock de Kivy solo repinta
+        self.clock = CountdownClock(self.combat.snapshot.remaining)
+        self.rest_clock = None
+        self._clock_event = None
+        self._last_publish = 0.0
         self._rest_popup = None
         self.parent_screen = None
+        self.time_str = self._format_time(self.remaining_time)
+        self.round_str = f"Round {self.round_number}"
 
         self.build_ui()
 
+    # ---- Lectura del estado (solo lectura, desde la instantánea) ----
+    @property
+    def round_number(self):
+        return self.combat.snapshot.round_number
+
+    @property
+    def numero_rounds(self):
+        return self.combat.snapshot.numero_rounds
+
+    @property
+    def duracion_round(self):
+        return self.combat.snapshot.duracion_round
+
+    @property
+    def duracion_descanso(self):
+        return self.combat.snapshot.duracion_descanso
+
+    @property
+    def remaining_time(self):
+        return self.combat.snapshot.remaining
+
+    @property
+    def is_rest_time(self):
+        return self.combat.snapshot.is_rest
+
+    @property
+    def combat_started(self):
+        return self.combat.snapshot.combat_active
+
+    @property
+    def timer_running(self):
+        return self.combat.snapshot.phase == RUNNING
+
+    @staticmethod
+    def _format_time(seconds):
+        return f"{seconds // 60:02}:{seconds % 60:02}"
+
+    def publish_clock(self):
+        """Publica el tiempo autoritativo (round o descanso) para los tableros de visualización."""
+        self._last_publish = time.monotonic()
+        if not self.parent_screen:
+            return
+        snapshot = self.combat.snapshot
+        clock = self.rest_clock if snapshot.is_rest and self.rest_clock else self.clock
+        state = clock.state()
+        state.update(round=snapshot.round_number, phase=snapshot.phase)
+        self.parent_screen.publish_clock(state)
+
+    def _maybe_publish_clock(self):
+        if time.monotonic() - self._last_publish >= CLOCK_PUBLISH_INTERVAL:
+            self.publish_clock()
+
+    def render(self, snapshot):
+        """Pinta cronómetro, round y estado a partir de la instantánea"""
+        if snapshot.finished:
+            self.time_str = "FIN"
+            round_text, status, color = {
+                "abandono": ("ABANDONO", "COMBATE TERMINADO", (0.8, 0.5, 0.1, 1)),
+                "descalificacion": ("DESCALIFICACIÓN", "COMBATE TERMINADO", (0.8, 0.2, 0.2, 1)),
+            }.get(snapshot.result, ("Combate Finalizado", "COMBATE FINALIZADO", (0.5, 0.5, 0.5, 1)))
+        else:
+            self.time_str = self._format_time(snapshot.remaining)
+            round_text = f"Round {snapshot.round_number}"
+            if snapshot.phase == RUNNING:
+                status, color = "COMBATE EN CURSO", (0.2, 0.7, 0.2, 1)
+            elif snapshot.phase == PAUSED and snapshot.last_event == 'medical_end':
+                status, color = "LISTO PARA INICIAR", (0.2, 0.7, 0.2, 1)
+            elif snapshot.phase == PAUSED:
+                status, color = "COMBATE PAUSADO", (0.8, 0.6, 0, 1)
+            elif snapshot.phase == REST:
+                status, color = "DESCANSO", (0.8, 0.6, 0, 1)
+            elif snapshot.phase == MEDICAL:
+                status, color = "TIEMPO MÉDICO", (1, 0.75, 0.1, 1)
+            elif not snapshot.started and snapshot.round_number == 1:
+                status, color = "COMBATE NO INICIADO", (0.8, 0.2, 0.2, 1)
+            else:
+                status, color = "LISTO PARA INICIAR", (0.8, 0.6, 0, 1)
+        self.round_str = round_text
+        self.round_label.text = round_text
+        self.combat_status_label.text = status
+        self.combat_status_label.color = color
+
     def build_ui(self):
         self.clear_widgets()
         self.orientation = 'vertical'
@@ -1195,6 +1518,16 @@ class CenterPanel(BoxLayout):
         )
         self.add_widget(self.combat_status_label)
 
+        # Estado de la cola offline (profundidad y reenvío)
+        self.sync_label = Label(
+            text="",
+            font_size=ResponsiveHelper.get_font_size(11),
+            color=(0.2, 0.6, 0.2, 1),
+            size_hint_y=None,
+            height=dp(16)
+        )
+        self.add_widget(self.sync_label)
+
         # Round label
         self.round_label = Label(
             text=self.round_str,
@@ -1386,14 +1719,16 @@ class CenterPanel(BoxLayout):
                     athlete_name = self.parent_screen.com2_panel.name
 
             def _open(dt):
+                # El reloj del round queda congelado al centésimo durante el tiempo médico
+                self.pause_timer()
+                if self.combat.apply("medical_start", lado=color).phase != MEDICAL:
+                    return
                 med = MedicalTimePopup(
                     athlete_name=athlete_name,
                     athlete_color=color,
                     on_result_callback=self.on_medical_result
                 )
                 med.open()
-                self.combat_status_label.text = "TIEMPO MÉDICO"
-                self.combat_status_label.color = (1, 0.75, 0.1, 1)
 
             Clock.schedule_once(_open, 0.25)
 
@@ -1417,24 +1752,17 @@ class CenterPanel(BoxLayout):
         sel_popup.open()
 
     def on_medical_result(self, result, athlete_color, athlete_name):
-        print(f"[CenterPanel] Resultado médico: {result} — {athlete_name} ({athlete_color})")
+        log.info("medico.resultado", resultado=result, atleta=athlete_name, color=athlete_color)
+        self.pause_timer()
+        self.combat.apply("medical_end", lado=athlete_color, result=result)
 
         if result == 'continuar':
-            self.combat_status_label.text = "LISTO PARA INICIAR"
-            self.combat_status_label.color = (0.2, 0.7, 0.2, 1)
             self.mostrar_mensaje(
                 titulo="Tiempo Médico",
                 mensaje=f"{athlete_name} continúa\nel combate"
             )
 
         elif result == 'abandono':
-            self.pause_timer()
-            self.combat_started = False
-            self.time_str = "FIN"
-            self.time_label.text = self.time_str
-            self.round_label.text = "ABANDONO"
-            self.combat_status_label.text = "COMBATE TERMINADO"
-            self.combat_status_label.color = (0.8, 0.5, 0.1, 1)
             winner_color = "AZUL" if athlete_color == 'rojo' else "ROJO"
             self.mostrar_mensaje(
                 titulo="Abandono",
@@ -1442,13 +1770,6 @@ class CenterPanel(BoxLayout):
             )
 
         elif result == 'descalificacion':
-            self.pause_timer()
-            self.combat_started = False
-            self.time_str = "FIN"
-            self.time_label.text = self.time_str
-            self.round_label.text = "DESCALIFICACIÓN"
-            self.combat_status_label.text = "COMBATE TERMINADO"
-            self.combat_status_label.color = (0.8, 0.2, 0.2, 1)
             winner_color = "AZUL" if athlete_color == 'rojo' else "ROJO"
             self.mostrar_mensaje(
                 titulo="Descalificación",
@@ -1456,23 +1777,31 @@ class CenterPanel(BoxLayout):
             )
 
     def start_timer(self):
-        if not self.timer_running:
-            self.timer_running = True
-            self.combat_started = True
-            self.combat_status_label.text = "COMBATE EN CURSO"
-            self.combat_status_label.color = (0.2, 0.7, 0.2, 1)
-            Clock.schedule_interval(self.update_time, 1)
-            print("[CenterPanel] Timer iniciado - Combate ACTIVO")
-            if self.parent_screen:
-                self.parent_screen.on_combat_started()
+        if self.timer_running:
+            return
+        if self.combat.apply("start").phase != RUNNING:
+            return
+        self.clock.start()
+        if self._clock_event:
+            self._clock_event.cancel()
+        self._clock_event = Clock.schedule_interval(self.update_time, CLOCK_DISPLAY_INTERVAL)
+        log.info("timer.iniciado", round=self.round_number)
+        if self.parent_screen:
+            self.parent_screen.on_combat_started()
 
     def pause_timer(self):
-        self.timer_running = False
-        Clock.unschedule(self.update_time)
-        if self.combat_started:
-            self.combat_status_label.text = "COMBATE PAUSADO"
-            self.combat_status_label.color = (0.8, 0.6, 0, 1)
-        print("[CenterPanel] Timer pausado")
+        if self._clock_event:
+            self._clock_event.cancel()
+            self._clock_event = None
+        self.clock.pause()
+        if self.timer_running:
+            self.combat.apply("time", remaining=int(math.ceil(self.clock.remaining())))
+            self.combat.apply("pause")
+        log.info("timer.pausado", round=self.round_number)
+
+    def reset_clock(self):
+        """Deja el reloj con el tiempo del round actual (detenido)."""
+        self.clock.reset(self.remaining_time)
 
     def is_combat_active(self):
         return self.combat_started
@@ -1481,42 +1810,45 @@ class CenterPanel(BoxLayout):
         return self.timer_running
 
     def update_time(self, dt):
-        if self.remaining_time > 0:
-            self.remaining_time -= 1
-            minutes = self.remaining_time // 60
-            seconds = self.remaining_time % 60
-            self.time_str = f"{minutes:02}:{seconds:02}"
-        else:
+        # El tiempo sale del reloj monotónico; aquí solo se muestrea y se pinta
+        remaining = self.clock.remaining()
+        whole = int(math.ceil(remaining))
+        if whole != self.remaining_time:
+            self.combat.apply("time", remaining=whole)
+        if remaining <= 0:
             self.pause_timer()
             self._on_round_ended()
+            return
+        self._maybe_publish_clock()
 
     def _on_round_ended(self):
-        print(f"[CenterPanel] Round {self.round_number} terminado")
+        round_number = self.round_number
+        log.info("round.terminado", round=round_number)
 
         if self.parent_screen:
-            self.parent_screen.save_round_scores()
+            snapshot = self.parent_screen.save_round_scores()
+        else:
+            snapshot = self.combat.apply("round_end")
 
-        if self.round_number >= self.numero_rounds:
+        if snapshot.finished:
             self.end_combat_automatically()
             return
+        if not snapshot.is_rest:
+            return
 
-        self.combat_started = False
-        self.is_rest_time = True
-        self.combat_status_label.text = "DESCANSO"
-        self.combat_status_label.color = (0.8, 0.6, 0, 1)
-
-        round_scores = {}
-        if self.parent_screen:
-            round_scores = {
-                'rojo': list(self.parent_screen.com1_panel.round_scores),
-                'azul': list(self.parent_screen.com2_panel.round_scores),
-            }
+        round_scores = {
+            'rojo': list(snapshot.rojo.round_scores),
+            'azul': list(snapshot.azul.round_scores),
+        }
 
+        self.rest_clock = CountdownClock(self.duracion_descanso)
         self._rest_popup = RestPopup(
-            round_number=self.round_number,
+            round_number=round_number,
             duracion_descanso=self.duracion_descanso,
             on_rest_end_callback=self._after_rest,
-            round_scores=round_scores
+            round_scores=round_scores,
+            clock=self.rest_clock,
+            on_tick=self._maybe_publish_clock
         )
         self._rest_popup.open()
 
@@ -1524,38 +1856,22 @@ class CenterPanel(BoxLayout):
         self.start_new_round()
 
     def start_new_round(self):
-        if self.round_number >= self.numero_rounds:
-            self.end_combat_automatically()
+        if self.combat.apply("rest_end").phase != READY:
             return
-
-        self.round_number += 1
-        self.round_str = f"Round {self.round_number}"
-        self.round_label.text = self.round_str
-        self.is_rest_time = False
-        self.combat_started = False
-        self.remaining_time = self.duracion_round
-        minutes = self.remaining_time // 60
-        seconds = self.remaining_time % 60
-        self.time_str = f"{minutes:02}:{seconds:02}"
-        self.combat_status_label.text = "LISTO PARA INICIAR"
-        self.combat_status_label.color = (0.8, 0.6, 0, 1)
+        self.rest_clock = None
+        self.reset_clock()
 
         if self.parent_screen:
             self.parent_screen.reset_competitor_scores()
 
-        print(f"[CenterPanel] Round {self.round_number} listo - Presiona INICIAR")
+        log.info("round.listo", round=self.round_number)
 
     def end_combat_automatically(self):
         """Finaliza el combate automáticamente y muestra el popup con el ganador."""
         self.pause_timer()
-        self.combat_started = False
-        self.is_rest_time = False
-        self.time_str = "FIN"
-        self.time_label.text = self.time_str
-        self.round_label.text = "Combate Finalizado"
-        self.combat_status_label.text = "COMBATE FINALIZADO"
-        self.combat_status_label.color = (0.5, 0.5, 0.5, 1)
-        print(f"[CenterPanel] Combate finalizado - {self.numero_rounds} rounds completados")
+        log.info("combate.finalizado", rounds=self.numero_rounds)
+        if self.parent_screen:
+            self.parent_screen.on_combat_finished()
 
         # Mostrar popup de resultado final con ganador
         if self.parent_screen:
@@ -1569,13 +1885,14 @@ class CenterPanel(BoxLayout):
     def _show_final_result_popup(self):
         """Construye y abre el FinalResultPopup con los datos reales."""
         ps = self.parent_screen
+        snapshot = self.combat.snapshot
         nombre_rojo   = ps.com1_panel.name
-        rounds_rojo   = list(ps.com1_panel.round_scores)
-        score_rojo    = ps.com1_panel.api_score
+        rounds_rojo   = list(snapshot.rojo.round_scores)
+        score_rojo    = snapshot.rojo.score
 
         nombre_azul   = ps.com2_panel.name
-        rounds_azul   = list(ps.com2_panel.round_scores)
-        score_azul    = ps.com2_panel.api_score
+        rounds_azul   = list(snapshot.azul.round_scores)
+        score_azul    = snapshot.azul.score
 
         popup = FinalResultPopup(
             nombre_rojo=nombre_rojo,
@@ -1587,14 +1904,11 @@ class CenterPanel(BoxLayout):
         )
         popup.open()
 
-    def end_combat_by_disqualification(self, player_name):
+    def end_combat_by_disqualification(self, player_name, lado=None):
         self.pause_timer()
-        self.combat_started = False
-        self.time_str = "FIN"
-        self.time_label.text = self.time_str
-        self.round_label.text = "DESCALIFICACIÓN"
-        self.combat_status_label.text = "COMBATE TERMINADO"
-        self.combat_status_label.color = (0.8, 0.2, 0.2, 1)
+        if lado:
+            self.combat.apply("disqualification", lado=lado)
+        log.info("descalificacion", atleta=player_name)
 
     def mostrar_mensaje(self, titulo, mensaje, confirm_callback=None):
         content = BoxLayout(orientation='vertical', spacing=dp(15), padding=dp(20))
@@ -1684,18 +1998,15 @@ class CenterPanel(BoxLayout):
         )
 
     def next_round(self, instance):
-        if self.parent_screen:
-            self.parent_screen.save_round_scores()
-
-        self.round_number += 1
-        self.round_str = f"Round {self.round_number}"
-        self.round_label.text = self.round_str
-        self.remaining_time = self.duracion_round
-        minutes = self.remaining_time // 60
-        seconds = self.remaining_time % 60
-        self.time_str = f"{minutes:02}:{seconds:02}"
-        self.is_rest_time = False
         self.pause_timer()
+        before = self.combat.snapshot.seq
+        if self.parent_screen:
+            snapshot = self.parent_screen.save_round_scores("next_round")
+        else:
+            snapshot = self.combat.apply("next_round")
+        if snapshot.seq == before:
+            return
+        self.reset_clock()
 
         if self.parent_screen:
             self.parent_screen.reset_competitor_scores()
@@ -1708,18 +2019,14 @@ class CenterPanel(BoxLayout):
     def end_combat(self, instance):
         """Finalizar combate manualmente — también muestra el popup de ganador."""
         self.pause_timer()
-        self.combat_started = False
-        self.time_str = "FIN"
-        self.time_label.text = self.time_str
-        self.round_label.text = "Combate Finalizado"
-        self.combat_status_label.text = "COMBATE FINALIZADO"
-        self.combat_status_label.color = (0.5, 0.5, 0.5, 1)
 
         # Guardar puntaje del round actual antes de mostrar resultado
         if self.parent_screen:
-            self.parent_screen.save_round_scores()
+            self.parent_screen.save_round_scores("finish")
+            self.parent_screen.on_combat_finished()
             self._show_final_result_popup()
         else:
+            self.combat.apply("finish")
             self.mostrar_mensaje(
                 titulo="Combate Finalizado",
                 mensaje="El combate ha sido\ndado por finalizado"
@@ -1744,16 +2051,55 @@ class MainScreentabc(Screen):
         self.combate_id = None
         self.id_alumno_rojo = None
         self.id_alumno_azul = None
-        self.ws = None
-        self.ws_thread = None
-        self.ws_keepalive = None
+        self.realtime = RealtimeConnection(
+            "tablero_central",
+            on_event=self._on_realtime_event,
+            on_resync=self.fetch_initial_scores
+        )
+        self._sync_event = None
+        self.combat = None
+        self._published_key = None
+        self.frame_counter = FrameTimeCounter()
+        self._frame_event = None
+        self._render_trigger = Clock.create_trigger(self._render_combat)
+        self.combat_renders = 0
+        # Eventos del WebSocket: último estado por atleta, aplicado una vez por frame
+        self.realtime_events = FrameDispatcher("tablero_central", self._apply_realtime_event)
         self.build_ui()
 
+    def _bind_combat(self, combat):
+        """Sustituye la máquina de estados del combate y se suscribe a sus instantáneas."""
+        if self.combat is not None:
+            self.combat.unsubscribe(self._on_combat_snapshot)
+        self.combat = combat
+        combat.subscribe(self._on_combat_snapshot)
+        return combat
+
+    def _on_combat_snapshot(self, snapshot):
+        # Cualquier hilo: varias instantáneas en el mismo frame cuestan un solo render
+        self._render_trigger()
+
+    def _render_combat(self, *args):
+        self.combat_renders += 1
+        snapshot = self.combat.snapshot
+        self.center_panel.render(snapshot)
+        self.com1_panel.render(snapshot)
+        self.com2_panel.render(snapshot)
+        # Cada cambio de fase o de round se publica al momento a los visores
+        key = (snapshot.phase, snapshot.round_number)
+        if key != self._published_key:
+            self._published_key = key
+            self.center_panel.publish_clock()
+
+    def publish_clock(self, state):
+        """Envía el tiempo autoritativo por el stream del combate (lo retransmite el servidor)."""
+        if not self.combate_id:
+            return
+        message = dict(state, event="clock", combateId=self.combate_id, sent_at=int(time.time() * 1000))
+        self.realtime.send(message)
+
     def set_competitors(self, name1, nat1, name2, nat2, combate_data=None):
-        print("\n" + "=" * 60)
-        print("[MainScreentabc] CONFIGURANDO COMPETIDORES")
-        print(f"Rojo: {name1} ({nat1})")
-        print(f"Azul: {name2} ({nat2})")
+        log.info("competidores", rojo=name1, nat_rojo=nat1, azul=name2, nat_azul=nat2)
 
         if combate_data:
             self.combate_id = combate_data.get('idCombate') or combate_data.get('id')
@@ -1769,9 +2115,48 @@ class MainScreentabc(Screen):
 
         self.rebuild_with_data(name1, nat1, name2, nat2, duracion_round, duracion_descanso, numero_rounds)
 
+        if self.combate_id:
+            offline_queue.on_drained = self.fetch_initial_scores
+            self.restore_from_wal(offline_queue.open(self.combate_id))
+            self.start_sync_status()
+
         if self.combate_id and WEBSOCKET_AVAILABLE:
             self.connect_websocket()
 
+    def restore_from_wal(self, local_events):
+        """Reconstruye los rounds cerrados a partir del WAL tras un cierre inesperado."""
+        rounds = [e.get('args', {}) for e in local_events if e.get('kind') == 'round_end']
+        if not rounds:
+            return
+        self.combat.apply("restore", rounds=rounds)
+        self.center_panel.reset_clock()
+        log.info("wal.rounds_recuperados", rounds=len(rounds))
+
+    def start_sync_status(self):
+        if self._sync_event:
+            self._sync_event.cancel()
+        self._sync_event = Clock.schedule_interval(self._update_sync_status, 0.5)
+
+    def _update_sync_status(self, dt):
+        if not hasattr(self, 'center_panel'):
+            return
+        stats = offline_queue.stats()
+        label = self.center_panel.sync_label
+        if stats['depth'] == 0 and stats['online']:
+            label.text = "● Sincronizado"
+            label.color = (0.2, 0.6, 0.2, 1)
+        elif not stats['online']:
+            label.text = f"Sin conexión — {stats['depth']} en cola"
+            label.color = (0.85, 0.3, 0.1, 1)
+        else:
+            label.text = f"Reenviando {stats['depth']} · {stats['throughput_ops_s']} ops/s"
+            label.color = (0.8, 0.6, 0, 1)
+
+    def on_combat_finished(self):
+        """El WAL del combate se borra cuando la cola termina de vaciarse."""
+        if self.combate_id:
+            offline_queue.finish(self.combate_id)
+
     def parse_time_to_seconds(self, time_str):
         try:
             parts = time_str.split(':')
@@ -1786,13 +2171,15 @@ class MainScreentabc(Screen):
         self.clear_widgets()
         orientation = ResponsiveHelper.get_layout_orientation()
         main_layout = BoxLayout(orientation=orientation, spacing=0)
+        combat = self._bind_combat(CombatStateMachine(numero_rounds, duracion_round, duracion_descanso))
 
         # ── ROJO a la IZQUIERDA ──
         self.com1_panel = CompetitorPanel(
             name=name1, color="#E53935",
             nationality=nat1,
             alumno_id=self.id_alumno_rojo,
-            combate_id=self.combate_id
+            combate_id=self.combate_id,
+            lado='rojo', combat=combat
         )
         self.com1_panel.parent_screen = self
         main_layout.add_widget(self.com1_panel)
@@ -1800,7 +2187,8 @@ class MainScreentabc(Screen):
         self.center_panel = CenterPanel(
             duracion_round=duracion_round,
             duracion_descanso=duracion_descanso,
-            numero_rounds=numero_rounds
+            numero_rounds=numero_rounds,
+            combat=combat
         )
         self.center_panel.parent_screen = self
         main_layout.add_widget(self.center_panel)
@@ -1810,7 +2198,8 @@ class MainScreentabc(Screen):
             name=name2, color="#1E88E5",
             nationality=nat2,
             alumno_id=self.id_alumno_azul,
-            combate_id=self.combate_id
+            combate_id=self.combate_id,
+            lado='azul', combat=combat
         )
         self.com2_panel.parent_screen = self
         main_layout.add_widget(self.com2_panel)
@@ -1818,95 +2207,81 @@ class MainScreentabc(Screen):
         self.add_widget(main_layout)
 
     def is_timer_active(self):
-        if hasattr(self, 'center_panel') and self.center_panel:
-            return self.center_panel.is_combat_active() and not self.center_panel.is_rest_time
-        return False
+        return self.combat is not None and self.combat.snapshot.combat_active
 
     def on_combat_started(self):
-        print("[MainScreentabc] Combate iniciado")
+        log.info("combate.iniciado", combate_id=self.combate_id)
         self.fetch_initial_gamjeom()
 
     def on_player_disqualified(self, alumno_id, player_name):
-        print(f"\n{'='*60}\nDESCALIFICACIÓN: {player_name}\n{'='*60}\n")
         if alumno_id == self.id_alumno_rojo:
-            winner = self.com2_panel.name
+            lado, winner = 'rojo', self.com2_panel.name
         else:
-            winner = self.com1_panel.name
-        self.center_panel.end_combat_by_disqualification(player_name)
+            lado, winner = 'azul', self.com1_panel.name
+        self.center_panel.end_combat_by_disqualification(player_name, lado)
         self.center_panel.mostrar_mensaje(
             titulo="DESCALIFICACIÓN",
             mensaje=f"{player_name} ha sido descalificado\npor acumular 3 faltas GAM-JEOM.\n\nGanador: {winner}"
         )
 
-    def save_round_scores(self):
-        if hasattr(self, 'com1_panel'):
-            self.com1_panel.save_round_score()
-        if hasattr(self, 'com2_panel'):
-            self.com2_panel.save_round_score()
+    def save_round_scores(self, kind="round_end"):
+        """
+        Cierra el round con el evento `kind` (round_end, next_round o finish)
+        y lo registra en el WAL. Retorna la instantánea resultante.
+        """
+        before = self.combat.snapshot
+        coalescer.flush()
+        snapshot = self.combat.apply(kind)
+        if snapshot.seq == before.seq:
+            return snapshot
+        rojo, azul = snapshot.rojo.round_scores, snapshot.azul.round_scores
+        if len(rojo) > len(before.rojo.round_scores):
+            offline_queue.record_local("round_end", {
+                "round": before.round_number,
+                "rojo": rojo[-1],
+                "azul": azul[-1],
+            })
+            log.info("round.guardado", round=before.round_number, rojo=rojo[-1], azul=azul[-1])
+        stats = coalescer.close_round(before.round_number)
+        log.info("round.peticiones", round=stats['round'], pulsaciones=stats['mutations'],
+                 peticiones=stats['requests'], ahorradas=stats['saved'])
+        return snapshot
 
     def connect_websocket(self):
-        if not WEBSOCKET_AVAILABLE:
-            return
+        if self.combate_id:
+            self.realtime.start(f"/ws/tablero/{self.combate_id}")
 
-        def on_message(ws, message):
-            try:
-                data = json.loads(message)
-                if data.get('event') == 'score_update':
-                    alumno_id = data.get('alumnoId')
-                    new_count = data.get('count', 0)
-                    if not self.is_timer_active():
-                        self.revert_score(alumno_id)
-                        return
-                    if alumno_id == self.id_alumno_rojo:
-                        self.com1_panel.update_api_score(new_count)
-                    elif alumno_id == self.id_alumno_azul:
-                        self.com2_panel.update_api_score(new_count)
-                elif data.get('status') == 'connected':
-                    self.fetch_initial_scores()
-            except Exception as e:
-                print(f"[WebSocket] ✗ Error: {e}")
-
-        def on_error(ws, error):
-            print(f"[WebSocket] ✗ Error: {error}")
-
-        def on_close(ws, close_status_code, close_msg):
-            print(f"[WebSocket] ✗ Cerrado")
-            if self.ws_keepalive:
-                Clock.schedule_once(lambda dt: self.reconnect_websocket(), 3)
-
-        def on_open(ws):
-            print(f"[WebSocket] ✓ Conectado al combate {self.combate_id}")
-            self.start_keepalive()
-
-        ws_url = f"ws://localhost:8080/ws/tablero/{self.combate_id}"
-        self.ws = websocket.WebSocketApp(ws_url, on_message=on_message,
-                                          on_error=on_error, on_close=on_close, on_open=on_open)
-        self.ws_thread = Thread(target=self.ws.run_forever, daemon=True)
-        self.ws_thread.start()
+    def _panel_for(self, alumno_id):
+        if alumno_id == self.id_alumno_rojo:
+            return self.com1_panel
+        if alumno_id == self.id_alumno_azul:
+            return self.com2_panel
+        return None
+
+    def _on_realtime_event(self, data):
+        """Hilo del socket: solo clasifica y acumula; se aplica en el próximo frame."""
+        try:
+            if data.get('event') == 'score_update':
+                alumno_id = data.get('alumnoId')
+                if not self.is_timer_active():
+                    self.revert_score(alumno_id)
+                    return
+                panel = self._panel_for(alumno_id)
+                if panel is not None:
+                    # La versión cuenta desde la recepción, no desde el frame
+                    self.realtime_events.push(dict(data, _version=panel.score_journal.ticket()))
+        except Exception as e:
+            log.error("websocket.evento_error", error=e)
+
+    def _apply_realtime_event(self, data):
+        panel = self._panel_for(data.get('alumnoId'))
+        if panel is not None:
+            panel.apply_api_score(data.get('count', 0), data['_version'])
 
     def revert_score(self, alumno_id):
-        def work():
-            try:
-                url = f"http://localhost:8080/apiPuntajes/puntaje/alumno/{alumno_id}/last"
-                requests.delete(url, timeout=5)
-            except:
-                pass
-        Thread(target=work, daemon=True).start()
-
-    def start_keepalive(self):
-        def send_ping(dt):
-            if self.ws and self.ws.sock and self.ws.sock.connected:
-                try:
-                    self.ws.send('ping')
-                except:
-                    pass
-        if self.ws_keepalive:
-            self.ws_keepalive.cancel()
-        self.ws_keepalive = Clock.schedule_interval(send_ping, 30)
-
-    def reconnect_websocket(self):
-        if self.combate_id and WEBSOCKET_AVAILABLE:
-            self.connect_websocket()
+        offline_queue.enqueue(
+            f"{self.combate_id}:{alumno_id}:puntaje", "puntaje.delete", {"alumnoId": alumno_id}
+        )
 
     @mainthread
     def update_judges_status(self, text):
@@ -1914,34 +2289,40 @@ class MainScreentabc(Screen):
             self.center_panel.mostrar_mensaje(titulo="Estado de Jueces", mensaje=text)
 
     def fetch_initial_scores(self):
-        def work():
-            try:
-                if self.id_alumno_rojo:
-                    r = requests.get(f"http://localhost:8080/apiPuntajes/puntaje/alumno/{self.id_alumno_rojo}/count", timeout=2)
-                    if r.status_code == 200:
-                        self.com1_panel.update_api_score(r.json().get('count', 0))
-                if self.id_alumno_azul:
-                    r = requests.get(f"http://localhost:8080/apiPuntajes/puntaje/alumno/{self.id_alumno_azul}/count", timeout=2)
-                    if r.status_code == 200:
-                        self.com2_panel.update_api_score(r.json().get('count', 0))
-            except:
-                pass
-        Thread(target=work, daemon=True).start()
+        self.hydrate_from_snapshot()
 
     def fetch_initial_gamjeom(self):
-        def work():
-            try:
-                if self.id_alumno_rojo and self.combate_id:
-                    r = requests.get(f"http://localhost:8080/apiGamJeom/falta/alumno/{self.id_alumno_rojo}/combate/{self.combate_id}/count", timeout=2)
-                    if r.status_code == 200:
-                        self.com1_panel.update_gamjeom_count(r.json().get('count', 0))
-                if self.id_alumno_azul and self.combate_id:
-                    r = requests.get(f"http://localhost:8080/apiGamJeom/falta/alumno/{self.id_alumno_azul}/combate/{self.combate_id}/count", timeout=2)
-                    if r.status_code == 200:
-                        self.com2_panel.update_gamjeom_count(r.json().get('count', 0))
-            except:
-                pass
-        Thread(target=work, daemon=True).start()
+        self.hydrate_from_snapshot()
+
+    def hydrate_from_snapshot(self):
+        """Puntajes y faltas de ambos competidores en una sola llamada (en vez de 4 GET)."""
+        if not self.combate_id:
+            return
+        start = time.perf_counter()
+        # Versiones tomadas al pedir: un push que llegue mientras tanto gana
+        versions = {
+            panel: (panel.score_journal.ticket(), panel.gamjeom_journal.ticket())
+            for panel in (self.com1_panel, self.com2_panel)
+        }
+        scoring.get_combate_snapshot(
+            self.combate_id, self.id_alumno_rojo, self.id_alumno_azul,
+            on_success=lambda snapshot: self._apply_snapshot(snapshot, start, versions),
+            on_error=lambda e: log.error("hidratar.error", combate_id=self.combate_id, error=e)
+        )
+
+    @mainthread
+    def _apply_snapshot(self, snapshot, start, versions=None):
+        versions = versions or {}
+        for panel, lado in ((self.com1_panel, 'rojo'), (self.com2_panel, 'azul')):
+            datos = snapshot.get(lado) or {}
+            score_version, foul_version = versions.get(panel, (None, None))
+            if datos.get('puntaje') is not None:
+                panel.update_api_score(datos['puntaje'], score_version)
+            if datos.get('faltas') is not None:
+                panel.update_gamjeom_count(datos['faltas'], foul_version)
+        total_ms = (time.perf_counter() - start) * 1000.0
+        log.info("hidratado", total_ms=round(total_ms, 1), red_ms=snapshot.get('elapsed_ms'),
+                 fuente=snapshot.get('source'))
 
     def pausar_tiempo(self):
         if hasattr(self, 'center_panel') and self.center_panel:
@@ -1999,14 +2380,8 @@ class MainScreentabc(Screen):
             self.center_panel.start_timer()
 
     def disconnect_websocket(self):
-        if self.ws_keepalive:
-            self.ws_keepalive.cancel()
-            self.ws_keepalive = None
-        if self.ws:
-            try:
-                self.ws.close()
-            except:
-                pass
+        self.realtime.stop()
+        self.realtime_events.clear()
 
     def reset_competitor_scores(self):
         self.com1_panel.reset_scores()
@@ -2017,33 +2392,61 @@ class MainScreentabc(Screen):
             self.com1_panel.set_judge_active(judge_name, True, auto_reset_seconds)
         if panel in ('azul', 'both') and hasattr(self, 'com2_panel'):
             self.com2_panel.set_judge_active(judge_name, True, auto_reset_seconds)
-        print(f"[MainScreentabc] LED {judge_name} activado (panel={panel})")
+        log.debug("juez.led", juez=judge_name, panel=panel)
 
     def build_ui(self):
         self.clear_widgets()
         orientation = ResponsiveHelper.get_layout_orientation()
         main_layout = BoxLayout(orientation=orientation, spacing=0)
+        combat = self._bind_combat(CombatStateMachine())
 
         # ROJO izquierda
-        self.com1_panel = CompetitorPanel(name="COMPETIDOR ROJO", color="#E53935", nationality="")
+        self.com1_panel = CompetitorPanel(name="COMPETIDOR ROJO", color="#E53935", nationality="",
+                                          lado='rojo', combat=combat)
         self.com1_panel.parent_screen = self
         main_layout.add_widget(self.com1_panel)
 
-        self.center_panel = CenterPanel()
+        self.center_panel = CenterPanel(combat=combat)
         self.center_panel.parent_screen = self
         main_layout.add_widget(self.center_panel)
 
         # AZUL derecha
-        self.com2_panel = CompetitorPanel(name="COMPETIDOR AZUL", color="#1E88E5", nationality="")
+        self.com2_panel = CompetitorPanel(name="COMPETIDOR AZUL", color="#1E88E5", nationality="",
+                                          lado='azul', combat=combat)
         self.com2_panel.parent_screen = self
         main_layout.add_widget(self.com2_panel)
 
         self.add_widget(main_layout)
 
+    def on_enter(self, *args):
+        # Tiempo de frame mientras el tablero está en pantalla
+        if self._frame_event is None:
+            self.frame_counter.pause()
+            self._frame_event = Clock.schedule_interval(self.frame_counter.tick, 0)
+        return super().on_enter(*args)
+
     def on_pre_leave(self, *args):
         self.disconnect_websocket()
+        if self._frame_event:
+            self._frame_event.cancel()
+            self._frame_event = None
+            frames = self.frame_counter.snapshot()
+            log.info("frames", p50_ms=frames['p50_ms'], p95_ms=frames['p95_ms'], max_ms=frames['max_ms'],
+                     lentos=frames['slow_frames'])
         return super().on_pre_leave(*args)
 
+    def get_render_stats(self):
+        """Tiempo de frame, eventos recibidos frente a renders y trabajo de la tabla de rounds."""
+        return {
+            "frames": self.frame_counter.snapshot(),
+            "realtime": self.realtime_events.stats(),
+            "combat_renders": self.combat_renders,
+            "round_table": {
+                panel.lado: {"cell_writes": panel.table_cell_writes, "columns_added": panel.table_columns_added}
+                for panel in (self.com1_panel, self.com2_panel)
+            },
+        }
+
 
 # ------------------ APP DE PRUEBA ------------------
 if __name__ == '__main__':
@@ -0,0 +1,191 @@
+import itertools
+import queue
+import threading
+import time
+from collections import deque
+
+from kivy.clock import Clock
+
+from config import BACKGROUND_WORKERS
+from metrics import LatencyStats, LatencyRegistry
+from app_logging import get_logger
+
+log = get_logger("task_executor")
+
+
+# Carriles de prioridad (menor = antes)
+PRIORITY_HIGH = 0     # acciones del usuario: login, guardar, eliminar
+PRIORITY_NORMAL = 1   # carga de datos de una pantalla
+PRIORITY_LOW = 2      # refrescos y precargas
+
+_LANES = {PRIORITY_HIGH: "high", PRIORITY_NORMAL: "normal", PRIORITY_LOW: "low"}
+
+
+class TaskHandle:
+    """Tarea encolada; `cancel()` la descarta si aún no corre y siempre descarta su resultado."""
+
+    __slots__ = ("name", "fn", "args", "kwargs", "owner", "priority", "essential",
+                 "on_success", "on_error", "cancelled", "submitted_at")
+
+    def __init__(self, name, fn, args, kwargs, owner, priority, essential, on_success, on_error):
+        self.name = name
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.owner = owner
+        self.priority = priority
+        self.essential = essential
+        self.on_success = on_success
+        self.on_error = on_error
+        self.cancelled = False
+        self.submitted_at = time.perf_counter()
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class TaskExecutor:
+    """
+    Ejecutor compartido de trabajo en segundo plano para todas las pantallas.
+
+    - Pool fijo de BACKGROUND_WORKERS hilos (se crean al primer uso) que
+      toman tareas de una cola con carriles de prioridad.
+    - Cada tarea pertenece a un `owner` (normalmente la Screen). Al salir de
+      la pantalla, `cancel_owner(self)` en `on_pre_leave` descarta lo que aún
+      no empezó y los resultados de lo que ya estaba corriendo. Las tareas
+      `essential=True` (escrituras) se ejecutan igual; solo se pierden sus
+      callbacks.
+    - Los callbacks `on_success(resultado)` / `on_error(excepcion)` corren en
+      el hilo principal: los resultados se acumulan y se entregan en un único
+      drenado por frame (Clock.create_trigger).
+    """
+
+    def __init__(self, max_workers=BACKGROUND_WORKERS):
+        self.max_workers = max_workers
+        self.latency = LatencyRegistry()
+        self.wait = LatencyStats()
+        self._queue = queue.PriorityQueue()
+        self._order = itertools.count()
+        self._lock = threading.Lock()
+        self._workers = []
+        self._queued = {lane: 0 for lane in _LANES}
+        self._running = set()
+        self._results = deque()
+        self._drain_trigger = Clock.create_trigger(self.drain, 0)
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.dropped_results = 0
+
+    # ============ API PÚBLICA ============
+
+    def submit(self, fn, *args, owner=None, priority=PRIORITY_NORMAL, essential=False,
+               on_success=None, on_error=None, name=None, **kwargs) -> TaskHandle:
+        """Encola fn(*args, **kwargs); los callbacks se llaman en el hilo principal."""
+        if priority not in _LANES:
+            raise ValueError(f"Prioridad desconocida: {priority}")
+        handle = TaskHandle(name or getattr(fn, "__name__", "task"), fn, args, kwargs,
+                            owner, priority, essential, on_success, on_error)
+        with self._lock:
+            self.submitted += 1
+            self._queued[priority] += 1
+            self._ensure_workers_locked()
+        self._queue.put((priority, next(self._order), handle))
+        return handle
+
+    def cancel_owner(self, owner) -> int:
+        """Cancela las tareas de `owner` (en cola o en curso). Retorna cuántas."""
+        count = 0
+        with self._lock:
+            for _, _, handle in list(self._queue.queue):
+                if handle.owner is owner and not handle.cancelled:
+                    handle.cancel()
+                    count += 1
+            for handle in self._running:
+                if handle.owner is owner and not handle.cancelled:
+                    handle.cancel()
+                    count += 1
+        if count:
+            log.debug("tareas.canceladas", count=count, owner=type(owner).__name__)
+        return count
+
+    def depth(self) -> dict:
+        """Tareas en cola por carril (las canceladas se cuentan hasta que un hilo las descarta)."""
+        with self._lock:
+            return {_LANES[p]: n for p, n in self._queued.items()}
+
+    def stats(self) -> dict:
+        with self._lock:
+            data = {
+                "workers": len(self._workers),
+                "running": len(self._running),
+                "queued": {_LANES[p]: n for p, n in self._queued.items()},
+                "pending_results": len(self._results),
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "cancelled": self.cancelled,
+                "dropped_results": self.dropped_results,
+            }
+        data["wait"] = self.wait.snapshot()
+        data["run"] = self.latency.snapshot()
+        return data
+
+    def drain(self, *args):
+        """Entrega en el hilo principal los resultados terminados (una vez por frame)."""
+        while True:
+            try:
+                handle, result, exc = self._results.popleft()
+            except IndexError:
+                return
+            if handle.cancelled:
+                self.dropped_results += 1
+                continue
+            try:
+                if exc is None:
+                    if handle.on_success:
+                        handle.on_success(result)
+                elif handle.on_error:
+                    handle.on_error(exc)
+                else:
+                    log.error("tarea.error", tarea=handle.name, error=exc)
+            except Exception:
+                log.exception("callback.error", tarea=handle.name)
+
+    # ============ INTERNOS ============
+
+    def _ensure_workers_locked(self):
+        idle = len(self._workers) - len(self._running)
+        if len(self._workers) < self.max_workers and sum(self._queued.values()) > idle:
+            worker = threading.Thread(target=self._work, name=f"task-{len(self._workers) + 1}", daemon=True)
+            self._workers.append(worker)
+            worker.start()
+
+    def _work(self):
+        while True:
+            priority, _, handle = self._queue.get()
+            with self._lock:
+                self._queued[priority] -= 1
+                if handle.cancelled and not handle.essential:
+                    self.cancelled += 1
+                    continue
+                self._running.add(handle)
+            self.wait.record((time.perf_counter() - handle.submitted_at) * 1000.0)
+            result = exc = None
+            try:
+                result = self.latency.measure(handle.name, handle.fn, *handle.args, **handle.kwargs)
+            except Exception as e:
+                exc = e
+            with self._lock:
+                self._running.discard(handle)
+                if exc is None:
+                    self.completed += 1
+                else:
+                    self.failed += 1
+            self._results.append((handle, result, exc))
+            self._drain_trigger()
+
+
+# Instancia global del ejecutor
+tasks = TaskExecutor()
@@ -3,20 +3,20 @@ from kivy.uix.screenmanager import Screen, ScreenManager
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.uix.button import Button
-from kivy.uix.scrollview import ScrollView
 from kivy.graphics import Color, RoundedRectangle, Rectangle
 from kivy.core.window import Window
-from kivy.uix.gridlayout import GridLayout
 from kivy.metrics import dp, sp
 from kivy.properties import ListProperty, StringProperty
 from kivy.uix.popup import Popup
 from kivy.uix.textinput import TextInput
 from kivy.utils import platform
 from kivy.clock import Clock
-from threading import Thread
+from task_executor import tasks, PRIORITY_HIGH
 from datetime import datetime
 from api_client import api
 from actualizar_torneos import ActualizarTorneoScreen
+from card_list import CardList, RecycledCard
+from responsive import responsive
 
 # ------------------ UTILIDADES RESPONSIVE ------------------
 class ResponsiveHelper:
@@ -107,15 +107,13 @@ class HoverButton(Button):
             self.rect = RoundedRectangle(pos=self.pos, size=self.size, radius=[self.border_radius])
 
         self.bind(pos=self.update_rect, size=self.update_rect)
-        Window.bind(on_resize=self.on_window_resize)
+        responsive.track(self,
+                         font_size=lambda: ResponsiveHelper.get_font_size(18),
+                         height=ResponsiveHelper.get_button_height)
 
     def update_rect(self, *args):
         self.rect.pos = self.pos
         self.rect.size = self.size
-    
-    def on_window_resize(self, instance, width, height):
-        self.font_size = ResponsiveHelper.get_font_size(18)
-        self.height = ResponsiveHelper.get_button_height()
 
 
 class LightBlueButton(HoverButton):
@@ -231,10 +229,11 @@ class ConfirmDeletePopup(Popup):
 
 
 # ------------------ TARJETA DE TORNEO RESPONSIVE ------------------
-class TorneoCard(BoxLayout):
+class TorneoCard(RecycledCard, BoxLayout):
+    """Tarjeta reutilizable: CardList le asigna torneo_data y callbacks."""
     bg_color = ListProperty([0.1, 0.4, 0.7, 1])
 
-    def __init__(self, torneo_data, on_delete, on_edit, **kwargs):
+    def __init__(self, torneo_data=None, on_delete=None, on_edit=None, **kwargs):
         super().__init__(**kwargs)
         self.orientation = 'vertical'
         self.spacing = dp(10)
@@ -259,15 +258,15 @@ class TorneoCard(BoxLayout):
             self.rect = RoundedRectangle(pos=self.pos, size=self.size, radius=[dp(15)])
             self.bind(pos=self.update_rect, size=self.update_rect)
 
-        Window.bind(on_resize=self.on_window_resize)
         self.build_card()
+        if torneo_data is not None:
+            self.show()
 
     def build_card(self):
         self.clear_widgets()
 
         # Título con mejor espaciado
         self.title_label = Label(
-            text=f"[b]{self.torneo_data['nombre']}[/b]",
             markup=True,
             font_size=ResponsiveHelper.get_font_size(22),
             color=(1, 1, 1, 1),
@@ -276,6 +275,7 @@ class TorneoCard(BoxLayout):
             halign='center',
             valign='middle'
         )
+        responsive.track(self.title_label, font_size=lambda: ResponsiveHelper.get_font_size(22))
         self.title_label.bind(size=self.title_label.setter('text_size'))
         self.add_widget(self.title_label)
 
@@ -296,9 +296,12 @@ class TorneoCard(BoxLayout):
             spacing=dp(8),
             padding=[dp(10), dp(15), dp(10), dp(10)]
         )
-        self.info_layout.add_widget(self.create_info_row(f"  {self.torneo_data['fecha']}"))
-        self.info_layout.add_widget(self.create_info_row(f"  {self.torneo_data['hora_inicio']} - {self.torneo_data['hora_fin']}"))
-        self.info_layout.add_widget(self.create_info_row(f"  {self.torneo_data['Sede']}"))
+        self.fecha_label = self.create_info_row("")
+        self.horario_label = self.create_info_row("")
+        self.sede_label = self.create_info_row("")
+        self.info_layout.add_widget(self.fecha_label)
+        self.info_layout.add_widget(self.horario_label)
+        self.info_layout.add_widget(self.sede_label)
         self.add_widget(self.info_layout)
 
         # Espaciador flexible
@@ -321,6 +324,7 @@ class TorneoCard(BoxLayout):
             spacing=dp(10),
             padding=[0, dp(8), 0, 0]
         )
+        responsive.track(self.button_layout, height=ResponsiveHelper.get_button_height)
         
         self.edit_button = LightBlueButton(text='EDITAR', size_hint_x=0.5)
         self.edit_button.bind(on_press=self.open_edit_screen)
@@ -341,6 +345,13 @@ class TorneoCard(BoxLayout):
         self.button_layout.add_widget(self.delete_button)
         self.add_widget(self.button_layout)
 
+    def show(self):
+        """Pinta los datos del torneo actual en los widgets ya creados."""
+        self.title_label.text = f"[b]{self.torneo_data['nombre']}[/b]"
+        self.fecha_label.text = f"  {self.torneo_data['fecha']}"
+        self.horario_label.text = f"  {self.torneo_data['hora_inicio']} - {self.torneo_data['hora_fin']}"
+        self.sede_label.text = f"  {self.torneo_data['Sede']}"
+
     def create_info_row(self, text):
         label = Label(
             text=text,
@@ -351,6 +362,7 @@ class TorneoCard(BoxLayout):
             size_hint_y=None,
             height=dp(30)
         )
+        responsive.track(label, font_size=lambda: ResponsiveHelper.get_font_size(16))
         label.bind(size=label.setter('text_size'))
         return label
 
@@ -360,13 +372,6 @@ class TorneoCard(BoxLayout):
         self.shadow.pos = (self.pos[0] + dp(3), self.pos[1] - dp(3))
         self.shadow.size = self.size
 
-    def on_window_resize(self, instance, width, height):
-        Clock.schedule_once(lambda dt: self.rebuild_card(), 0.1)
-    
-    def rebuild_card(self):
-        self.height = ResponsiveHelper.get_card_height()
-        self.build_card()
-
     def open_delete_popup(self, instance):
         ConfirmDeletePopup(
             torneo_data=self.torneo_data,
@@ -407,10 +412,7 @@ class TorneoCard(BoxLayout):
         combates_screen.torneo_nombre = self.torneo_data['nombre']
         combates_screen.torneo_id = self.torneo_data.get('idTorneo')
         
-        # Solo rebuildeamos si el screen ya estaba creado
-        if combates_screen in app.root.screens:
-            combates_screen.build_ui()
-        
+        # on_enter recarga los combates del torneo elegido
         app.root.current = 'combates_anteriores'
 
 # ------------------ PANTALLA DE TORNEOS ANTERIORES ------------------
@@ -456,58 +458,51 @@ class TorneosAnterioresScreen(Screen):
         super().__init__(**kwargs)
         self.torneos_data = []
         self.build_ui()
-        Window.bind(on_resize=self.on_window_resize)
+        responsive.subscribe(self)
 
     def on_enter(self, *args):
         """Se ejecuta cada vez que se entra a esta pantalla"""
         self.fetch_torneos()
 
+    def on_pre_leave(self, *args):
+        tasks.cancel_owner(self)
+
     def fetch_torneos(self):
         """Obtiene los torneos desde el backend"""
         self.torneos_data = []
-        self.grid.clear_widgets()
-        loading = Label(
-            text="Cargando torneos...",
-            font_size=ResponsiveHelper.get_font_size(18),
-            color=(0.2, 0.4, 0.7, 1),
-            size_hint_y=None,
-            height=dp(40)
-        )
-        self.grid.add_widget(loading)
+        self.card_list.clear()
+        self.set_status("Cargando torneos...")
 
         def _task():
-            try:
-                print("[DEBUG] Solicitando torneos al backend...")
-                resp = api.get_json("/apiTorneos/torneo")
-                status = resp.status_code
-                print(f"[DEBUG] Status code: {status}")
-                
-                if status == 200:
-                    try:
-                        data = resp.json() or []
-                        print(f"[DEBUG] Torneos recibidos: {len(data)}")
-                    except Exception as e:
-                        print(f"[ERROR] Error parseando JSON: {e}")
-                        data = []
-                    
-                    # Mapear datos
-                    mapped = [self._map_torneo(t) for t in data]
-                    
-                    def _ok(dt):
-                        self.torneos_data = mapped
-                        self.populate_torneos()
-                    Clock.schedule_once(_ok, 0)
-                else:
-                    def _err(dt):
-                        self._show_error(f"Error {status} al consultar torneos.")
-                    Clock.schedule_once(_err, 0)
-            except Exception as e:
-                print(f"[ERROR] Exception en fetch_torneos: {e}")
-                def _err(dt, m=str(e)):
-                    self._show_error(f"No se pudo obtener torneos.\n{m}")
-                Clock.schedule_once(_err, 0)
+            print("[DEBUG] Solicitando torneos al backend...")
+            # Si la lista está en caché se pinta al instante; si estaba
+            # vencida, _refreshed la reemplaza cuando llegue la respuesta
+            data = api.get_all_torneos(on_update=_refreshed, owner=self) or []
+            print(f"[DEBUG] Torneos recibidos: {len(data)}")
+            
+            # Mapear datos
+            return [self._map_torneo(t) for t in data]
+
+        def _ok(mapped):
+            self.torneos_data = mapped
+            self.populate_torneos()
+
+        def _refreshed(data):
+            print(f"[DEBUG] Torneos actualizados: {len(data)}")
+            _ok([self._map_torneo(t) for t in data or []])
 
-        Thread(target=_task, daemon=True).start()
+        def _err(e):
+            if isinstance(e, RuntimeError):
+                self._show_error(str(e))
+                return
+            print(f"[ERROR] Exception en fetch_torneos: {e}")
+            self._show_error(f"No se pudo obtener torneos.\n{e}")
+
+        # Una recarga reemplaza a la anterior que siga en curso
+        if getattr(self, '_fetch_task', None):
+            self._fetch_task.cancel()
+        self._fetch_task = tasks.submit(_task, owner=self, name="torneos.list",
+                                        on_success=_ok, on_error=_err)
 
     def _show_error(self, msg: str):
         """Muestra un popup con mensaje de error"""
@@ -536,26 +531,20 @@ class TorneosAnterioresScreen(Screen):
         popup.content = box
         popup.open()
 
-    def populate_torneos(self):
-        """Llena el grid con las tarjetas de torneos"""
-        self.grid.clear_widgets()
-        if not self.torneos_data:
-            self.grid.add_widget(Label(
-                text="No hay torneos registrados",
-                font_size=ResponsiveHelper.get_font_size(18),
-                color=(0.2, 0.4, 0.7, 1),
-                size_hint_y=None,
-                height=dp(40)
-            ))
-            return
+    def set_status(self, text: str):
+        """Mensaje sobre la lista (cargando, vacía...); texto vacío lo oculta."""
+        self.status_label.text = text
+        self.status_label.height = dp(40) if text else 0
+        self.status_label.opacity = 1 if text else 0
 
-        for torneo in self.torneos_data:
-            card = TorneoCard(
-                torneo_data=torneo,
-                on_delete=self.delete_torneo,
-                on_edit=self.edit_torneo
-            )
-            self.grid.add_widget(card)
+    def populate_torneos(self):
+        """Entrega los torneos a la lista reciclable (solo se crean las tarjetas visibles)"""
+        self.set_status("" if self.torneos_data else "No hay torneos registrados")
+        self.card_list.set_items(
+            [{"torneo_data": torneo} for torneo in self.torneos_data],
+            on_delete_callback=self.delete_torneo,
+            on_edit_callback=self.edit_torneo
+        )
 
     def build_ui(self):
         self.clear_widgets()
@@ -575,6 +564,7 @@ class TorneosAnterioresScreen(Screen):
             height=header_height,
             padding=[dp(20), dp(20), dp(20), dp(10)]
         )
+        responsive.track(self.header, height=lambda: dp(100) if Window.width >= 600 else dp(80))
         
         # Fondo del header con gradiente simulado
         with self.header.canvas.before:
@@ -593,27 +583,32 @@ class TorneosAnterioresScreen(Screen):
             bold=True,
             color=(0.1, 0.4, 0.7, 1)
         )
+        responsive.track(self.title_label, font_size=lambda: ResponsiveHelper.get_font_size(40))
         self.header.add_widget(self.title_label)
         self.layout.add_widget(self.header)
 
-        # ScrollView con el grid de torneos
-        self.scroll = ScrollView(
-            bar_width=dp(10),
-            bar_color=[0.2, 0.6, 1, 0.8],
-            bar_inactive_color=[0.2, 0.6, 1, 0.4]
+        # Mensaje de estado (cargando / sin torneos)
+        self.status_label = Label(
+            font_size=ResponsiveHelper.get_font_size(18),
+            color=(0.2, 0.4, 0.7, 1),
+            size_hint_y=None,
+            height=0
         )
-        
-        self.grid = GridLayout(
+        responsive.track(self.status_label, font_size=lambda: ResponsiveHelper.get_font_size(18))
+        self.layout.add_widget(self.status_label)
+
+        # Lista reciclable de tarjetas de torneos
+        self.card_list = CardList(
+            TorneoCard,
             cols=self.calculate_columns(),
+            row_height=ResponsiveHelper.get_card_height(),
             spacing=ResponsiveHelper.get_grid_spacing(),
             padding=ResponsiveHelper.get_grid_padding(),
-            size_hint_y=None,
-            row_default_height=ResponsiveHelper.get_card_height() + dp(10)
+            bar_width=dp(10),
+            bar_color=[0.2, 0.6, 1, 0.8],
+            bar_inactive_color=[0.2, 0.6, 1, 0.4]
         )
-        self.grid.bind(minimum_height=self.grid.setter('height'))
-
-        self.scroll.add_widget(self.grid)
-        self.layout.add_widget(self.scroll)
+        self.layout.add_widget(self.card_list)
 
         # Footer con botón volver
         footer_height = dp(80) if Window.width >= 600 else dp(70)
@@ -622,6 +617,11 @@ class TorneosAnterioresScreen(Screen):
             height=footer_height,
             padding=ResponsiveHelper.get_grid_padding()
         )
+        responsive.track(
+            self.footer,
+            height=lambda: dp(80) if Window.width >= 600 else dp(70),
+            padding=lambda: [ResponsiveHelper.get_grid_padding()] * 4
+        )
 
         btn_width = 0.3 if Window.width >= 900 else (0.5 if Window.width >= 600 else 0.7)
         self.btn_volver = HoverButton(
@@ -630,6 +630,10 @@ class TorneosAnterioresScreen(Screen):
             size_hint=(btn_width, 1),
             pos_hint={'center_x': 0.5}
         )
+        responsive.track(
+            self.btn_volver,
+            size_hint=lambda: (0.3 if Window.width >= 900 else (0.5 if Window.width >= 600 else 0.7), 1)
+        )
         self.btn_volver.bind(on_press=lambda x: setattr(self.manager, 'current', 'ini'))
         self.footer.add_widget(self.btn_volver)
         self.layout.add_widget(self.footer)
@@ -665,39 +669,28 @@ class TorneosAnterioresScreen(Screen):
             return
 
         # Estado visual de "eliminando..."
-        self.grid.clear_widgets()
-        self.grid.add_widget(Label(
-            text="Eliminando torneo...",
-            font_size=ResponsiveHelper.get_font_size(18),
-            color=(0.2, 0.4, 0.7, 1),
-            size_hint_y=None,
-            height=dp(40)
-        ))
+        self.card_list.clear()
+        self.set_status("Eliminando torneo...")
 
         def _task():
-            try:
-                print(f"[DEBUG] Eliminando torneo ID: {torneo_id}")
-                resp = api.delete(f"/apiTorneos/torneo/{torneo_id}")
-                print(f"[DEBUG] Status code delete: {resp.status_code}")
-                
-                if resp.status_code in (200, 204):
-                    # Éxito: refrescar lista desde el backend
-                    def _ok(dt):
-                        self.fetch_torneos()
-                    Clock.schedule_once(_ok, 0)
-                else:
-                    def _err(dt):
-                        self._show_error(f"No se pudo eliminar (HTTP {resp.status_code}).")
-                        self.fetch_torneos()
-                    Clock.schedule_once(_err, 0)
-            except Exception as e:
-                print(f"[ERROR] Exception eliminando torneo: {e}")
-                def _err(dt, m=str(e)):
-                    self._show_error(f"Error eliminando torneo:\n{m}")
-                    self.fetch_torneos()
-                Clock.schedule_once(_err, 0)
+            print(f"[DEBUG] Eliminando torneo ID: {torneo_id}")
+            resp = api.delete(f"/apiTorneos/torneo/{torneo_id}")
+            print(f"[DEBUG] Status code delete: {resp.status_code}")
+            return resp.status_code
 
-        Thread(target=_task, daemon=True).start()
+        def _ok(status_code):
+            if status_code not in (200, 204):
+                self._show_error(f"No se pudo eliminar (HTTP {status_code}).")
+            # Refrescar lista desde el backend
+            self.fetch_torneos()
+
+        def _err(e):
+            print(f"[ERROR] Exception eliminando torneo: {e}")
+            self._show_error(f"Error eliminando torneo:\n{e}")
+            self.fetch_torneos()
+
+        tasks.submit(_task, owner=self, priority=PRIORITY_HIGH, essential=True, name="torneo.delete",
+                     on_success=_ok, on_error=_err)
 
     def edit_torneo(self, torneo_original, nuevos_datos):
         """
@@ -715,18 +708,14 @@ class TorneosAnterioresScreen(Screen):
         self.rect.pos = self.layout.pos
         self.rect.size = self.layout.size
 
-    def on_window_resize(self, instance, width, height):
-        Clock.schedule_once(lambda dt: self.rebuild_ui(), 0.1)
-    
-    def rebuild_ui(self):
-        # Actualizar número de columnas
-        self.grid.cols = self.calculate_columns()
-        self.grid.spacing = ResponsiveHelper.get_grid_spacing()
-        self.grid.padding = ResponsiveHelper.get_grid_padding()
-        self.grid.row_default_height = ResponsiveHelper.get_card_height() + dp(10)
-        
-        # Reconstruir UI completa para ajustar tamaños
-        self.build_ui()
+    def reflow(self):
+        """Ajusta columnas y medidas de la grilla; las tarjetas y los datos se conservan"""
+        self.card_list.set_layout(
+            cols=self.calculate_columns(),
+            row_height=ResponsiveHelper.get_card_height(),
+            spacing=ResponsiveHelper.get_grid_spacing(),
+            padding=ResponsiveHelper.get_grid_padding()
+        )
 
 
 # ------------------ APLICACIÓN ------------------
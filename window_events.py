@@ -0,0 +1,150 @@
+import weakref
+
+from kivy.clock import Clock
+from kivy.core.window import Window
+from app_logging import get_logger
+
+log = get_logger("window_events")
+
+
+class ResizeRegistry:
+    """
+    Único enlace con Window.on_resize para todos los widgets.
+
+    `Window.bind(on_resize=...)` en cada widget dejaba la ventana
+    apuntando a pantallas y tarjetas ya descartadas, que seguían
+    reconstruyéndose en cada resize. Aquí:
+
+    - Los widgets se guardan con referencias débiles: al descartarse
+      salen solos del registro (`collected`).
+    - Solo se avisa a los widgets conectados a la ventana. Los de una
+      pantalla inactiva quedan pendientes y reciben el tamaño actual
+      cuando su pantalla vuelve a mostrarse (`watch_manager`).
+    - `unbind(widget)` los quita explícitamente.
+
+    El callback por defecto es `widget.on_window_resize(window, w, h)`.
+    Cada resize se entrega enseguida, salvo que un servicio lo intercepte
+    (`intercept`): entonces recibe él los resizes de la ventana y decide
+    cuándo avisar a los widgets con `dispatch()`, p.ej. una sola vez tras
+    una ráfaga de resizes.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._pending = set()
+        self._bound = False
+        self._interceptor = None
+        self._args = ()
+        self._flush_trigger = Clock.create_trigger(self.flush_pending, 0)
+        # Métricas
+        self.registered = 0
+        self.collected = 0
+        self.dispatches = 0
+        self.delivered = 0
+        self.deferred = 0
+
+    # ============ API PÚBLICA ============
+
+    def bind(self, widget, method="on_window_resize"):
+        """Registra `widget.<method>` para recibir los cambios de tamaño."""
+        self._ensure_bound()
+        key = id(widget)
+        ref = weakref.ref(widget, lambda r, key=key: self._forget(key, r))
+        self._entries[key] = (ref, method)
+        self.registered += 1
+
+    def unbind(self, widget):
+        key = id(widget)
+        self._entries.pop(key, None)
+        self._pending.discard(key)
+
+    def intercept(self, callback):
+        """Los resizes de la ventana van a `callback(window, w, h)` en vez de a los widgets."""
+        self._ensure_bound()
+        self._interceptor = callback
+
+    def dispatch(self, *args):
+        """Avisa a los widgets conectados con `args`; los demás quedan pendientes."""
+        self._args = args
+        self.dispatches += 1
+        for key in list(self._entries):
+            widget = self._widget(key)
+            if widget is None:
+                continue
+            if widget.get_root_window() is None:
+                # Pantalla inactiva o widget fuera del árbol: se avisa al volver
+                if key not in self._pending:
+                    self._pending.add(key)
+                    self.deferred += 1
+                continue
+            self._pending.discard(key)
+            self._deliver(key, widget, args)
+
+    def watch_manager(self, manager):
+        """Al cambiar de pantalla, entrega los resizes pendientes a la que se muestra."""
+        manager.bind(current=lambda *args: self._flush_trigger())
+
+    def flush_pending(self, *args):
+        if not self._pending:
+            return
+        for key in list(self._pending):
+            widget = self._widget(key)
+            if widget is None:
+                self._pending.discard(key)
+            elif widget.get_root_window() is not None:
+                self._pending.discard(key)
+                self._deliver(key, widget, self._args)
+
+    def handlers(self) -> int:
+        """Widgets vivos registrados."""
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        return {
+            "handlers": len(self._entries),
+            "pending": len(self._pending),
+            "registered": self.registered,
+            "collected": self.collected,
+            "dispatches": self.dispatches,
+            "delivered": self.delivered,
+            "deferred": self.deferred,
+        }
+
+    # ============ INTERNOS ============
+
+    def _ensure_bound(self):
+        if not self._bound:
+            Window.bind(on_resize=self._on_resize)
+            self._args = (Window, Window.width, Window.height)
+            self._bound = True
+
+    def _forget(self, key, ref):
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is ref:
+            del self._entries[key]
+            self._pending.discard(key)
+            self.collected += 1
+
+    def _widget(self, key):
+        entry = self._entries.get(key)
+        return entry[0]() if entry is not None else None
+
+    def _deliver(self, key, widget, args):
+        callback = getattr(widget, self._entries[key][1], None)
+        if callback is None:
+            return
+        try:
+            callback(*args)
+            self.delivered += 1
+        except Exception as e:
+            log.error("resize.error", widget=type(widget).__name__, error=e)
+
+    def _on_resize(self, window, width, height):
+        if self._interceptor is not None:
+            self._interceptor(window, width, height)
+        else:
+            self.dispatch(window, width, height)
+
+
+# Instancia global del registro
+resize_events = ResizeRegistry()